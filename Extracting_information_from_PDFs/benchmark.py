@@ -0,0 +1,442 @@
+"""
+benchmark.py
+
+This script measures the speed of single steps of the automated information retrieval of 'pdf_processing'
+and makes sure that faster implementations still give exactly the same results as the original ones.
+
+Usage:
+    python benchmark.py find-matches [--folder FOLDER] [--repeat N]
+    python benchmark.py dedup [--folder FOLDER] [--coordinates N] [--repeat N]
+    python benchmark.py keywords [--folder FOLDER] [--repeat N]
+    python benchmark.py pipeline [--sizes N [N ...]] [--pages N] [--workers N] [--output FILE]
+
+Author:
+    Jonathan Mattis Wisser
+    jmader@uni-muenster.de
+
+Version:
+    1.0
+Datum:
+    2026-10-17
+"""
+
+__author__ = "Jonathan Mattis Wisser"
+__version__ = "1.0"
+__date__ = "2026-10-17"
+
+# ------------------------------------------------- IMPORTS ---------------------------------------------------------- #
+# 'os' to get the path to the example studies
+import os
+
+# 're' for the original implementations which are used as reference
+import re
+
+# 'time' to measure the duration of each implementation
+import time
+
+# 'argparse' to choose which benchmark should be executed
+import argparse
+
+# 'random' to create large sets of coordinates for the duplicate removal
+import random
+
+# 'sys', 'subprocess', 'json', 'platform' and 'datetime' to run the whole pipeline in a separate process and store its results
+import sys
+import subprocess
+import json
+import platform
+from datetime import datetime
+
+# 'resource' to measure the peak memory of the pipeline, it only exists on Unix systems
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# The module whose functions are measured
+import pdf_processing
+
+# Timers of every PDF, which are used for the latency of the pipeline
+import instrumentation
+
+# Synthetic papers for measuring the pipeline with any number of studies
+from synthetic_corpus import create_corpus
+
+# Folder with the example studies, which are used if no other folder is given
+EXAMPLE_STUDIES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'Example_studies')
+
+# Folder of the synthetic papers and of the stored results of the pipeline benchmark
+SYNTHETIC_CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'synthetic_corpus')
+BENCHMARK_RESULTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'benchmark_results')
+
+# ------------------------------------------------- UTILITY ---------------------------------------------------------- #
+def load_lines(folder_path):
+    """
+    Extracts the cleaned lines of all PDFs inside a folder, so that only the search itself is measured afterward.
+
+    Args:
+        folder_path (str): The path to the folder containing the PDF files.
+
+    Returns:
+        dict: A dictionary with the file path of each PDF as key and its cleaned lines as value.
+    """
+    return {pdf_file: pdf_processing.extract_lines_from_pdf(pdf_file) for pdf_file in pdf_processing.list_pdf_files(folder_path)}
+
+def measure(function, repeat):
+    """
+    Executes a function several times and returns the fastest duration, which is the least affected by other processes.
+
+    Args:
+        function (callable): The function to be measured, it is called without arguments.
+        repeat (int): How often the function is executed.
+
+    Returns:
+        tuple: The fastest duration in seconds and the result of the last execution.
+
+    References:
+        - 'time.perf_counter()': https://docs.python.org/3/library/time.html#time.perf_counter
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        durations.append(time.perf_counter() - start)
+    return min(durations), result
+
+# ------------------------------------------------- REFERENCES ------------------------------------------------------- #
+def original_find_matches(line):
+    """
+    The original implementation of pdf_processing.find_matches(), which applies every coordinate pattern one after another to the line.
+
+    Args:
+        line (str): A single line of (cleaned) text in which coordinate patterns are searched for.
+
+    Returns:
+        list: A list of strings, each containing a found coordinate match.
+    """
+    matches = []
+    for _, pattern in pdf_processing.COORDINATE_PATTERNS:
+        matches.extend(re.findall(pattern, line))
+    return matches
+
+def original_remove_contained_coordinates(coordinates):
+    """
+    The original duplicate removal of pdf_processing.extract_spatial_information_from_pdf(), which compares every coordinate with every other one.
+
+    Args:
+        coordinates (set): All coordinates found in a PDF.
+
+    Returns:
+        set: The coordinates which are not part of any other found coordinate.
+    """
+    final_coordinates = set()
+    for coord in coordinates:
+        include_match = True
+        for other_coord in coordinates:
+            if coord != other_coord and coord in other_coord:
+                include_match = False
+                break
+        if include_match:
+            final_coordinates.add(coord)
+    return final_coordinates
+
+def original_find_study_site(lines):
+    """
+    The original implementation of pdf_processing.find_study_site(), which searches every keyword with its own RegEx in every line.
+
+    Args:
+        lines (list): A list of text lines in which keywords are searched for the study area.
+
+    Returns:
+        str or None: A string containing the context of the areas found in a study, or None if none were found
+    """
+    for i, line in enumerate(lines):
+        if (any(re.search(r'\b' + re.escape(keyword) + r'\b', line, re.IGNORECASE) for keyword in pdf_processing.STUDY_SITE_KEYWORDS)
+                or (line.strip().endswith("study") and (i + 1 < len(lines)) and lines[i + 1].strip().startswith("site"))):
+            return " ".join(lines[i:i + 4]).strip()
+    return None
+
+def original_find_drought_definitions(lines):
+    """
+    The original implementation of pdf_processing.find_drought_definitions(), which searches the whole text again for every keyword.
+
+    Args:
+        lines (list): A list of text lines in which keywords are searched for the drought definitions
+
+    Returns:
+        tuple: The summarized relevant lines and the list of keywords found, or (None, None) if no relevant information was found.
+    """
+    drought_lines = []
+    drought_quantification_keywords = []
+    for keyword in pdf_processing.DROUGHT_DEFINITION_KEYWORDS:
+        for i, line in enumerate(lines):
+            if re.search(r'\b' + re.escape(keyword) + r'\b', line, re.IGNORECASE):
+                drought_quantification_keywords.append(keyword)
+                drought_lines.append(" ".join(lines[max(0, i - 1):i + 3]).strip())
+                break
+    if drought_lines:
+        return " ".join(drought_lines).strip(), drought_quantification_keywords
+    return None, None
+
+def generate_coordinates(count, seed=0):
+    """
+    Creates a set of random coordinates in different formats, including many which are part of others (e.g. single latitudes of coordinate pairs),
+    like they are found in the coordinate tables of supplementary materials.
+
+    Args:
+        count (int): The number of coordinate pairs to be created.
+        seed (int): The seed for the random number generator, so that the same coordinates are created every time.
+
+    Returns:
+        set: The created coordinates.
+    """
+    generator = random.Random(seed)
+    coordinates = set()
+    for _ in range(count):
+        latitude = f"{generator.randint(0, 89)}°{generator.randint(0, 59):02d}′{generator.randint(0, 59):02d}″ {generator.choice('NS')}"
+        longitude = f"{generator.randint(0, 179)}°{generator.randint(0, 59):02d}′{generator.randint(0, 59):02d}″ {generator.choice('EW')}"
+        decimal = f"{generator.uniform(0, 90):.6f}"
+        coordinates.update([latitude, longitude, f"{latitude}, {longitude}", decimal, f"{decimal[:-3]}° {generator.choice('NS')}"])
+    return coordinates
+
+def current_commit():
+    """
+    Gets the git commit of the code that is measured, so that the results of different commits can be compared.
+
+    Returns:
+        str or None: The hash of the commit, marked with '-dirty' if there are uncommitted changes, or None outside of a git repository.
+
+    References:
+        - 'subprocess.run()': https://docs.python.org/3/library/subprocess.html#subprocess.run
+    """
+    repository = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=repository, capture_output=True, text=True, check=True).stdout.strip()
+        changes = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=repository, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ('-dirty' if changes.strip() else '')
+
+def run_pipeline(folder_path, workers, output_path):
+    """
+    Runs the whole pipeline of 'pdf_processing' on a folder and stores the duration, the latency of every PDF and the peak memory as JSON file.
+    This is executed in its own process by benchmark_pipeline(), so that the peak memory only belongs to this run.
+
+    Args:
+        folder_path (str): The path to the folder containing the PDF files.
+        workers (int): The number of processes used to search the PDF files in parallel.
+        output_path (str): The path of the JSON file with the measurements.
+
+    References:
+        - 'resource.getrusage()': https://docs.python.org/3/library/resource.html#resource.getrusage
+    """
+    start = time.perf_counter()
+    # The results are only counted and not collected, so that the peak memory is the one of the pipeline itself
+    documents = sum(1 for _ in pdf_processing.iter_extraction_results(folder_path, workers=workers))
+    duration = time.perf_counter() - start
+
+    # The peak memory of this process and of the largest worker process, 'ru_maxrss' is given in kilobytes on Linux
+    peak_rss = None
+    if resource is not None:
+        peak_rss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss) * 1024
+
+    with open(output_path, 'w', encoding='utf-8') as file:
+        json.dump({
+            'documents': documents,
+            'seconds': duration,
+            'latencies': [metrics.seconds for metrics in instrumentation.RUN_DOCUMENTS],
+            'failed': sum(metrics.status != 'ok' for metrics in instrumentation.RUN_DOCUMENTS),
+            'peak_rss_bytes': peak_rss,
+        }, file)
+
+# ------------------------------------------------- BENCHMARKS ------------------------------------------------------- #
+def benchmark_find_matches(folder_path, repeat):
+    """
+    Compares the original find_matches() with the current one on all lines of the PDFs in the given folder
+    and raises an error if they do not find exactly the same coordinates in every line.
+
+    Args:
+        folder_path (str): The path to the folder containing the PDF files.
+        repeat (int): How often each implementation is executed.
+    """
+    documents = load_lines(folder_path)
+    all_lines = [line for lines in documents.values() for line in lines]
+
+    original_duration, original_matches = measure(lambda: [original_find_matches(line) for line in all_lines], repeat)
+    current_duration, current_matches = measure(lambda: [pdf_processing.find_matches(line) for line in all_lines], repeat)
+
+    # Both implementations have to find the same coordinates in the same order for every line
+    if original_matches != current_matches:
+        raise AssertionError("find_matches() does not give the same results as the original implementation")
+
+    # Count how many lines are already skipped by the quick pre-filters
+    prefiltered_lines = sum(1 for line in all_lines if not pdf_processing.COORDINATE_DIGIT_PATTERN.search(line)
+                            or not pdf_processing.COORDINATE_PREFILTER_PATTERN.search(line))
+
+    print(f"PDFs: {len(documents)}, lines: {len(all_lines)}, coordinate matches: {sum(map(len, current_matches))}")
+    print(f"Lines skipped by the pre-filters: {prefiltered_lines} ({prefiltered_lines / max(len(all_lines), 1):.1%})")
+    print(f"Original find_matches(): {original_duration:.3f} s")
+    print(f"Current find_matches():  {current_duration:.3f} s")
+    print(f"Speedup: {original_duration / current_duration:.1f}x")
+
+def benchmark_dedup(folder_path, count, repeat):
+    """
+    Compares the original duplicate removal of coordinates with remove_contained_coordinates(), once for the coordinates found in each PDF
+    of the given folder and once for a large set of generated coordinates, and raises an error if the results are not exactly the same.
+
+    Args:
+        folder_path (str): The path to the folder containing the PDF files.
+        count (int): The number of generated coordinate pairs.
+        repeat (int): How often each implementation is executed.
+    """
+    # The coordinates as they are found in the PDFs
+    for pdf_file, lines in load_lines(folder_path).items():
+        coordinates = {match for line in lines for match in pdf_processing.find_matches(line)}
+        if original_remove_contained_coordinates(coordinates) != pdf_processing.remove_contained_coordinates(coordinates):
+            raise AssertionError(f"remove_contained_coordinates() does not give the same results as the original implementation for '{pdf_file}'")
+    print("Same results as the original implementation for all PDFs")
+
+    # A large set of generated coordinates
+    coordinates = generate_coordinates(count)
+    original_duration, original_result = measure(lambda: original_remove_contained_coordinates(coordinates), repeat)
+    current_duration, current_result = measure(lambda: pdf_processing.remove_contained_coordinates(coordinates), repeat)
+    if original_result != current_result:
+        raise AssertionError("remove_contained_coordinates() does not give the same results as the original implementation for the generated coordinates")
+
+    print(f"Generated coordinates: {len(coordinates)}, kept: {len(current_result)}")
+    print(f"Original duplicate removal:       {original_duration:.3f} s")
+    print(f"remove_contained_coordinates():   {current_duration:.3f} s")
+    print(f"Speedup: {original_duration / current_duration:.1f}x")
+
+def benchmark_keywords(folder_path, repeat):
+    """
+    Compares the original keyword searches of find_drought_definitions() and find_study_site() with the current ones,
+    which share the hits of a single pass of 'DOCUMENT_KEYWORD_MATCHER' in the prepared document, and raises an error if they do not give the same results for every PDF.
+
+    Args:
+        folder_path (str): The path to the folder containing the PDF files.
+        repeat (int): How often each implementation is executed.
+    """
+    documents = load_lines(folder_path)
+
+    def original():
+        return [(original_find_drought_definitions(lines), original_find_study_site(lines)) for lines in documents.values()]
+
+    def current():
+        results = []
+        for pdf_file, lines in documents.items():
+            document = pdf_processing.build_document(lines, pdf_processing.DOCUMENT_KEYWORD_MATCHER)
+            results.append((pdf_processing.find_drought_definitions(document, pdf_file),
+                            pdf_processing.find_study_site(document)))
+        return results
+
+    original_duration, original_results = measure(original, repeat)
+    current_duration, current_results = measure(current, repeat)
+    if original_results != current_results:
+        raise AssertionError("The keyword searches do not give the same results as the original implementation")
+
+    print(f"PDFs: {len(documents)}, lines: {sum(map(len, documents.values()))}")
+    print(f"Original keyword searches: {original_duration:.3f} s")
+    print(f"Single pass keyword search: {current_duration:.3f} s")
+    print(f"Speedup: {original_duration / current_duration:.1f}x")
+
+def benchmark_pipeline(sizes, pages, workers, corpus_path, output_path):
+    """
+    Measures how the whole pipeline scales with the number of studies, using synthetic papers created by 'synthetic_corpus'.
+    For every size the pipeline is run in a new process, which reports the throughput, the median and 95th percentile of the time per PDF
+    and the peak memory. All results are stored as JSON file together with the git commit, so that runs can be compared across commits.
+
+    Args:
+        sizes (list): The numbers of papers, e.g. [10, 100, 1000].
+        pages (int): The approximate number of pages of every paper.
+        workers (int): The number of processes used to search the PDF files in parallel.
+        corpus_path (str): The folder in which the synthetic papers are created (and reused in later runs).
+        output_path (str or None): The path of the JSON file with the results, None for a file named after the commit in 'BENCHMARK_RESULTS_PATH'.
+    """
+    commit = current_commit()
+    runs = []
+    for size in sizes:
+        # Every size gets its own folder, because the pipeline searches all PDFs of a folder
+        folder_path = os.path.join(corpus_path, f"{size}_papers_{pages}_pages")
+        create_corpus(folder_path, size, pages)
+
+        # Run the pipeline in its own process, so that the peak memory is not influenced by the previous sizes
+        measurement_file = os.path.join(folder_path, 'measurement.json')
+        subprocess.run([sys.executable, os.path.abspath(__file__), 'pipeline-run', folder_path, '--workers', str(workers), '--output', measurement_file],
+                       check=True, stderr=subprocess.DEVNULL)
+        with open(measurement_file, encoding='utf-8') as file:
+            measurement = json.load(file)
+        os.remove(measurement_file)
+
+        run = {
+            'documents': measurement['documents'],
+            'failed': measurement['failed'],
+            'seconds': round(measurement['seconds'], 3),
+            'documents_per_second': round(measurement['documents'] / measurement['seconds'], 3),
+            'latency_p50_seconds': round(instrumentation.percentile(measurement['latencies'], 0.5), 4),
+            'latency_p95_seconds': round(instrumentation.percentile(measurement['latencies'], 0.95), 4),
+            'peak_rss_mb': round(measurement['peak_rss_bytes'] / 1024 / 1024, 1) if measurement['peak_rss_bytes'] else None,
+        }
+        runs.append(run)
+        print(f"{run['documents']:>6} PDFs: {run['seconds']:8.2f} s, {run['documents_per_second']:7.2f} PDFs/s, "
+              f"p50 {run['latency_p50_seconds']:.3f} s, p95 {run['latency_p95_seconds']:.3f} s, peak RSS {run['peak_rss_mb']} MB")
+
+    results = {
+        'commit': commit,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pdfminer': pdf_processing.pdfminer.__version__,
+        'pages': pages,
+        'workers': workers,
+        'runs': runs,
+    }
+    if output_path is None:
+        os.makedirs(BENCHMARK_RESULTS_PATH, exist_ok=True)
+        output_path = os.path.join(BENCHMARK_RESULTS_PATH, f"pipeline_{(commit or 'unknown')[:12]}_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(output_path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+    print(f"Results stored in '{output_path}'")
+
+# ------------------------------------------------- EXECUTION -------------------------------------------------------- #
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmarks for the automated information retrieval")
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    find_matches_parser = subparsers.add_parser('find-matches', help="Compare the coordinate search with its original implementation")
+    find_matches_parser.add_argument('--folder', default=EXAMPLE_STUDIES_PATH, help="Folder with the PDFs (default: the example studies)")
+    find_matches_parser.add_argument('--repeat', type=int, default=3, help="How often each implementation is executed (default: %(default)s)")
+
+    dedup_parser = subparsers.add_parser('dedup', help="Compare the duplicate removal of coordinates with its original implementation")
+    dedup_parser.add_argument('--folder', default=EXAMPLE_STUDIES_PATH, help="Folder with the PDFs (default: the example studies)")
+    dedup_parser.add_argument('--coordinates', type=int, default=1000, help="Number of generated coordinate pairs (default: %(default)s)")
+    dedup_parser.add_argument('--repeat', type=int, default=3, help="How often each implementation is executed (default: %(default)s)")
+
+    keywords_parser = subparsers.add_parser('keywords', help="Compare the keyword searches with their original implementation")
+    keywords_parser.add_argument('--folder', default=EXAMPLE_STUDIES_PATH, help="Folder with the PDFs (default: the example studies)")
+    keywords_parser.add_argument('--repeat', type=int, default=3, help="How often each implementation is executed (default: %(default)s)")
+
+    pipeline_parser = subparsers.add_parser('pipeline', help="Measure the whole pipeline on 10, 100 and 1000 synthetic papers")
+    pipeline_parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000], help="Numbers of papers (default: %(default)s)")
+    pipeline_parser.add_argument('--pages', type=int, default=4, help="Approximate number of pages of every paper (default: %(default)s)")
+    pipeline_parser.add_argument('--workers', type=int, default=1, help="Number of processes used to search the PDFs in parallel (default: %(default)s)")
+    pipeline_parser.add_argument('--corpus', default=SYNTHETIC_CORPUS_PATH, help="Folder of the synthetic papers (default: %(default)s)")
+    pipeline_parser.add_argument('--output', help="JSON file for the results (default: a file named after the git commit in data/benchmark_results)")
+
+    # Only used internally by the 'pipeline' benchmark to run the pipeline in its own process
+    pipeline_run_parser = subparsers.add_parser('pipeline-run')
+    pipeline_run_parser.add_argument('folder')
+    pipeline_run_parser.add_argument('--workers', type=int, default=1)
+    pipeline_run_parser.add_argument('--output', required=True)
+
+    args = parser.parse_args()
+
+    if args.benchmark == 'find-matches':
+        benchmark_find_matches(args.folder, args.repeat)
+    elif args.benchmark == 'dedup':
+        benchmark_dedup(args.folder, args.coordinates, args.repeat)
+    elif args.benchmark == 'keywords':
+        benchmark_keywords(args.folder, args.repeat)
+    elif args.benchmark == 'pipeline':
+        benchmark_pipeline(args.sizes, args.pages, args.workers, args.corpus, args.output)
+    elif args.benchmark == 'pipeline-run':
+        run_pipeline(args.folder, args.workers, args.output)
@@ -0,0 +1,100 @@
+"""
+document_model.py
+
+This script prepares the cleaned lines of a PDF once for all search functions of 'pdf_processing', so that the lowercase lines, the sentences,
+the start of the reference section and the found keywords do not need to be determined again by every single search function.
+
+Author:
+    Jonathan Mattis Wisser
+    jmader@uni-muenster.de
+
+Version:
+    1.0
+Datum:
+    2026-10-17
+"""
+
+__author__ = "Jonathan Mattis Wisser"
+__version__ = "1.0"
+__date__ = "2026-10-17"
+
+# ------------------------------------------------- IMPORTS ---------------------------------------------------------- #
+# 'Regex' for splitting the lines into sentences
+import re
+
+# 'dataclass' to store all prepared information of a PDF in one object
+from dataclasses import dataclass
+
+# Searching many keywords at once in a single pass over the text
+from keyword_search import find_keyword_hits
+
+# ------------------------------------------------- SET-UPS ---------------------------------------------------------- #
+# RegEx pattern to split the lines into sentences using all sentence ending characters
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+# ------------------------------------------------- DOCUMENT --------------------------------------------------------- #
+@dataclass
+class Document:
+    """
+    All information of a PDF which is used by more than one search function, prepared once by build_document().
+
+    Attributes:
+        lines (list): The cleaned lines of the PDF.
+        lowercase_lines (list): The same lines in lower case.
+        reference_line (int): The number of the first line containing 'reference' or the number of lines if there is none.
+        references_line (int): The number of the first line containing 'references' or the number of lines if there is none.
+        sentences (list): The sentences of every line in front of 'references_line', as one list of sentences per line.
+        keyword_hits (list): The keywords found in the lines as tuples (line number, keyword), as returned by find_keyword_hits().
+
+    References:
+        - 'dataclasses': https://docs.python.org/3/library/dataclasses.html
+    """
+    lines: list
+    lowercase_lines: list
+    reference_line: int
+    references_line: int
+    sentences: list
+    keyword_hits: list
+
+def find_first_line_containing(lowercase_lines, word):
+    """
+    Finds the first line that contains a word, which is used to find the start of the reference section of a study.
+
+    Args:
+        lowercase_lines (list): The lines of the PDF in lower case.
+        word (str): The word in lower case.
+
+    Returns:
+        int: The number of the first line containing the word or the number of lines if no line contains it.
+    """
+    return next((line_number for line_number, line in enumerate(lowercase_lines) if word in line), len(lowercase_lines))
+
+def build_document(lines, keyword_matcher):
+    """
+    Prepares the cleaned lines of a PDF for all search functions of 'pdf_processing'.
+
+    Args:
+        lines (list): The cleaned lines of the PDF.
+        keyword_matcher (tuple): The matcher built by build_keyword_matcher() with all keywords that are searched in the PDF.
+
+    Returns:
+        Document: The prepared information of the PDF.
+
+    References:
+        - 're.split()': https://docs.python.org/3/library/re.html#re.split
+    """
+    lowercase_lines = [line.lower() for line in lines]
+
+    # The reference section is recognized differently by the search functions: the analyzed years stop at 'reference', the drought years at 'references'
+    reference_line = find_first_line_containing(lowercase_lines, 'reference')
+    references_line = find_first_line_containing(lowercase_lines, 'references')
+
+    return Document(
+        lines=lines,
+        lowercase_lines=lowercase_lines,
+        reference_line=reference_line,
+        references_line=references_line,
+        # Sentences are only needed in front of the reference section
+        sentences=[SENTENCE_SPLIT_PATTERN.split(line) for line in lines[:references_line]],
+        keyword_hits=find_keyword_hits(keyword_matcher, lines),
+    )
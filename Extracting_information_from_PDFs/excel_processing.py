@@ -21,12 +21,22 @@ __date__ = "2024-11-12"
 # openpyxl zum Arbeiten mit Excel Dateien
 import openpyxl
 
+# 'os' and 'json' for the staging file, into which the rows are written as soon as each PDF is finished
+import os
+import json
+
 # Logging for a better understanding of the results and outputs as set up in the main module
 # Logging.info() and logging.error() are used here
 # https://docs.python.org/3/library/logging.html#logging.INFO
 # https://docs.python.org/3/library/logging.html#logging.error
 import logging
 
+# ------------------------------------------------- SET-UPS ---------------------------------------------------------- #
+# Name of the worksheet into which the extracted information is inserted
+WORKSHEET_NAME = 'relevantInfo'
+
+# Columns which are filled by build_excel_row(), all other columns are filled in by hand and are never overwritten when a row is updated
+EXTRACTED_COLUMNS = (1, 2, 3, 4, 5, 9, 11, 13)
 
 # ------------------------------------------------- UTILITY ---------------------------------------------------------- #
 def find_first_empty_row(sheet):
@@ -35,36 +45,183 @@ def find_first_empty_row(sheet):
     for inserting the relevant information.
     This is necessary in order to be able to work as flexibly as possible with every possible Excel table
 
+    The worksheet has to be opened in read-only mode (see locate_rows()), where iter_rows(values_only=True) only streams the values
+    from the file: on a normally opened worksheet, iter_rows() would create every cell up to the last row and column in memory.
+    The search stops at the first empty row.
+
     Args:
-        sheet (openpyxl.worksheet.worksheet.Worksheet): The worksheet we want to copy the extracted information into.
+        sheet (openpyxl.worksheet._read_only.ReadOnlyWorksheet): The worksheet we want to copy the extracted information into, opened in read-only mode.
 
     Returns:
         int: The number of the first empty row found.
 
     References:
         - Working with Excel worksheets using openpyxl: https://openpyxl.readthedocs.io/en/stable/api/openpyxl.worksheet.worksheet.html#openpyxl.worksheet.worksheet.Worksheet
-        - Finding 'maximum column index containing data' using max_column: https://openpyxl.readthedocs.io/en/3.1/api/openpyxl.worksheet.worksheet.html#openpyxl.worksheet.worksheet.Worksheet.max_column
-        - Finding 'the maximum row index containing data' using max_row: https://openpyxl.readthedocs.io/en/3.1/api/openpyxl.worksheet.worksheet.html#openpyxl.worksheet.worksheet.Worksheet.max_row
+        - 'iter_rows()': https://openpyxl.readthedocs.io/en/stable/api/openpyxl.worksheet.worksheet.html#openpyxl.worksheet.worksheet.Worksheet.iter_rows
+        - Reading the values of a worksheet opened in read-only mode: https://openpyxl.readthedocs.io/en/stable/optimized.html#read-only-mode
     """
-    # Search for the first empty row by scanning all cells from row 1 to the maximum row + 1 for all columns for None values
-    for row in range(1, sheet.max_row + 1):
-        # When all cells are empty (None value) in one row for all columns, give back this row as first empty row to add new data to
-        if all(sheet.cell(row=row, column=col).value is None for col in range(1, sheet.max_column + 1)):
+    # When all cells of a row are empty (None value), give back this row as first empty row to add new data to
+    # (a worksheet without any values gives no rows at all, then row 1 is the first empty row)
+    row = 0
+    for row, values in enumerate(sheet.iter_rows(values_only=True), start=1):
+        if all(value is None for value in values):
             return row
 
-    return sheet.max_row + 1
+    return row + 1
+
+def build_excel_row(extracted_result):
+    """
+    Converts the extracted data of a single PDF into the values of its row in the worksheet 'relevantInfo'.
+    Columns without a found value are left out, so that they stay empty.
+
+    Args:
+        extracted_result (ExtractionResult): The extracted information of one PDF by the 'pdf_processing' module.
+
+    Returns:
+        dict: The values of the row, stored by the number of their column.
+    """
+    # The pure name of a study (or rather its PDF) is inserted into column A (Paper), the coordinates into column B (location coordinates)
+    # and the study site information (either coordinate context lines or study site directly, depending what is stored in 'extracted_data') into column C (Area name)
+    row = {1: extracted_result.pdf_basename, 2: extracted_result.coordinates, 3: extracted_result.context_lines}
+
+    # If a time period referring to the analyzed years of a study was found, insert it into column D (time period analyzed)
+    if extracted_result.analyzed_years:
+        # Convert the list to string first, so there is no type error for the Excel file
+        row[4] = ', '.join(extracted_result.analyzed_years)
+
+    # If periods or single years with drought were found, insert the combined (string) value into column E (time period with drought (if mentioned))
+    if extracted_result.periods_with_drought or extracted_result.single_years_with_drought:
+        # Combine both lists and convert them into one string so there is no type error for the Excel file
+        combined_drought_years = extracted_result.periods_with_drought + extracted_result.single_years_with_drought
+        row[5] = ', '.join(sorted(combined_drought_years))
+
+    # Insert, if a method to assess drought was found its corresponding keyword into column J (study type)
+    if extracted_result.study_type:
+        row[9] = extracted_result.study_type
+
+    # Insert the text information, how drought was characterized into column L (how was drought characterized), if there is any
+    if extracted_result.drought_characterization:
+        row[11] = extracted_result.drought_characterization
+
+    # Insert the found keywords of how drought was characterized into column M (drought quantification keyword for plots), if there are any
+    if extracted_result.drought_characterization_keywords:
+        # Convert the list to string first, so there is no type error for the Excel file
+        row[13] = ', '.join(extracted_result.drought_characterization_keywords)
+
+    return row
+
+def write_excel_row(worksheet, row_number, row):
+    """
+    Writes the values of a row as created by build_excel_row() into the worksheet.
+
+    Args:
+        worksheet (openpyxl.worksheet.worksheet.Worksheet): The worksheet we want to copy the extracted information into.
+        row_number (int): The number of the row in the worksheet.
+        row (dict): The values of the row, stored by the number of their column.
+
+    References:
+        - Adding new data to cells for specific rows and specific columns: https://openpyxl.readthedocs.io/en/stable/api/openpyxl.worksheet.worksheet.html#openpyxl.worksheet.worksheet.Worksheet.cell
+    """
+    for column, value in row.items():
+        # The value is set on the cell itself, because cell() ignores None, which is needed to empty a column when a row is updated
+        worksheet.cell(row=row_number, column=column).value = value
+
+def index_existing_papers(sheet):
+    """
+    Finds the row of every paper that is already stored in the worksheet, using the names of the PDFs in column A (Paper).
+    If a paper is stored in more than one row, the first of these rows is used.
+
+    Args:
+        sheet (openpyxl.worksheet._read_only.ReadOnlyWorksheet): The worksheet we want to copy the extracted information into, opened in read-only mode.
+
+    Returns:
+        dict: The number of the row of every paper, stored by the name of its PDF.
+    """
+    # Only the values of column A are read, row by row from the top, so the first row of every paper is kept
+    # https://openpyxl.readthedocs.io/en/stable/api/openpyxl.worksheet.worksheet.html#openpyxl.worksheet.worksheet.Worksheet.iter_rows
+    paper_rows = {}
+    for row, (pdf_basename,) in enumerate(sheet.iter_rows(min_col=1, max_col=1, values_only=True), start=1):
+        if pdf_basename is not None:
+            paper_rows.setdefault(pdf_basename, row)
+    return paper_rows
+
+def locate_rows(excel_path, upsert=False):
+    """
+    Finds the first empty row of the worksheet 'relevantInfo' and, for an upsert, the row of every stored paper.
+    The Excel file is opened in read-only mode for this, so that no cells are created in memory while the rows are searched.
+
+    Args:
+        excel_path (str): The full file path to the Excel file.
+        upsert (bool): Whether the rows of the stored papers are needed.
+
+    Returns:
+        tuple: The number of the first empty row and the number of the row of every stored paper (dict, empty without upsert).
+
+    References:
+        - Read-only mode of openpyxl: https://openpyxl.readthedocs.io/en/stable/optimized.html#read-only-mode
+    """
+    workbook = openpyxl.load_workbook(excel_path, read_only=True)
+    try:
+        sheet = workbook[WORKSHEET_NAME]
+        return find_first_empty_row(sheet), index_existing_papers(sheet) if upsert else {}
+    finally:
+        workbook.close()
+
+def read_existing_papers(excel_path):
+    """
+    Reads the names of all papers that are already stored in column A (Paper) of the Excel file, so that their PDFs do not need to be searched again.
+    The Excel file is opened in read-only mode, which reads the rows one after another without loading the complete file.
+
+    Args:
+        excel_path (str): The full file path to the Excel file.
+
+    Returns:
+        set: The names of the PDFs (without the file extension) of all stored papers.
+
+    References:
+        - Read-only mode of openpyxl: https://openpyxl.readthedocs.io/en/stable/optimized.html#read-only-mode
+    """
+    workbook = openpyxl.load_workbook(excel_path, read_only=True)
+    try:
+        rows = workbook[WORKSHEET_NAME].iter_rows(min_col=1, max_col=1, values_only=True)
+        return {values[0] for values in rows if values and values[0] is not None}
+    finally:
+        workbook.close()
+
+def read_staging_rows(staging_path):
+    """
+    Reads the rows from the staging file one by one, so that the file never needs to be loaded completely.
+    An incomplete last line, which is left if the extraction was stopped while writing it, is skipped.
+
+    Args:
+        staging_path (str): The path to the staging file.
+
+    Yields:
+        dict: The values of each row, stored by the number of their column.
+
+    References:
+        - JSON Lines: https://jsonlines.org/
+    """
+    with open(staging_path, encoding='utf-8') as file:
+        for line_number, line in enumerate(file, start=1):
+            try:
+                # JSON only allows text as keys, so the numbers of the columns are converted back
+                yield {int(column): value for column, value in json.loads(line).items()}
+            except ValueError:
+                logging.error(f"Skipping incomplete line {line_number} of the staging file '{staging_path}'")
 
 # ------------------------------------------------- PROCESSING ------------------------------------------------------- #
-def update_excel_with_extracted_data(excel_path, extracted_data):
+def update_excel_with_extracted_data(excel_path, extracted_data, upsert=False):
     """
     Updates the specified worksheet from an Excel file with the data previously extracted from the PDFs by the 'pdf_processing' module
 
     Args:
         excel_path (str): The full file path to the Excel file.
-        extracted_data (list): List of tuples with the extracted information by the 'pdf_processing' module.
+        extracted_data (list): The results (ExtractionResult) with the extracted information by the 'pdf_processing' module.
+        upsert (bool): Whether papers which are already stored in the worksheet are updated in their row instead of being added again.
 
     Returns:
-        workbook: The Excel file with the updated worksheet.
+        bool: True if the Excel file was saved, False otherwise.
 
     References:
         - General tutorial for openpyxl: https://openpyxl.readthedocs.io/en/stable/tutorial.html
@@ -73,56 +230,143 @@ def update_excel_with_extracted_data(excel_path, extracted_data):
         - Adding new data to cells for specific rows and specific columns: https://openpyxl.readthedocs.io/en/latest/tutorial.html#playing-with-data
           & https://openpyxl.readthedocs.io/en/stable/api/openpyxl.worksheet.worksheet.html#openpyxl.worksheet.worksheet.Worksheet.cell
     """
+    return write_rows_into_excel(excel_path, (build_excel_row(extracted_result) for extracted_result in extracted_data), upsert)
+
+def write_rows_into_excel(excel_path, rows, upsert=False):
+    """
+    Appends rows as created by build_excel_row() below the last filled row of the worksheet 'relevantInfo' and saves the Excel file once at the end.
+    With 'upsert', a paper which is already stored in column A is updated in its row instead: the columns in 'EXTRACTED_COLUMNS' are overwritten
+    (and emptied if nothing was found anymore), while all columns filled in by hand stay as they are. Only new papers are appended.
+
+    Args:
+        excel_path (str): The full file path to the Excel file.
+        rows (iterable): The rows, each as dictionary of the values stored by the number of their column.
+        upsert (bool): Whether papers which are already stored in the worksheet are updated in their row instead of being added again.
+
+    Returns:
+        bool: True if the Excel file was saved, False otherwise.
+    """
+
+    # Finde the row from where to start adding data and the rows of the papers that are already stored (only needed when they are updated)
+    # by using the helper function 'locate_rows()', before the workbook is loaded for writing
+    next_row, paper_rows = locate_rows(excel_path, upsert)
+    updated_rows = 0
 
     # Open the wanted worksheet from the given Excel file
     workbook = openpyxl.load_workbook(excel_path)
-    worksheet = workbook['relevantInfo']
-
-    # Finde the row from where to start adding data by using the helper function 'find_first_empty_row()'
-    start_row = find_first_empty_row(worksheet)
-
-    # Enter the information extracted from the PDFs into the Excel file by iterating over 'extracted_data' and going one row further with each iteration
-    for i, (pdf_basename, coordinates, lines_with_coordinates, drought_characterization, drought_characterization_keywords, study_type, analyzed_years, periods_with_drought, single_years_with_drought) in enumerate(extracted_data):
-        # Insert the pure name of a study (or rather its PDF) into column A (Paper)
-        worksheet.cell(row=start_row + i, column=1, value=pdf_basename)
-
-        # Insert the coordinates into column B (location coordinates)
-        worksheet.cell(row=start_row + i, column=2, value=coordinates)
-        # Insert the study site information (either coordinate context lines or study site directly, depending what is stored in 'extracted_data') into column C (Area name)
-        worksheet.cell(row=start_row + i, column=3, value=lines_with_coordinates)
-
-        # If a time period referring to the analyzed years of a study was found, insert it into column D (time period analyzed)
-        if analyzed_years:
-            # Convert the list to string first, so there is no type error for the Excel file
-            analyzed_years_str = ', '.join(analyzed_years)
-            worksheet.cell(row=start_row + i, column=4, value=analyzed_years_str)
-
-        # If periods or single years with drought were found, insert the combined (string) value into column E (time period with drought (if mentioned))
-        if periods_with_drought or single_years_with_drought:
-            # Combine both lists and convert them into one string so there is no type error for the Excel file
-            combined_drought_years = periods_with_drought + single_years_with_drought
-            combined_drought_years_str = ', '.join(sorted(combined_drought_years))
-            worksheet.cell(row=start_row + i, column=5, value=combined_drought_years_str)
-
-        # Insert, if a method to assess drought was found its corresponding keyword into column J (study type)
-        if study_type:
-            worksheet.cell(row=start_row + i, column=9, value=study_type)
-
-        # Insert the text information, how drought was characterized into column L (how was drought characterized), if there is any
-        if drought_characterization:
-            worksheet.cell(row=start_row + i, column=11, value=drought_characterization)
-
-        # Insert the found keywords of how drought was characterized into column M (drought quantification keyword for plots), if there are any
-        if drought_characterization_keywords:
-            # Convert the list to string first, so there is no type error for the Excel file
-            drought_characterization_keywords_str = ', '.join(drought_characterization_keywords)
-            worksheet.cell(row=start_row + i, column=13, value=drought_characterization_keywords_str)
+    worksheet = workbook[WORKSHEET_NAME]
+
+    # Enter the information extracted from the PDFs into the Excel file by iterating over the rows and going one row further with each new paper
+    for row in rows:
+        pdf_basename = row[1]
+        if upsert and pdf_basename in paper_rows:
+            # Overwrite all extracted columns of the stored paper, columns without a found value are emptied
+            write_excel_row(worksheet, paper_rows[pdf_basename], {column: row.get(column) for column in EXTRACTED_COLUMNS})
+            updated_rows += 1
+        else:
+            write_excel_row(worksheet, next_row, row)
+            paper_rows[pdf_basename] = next_row
+            next_row += 1
+
+    if upsert:
+        logging.info(f"Updated {updated_rows} stored paper(s) in the Excel file")
 
     try:
         # Save the changes made in the Excel file and log that it worked
         workbook.save(excel_path)
         logging.info(f"Excel file was successfully updated!")
+        return True
 
     # Fallback error logging if an error occurred
     except Exception as e:
-        logging.error(f"Error saving the updated Excel file: {e}")
\ No newline at end of file
+        logging.error(f"Error saving the updated Excel file: {e}")
+        return False
+
+def open_staging_file(staging_path, append=True):
+    """
+    Opens the staging file for appending rows, starting in a new line if the last run was stopped in the middle of a row.
+    Without appending, the rows of a previous (e.g. stopped) run are removed, because all of its PDFs are given out again.
+
+    Args:
+        staging_path (str): The path to the staging file.
+        append (bool): Whether rows are appended if the staging file already exists, False to start it anew.
+
+    Returns:
+        file: The staging file opened for appending.
+    """
+    staging_folder = os.path.dirname(staging_path)
+    if staging_folder:
+        os.makedirs(staging_folder, exist_ok=True)
+
+    # If the last run was stopped in the middle of a row, the next row has to start in a new line
+    ends_with_line_break = True
+    if append and os.path.exists(staging_path) and os.path.getsize(staging_path) > 0:
+        with open(staging_path, 'rb') as file:
+            file.seek(-1, os.SEEK_END)
+            ends_with_line_break = file.read(1) == b'\n'
+
+    file = open(staging_path, 'a' if append else 'w', encoding='utf-8')
+    if not ends_with_line_break:
+        file.write('\n')
+    return file
+
+def stage_row(file, extracted_result):
+    """
+    Writes the row of a single PDF into the staging file as one line of JSON and flushes it directly,
+    so that after a crash all finished PDFs are still stored in the staging file.
+
+    Args:
+        file (file): The staging file as opened by open_staging_file().
+        extracted_result (ExtractionResult): The extracted information of one PDF by the 'pdf_processing' module.
+
+    References:
+        - JSON Lines: https://jsonlines.org/
+        - 'file.flush()': https://docs.python.org/3/library/io.html#io.IOBase.flush
+    """
+    file.write(json.dumps(build_excel_row(extracted_result), ensure_ascii=False) + '\n')
+    file.flush()
+
+def stage_extracted_data(staging_path, extracted_data):
+    """
+    Writes the row of every PDF into a staging file as soon as the PDF is finished, instead of keeping all results in memory until the Excel file is written.
+    The rows are added to the Excel file afterward by merge_staging_into_excel().
+
+    Args:
+        staging_path (str): The path to the staging file, rows are appended if it already exists.
+        extracted_data (iterable): The results (ExtractionResult) with the extracted information by the 'pdf_processing' module, e.g. as given out by iter_extraction_results().
+
+    Returns:
+        int: The number of staged rows.
+    """
+    staged_rows = 0
+    with open_staging_file(staging_path) as file:
+        for extracted_result in extracted_data:
+            stage_row(file, extracted_result)
+            staged_rows += 1
+
+    return staged_rows
+
+def merge_staging_into_excel(excel_path, staging_path, upsert=False):
+    """
+    Appends all rows of the staging file into the worksheet 'relevantInfo' and deletes the staging file afterward.
+    openpyxl cannot add rows to an existing Excel file without loading it, so the workbook is loaded and saved exactly once here,
+    while the rows are read from the staging file one by one.
+
+    Args:
+        excel_path (str): The full file path to the Excel file.
+        staging_path (str): The path to the staging file.
+        upsert (bool): Whether papers which are already stored in the worksheet are updated in their row instead of being added again.
+
+    Returns:
+        bool: True if the rows were added to the Excel file, False otherwise.
+    """
+    if not os.path.exists(staging_path):
+        logging.error(f"No staging file found in '{staging_path}'")
+        return False
+
+    merged = write_rows_into_excel(excel_path, read_staging_rows(staging_path), upsert)
+
+    # The staging file is only deleted if its rows are really stored in the Excel file, otherwise the merge can be repeated
+    if merged:
+        os.remove(staging_path)
+    return merged
@@ -0,0 +1,339 @@
+"""
+export.py
+
+This script writes the extracted information of the PDFs into one or more outputs ("sinks") while the PDFs are searched:
+Parquet and Feather files (with the lists of years and keywords as real list columns, so that they can be loaded directly with pandas),
+CSV and JSON Lines files, and the Excel file of 'excel_processing'. All sinks are filled from the same stream of results,
+so every PDF is only searched once no matter how many outputs are requested.
+
+Author:
+    Jonathan Mattis Wisser
+    jmader@uni-muenster.de
+
+Version:
+    1.0
+Datum:
+    2026-10-17
+"""
+
+__author__ = "Jonathan Mattis Wisser"
+__version__ = "1.0"
+__date__ = "2026-10-17"
+
+# ------------------------------------------------- IMPORTS ---------------------------------------------------------- #
+# 'os' for data management (creating the folders of the outputs)
+import os
+
+# 'csv' and 'json' for the text based outputs
+import csv
+import json
+
+# 'fields' and 'asdict' to get the columns of the outputs from the fields of the extracted information
+from dataclasses import fields, asdict
+
+# 'pyarrow' for the Parquet and Feather files, which are only available if it is installed
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# The fields of the extracted information and the Excel file as one of the sinks
+from pdf_processing import ExtractionResult, StoredExtractionResult
+from excel_processing import build_excel_row, write_rows_into_excel, open_staging_file, stage_row, merge_staging_into_excel
+
+# 'instrumentation' to add the time of every sink to the timing report of the run
+import instrumentation
+
+# Logging for a better understanding of the results and outputs as set up in the main module
+# Logging.info() and logging.error() are used here
+# https://docs.python.org/3/library/logging.html#logging.INFO
+# https://docs.python.org/3/library/logging.html#logging.error
+import logging
+
+# ------------------------------------------------- SET-UPS ---------------------------------------------------------- #
+# Columns of all outputs, in the order of the fields of the extracted information
+EXPORT_COLUMNS = [result_field.name for result_field in fields(ExtractionResult)]
+
+# Columns which hold lists (e.g. the analyzed years), stored as list columns in Parquet and Feather and as JSON arrays in CSV
+LIST_COLUMNS = {result_field.name for result_field in fields(ExtractionResult) if result_field.type is list}
+
+# Schema of the Parquet and Feather files, every value is a string or a list of strings
+# https://arrow.apache.org/docs/python/generated/pyarrow.schema.html
+ARROW_SCHEMA = pyarrow.schema([(column, pyarrow.list_(pyarrow.string()) if column in LIST_COLUMNS else pyarrow.string())
+                               for column in EXPORT_COLUMNS]) if pyarrow is not None else None
+
+# Number of PDFs that are collected before they are written into a Parquet or Feather file as one batch
+EXPORT_BATCH_SIZE = 1000
+
+# File extensions of the outputs and their format
+EXPORT_FORMATS = {'.parquet': 'parquet', '.feather': 'feather', '.arrow': 'feather', '.csv': 'csv', '.jsonl': 'jsonl'}
+
+# ------------------------------------------------- SINKS ------------------------------------------------------------ #
+class ArrowSink:
+    """
+    Writes the extracted information into a Parquet or Feather file, in batches of 'batch_size' PDFs,
+    so that the file grows while the PDFs are searched and never more than one batch is kept in memory.
+
+    Attributes:
+        path (str): The path of the Parquet or Feather file.
+        batch_size (int): The number of PDFs that are written at once.
+        stage_name (str): The name of the stage of the sink in the timing report.
+
+    References:
+        - 'ParquetWriter': https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetWriter.html
+        - Feather is the Arrow IPC file format: https://arrow.apache.org/docs/python/feather.html
+        - 'pyarrow.ipc.new_file()': https://arrow.apache.org/docs/python/generated/pyarrow.ipc.new_file.html
+    """
+    def __init__(self, path, file_format='parquet', batch_size=EXPORT_BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self.stage_name = f"export_{file_format}"
+        self.rows = []
+        if file_format == 'parquet':
+            self.writer = pyarrow.parquet.ParquetWriter(path, ARROW_SCHEMA)
+        else:
+            self.writer = pyarrow.ipc.new_file(path, ARROW_SCHEMA)
+
+    def write(self, record):
+        """
+        Writes the result of a single PDF into the sink.
+
+        Args:
+            record (ExtractionResult): The extracted information of the PDF.
+        """
+        self.rows.append(asdict(record))
+        if len(self.rows) >= self.batch_size:
+            self.write_batch()
+
+    def write_batch(self):
+        """
+        Writes the collected PDFs into the file, every batch becomes one row group (Parquet) or record batch (Feather).
+        """
+        if self.rows:
+            self.writer.write_table(pyarrow.Table.from_pylist(self.rows, schema=ARROW_SCHEMA))
+            self.rows = []
+
+    def close(self, completed=True):
+        """
+        Writes everything that is left and closes the output.
+
+        Args:
+            completed (bool): Whether all PDFs were searched, False if the run was stopped by an error.
+
+        Returns:
+            bool: True if the output was written successfully, False otherwise.
+        """
+        # The PDFs of a stopped run are written as well, the file is valid in any case
+        self.write_batch()
+        self.writer.close()
+        logging.info(f"Exported the results to '{self.path}'")
+        return True
+
+class CsvSink:
+    """
+    Writes the extracted information into a CSV file, one row per PDF, with the lists stored as JSON arrays.
+
+    Attributes:
+        path (str): The path of the CSV file.
+        stage_name (str): The name of the stage of the sink in the timing report.
+
+    References:
+        - 'csv.DictWriter': https://docs.python.org/3/library/csv.html#csv.DictWriter
+    """
+    def __init__(self, path):
+        self.path = path
+        self.stage_name = 'export_csv'
+        self.file = open(path, 'w', encoding='utf-8', newline='')
+        self.writer = csv.DictWriter(self.file, fieldnames=EXPORT_COLUMNS)
+        self.writer.writeheader()
+
+    def write(self, record):
+        """
+        Writes the result of a single PDF into the sink.
+
+        Args:
+            record (ExtractionResult): The extracted information of the PDF.
+        """
+        row = asdict(record)
+        for column in LIST_COLUMNS:
+            row[column] = json.dumps(row[column], ensure_ascii=False)
+        self.writer.writerow(row)
+
+    def close(self, completed=True):
+        """
+        Writes everything that is left and closes the output.
+
+        Args:
+            completed (bool): Whether all PDFs were searched, False if the run was stopped by an error.
+
+        Returns:
+            bool: True if the output was written successfully, False otherwise.
+        """
+        self.file.close()
+        logging.info(f"Exported the results to '{self.path}'")
+        return True
+
+class JsonlSink:
+    """
+    Writes the extracted information into a JSON Lines file, one line per PDF.
+
+    Attributes:
+        path (str): The path of the JSON Lines file.
+        stage_name (str): The name of the stage of the sink in the timing report.
+
+    References:
+        - JSON Lines: https://jsonlines.org/
+    """
+    def __init__(self, path):
+        self.path = path
+        self.stage_name = 'export_jsonl'
+        self.file = open(path, 'w', encoding='utf-8')
+
+    def write(self, record):
+        """
+        Writes the result of a single PDF into the sink.
+
+        Args:
+            record (ExtractionResult): The extracted information of the PDF.
+        """
+        self.file.write(json.dumps(asdict(record), ensure_ascii=False) + '\n')
+
+    def close(self, completed=True):
+        """
+        Writes everything that is left and closes the output.
+
+        Args:
+            completed (bool): Whether all PDFs were searched, False if the run was stopped by an error.
+
+        Returns:
+            bool: True if the output was written successfully, False otherwise.
+        """
+        self.file.close()
+        logging.info(f"Exported the results to '{self.path}'")
+        return True
+
+class ExcelSink:
+    """
+    Writes the extracted information into the Excel file of 'excel_processing'. openpyxl has to load and save the whole workbook,
+    so only the (small) rows are collected and written into the Excel file at once when the run is finished,
+    or, with a staging file, every row is stored in it as soon as the PDF is finished and the staging file is merged at the end.
+    If the run is stopped, the Excel file is not changed, the rows can be added later with '--resume' or '--merge-staging'.
+    The results of unchanged PDFs reused from the manifest (StoredExtractionResult) are left out, because their rows are already stored
+    and may have been corrected by hand.
+
+    Attributes:
+        excel_path (str): The full file path to the Excel file.
+        upsert (bool): Whether papers which are already stored in the worksheet are updated in their row instead of being added again.
+        staging_path (str or None): The path of the staging file, None to collect the rows in memory.
+        stage_name (str): The name of the stage of the sink in the timing report.
+    """
+    def __init__(self, excel_path, upsert=False, staging_path=None):
+        self.excel_path = excel_path
+        self.upsert = upsert
+        self.staging_path = staging_path
+        self.stage_name = 'excel_update'
+        self.rows = []
+        self.row_count = 0
+        # The staging file of a previous run is started anew: its PDFs are searched again, or given out again from the journal when resuming
+        self.staging_file = open_staging_file(staging_path, append=False) if staging_path else None
+
+    def write(self, record):
+        """
+        Writes the result of a single PDF into the sink.
+
+        Args:
+            record (ExtractionResult): The extracted information of the PDF.
+        """
+        if isinstance(record, StoredExtractionResult):
+            return
+        self.row_count += 1
+        if self.staging_file is not None:
+            stage_row(self.staging_file, record)
+        else:
+            self.rows.append(build_excel_row(record))
+
+    def close(self, completed=True):
+        """
+        Writes everything that is left and closes the output.
+
+        Args:
+            completed (bool): Whether all PDFs were searched, False if the run was stopped by an error.
+
+        Returns:
+            bool: True if the output was written successfully, False otherwise.
+        """
+        # Without any searched PDF (e.g. an incremental run without new PDFs), the workbook does not have to be loaded and saved at all
+        if completed and not self.row_count:
+            if self.staging_file is not None:
+                self.staging_file.close()
+                os.remove(self.staging_path)
+            logging.info("No new rows for the Excel file")
+            return True
+        if self.staging_file is not None:
+            self.staging_file.close()
+            return completed and merge_staging_into_excel(self.excel_path, self.staging_path, self.upsert)
+        return completed and write_rows_into_excel(self.excel_path, self.rows, self.upsert)
+
+# ------------------------------------------------- PROCESSING ------------------------------------------------------- #
+def create_sink(path, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Creates the sink that fits the file extension of the given path.
+    If pyarrow is not installed, a Parquet or Feather file is written as JSON Lines file with the same name instead.
+
+    Args:
+        path (str): The path of the output, ending with '.parquet', '.feather', '.arrow', '.csv' or '.jsonl'.
+        batch_size (int): The number of PDFs that are written at once into a Parquet or Feather file.
+
+    Returns:
+        ArrowSink, CsvSink or JsonlSink: The sink.
+
+    Raises:
+        ValueError: If the file extension is not one of 'EXPORT_FORMATS'.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{extension}', use one of: {', '.join(EXPORT_FORMATS)}")
+    file_format = EXPORT_FORMATS[extension]
+
+    if file_format in ('parquet', 'feather') and pyarrow is None:
+        logging.error(f"pyarrow is not installed, '{path}' is written as JSON Lines file instead")
+        path, file_format = os.path.splitext(path)[0] + '.jsonl', 'jsonl'
+
+    export_folder = os.path.dirname(path)
+    if export_folder:
+        os.makedirs(export_folder, exist_ok=True)
+
+    if file_format == 'csv':
+        return CsvSink(path)
+    if file_format == 'jsonl':
+        return JsonlSink(path)
+    return ArrowSink(path, file_format, batch_size)
+
+def export_results(extracted_data, sinks):
+    """
+    Writes every result into all given sinks as soon as its PDF is finished and closes the sinks at the end.
+    The time of every sink is added to the timing report under the stage name of the sink.
+    If the run is stopped by an error, the sinks are still closed, but the Excel file is not changed.
+
+    Args:
+        extracted_data (iterable): The results (ExtractionResult) as given out by iter_extraction_results().
+        sinks (list): The sinks as created by create_sink() or ExcelSink.
+
+    Returns:
+        bool: True if all sinks were written successfully, False otherwise.
+    """
+    completed = False
+    try:
+        for record in extracted_data:
+            for sink in sinks:
+                with instrumentation.stage(sink.stage_name):
+                    sink.write(record)
+        completed = True
+    finally:
+        results = []
+        for sink in sinks:
+            with instrumentation.stage(sink.stage_name):
+                results.append(sink.close(completed))
+    return all(results)
@@ -0,0 +1,268 @@
+"""
+instrumentation.py
+
+This script measures how long every stage of the extraction takes for each PDF (pdfminer, cleaning, coordinate search, keyword searches, ...)
+and counts what was processed (lines, bytes, matches, RegEx calls), so that a slow run can be traced back to the responsible stage.
+At the end of a run all measurements are written into a JSON report. Optionally a single PDF can be searched with a profiler.
+
+Author:
+    Jonathan Mattis Wisser
+    jmader@uni-muenster.de
+
+Version:
+    1.0
+Datum:
+    2026-10-17
+"""
+
+__author__ = "Jonathan Mattis Wisser"
+__version__ = "1.0"
+__date__ = "2026-10-17"
+
+# ------------------------------------------------- IMPORTS ---------------------------------------------------------- #
+# 'os' for data management (creating the folder of the report)
+import os
+
+# 'json' to write the report in a machine-readable form
+import json
+
+# 'time' for the timers and 'datetime' for the time stamp of the report
+import time
+from datetime import datetime
+
+# 'dataclass' to store the measurements of a single PDF, which are sent back from the worker processes
+from dataclasses import dataclass, field, asdict
+
+# 'contextmanager' to time a stage with a simple 'with' block
+from contextlib import contextmanager
+
+# 'cProfile' for profiling a single PDF, 'pyinstrument' is used instead if it is installed and requested
+import cProfile
+try:
+    import pyinstrument
+except ImportError:
+    pyinstrument = None
+
+# Logging for a better understanding of the results and outputs as set up in the main module
+# Logging.info() and logging.error() are used here
+# https://docs.python.org/3/library/logging.html#logging.INFO
+# https://docs.python.org/3/library/logging.html#logging.error
+import logging
+
+# ------------------------------------------------- SET-UPS ---------------------------------------------------------- #
+@dataclass
+class DocumentMetrics:
+    """
+    The measurements of a single PDF.
+
+    Attributes:
+        name (str): The file name of the PDF without the file extension (.pdf).
+        status (str): 'ok' or the reason why the PDF could not be searched.
+        seconds (float): The time the PDF took in total.
+        stages (dict): The time in seconds of every stage, stored by the name of the stage.
+        counters (dict): The counted values (e.g. 'lines', 'pdf_bytes', 'coordinate_pattern_checks'), stored by their name.
+    """
+    name: str
+    status: str = 'ok'
+    seconds: float = 0.0
+    stages: dict = field(default_factory=dict)
+    counters: dict = field(default_factory=dict)
+
+# The measurements of the PDF that is currently searched in this process, None if no PDF is searched
+CURRENT_DOCUMENT = None
+
+# The measurements of all searched PDFs of the run, collected in the main process
+RUN_DOCUMENTS = []
+
+# The time in seconds of the stages of the whole run, which do not belong to a single PDF (e.g. writing the Excel file)
+RUN_STAGES = {}
+
+# ------------------------------------------------- UTILITY ---------------------------------------------------------- #
+def start_document(name):
+    """
+    Starts the measurements of a PDF, all following stages and counters of this process belong to it until finish_document() is called.
+
+    Args:
+        name (str): The file name of the PDF without the file extension (.pdf).
+
+    Returns:
+        DocumentMetrics: The (still empty) measurements of the PDF.
+    """
+    global CURRENT_DOCUMENT
+    CURRENT_DOCUMENT = DocumentMetrics(name)
+    return CURRENT_DOCUMENT
+
+def finish_document(seconds, status='ok'):
+    """
+    Ends the measurements of the PDF that is currently searched in this process.
+
+    Args:
+        seconds (float): The time the PDF took in total.
+        status (str): 'ok' or the reason why the PDF could not be searched.
+
+    Returns:
+        DocumentMetrics: The measurements of the PDF.
+    """
+    global CURRENT_DOCUMENT
+    metrics, CURRENT_DOCUMENT = CURRENT_DOCUMENT, None
+    metrics.seconds = seconds
+    metrics.status = status
+    return metrics
+
+@contextmanager
+def stage(name):
+    """
+    Measures the time of the code inside the 'with' block and adds it to the stage of the current PDF,
+    or to the stages of the whole run if no PDF is searched at the moment. A stage that is run several times is summed up.
+
+    Args:
+        name (str): The name of the stage.
+
+    References:
+        - 'contextlib.contextmanager': https://docs.python.org/3/library/contextlib.html#contextlib.contextmanager
+        - 'time.perf_counter()': https://docs.python.org/3/library/time.html#time.perf_counter
+    """
+    stages = CURRENT_DOCUMENT.stages if CURRENT_DOCUMENT is not None else RUN_STAGES
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stages[name] = stages.get(name, 0.0) + time.perf_counter() - start
+
+def count(name, amount=1):
+    """
+    Adds an amount to a counter of the PDF that is currently searched in this process.
+
+    Args:
+        name (str): The name of the counter.
+        amount (int): The amount that is added.
+    """
+    if CURRENT_DOCUMENT is not None:
+        CURRENT_DOCUMENT.counters[name] = CURRENT_DOCUMENT.counters.get(name, 0) + amount
+
+def percentile(values, fraction):
+    """
+    Calculates a percentile of a list of values by linear interpolation between the two closest values.
+
+    Args:
+        values (list): The values.
+        fraction (float): The percentile as fraction, e.g. 0.95 for the 95th percentile.
+
+    Returns:
+        float: The percentile or 0.0 if there are no values.
+
+    References:
+        - Linear interpolation between closest ranks: https://en.wikipedia.org/wiki/Percentile#The_linear_interpolation_between_closest_ranks_method
+    """
+    if not values:
+        return 0.0
+    values = sorted(values)
+    position = (len(values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+def record_document(metrics):
+    """
+    Stores the measurements of a PDF (which might come from a worker process) for the report of the run.
+
+    Args:
+        metrics (DocumentMetrics): The measurements of the PDF.
+    """
+    RUN_DOCUMENTS.append(metrics)
+
+def reset_run():
+    """
+    Removes all measurements of the run, so that a new run starts with an empty report.
+    """
+    RUN_DOCUMENTS.clear()
+    RUN_STAGES.clear()
+
+# ------------------------------------------------- PROCESSING ------------------------------------------------------- #
+def profile_call(function, args, output_path, profiler='cprofile'):
+    """
+    Calls a function with a profiler and stores the profile in a file, which is used to take a closer look at a single PDF.
+    cProfile writes a '.prof' file that can be opened with 'pstats' or 'snakeviz', pyinstrument writes an '.html' file.
+
+    Args:
+        function (callable): The function to be profiled.
+        args (tuple): The arguments of the function.
+        output_path (str): The path of the profile file without the file extension.
+        profiler (str): 'cprofile' or 'pyinstrument', cProfile is used if pyinstrument is not installed.
+
+    Returns:
+        The return value of the function.
+
+    References:
+        - 'cProfile': https://docs.python.org/3/library/profile.html
+        - 'pyinstrument': https://pyinstrument.readthedocs.io/en/latest/guide.html
+    """
+    if profiler == 'pyinstrument' and pyinstrument is None:
+        logging.error("pyinstrument is not installed, cProfile is used instead")
+        profiler = 'cprofile'
+
+    if profiler == 'pyinstrument':
+        with pyinstrument.Profiler() as profile:
+            result = function(*args)
+        output_file = output_path + '.html'
+        with open(output_file, 'w', encoding='utf-8') as file:
+            file.write(profile.output_html())
+    else:
+        profile = cProfile.Profile()
+        result = profile.runcall(function, *args)
+        output_file = output_path + '.prof'
+        profile.dump_stats(output_file)
+
+    logging.info(f"Stored the profile in '{output_file}'")
+    return result
+
+def build_report():
+    """
+    Summarizes the measurements of all PDFs and of the whole run.
+
+    Returns:
+        dict: The report with the stages and counters of the run summed up over all PDFs and the measurements of every single PDF.
+    """
+    documents = sorted(RUN_DOCUMENTS, key=lambda metrics: metrics.name)
+
+    # Sum up every stage and every counter over all PDFs, the slowest PDF of each stage helps to find outliers
+    stages = {}
+    counters = {}
+    for metrics in documents:
+        for name, seconds in metrics.stages.items():
+            summary = stages.setdefault(name, {'total': 0.0, 'max': 0.0, 'slowest_document': None})
+            summary['total'] += seconds
+            if seconds >= summary['max']:
+                summary['max'] = seconds
+                summary['slowest_document'] = metrics.name
+        for name, amount in metrics.counters.items():
+            counters[name] = counters.get(name, 0) + amount
+
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'documents_total': len(documents),
+        'documents_failed': sum(metrics.status != 'ok' for metrics in documents),
+        'run_stages': dict(RUN_STAGES),
+        'stages': stages,
+        'counters': counters,
+        'documents': [asdict(metrics) for metrics in documents],
+    }
+
+def write_report(report_path):
+    """
+    Writes the report of the run as JSON file.
+
+    Args:
+        report_path (str): The path of the JSON file.
+
+    References:
+        - 'json.dump()': https://docs.python.org/3/library/json.html#json.dump
+    """
+    report_folder = os.path.dirname(report_path)
+    if report_folder:
+        os.makedirs(report_folder, exist_ok=True)
+
+    with open(report_path, 'w', encoding='utf-8') as file:
+        json.dump(build_report(), file, indent=2, ensure_ascii=False)
+
+    logging.info(f"Stored the timing report in '{report_path}'")
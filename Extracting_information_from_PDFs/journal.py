@@ -0,0 +1,126 @@
+"""
+journal.py
+
+This script writes the result of every searched PDF into an append-only journal as soon as the PDF is finished, so that a run which is stopped
+(e.g. after 1,900 of 2,000 PDFs) can be resumed: the PDFs in the journal are not searched again and their results are written into the Excel file
+together with the ones of the remaining PDFs. Every entry is one line of JSON that is written to disk directly, so a stopped run can at most
+leave an incomplete last line, which is ignored.
+
+Author:
+    Jonathan Mattis Wisser
+    jmader@uni-muenster.de
+
+Version:
+    1.0
+Datum:
+    2026-10-17
+"""
+
+__author__ = "Jonathan Mattis Wisser"
+__version__ = "1.0"
+__date__ = "2026-10-17"
+
+# ------------------------------------------------- IMPORTS ---------------------------------------------------------- #
+# 'os' for data management (writing the journal to disk and deleting it)
+import os
+
+# 'json' to store every entry as one line of JSON and 'asdict' to store the fields of the extracted information by their name
+import json
+from dataclasses import asdict
+
+# Logging for a better understanding of the results and outputs as set up in the main module
+# Logging.info() and logging.error() are used here
+# https://docs.python.org/3/library/logging.html#logging.INFO
+# https://docs.python.org/3/library/logging.html#logging.error
+import logging
+
+# ------------------------------------------------- PROCESSING ------------------------------------------------------- #
+def read_journal(journal_path, rules_version):
+    """
+    Reads the results of all PDFs that were finished in a previous run from the journal.
+    Lines that are incomplete (because the run was stopped while writing them) or that were written with other extraction rules are ignored.
+
+    Args:
+        journal_path (str): The path to the journal.
+        rules_version (str): The version of the extraction rules as created by 'pdf_processing'.
+
+    Returns:
+        dict: The stored results as dictionaries of their fields, stored by the absolute file path of each PDF.
+
+    References:
+        - JSON Lines: https://jsonlines.org/
+    """
+    if not os.path.exists(journal_path):
+        return {}
+
+    records = {}
+    with open(journal_path, encoding='utf-8') as file:
+        for line_number, line in enumerate(file, start=1):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                logging.error(f"Ignoring incomplete line {line_number} of the journal '{journal_path}'")
+                continue
+            if entry['rules_version'] == rules_version:
+                records[entry['path']] = entry['record']
+
+    logging.info(f"Found {len(records)} finished PDF(s) in the journal '{journal_path}'")
+    return records
+
+def open_journal(journal_path, resume=False):
+    """
+    Opens the journal for writing. Without resuming, a journal of a previous run is started anew.
+    When resuming, new entries are appended, starting in a new line if the previous run was stopped in the middle of a line.
+
+    Args:
+        journal_path (str): The path to the journal.
+        resume (bool): Whether the entries of the previous run are kept.
+
+    Returns:
+        file: The journal opened for appending.
+    """
+    journal_folder = os.path.dirname(journal_path)
+    if journal_folder:
+        os.makedirs(journal_folder, exist_ok=True)
+
+    # Check whether the last line of the previous run is complete
+    ends_with_line_break = True
+    if resume and os.path.exists(journal_path) and os.path.getsize(journal_path) > 0:
+        with open(journal_path, 'rb') as file:
+            file.seek(-1, os.SEEK_END)
+            ends_with_line_break = file.read(1) == b'\n'
+
+    journal = open(journal_path, 'a' if resume else 'w', encoding='utf-8')
+    if not ends_with_line_break:
+        journal.write('\n')
+    return journal
+
+def append_to_journal(journal, pdf_file, rules_version, record):
+    """
+    Appends the result of a PDF to the journal and makes sure it is written to disk before the next PDF is handled.
+    The entry is written with a single write call, so that it is either complete or only leaves an incomplete last line.
+
+    Args:
+        journal (file): The journal as opened by open_journal().
+        pdf_file (str): The full file path to the PDF file.
+        rules_version (str): The version of the extraction rules as created by 'pdf_processing'.
+        record (ExtractionResult): The extracted information of the PDF.
+
+    References:
+        - 'os.fsync()': https://docs.python.org/3/library/os.html#os.fsync
+    """
+    journal.write(json.dumps({'path': os.path.abspath(pdf_file), 'rules_version': rules_version, 'record': asdict(record)}, ensure_ascii=False) + '\n')
+    journal.flush()
+    os.fsync(journal.fileno())
+
+def remove_journal(journal_path):
+    """
+    Deletes the journal after all results were stored in the Excel file, so that the next run starts anew.
+
+    Args:
+        journal_path (str): The path to the journal.
+    """
+    try:
+        os.remove(journal_path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,138 @@
+"""
+keyword_search.py
+
+This script searches a whole list of keywords at once in the lines of a PDF, so that 'pdf_processing' only needs to go over a text once
+instead of once for every single keyword. Upper and lower case is ignored and keywords are only found as whole words,
+exactly like with the RegEx pattern r'\b' + re.escape(keyword) + r'\b' and re.IGNORECASE.
+
+Author:
+    Jonathan Mattis Wisser
+    jmader@uni-muenster.de
+
+Version:
+    1.0
+Datum:
+    2026-10-17
+"""
+
+__author__ = "Jonathan Mattis Wisser"
+__version__ = "1.0"
+__date__ = "2026-10-17"
+
+# ------------------------------------------------- IMPORTS ---------------------------------------------------------- #
+# 'Regex' for the combined pattern of all keywords
+import re
+
+# ------------------------------------------------- UTILITY ---------------------------------------------------------- #
+def fold(keyword):
+    """
+    Converts a keyword into the form in which it is compared and returned by find_keyword_hits(), so that upper and lower case do not matter.
+
+    Args:
+        keyword (str): The keyword as it is written in the keyword list.
+
+    Returns:
+        str: The keyword without upper and lower case differences.
+
+    References:
+        - 'str.casefold()': https://docs.python.org/3/library/stdtypes.html#str.casefold
+    """
+    return keyword.casefold()
+
+def is_word_character(text, position):
+    """
+    Checks whether the character at a position of a text is a word character in the sense of the RegEx '\\w',
+    positions outside the text count as non-word characters.
+
+    Args:
+        text (str): The text that is checked.
+        position (int): The position of the character in the text.
+
+    Returns:
+        bool: True if the character is a letter, a digit or an underscore, False otherwise.
+    """
+    if position < 0 or position >= len(text):
+        return False
+    character = text[position]
+    return character.isalnum() or character == '_'
+
+def is_word_boundary(text, position):
+    """
+    Checks whether there is a word boundary in the sense of the RegEx '\\b' in front of a position of a text.
+
+    Args:
+        text (str): The text that is checked.
+        position (int): The position in the text.
+
+    Returns:
+        bool: True if exactly one of the characters in front of and at this position is a word character.
+
+    References:
+        - '\\b' in Python RegEx: https://docs.python.org/3/library/re.html#index-26
+    """
+    return is_word_character(text, position - 1) != is_word_character(text, position)
+
+# ------------------------------------------------- PROCESSING ------------------------------------------------------- #
+def build_keyword_matcher(keywords):
+    """
+    Builds the matcher for a list of keywords, which is done only once, so that it can be used for every PDF afterward.
+    The matcher consists of one combined RegEx pattern of all keywords, which is tested at every position of a line in a single pass.
+    Because a RegEx alternation only returns one keyword per position, the longest keywords are tried first and all shorter keywords that are
+    the beginning of a longer one (e.g. 'drought' of 'drought conditions') are stored, so they can be checked additionally.
+
+    Args:
+        keywords (list): The keywords to be searched for.
+
+    Returns:
+        tuple: The combined pattern of all keywords and a dictionary with the shorter keywords that start each keyword.
+
+    References:
+        - 're.escape()': https://docs.python.org/3/library/re.html#re.escape
+        - Finding overlapping matches with a lookahead: https://stackoverflow.com/a/5616910
+    """
+    # Every keyword only once and in the form in which it is compared, sorted from the longest to the shortest one
+    folded_keywords = sorted({fold(keyword) for keyword in keywords}, key=len, reverse=True)
+
+    # The lookahead allows finding keywords at every position, even if they overlap with another keyword found before
+    pattern = re.compile(r'(?=\b(' + '|'.join(map(re.escape, folded_keywords)) + r')\b)', re.IGNORECASE)
+
+    # For every keyword, store all other keywords which are at its beginning
+    prefixes = {keyword: [other_keyword for other_keyword in folded_keywords
+                          if len(other_keyword) < len(keyword) and keyword.startswith(other_keyword)]
+                for keyword in folded_keywords}
+
+    return pattern, prefixes
+
+def find_keyword_hits(matcher, lines):
+    """
+    Finds every occurrence of all keywords of a matcher in the given lines in one pass over each line.
+
+    Args:
+        matcher (tuple): The matcher built by build_keyword_matcher().
+        lines (list): A list of text lines in which the keywords are searched for.
+
+    Returns:
+        list: A list of tuples (line number, keyword) in the order in which the keywords occur in the text,
+              the keywords are returned in the form of fold().
+
+    References:
+        - 'Pattern.finditer()': https://docs.python.org/3/library/re.html#re.Pattern.finditer
+    """
+    pattern, prefixes = matcher
+
+    hits = []
+    for line_number, line in enumerate(lines):
+        for match in pattern.finditer(line):
+            start = match.start()
+            keyword = fold(match.group(1))
+            # In rare cases the upper and lower case rules of RegEx and casefold() differ, then the keyword is looked up by the pattern itself
+            if keyword not in prefixes:
+                keyword = next(other_keyword for other_keyword in prefixes
+                               if re.fullmatch(re.escape(other_keyword), match.group(1), re.IGNORECASE))
+            hits.append((line_number, keyword))
+            # Shorter keywords at the beginning of the found keyword are also found, if they end at a word boundary
+            for prefix in prefixes[keyword]:
+                if is_word_boundary(line, start + len(prefix)):
+                    hits.append((line_number, prefix))
+
+    return hits
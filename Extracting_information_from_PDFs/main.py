@@ -24,9 +24,18 @@ import os
 # To show the extracted data, the logging library is imported here
 import logging
 
+# 'argparse' to read the optional command line arguments (e.g. the number of worker processes)
+import argparse
+
 # Loading the other modules for extracting information and storing them in the Excel file
-from pdf_processing import process_extraction_results
-from excel_processing import update_excel_with_extracted_data
+from pdf_processing import iter_extraction_results, TextExtractionOptions
+from excel_processing import merge_staging_into_excel, read_existing_papers
+from export import create_sink, export_results, ExcelSink, EXPORT_BATCH_SIZE
+from text_cache import invalidate_cache
+from journal import remove_journal
+from watcher import watch_folder, FLUSH_INTERVAL, SETTLE_SECONDS, POLL_INTERVAL
+from service import run_service, SERVICE_HOST, SERVICE_PORT, QUEUE_SIZE
+import instrumentation
 
 # ------------------------------------------------- SET-UPS ---------------------------------------------------------- #
 # Setting up logging for information, specifying the time (asctime), the type of log output (levelname) and of course the message to be output (message).
@@ -44,18 +53,155 @@ FOLDER_PATH = os.getenv('FOLDER_PATH', './data/Example_studies')
 # Local: r'D:\Uni\Bachelorarbeit\Bachelor-thesis\Extracting_information_from_PDFs\data\Example.xlsx'
 EXCEL_PATH =  os.getenv('EXCEL_PATH', './data/Example.xlsx')
 
+# Number of processes used to search the PDFs in parallel, 1 means that the PDFs are searched one after another
+# Docker: os.getenv('WORKERS', 1), can be overwritten by the command line argument '--workers N'
+WORKERS = int(os.getenv('WORKERS', 1))
+
+# Path to the folder of the text cache, which stores the cleaned lines of already searched PDFs, so that they do not need to be parsed again
+# Docker: os.getenv('CACHE_PATH', './data/text_cache')
+CACHE_PATH = os.getenv('CACHE_PATH', './data/text_cache')
+
+# Maximum size of the text cache in megabytes, if it gets bigger the least recently used PDFs are removed from it
+CACHE_MAX_MB = int(os.getenv('CACHE_MAX_MB', 500))
+
+# Maximum time in seconds and maximum memory in megabytes a single PDF may take, 0 means no limit
+# If one of them is set, every PDF is searched in its own process, and a PDF that exceeds a limit is stored with the reason instead of its results
+# Docker: os.getenv('PDF_TIMEOUT', 0) and os.getenv('PDF_MAX_MEMORY_MB', 0), can be overwritten by '--timeout S' and '--max-memory MB'
+PDF_TIMEOUT = float(os.getenv('PDF_TIMEOUT', 0))
+PDF_MAX_MEMORY_MB = int(os.getenv('PDF_MAX_MEMORY_MB', 0))
+
+# Path to the JSON report with the time of every stage and the counted lines, bytes, matches and RegEx calls of every PDF
+# Docker: os.getenv('METRICS_PATH', './data/extraction_metrics.json')
+METRICS_PATH = os.getenv('METRICS_PATH', './data/extraction_metrics.json')
+
+# Path to the staging file, into which the row of every PDF is written as soon as it is finished, before all rows are added to the Excel file at once
+# Docker: os.getenv('STAGING_PATH', './data/extraction_staging.jsonl')
+STAGING_PATH = os.getenv('STAGING_PATH', './data/extraction_staging.jsonl')
+
+# Path to the manifest of all searched PDFs and their results, which is used to search only new or changed PDFs
+# Docker: os.getenv('MANIFEST_PATH', './data/extraction_manifest.sqlite')
+MANIFEST_PATH = os.getenv('MANIFEST_PATH', './data/extraction_manifest.sqlite')
+
+# Path to the journal, into which the result of every PDF is written as soon as it is finished, so that a stopped run can be resumed with '--resume'
+# Docker: os.getenv('JOURNAL_PATH', './data/extraction_journal.jsonl')
+JOURNAL_PATH = os.getenv('JOURNAL_PATH', './data/extraction_journal.jsonl')
+
+# Additional outputs of the extracted information next to the Excel file, separated by commas, e.g. './data/results.parquet,./data/results.csv'
+# The format is chosen by the file extension: '.parquet', '.feather', '.arrow', '.csv' or '.jsonl'
+# Docker: os.getenv('EXPORT_PATHS', ''), can be extended by the command line argument '--export PATH'
+EXPORT_PATHS = [path for path in os.getenv('EXPORT_PATHS', '').split(',') if path]
+
+# Whether the folder of the PDFs is watched as a service, which searches every new PDF and writes the results every 'WATCH_FLUSH_INTERVAL' seconds
+# Docker: os.getenv('WATCH', '0') == '1', can also be set by the command line argument '--watch'
+WATCH = os.getenv('WATCH', '0') == '1'
+WATCH_FLUSH_INTERVAL = float(os.getenv('WATCH_FLUSH_INTERVAL', FLUSH_INTERVAL))
+
+# Address of the local HTTP service started with '--serve', inside the Docker container it has to listen on '0.0.0.0' to be reachable from outside
+# Docker: the Dockerfile sets SERVICE_HOST=0.0.0.0, locally the service only listens on 127.0.0.1 unless '--host' is given
+SERVICE_HOST = os.getenv('SERVICE_HOST', SERVICE_HOST)
+SERVICE_PORT = int(os.getenv('SERVICE_PORT', SERVICE_PORT))
+
+# Command line arguments, which overwrite the set-ups above if given
+# https://docs.python.org/3/library/argparse.html
+parser = argparse.ArgumentParser(description="Automated information retrieval from scientific PDFs into an Excel file")
+parser.add_argument('--workers', type=int, default=WORKERS, help="Number of processes used to search the PDFs in parallel (default: %(default)s)")
+parser.add_argument('--cache-dir', default=CACHE_PATH, help="Folder of the text cache (default: %(default)s)")
+parser.add_argument('--cache-max-mb', type=int, default=CACHE_MAX_MB, help="Maximum size of the text cache in megabytes (default: %(default)s)")
+parser.add_argument('--no-cache', action='store_true', help="Parse every PDF again without reading or writing the text cache")
+parser.add_argument('--stream', action='store_true', help="Parse the PDFs page by page instead of extracting the text of a whole PDF as one string (gives the same lines)")
+parser.add_argument('--timeout', type=float, default=PDF_TIMEOUT, help="Maximum time in seconds for a single PDF, 0 for no limit (default: %(default)s)")
+parser.add_argument('--max-memory', type=int, default=PDF_MAX_MEMORY_MB, help="Maximum memory in megabytes for a single PDF, 0 for no limit (default: %(default)s)")
+parser.add_argument('--metrics', default=METRICS_PATH, help="Path of the JSON report with the timing of every stage (default: %(default)s)")
+parser.add_argument('--profile-document', metavar='NAME', help="File name (without .pdf) of a PDF which is searched with a profiler, the profile is stored next to the report")
+parser.add_argument('--profiler', choices=['cprofile', 'pyinstrument'], default='cprofile', help="Profiler used for '--profile-document' (default: %(default)s)")
+parser.add_argument('--staging', action='store_true', help="Write the row of every PDF into the staging file as soon as it is finished and add all rows to the Excel file at the end")
+parser.add_argument('--staging-path', default=STAGING_PATH, help="Path of the staging file (default: %(default)s)")
+parser.add_argument('--merge-staging', action='store_true', help="Only add the rows of an existing staging file (e.g. of a stopped run) to the Excel file and exit")
+parser.add_argument('--upsert', action='store_true', help="Update the rows of papers which are already stored in the Excel file instead of adding them again")
+parser.add_argument('--skip-existing', action='store_true', help="Do not search PDFs whose papers are already stored in the Excel file")
+parser.add_argument('--incremental', action='store_true', help="Only search new or changed PDFs and reuse the stored results of all others from the manifest for the exports, only the searched PDFs are written into the Excel file (combine with --upsert to update the rows of changed PDFs)")
+parser.add_argument('--manifest-path', default=MANIFEST_PATH, help="Path of the manifest of the searched PDFs (default: %(default)s)")
+parser.add_argument('--resume', action='store_true', help="Resume a stopped run: PDFs in the journal are not searched again, but their results are written into the Excel file")
+parser.add_argument('--journal-path', default=JOURNAL_PATH, help="Path of the journal of the finished PDFs (default: %(default)s)")
+parser.add_argument('--export', action='append', default=list(EXPORT_PATHS), metavar='PATH', help="Additionally write the results into a Parquet, Feather, CSV or JSON Lines file, can be given several times")
+parser.add_argument('--export-batch-size', type=int, default=EXPORT_BATCH_SIZE, help="Number of PDFs written at once into a Parquet or Feather file (default: %(default)s)")
+parser.add_argument('--no-excel', action='store_true', help="Do not write the results into the Excel file, only into the files given with '--export'")
+parser.add_argument('--watch', action='store_true', default=WATCH, help="Keep running and search every PDF that is added to the folder, until the service is stopped")
+parser.add_argument('--flush-interval', type=float, default=WATCH_FLUSH_INTERVAL, help="With '--watch', seconds between two writes of the results (default: %(default)s)")
+parser.add_argument('--settle-seconds', type=float, default=SETTLE_SECONDS, help="With '--watch', seconds a new PDF must not change before it is searched (default: %(default)s)")
+parser.add_argument('--poll-interval', type=float, default=POLL_INTERVAL, help="With '--watch', maximum seconds between two looks at the folder (default: %(default)s)")
+parser.add_argument('--serve', action='store_true', help="Start the local HTTP service, which searches PDFs on request ('/extract', '/batch', '/metrics')")
+parser.add_argument('--host', default=SERVICE_HOST, help="With '--serve', address the service listens on (default: %(default)s)")
+parser.add_argument('--port', type=int, default=SERVICE_PORT, help="With '--serve', port the service listens on (default: %(default)s)")
+parser.add_argument('--queue-size', type=int, default=QUEUE_SIZE, help="With '--serve', number of PDFs which may wait for a worker before requests are rejected (default: %(default)s)")
+parser.add_argument('--invalidate-cache', nargs='*', metavar='PDF', help="Remove the cached text of the given PDFs (or of all PDFs if none are given) and exit")
+
 # ------------------------------------------------- EXECUTION -------------------------------------------------------- #
-# Looking up if there are PDF files in the given folder 'folder_path'
-pdf_files = [filename for filename in os.listdir(FOLDER_PATH) if filename.endswith('.pdf')]
+# The execution is only started when this script is run directly, because the worker processes import this module again on some operating systems
+# https://docs.python.org/3/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    # Only clear the text cache, if this was requested, and do not search any PDFs
+    if args.invalidate_cache is not None:
+        invalidate_cache(args.cache_dir, args.invalidate_cache)
+        raise SystemExit
+
+    # Only add the rows of the staging file to the Excel file, if this was requested, and do not search any PDFs
+    if args.merge_staging:
+        merge_staging_into_excel(EXCEL_PATH, args.staging_path, upsert=args.upsert)
+        raise SystemExit
+
+    # Options how the text of the PDFs is extracted (text cache and streaming page by page)
+    options = TextExtractionOptions(cache_dir=None if args.no_cache else args.cache_dir,
+                                    cache_max_size=args.cache_max_mb * 1024 * 1024,
+                                    stream=args.stream,
+                                    profile_document=args.profile_document,
+                                    profiler=args.profiler,
+                                    profile_dir=os.path.dirname(args.metrics) or '.')
+
+    # As a service, the folder is watched until the service is stopped, also if it does not contain any PDFs yet
+    if args.watch:
+        watch_folder(FOLDER_PATH, EXCEL_PATH, args.workers, options, staging_path=args.staging_path if args.staging else None,
+                     journal_path=args.journal_path, metrics_path=args.metrics,
+                     export_sinks=[create_sink(path, args.export_batch_size) for path in args.export],
+                     flush_interval=args.flush_interval, settle_seconds=args.settle_seconds, poll_interval=args.poll_interval)
+        raise SystemExit
+
+    # As HTTP service, PDFs are only searched when they are requested
+    if args.serve:
+        run_service(FOLDER_PATH, args.workers, options, host=args.host, port=args.port, queue_size=args.queue_size)
+        raise SystemExit
+
+    # Looking up if there are PDF files in the given folder 'folder_path'
+    pdf_files = [filename for filename in os.listdir(FOLDER_PATH) if filename.endswith('.pdf')]
+
+    # For the case that no PDF files found in 'folder_path', this gets logged and the process will not continue!
+    if not pdf_files:
+        logging.error(f" 'No searchable PDFs found in: {FOLDER_PATH}'")
+
+    # When there is at least one PDF, continue normally with the execution
+    else:
+        # Limits for every PDF and which PDFs are searched (all, all except the ones already stored in the Excel file, or only new and changed ones)
+        # Every finished PDF is written into the journal, so that a stopped run can be resumed
+        run_settings = {'timeout': args.timeout or None, 'max_memory': args.max_memory * 1024 * 1024 or None,
+                        'skip_basenames': read_existing_papers(EXCEL_PATH) if args.skip_existing else None,
+                        'manifest_path': args.manifest_path if args.incremental else None,
+                        'journal_path': args.journal_path, 'resume': args.resume}
+
+        # All outputs are filled from the same results while the PDFs are searched: the additional exports and the Excel file
+        # With a staging file, the row of every PDF is stored as soon as it is finished, and all rows are added to the Excel file at the end
+        sinks = [create_sink(path, args.export_batch_size) for path in args.export]
+        if not args.no_excel:
+            sinks.append(ExcelSink(EXCEL_PATH, upsert=args.upsert, staging_path=args.staging_path if args.staging else None))
 
-# For the case that no PDF files found in 'folder_path', this gets logged and the process will not continue!
-if not pdf_files:
-    logging.error(f" 'No searchable PDFs found in: {FOLDER_PATH}'")
+        # Search the PDFs with the iter_extraction_results() function from the pdf_processing module and write every result into all outputs
+        with instrumentation.stage('pdf_processing'):
+            outputs_written = export_results(iter_extraction_results(FOLDER_PATH, args.workers, options, **run_settings), sinks)
 
-# When there is at least one PDF, continue normally with the execution
-else:
-    # Use the process_extraction_results() function from the pdf_processing module toe extract the relevant data
-    extracted_data = process_extraction_results(FOLDER_PATH)
+        # The journal is only needed until all results are stored in the Excel file and the other outputs
+        if outputs_written:
+            remove_journal(args.journal_path)
 
-    # Fill in the information into the Excel file using the update_excel_with_extracted_data() function of the excel_processing module
-    update_excel_with_extracted_data(EXCEL_PATH, extracted_data)
+        # Write the time of every stage and the counters of every PDF into the JSON report
+        instrumentation.write_report(args.metrics)
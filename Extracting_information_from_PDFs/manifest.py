@@ -0,0 +1,175 @@
+"""
+manifest.py
+
+This script keeps a manifest of all searched PDFs in an SQLite database, with the path, size, modification time and content hash of every PDF,
+the version of the extraction rules and the extracted information. With it, 'pdf_processing' only needs to search PDFs that were added or changed
+since the last run (or whose results would be different with the current extraction rules) and can reuse the stored results for all others.
+
+Author:
+    Jonathan Mattis Wisser
+    jmader@uni-muenster.de
+
+Version:
+    1.0
+Datum:
+    2026-10-17
+"""
+
+__author__ = "Jonathan Mattis Wisser"
+__version__ = "1.0"
+__date__ = "2026-10-17"
+
+# ------------------------------------------------- IMPORTS ---------------------------------------------------------- #
+# 'os' for data management (reading the size and modification time of the PDFs)
+import os
+
+# 'sqlite3' for the manifest itself and 'json' to store the extracted information in it
+import sqlite3
+import json
+
+# 'asdict' to store the fields of the extracted information by their name
+from dataclasses import asdict
+
+# 'datetime' to store when a PDF was searched
+from datetime import datetime
+
+# The content hash of a PDF is calculated the same way as for the text cache
+from text_cache import hash_file
+
+# Logging for a better understanding of the results and outputs as set up in the main module
+# Logging.info() and logging.error() are used here
+# https://docs.python.org/3/library/logging.html#logging.INFO
+# https://docs.python.org/3/library/logging.html#logging.error
+import logging
+
+# ------------------------------------------------- SET-UPS ---------------------------------------------------------- #
+# Table of the manifest with one row for every searched PDF
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS documents (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    rules_version TEXT NOT NULL,
+    record TEXT NOT NULL,
+    searched TEXT NOT NULL
+)
+"""
+
+# ------------------------------------------------- UTILITY ---------------------------------------------------------- #
+def open_manifest(manifest_path):
+    """
+    Opens the manifest and creates it (and its folder), if it does not exist yet.
+
+    Args:
+        manifest_path (str): The path to the SQLite file of the manifest.
+
+    Returns:
+        sqlite3.Connection: The connection to the manifest.
+
+    References:
+        - 'sqlite3': https://docs.python.org/3/library/sqlite3.html
+    """
+    manifest_folder = os.path.dirname(manifest_path)
+    if manifest_folder:
+        os.makedirs(manifest_folder, exist_ok=True)
+
+    connection = sqlite3.connect(manifest_path)
+    connection.execute(CREATE_TABLE)
+    connection.commit()
+    return connection
+
+def file_state(pdf_file):
+    """
+    Reads the size and the modification time of a file, which change whenever the file is changed.
+
+    Args:
+        pdf_file (str): The full file path to the PDF file.
+
+    Returns:
+        tuple: The size in bytes and the modification time in nanoseconds.
+
+    References:
+        - 'os.stat()': https://docs.python.org/3/library/os.html#os.stat
+    """
+    stat = os.stat(pdf_file)
+    return stat.st_size, stat.st_mtime_ns
+
+def manifest_key(pdf_file):
+    """
+    Creates the key of a PDF in the manifest, which is its absolute path, so that the same PDF is found no matter how the folder was given.
+
+    Args:
+        pdf_file (str): The file path to the PDF file.
+
+    Returns:
+        str: The absolute file path.
+    """
+    return os.path.abspath(pdf_file)
+
+# ------------------------------------------------- PROCESSING ------------------------------------------------------- #
+def find_stored_records(connection, pdf_files, rules_version):
+    """
+    Compares the PDFs of the folder with the manifest and returns the stored results of all PDFs that do not need to be searched again.
+    A PDF is searched again, if it is new, if it was searched with other extraction rules or if its content changed.
+    If only the modification time changed (e.g. because the PDF was copied), the content hash decides and the manifest is updated.
+    PDFs that are stored in the manifest but do not exist anymore are removed from it.
+
+    Args:
+        connection (sqlite3.Connection): The connection to the manifest.
+        pdf_files (list): The full file paths to all PDF files of the folder.
+        rules_version (str): The version of the extraction rules as created by 'pdf_processing'.
+
+    Returns:
+        dict: The stored results of the unchanged PDFs as dictionaries of their fields, stored by the file path of each PDF.
+    """
+    rows = {path: (size, mtime_ns, content_hash, stored_rules_version, record)
+            for path, size, mtime_ns, content_hash, stored_rules_version, record
+            in connection.execute("SELECT path, size, mtime_ns, content_hash, rules_version, record FROM documents")}
+
+    stored_records = {}
+    for pdf_file in pdf_files:
+        row = rows.pop(manifest_key(pdf_file), None)
+        if row is None:
+            continue
+        size, mtime_ns, content_hash, stored_rules_version, record = row
+        if stored_rules_version != rules_version:
+            continue
+
+        current_size, current_mtime_ns = file_state(pdf_file)
+        if (current_size, current_mtime_ns) != (size, mtime_ns):
+            # With another size the content has changed for sure, otherwise only the content hash can tell
+            if current_size != size or hash_file(pdf_file) != content_hash:
+                continue
+            connection.execute("UPDATE documents SET mtime_ns = ? WHERE path = ?", (current_mtime_ns, manifest_key(pdf_file)))
+
+        stored_records[pdf_file] = json.loads(record)
+
+    # Remaining rows belong to PDFs of other folders or to PDFs that were deleted or moved, only the latter are removed
+    missing_paths = [path for path in rows if not os.path.exists(path)]
+    if missing_paths:
+        connection.executemany("DELETE FROM documents WHERE path = ?", [(path,) for path in missing_paths])
+        logging.info(f"Removed {len(missing_paths)} PDF(s) from the manifest which do not exist anymore")
+
+    connection.commit()
+    return stored_records
+
+def store_record(connection, pdf_file, rules_version, record):
+    """
+    Stores the extracted information of a PDF in the manifest, together with everything needed to notice when the PDF changes.
+    Every PDF is committed on its own, so that the manifest stays usable if the run is stopped.
+
+    Args:
+        connection (sqlite3.Connection): The connection to the manifest.
+        pdf_file (str): The full file path to the PDF file.
+        rules_version (str): The version of the extraction rules as created by 'pdf_processing'.
+        record (ExtractionResult): The extracted information of the PDF.
+
+    References:
+        - 'INSERT OR REPLACE': https://www.sqlite.org/lang_insert.html
+    """
+    size, mtime_ns = file_state(pdf_file)
+    connection.execute("INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       (manifest_key(pdf_file), size, mtime_ns, hash_file(pdf_file), rules_version,
+                        json.dumps(asdict(record), ensure_ascii=False), datetime.now().isoformat(timespec='seconds')))
+    connection.commit()
@@ -24,8 +24,55 @@ import os
 # 'Regex' for implementing the search patterns (pattern)
 import re
 
+# Process pool to search several PDFs at the same time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# 'multiprocessing' and 'time' to search single PDFs in their own process, which is stopped when it takes too long
+import multiprocessing
+from multiprocessing.connection import wait
+import time
+
+# 'resource' to limit the memory of these processes, it only exists on Unix systems (e.g. inside the Docker container)
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# 'hashlib' to create the fingerprint of the text extraction for the text cache
+import hashlib
+
+# 'StringIO' to collect the text of each page while streaming a PDF page by page
+from io import StringIO
+
+# 'dataclass' for the options of the text extraction, which are passed on to the worker processes, and for the extracted information of a PDF
+from dataclasses import dataclass, field
+
 # PDFMiner to extract the texts from the PDFs
+import pdfminer
 from pdfminer.high_level import extract_text
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+
+# Cache for the cleaned lines of already searched PDFs
+import text_cache
+
+# Manifest of the already searched PDFs and their results, for searching only new or changed PDFs
+import manifest
+
+# Journal of the PDFs finished in the current run, for resuming a stopped run
+import journal
+
+# Searching many keywords at once in a single pass over the text
+from keyword_search import build_keyword_matcher, fold
+
+# Preparing the lines of a PDF once for all search functions
+from document_model import build_document
+
+# Timers and counters for every stage of the extraction of a PDF
+import instrumentation
 
 # Logging for a better understanding of the results and outputs as set up in the main module
 # Logging.info() and logging.error() are used here
@@ -33,6 +80,322 @@ from pdfminer.high_level import extract_text
 # https://docs.python.org/3/library/logging.html#logging.error
 import logging
 
+# ------------------------------------------------- SET-UPS ---------------------------------------------------------- #
+# Rules for replacing special characters, given as pairs of RegEx pattern and replacement, which are applied in this order
+# Replace '(cid:6)', '(cid:57)', '(cid:5)' and '¢' with "′" as well as all other special 'cid' characters with '°'
+CLEANING_RULES = [
+    (r'\(cid:6\)', '′'),
+    (r'\(cid:57\)', '′'),
+    (r'\(cid:5\)', '′'),
+    (r'\(cid:\d+\)', '°'),
+    (r'¢', '′'),
+]
+
+# RegEx pattern to divide the cleaned text of a PDF into lines
+LINE_SPLIT_PATTERN = r'\n+'
+
+# Fingerprint of everything that changes the cleaned lines of a PDF (the pdfminer version, the cleaning rules and the line splitting),
+# so that the text cache is not used anymore as soon as one of them changes
+# https://docs.python.org/3/library/hashlib.html
+TEXT_EXTRACTION_FINGERPRINT = hashlib.sha256(
+    repr((pdfminer.__version__, CLEANING_RULES, LINE_SPLIT_PATTERN)).encode('utf-8')
+).hexdigest()[:16]
+
+@dataclass
+class TextExtractionOptions:
+    """
+    The options how the text of the PDFs is extracted, which are given from the main module to every (worker) process.
+
+    Attributes:
+        cache_dir (str or None): The folder of the text cache, None if the text cache is not used.
+        cache_max_size (int): The maximum size of the text cache in bytes.
+        stream (bool): Whether the PDFs are parsed page by page, so that the raw text of a whole PDF is never stored as one string (the lines are the same).
+        profile_document (str or None): The file name (without .pdf) of a PDF which is searched with a profiler, None for no profiling.
+        profiler (str): The profiler used for 'profile_document', 'cprofile' or 'pyinstrument'.
+        profile_dir (str): The folder in which the profile of 'profile_document' is stored.
+    """
+    cache_dir: str = None
+    cache_max_size: int = 0
+    stream: bool = False
+    profile_document: str = None
+    profiler: str = 'cprofile'
+    profile_dir: str = '.'
+
+@dataclass(slots=True)
+class ExtractionResult:
+    """
+    The extracted information of a single PDF, which is given to the 'excel_processing' module and stored in the manifest and the journal.
+    Only the joined strings and short lists of the found information are kept, the text of the PDF itself is not part of it.
+
+    Attributes:
+        pdf_basename (str): The file name of the PDF without the file extension (.pdf).
+        coordinates (str): The valid coordinates or 'No coordinates found/given' if there were no coordinates found or given.
+        context_lines (str): The context lines of the coordinates, or of the study sites if no valid coordinates were found,
+                             a placeholder '' if neither were found, or the reason why the PDF could not be searched.
+        drought_characterization (str or None): The context lines of the found drought keywords.
+        drought_characterization_keywords (list or None): The found keywords how drought was characterized.
+        study_type (str or None): The approach to study drought of a study.
+        analyzed_years (list): The general years analyzed by a study.
+        periods_with_drought (list): Time periods were a study characterized drought.
+        single_years_with_drought (list): Year(s) were a study characterized drought.
+        failure_reason (str or None): Why the PDF could not be searched (e.g. an exceeded time limit), None if it was searched.
+
+    References:
+        - 'slots': https://docs.python.org/3/library/dataclasses.html#dataclasses.dataclass
+    """
+    pdf_basename: str
+    coordinates: str = 'No coordinates found/given'
+    context_lines: str = ''
+    drought_characterization: str = None
+    drought_characterization_keywords: list = None
+    study_type: str = None
+    analyzed_years: list = field(default_factory=list)
+    periods_with_drought: list = field(default_factory=list)
+    single_years_with_drought: list = field(default_factory=list)
+    failure_reason: str = None
+
+@dataclass(slots=True)
+class StoredExtractionResult(ExtractionResult):
+    """
+    The extracted information of an unchanged PDF, which was not searched again but reused from the manifest by iter_extraction_results().
+    Its row is already stored in the Excel file (and may have been corrected by hand there), so it is only written into the exports
+    that are created anew in every run.
+    """
+
+# Modules whose code decides which information is extracted from the cleaned lines of a PDF
+EXTRACTION_RULES_MODULES = ['pdf_processing.py', 'document_model.py', 'keyword_search.py']
+
+def extraction_rules_version(options=None):
+    """
+    Creates the version of the extraction rules, which changes as soon as the code of the search functions or the text extraction does.
+    Results stored in the manifest with another version are not reused.
+
+    Args:
+        options (TextExtractionOptions or None): The options of the text extraction, which are part of the version if they change the results
+                                                 (none of the current options does, streaming gives the same lines as the complete text).
+
+    Returns:
+        str: The version as hexadecimal hash.
+
+    References:
+        - 'hashlib.sha256()': https://docs.python.org/3/library/hashlib.html
+    """
+    rules_hash = hashlib.sha256(TEXT_EXTRACTION_FINGERPRINT.encode('utf-8'))
+    for module in EXTRACTION_RULES_MODULES:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), module), 'rb') as file:
+            rules_hash.update(file.read())
+    return rules_hash.hexdigest()[:16]
+
+# All RegEx patterns for searching different coordinate formats, each together with the name of the pattern family it belongs to
+COORDINATE_PATTERNS = [
+    # Most of the patterns do not allow coordinates to start with “.” to prevent DOI search entries.
+    # Cardinal points are automatically included in the categorization
+
+    # ------------------- Decimal degree pattern -------------------------------------------
+    # Captures simple decimal coordinates without sign and without cardinal direction
+    # Examples: '123.456789', '32.123456'
+    ('decimal degrees', r'\b(?<!\.)\d{1,3}\.\d{6}\b'),
+
+    # Captures decimal degrees with a degree symbol followed by a cardinal point.
+    # Examples: '123.456° N', '32.1234°E'
+    ('decimal degrees', r'\b(?<!\.)(?!0\.)\d{1,3}\.\d{2,6}[°º◦]?\s*[NSEW](?!-)\b'),
+
+    # Captures contiguous coordinates in decimal form with a possible negative sign and cardinal points, separated by commas.
+    # Examples: '-123.45678 N, -98.76543 E', '-23.4567 S, -45.6789 W'
+    ('decimal degrees', r'\b(?<!\.)[-–−]?(?!0\.)\d{1,3}\.\d+[NS],\s*(?<!\.)[-–−]?(?!0\.)\d{1,3}\.\d+[EW]\b'),
+
+    # Captures coordinates in decimal degree format with degree symbol and cardinal points, each for longitude and latitude.
+    # Examples: '123.4567°N, 89.1234°W', '45.6789°S, 23.4567°E'
+    ('decimal degrees', r'\b(?<!\.)(?!0\.)\d{1,3}\.\d{1,6}[°º◦][NS],\s*(?<!\.)\d{1,3}\.\d{1,6}[°º◦][EW]\b'),
+
+    # Captures coordinates within brackets, separated by commas, in decimal format.
+    # Examples: '(123.456, 78.901)', ‘(-12.345, -67.890)’, '(35.275, -111.721)'
+    ('decimal degrees', r'\(\s*(?<!\.)[-–−]?(?!0\.)\d{1,3}\.\d{3}\s*,\s*(?<!\.)\s*[-–−]?\s*(?!0\.)[\d−]{1,3}\.\d{3}\s*\)'),
+
+    # ------------------- Only [°º◦] pattern-------------------------------------------
+    # Captures simple degrees with a degree symbol and a cardinal point.
+    # Examples: '123° N”, '98° W'
+    ('degrees', r'\b(?<!\.)(?!0{1,2}\b)\d{1,3}[°º◦]\s*[NSEW]\b'),
+
+    # Captures degrees followed by a specific zero in the number
+    # Note: The zeros here are incorrectly converted “°”
+    # Examples: '123°270 N', '98°020 W'
+    ('degrees', r'\b(?<!\.)\d{1,3}[°º◦]\d{1,3}0\s*[NSEW]\b'),
+
+    # Captures two separate degrees, connected by a separator
+    # Examples: '123° - 45° N', '98° - 76° W', '78.5°−82.5°E', '123° - 45° N'
+    # r'\b(?<!\.)\d{1,3}[°º◦]\s*[-–−]*\s*\d{1,3}[°º◦]\s*[NSEW]\b',
+    ('degrees', r'\b(?<!\.)\d{1,3}(?:\.\d+)?[°º◦]\s*[-–−]*\s*\d{1,3}(?:\.\d+)?[°º◦]\s*[NSEW]\b'),
+
+    # Captures coordinates that contain three repeated degrees followed by a cardinal point.
+    # Examples: '123°45°67° N', '98°76°54° W'
+    ('degrees', r'\b(?<!\.)\d{1,3}[°º◦]\d{2}[°º◦]\d{2}[°º◦]\s*[NSEW]\b'),
+
+    # ------------------- Only [°º◦] and [ʹ′'’] pattern-------------------------------------------
+    # Captures ranges of coordinates in degrees and minutes connected by a separator, possibly without specific cardinal points.
+    # Examples: "123°45' N -67°89'", "12°34' S- 56°78' E"
+    ('degrees and minutes', r"(?<!\.)\d{1,3}[°º◦]\d{1,2}[ʹ′'’]\s*[NSEW]?\s*[-–−]\s*(?<!\.)\d{1,3}[°º◦]\d{1,2}[ʹ′'’]\s*[NSEW]?\b"),
+
+    # Captures coordinates in the form of degrees and minutes separated by commas with cardinal points.
+    # Examples: "52° 12' N, 13°28' E", "12°34', 56 78' W"
+    ('degrees and minutes', r"\b(?<!\.)\d{1,3}[°º◦]?\s*\d{1,3}[ʹ′'’]?\s*[NSEW],\s*\d{1,3}[°º◦]?\s*\d{1,3}[ʹ′'’]?\s*[NSEW]\b"),
+
+    # Captures two complete sets of coordinates, separated by a semicolon.
+    # Examples: "123°045'067 N; 123°045'067 W", "12°034'056 N; 12°034'056 W"
+    ('degrees and minutes', r'\b(?<!\.)\d{1,3}[°º◦]\s*0\d{2}\s*(?<!\.)\d{1,3}[°º◦]\s*0\d{3}\s*[NSEW];\s*(?<!\.)\d{1,3}[°º◦]\s*0\d{3}\s*(?<!\.)\d{1,3}[°º◦]\s*0\d{3}\s*[NSEW]\b'),
+
+    # Captures coordinates in full notation with degree signs, minutes and seconds, optionally followed by a cardinal point.
+    # Examples: "123°45''67' N", "98°76''54' E"
+    ('degrees and minutes', r"\d{1,3}[º°◦]\d{1,2}[ʹ′'’][ʹ′'’]\d{1,2}[ʹ′'’]\s*[N|S|E|W]?"),
+
+    # Captures coordinates in degrees, minutes and seconds, whereby the seconds can contain decimal values.
+    # Note: No word boundary (\b) as coordinates in table
+    # Examples: "123°45'67.89''", "98°76'54.32''"
+    ('degrees and minutes', r"(?<!\.)\d{1,3}[°º◦]\d{1,3}[ʹ′'’]\d{1,3}\.\d{1,3}[ʹ′'’][ʹ′'’]"),
+
+    # Captures coordinates in degrees and minutes, directly followed by a cardinal point.
+    # Examples: "123°456' N", "98°765' W"
+    ('degrees and minutes', r"\b(?<!\.)(?!0\.)\d{1,3}[°º◦]\s*\d{1,3}[ʹ′'’]?\s*[NSEW]\b"),
+
+    # Captures coordinates in the form of degrees, minutes and degree in tables and texts.
+    # Note: No word boundary (\b) as coordinates in table also included
+    # Examples: '123°45'67°E', '98°76'54°'
+    ('degrees and minutes', r'(?<!\.)\d{1,3}[°º◦]\d{2}[´′’\u0027\u2032]\d{2}[°º◦]?[NSEW]?'),
+
+    # ------------------- [°º◦] and (?:′|\u2032|\u0027) and ″ pattern -------------------------------------------
+    # Note: Unicode specifications for symbols must be used here, otherwise there will be a conflict with the Python syntax because of quotation marks
+
+    # Captures coordinates in the form of degrees, minutes and seconds.
+    # Examples: '123°45'67″ N', '12°34'56″ S'
+    ('degrees, minutes and seconds', r'\b(?<!\.)\d{1,3}(?:[°º◦]|\u00B0)?\s*\d{1,3}(?:′|\u2032|\u0027|´)?\s*\d{1,3}(?:\.\d+)?(?:″|\u2033|˝)?\s*[NSEW]\b'),
+
+    # Captures coordinates in the form of degrees, minutes and seconds in tables and texts.
+    # Note: No word boundary (\b) as coordinates in table
+    # Examples: '123°45'67" ', '98°76'54" '
+    ('degrees, minutes and seconds', r'(?<!\.)\d{1,3}[°º◦]\d{2}[´′’\u0027\u2032]\d{2}["”˝]?'),
+
+    # Captures two coordinates in one line, displaying degrees, minutes and seconds with different precision.
+    # Examples: '123°45'67.89″ N - 98°76'54.32″ W', '12°34'56.78″ S - 23°45'67.89″ E'
+    ('degrees, minutes and seconds', r'\b(?<!\.)\d{1,3}(?:[°º◦]|\u00B0)?\d{1,3}(?:′|\u2032|\u0027)?(?!0\.)\d{1,3}\.\d{1,3}(?:″|\u2033)?\s*[NSEW]\s*[-–−]\s*(?<!\.)\d{1,3}(?:[°◦]|\u00B0)?\d{1,3}(?:′|\u2032|\u0027)?(?!0\.)\d{1,3}\.\d{1,3}(?:″|\u2033)?\s*[NSEW]\b'),
+
+    # Captures coordinates in tables in degrees, minutes and seconds, whereby the seconds can have decimal places.
+    # Note: No word boundary (\b) as coordinates in table
+    # Examples: '123°45'67.89" N', '12°34'56.78"S'
+    ('degrees, minutes and seconds', r'(?<!\.)\d{1,3}[°º◦]\s*\d{1,3}[′’\u0027\u2032]\d{1,3}\.\d{1,3}["”]\s*[NSEW]?'),
+
+    # ------------------- Only [ʹ′'’] pattern -------------------------------------------
+    # Captures specific coordinates in minutes, also in tables.
+    # Introduced, because '°' was converted to '0' in some PDFs
+    # Examples: "43010'", "39058'"
+    ('minutes', r"(?<!\.)\d{1,3}0\d{1,3}[ʹ′'’]"),
+
+    # Captures specific coordinates in minutes, also in tables.
+    # Introduced, because '°' was converted to 'o' in some PDFs
+    # Examples: "44o26’N", "121o34’W"
+    ('minutes', r"(?<!\.)\d{1,3}o\d{1,3}[ʹ′'’]s*[NSEW]"),
+
+    # ------------------- Other special case pattern -------------------------------------------
+    # Captures simple details of coordinate ranges, separated by the word 'to'.
+    # Examples: '123 to 130 N'"', '45 to 50 W'
+    ('special cases', r'\b(?<!\.)\d{1,3}\s*to\s*\d{1,3}0\s*[NSEW]\b'),
+
+    # Captures ranges of decimal degrees, separated by the word 'to', with a final cardinal point at the latter coordinate.
+    # Examples: '123.456 to 789.012 N', '45.678 to 123.456 W'
+    ('special cases', r'\b(?<!\.)\d{1,3}\.\d{1,3}\s*to\s*\d{1,3}\.\d{1,3}\s*[NSEW]\b'),
+
+    # Captures ranges of coordinates, separated by a hyphen, followed by a cardinal point.
+    # Examples: '36–528 N', '52–988 W'
+    ('special cases', r'\b(?<!\.)\d{1,3}[-–−]\d{1,3}\s[NSWE]\b'),
+
+    # Captures coordinates in brackets, with 'lat' or 'long' prefix of length 9 to 10.
+    # Note: No word boundary (\b) as coordinates in table
+    # Examples: '(lat 1230230140, long 340450260)'
+    ('special cases', r'\(lat \d{9,10}, long \d{9,10}\)'),
+
+    # Captures very large numerical values as coordinates with subsequent cardinal points.
+    # Note: Due to a wrong conversation of some PDFs the special characters like '°' and "'" are either deleted or numbers
+    # Note: No word boundary (\b) as coordinates in table
+    # Examples: '123456789N', '987654321 W'
+    ('special cases', r'(?<!\.)(?!0\.)\d{9,10}\s*[NSEW]'),
+
+    # Captures coordinates with cardinal points, connected by a semicolon.
+    # Note: The zeros here are incorrectly converted '°'
+    # Examples: '12034 56078 N; 12034 56078 E'
+    ('special cases', r'\b(?<!\.)\d{1,3}\s*0\d{1,3}\s*\d{1,3}\s*0\d{1,3}\s*[NSEW];\s*\d{1,3}\s*0\d{1,3}\*\d{1,3}\s*0\d{1,3}\s*[NSEW]\b'),
+]
+
+# The coordinate patterns compiled once when this module is loaded, so they do not need to be looked up in the RegEx cache for every single line
+# https://docs.python.org/3/library/re.html#re.compile
+COMPILED_COORDINATE_PATTERNS = [(family, re.compile(pattern)) for family, pattern in COORDINATE_PATTERNS]
+
+# All coordinate patterns combined into one pattern, which only tells whether a line contains any coordinate at all
+# This is possible, because none of the patterns uses capturing groups
+COMBINED_COORDINATE_PATTERN = re.compile('|'.join(f'(?:{pattern})' for _, pattern in COORDINATE_PATTERNS))
+
+# Every coordinate pattern needs at least one digit and either a cardinal point, a degree or minute sign, a decimal number or the '(lat ' prefix
+# Lines without these are skipped before any coordinate pattern is applied
+COORDINATE_DIGIT_PATTERN = re.compile(r'\d')
+COORDINATE_PREFILTER_PATTERN = re.compile(r"[NSEW°º◦ʹ′'’]|\d\.\d|\(lat ")
+
+# The drought definition terms to be searched for by 'find_drought_definitions()' are saved in this list:
+DROUGHT_DEFINITION_KEYWORDS = ['PET',
+                               'SPI',
+                               'SPEI',
+                               'PDSI',
+                               'scPDSI',
+                               'index',
+                               'low soil moisture',
+                               'soil water content',
+                               'VPD',
+                               'reduced rainfall',
+                               'low precipitation',
+                               'lower precipitation',
+                               'soil water content',
+                               'dry soil conditions',
+                               'absence of precipitation',
+                               'decline in precipitation',
+                               'throughfall exclusion',
+                               'elevated temperatures',
+                               'water withdrawal',
+                               'long-term mean',
+                               'plant water stress',
+                               'low NPP',
+                               'drought',
+                               'droughts'
+                               'dry conditions',
+                               'drought conditions',
+                               'hot droughts',
+                               'big dry',
+                               'dry season',
+                               'dry period',
+                               'drought year',
+                               'El Niño',
+                               'Big Dry']
+
+# The terms/keywords which introduce the description of the study area and are searched for by 'find_study_site()'
+STUDY_SITE_KEYWORDS = ['Data Sources and Location',
+                       'study area',
+                       'study  area',
+                       'The area of',
+                       'forest areas',
+                       'study site',
+                       'study sites',
+                       'S T U D Y S I T E',
+                       'compared three sites',
+                       'study region',
+                       'Bioregional  description',
+                       'Study landscapes',
+                       'site description',
+                       'Study system',
+                       'forest sites',
+                       'study was conducted at',
+                       'study was conducted in',
+                       'site is located',
+                       'study location']
+
+# One matcher for all keywords of both lists, which is built only once and finds every keyword of a PDF in a single pass over its text
+DOCUMENT_KEYWORD_MATCHER = build_keyword_matcher(DROUGHT_DEFINITION_KEYWORDS + STUDY_SITE_KEYWORDS)
+
 # ------------------------------------------------- UTILITY ---------------------------------------------------------- #
 def clean_and_remove_control_characters(text):
     """
@@ -52,18 +415,56 @@ def clean_and_remove_control_characters(text):
         - Filtering strings: https://blog.finxter.com/5-best-ways-to-filter-strings-within-ascii-range-in-python/ (Method 5)
     """
 
-    # Replace '(cid:6)', '(cid:57)' and '¢' with "′" as well as all other special 'cid' characters with '°'
-    text = re.sub(r'\(cid:6\)', '′', text)
-    text = re.sub(r'\(cid:57\)', '′', text)
-    text = re.sub(r'\(cid:5\)', '′', text)
-    text = re.sub(r'\(cid:\d+\)', '°', text)
-    text = text.replace('¢', '′')
+    # Replace '(cid:6)', '(cid:57)' and '¢' with "′" as well as all other special 'cid' characters with '°' as set up in 'CLEANING_RULES'
+    for pattern, replacement in CLEANING_RULES:
+        text = re.sub(pattern, replacement, text)
 
     # Remove all unwanted ASCII control characters using ord() to get their ASCII numbers and joining the cleaned text
     cleaned_text = ''.join(char for char in text if ord(char) >= 32 or ord(char) == 10)
 
     return cleaned_text
 
+def scan_coordinates(line):
+    """
+    Finds coordinates which are given as regex patterns in lines of the cleaned text from a PDF file and tells to which pattern family each found coordinate belongs.
+    To save time, every line is first checked by two quick pre-filters and the single combined pattern, so that the patterns only need to be applied one after
+    another to the few lines which actually contain a coordinate. The results are exactly the same as if every pattern would be applied to every line.
+
+    Args:
+        line (str): A single line of (cleaned) text in which coordinate patterns are searched for.
+
+    Returns:
+        list: A list of tuples (pattern family, coordinate match), in the order of the patterns in 'COORDINATE_PATTERNS'.
+
+    References:
+        - Python RegEx in general: https://www.w3schools.com/python/python_regex.asp
+        - 're.compile()': https://docs.python.org/3/library/re.html#re.compile
+        - 'Pattern.findall()': https://docs.python.org/3/library/re.html#re.Pattern.findall
+    """
+
+    # Skip all lines which cannot contain any coordinate, because they have no digit or none of the characters every coordinate pattern needs,
+    # only the coordinate patterns that were really applied to the line are counted (the second pre-filter is not applied to lines without a digit)
+    if not COORDINATE_DIGIT_PATTERN.search(line):
+        instrumentation.count('coordinate_pattern_checks', 1)
+        return []
+    if not COORDINATE_PREFILTER_PATTERN.search(line):
+        instrumentation.count('coordinate_pattern_checks', 2)
+        return []
+
+    # Skip all lines in which not a single coordinate pattern matches, using only one pass over the line with the combined pattern
+    if not COMBINED_COORDINATE_PATTERN.search(line):
+        instrumentation.count('coordinate_pattern_checks', 3)
+        return []
+    instrumentation.count('coordinate_pattern_checks', 3 + len(COMPILED_COORDINATE_PATTERNS))
+
+    # Add all found coordinates with their pattern family to the 'hits' list, which is created here
+    hits = []
+    # Iterate over the precompiled patterns and as soon as a pattern has found a result in a line, add it to 'hits' using extend()
+    for family, pattern in COMPILED_COORDINATE_PATTERNS:
+        hits.extend((family, match) for match in pattern.findall(line))
+
+    return hits
+
 def find_matches(line):
     """
     Finds coordinates which are given as regex patterns in lines of the cleaned text from a PDF file.
@@ -73,161 +474,48 @@ def find_matches(line):
 
     Returns:
         list: A list of strings, each containing a found coordinate match.
+    """
 
-    References:
-        - Python RegEx in general: https://www.w3schools.com/python/python_regex.asp
-        - 're.findall()': https://docs.python.org/3/library/re.html#re.findall
+    # Use the helper function 'scan_coordinates()' and only keep the found coordinates without their pattern family
+    return [match for _, match in scan_coordinates(line)]
 
+def remove_contained_coordinates(coordinates):
     """
+    Removes all coordinates which are part of another, longer coordinate (e.g. '52° 12′ N' is removed if '52° 12′ N, 13° 28′ E' was also found),
+    so that every coordinate is only kept in its most complete form.
+    Instead of comparing every coordinate with every other one, all substrings of each coordinate which have the length of another found coordinate
+    are looked up in the set of coordinates, so that the duration only grows linearly with the number of coordinates.
 
-    # All RegEx patterns for searching different coordinate formats
-    patterns = [
-        # Most of the patterns do not allow coordinates to start with “.” to prevent DOI search entries.
-        # Cardinal points are automatically included in the categorization
-
-        # ------------------- Decimal degree pattern -------------------------------------------
-        # Captures simple decimal coordinates without sign and without cardinal direction
-        # Examples: '123.456789', '32.123456'
-        r'\b(?<!\.)\d{1,3}\.\d{6}\b',
-
-        # Captures decimal degrees with a degree symbol followed by a cardinal point.
-        # Examples: '123.456° N', '32.1234°E'
-        r'\b(?<!\.)(?!0\.)\d{1,3}\.\d{2,6}[°º◦]?\s*[NSEW](?!-)\b',
-
-        # Captures contiguous coordinates in decimal form with a possible negative sign and cardinal points, separated by commas.
-        # Examples: '-123.45678 N, -98.76543 E', '-23.4567 S, -45.6789 W'
-        r'\b(?<!\.)[-–−]?(?!0\.)\d{1,3}\.\d+[NS],\s*(?<!\.)[-–−]?(?!0\.)\d{1,3}\.\d+[EW]\b',
-
-        # Captures coordinates in decimal degree format with degree symbol and cardinal points, each for longitude and latitude.
-        # Examples: '123.4567°N, 89.1234°W', '45.6789°S, 23.4567°E'
-        r'\b(?<!\.)(?!0\.)\d{1,3}\.\d{1,6}[°º◦][NS],\s*(?<!\.)\d{1,3}\.\d{1,6}[°º◦][EW]\b',
-
-        # Captures coordinates within brackets, separated by commas, in decimal format.
-        # Examples: '(123.456, 78.901)', ‘(-12.345, -67.890)’, '(35.275, -111.721)'
-        r'\(\s*(?<!\.)[-–−]?(?!0\.)\d{1,3}\.\d{3}\s*,\s*(?<!\.)\s*[-–−]?\s*(?!0\.)[\d−]{1,3}\.\d{3}\s*\)',
-
-        # ------------------- Only [°º◦] pattern-------------------------------------------
-        # Captures simple degrees with a degree symbol and a cardinal point.
-        # Examples: '123° N”, '98° W'
-        r'\b(?<!\.)(?!0{1,2}\b)\d{1,3}[°º◦]\s*[NSEW]\b',
-
-        # Captures degrees followed by a specific zero in the number
-        # Note: The zeros here are incorrectly converted “°”
-        # Examples: '123°270 N', '98°020 W'
-        r'\b(?<!\.)\d{1,3}[°º◦]\d{1,3}0\s*[NSEW]\b',
-
-        # Captures two separate degrees, connected by a separator
-        # Examples: '123° - 45° N', '98° - 76° W', '78.5°−82.5°E', '123° - 45° N'
-        # r'\b(?<!\.)\d{1,3}[°º◦]\s*[-–−]*\s*\d{1,3}[°º◦]\s*[NSEW]\b',
-        r'\b(?<!\.)\d{1,3}(?:\.\d+)?[°º◦]\s*[-–−]*\s*\d{1,3}(?:\.\d+)?[°º◦]\s*[NSEW]\b',
-
-        # Captures coordinates that contain three repeated degrees followed by a cardinal point.
-        # Examples: '123°45°67° N', '98°76°54° W'
-        r'\b(?<!\.)\d{1,3}[°º◦]\d{2}[°º◦]\d{2}[°º◦]\s*[NSEW]\b',
-
-        # ------------------- Only [°º◦] and [ʹ′'’] pattern-------------------------------------------
-        # Captures ranges of coordinates in degrees and minutes connected by a separator, possibly without specific cardinal points.
-        # Examples: "123°45' N -67°89'", "12°34' S- 56°78' E"
-        r"(?<!\.)\d{1,3}[°º◦]\d{1,2}[ʹ′'’]\s*[NSEW]?\s*[-–−]\s*(?<!\.)\d{1,3}[°º◦]\d{1,2}[ʹ′'’]\s*[NSEW]?\b",
-
-        # Captures coordinates in the form of degrees and minutes separated by commas with cardinal points.
-        # Examples: "52° 12' N, 13°28' E", "12°34', 56 78' W"
-        r"\b(?<!\.)\d{1,3}[°º◦]?\s*\d{1,3}[ʹ′'’]?\s*[NSEW],\s*\d{1,3}[°º◦]?\s*\d{1,3}[ʹ′'’]?\s*[NSEW]\b",
-
-        # Captures two complete sets of coordinates, separated by a semicolon.
-        # Examples: "123°045'067 N; 123°045'067 W", "12°034'056 N; 12°034'056 W"
-        r'\b(?<!\.)\d{1,3}[°º◦]\s*0\d{2}\s*(?<!\.)\d{1,3}[°º◦]\s*0\d{3}\s*[NSEW];\s*(?<!\.)\d{1,3}[°º◦]\s*0\d{3}\s*(?<!\.)\d{1,3}[°º◦]\s*0\d{3}\s*[NSEW]\b',
-
-        # Captures coordinates in full notation with degree signs, minutes and seconds, optionally followed by a cardinal point.
-        # Examples: "123°45''67' N", "98°76''54' E"
-        r"\d{1,3}[º°◦]\d{1,2}[ʹ′'’][ʹ′'’]\d{1,2}[ʹ′'’]\s*[N|S|E|W]?",
-
-        # Captures coordinates in degrees, minutes and seconds, whereby the seconds can contain decimal values.
-        # Note: No word boundary (\b) as coordinates in table
-        # Examples: "123°45'67.89''", "98°76'54.32''"
-        r"(?<!\.)\d{1,3}[°º◦]\d{1,3}[ʹ′'’]\d{1,3}\.\d{1,3}[ʹ′'’][ʹ′'’]",
-
-        # Captures coordinates in degrees and minutes, directly followed by a cardinal point.
-        # Examples: "123°456' N", "98°765' W"
-        r"\b(?<!\.)(?!0\.)\d{1,3}[°º◦]\s*\d{1,3}[ʹ′'’]?\s*[NSEW]\b",
-
-        # Captures coordinates in the form of degrees, minutes and degree in tables and texts.
-        # Note: No word boundary (\b) as coordinates in table also included
-        # Examples: '123°45'67°E', '98°76'54°'
-        r'(?<!\.)\d{1,3}[°º◦]\d{2}[´′’\u0027\u2032]\d{2}[°º◦]?[NSEW]?',
-
-        # ------------------- [°º◦] and (?:′|\u2032|\u0027) and ″ pattern -------------------------------------------
-        # Note: Unicode specifications for symbols must be used here, otherwise there will be a conflict with the Python syntax because of quotation marks
-
-        # Captures coordinates in the form of degrees, minutes and seconds.
-        # Examples: '123°45'67″ N', '12°34'56″ S'
-        r'\b(?<!\.)\d{1,3}(?:[°º◦]|\u00B0)?\s*\d{1,3}(?:′|\u2032|\u0027|´)?\s*\d{1,3}(?:\.\d+)?(?:″|\u2033|˝)?\s*[NSEW]\b',
-
-        # Captures coordinates in the form of degrees, minutes and seconds in tables and texts.
-        # Note: No word boundary (\b) as coordinates in table
-        # Examples: '123°45'67" ', '98°76'54" '
-        r'(?<!\.)\d{1,3}[°º◦]\d{2}[´′’\u0027\u2032]\d{2}["”˝]?',
-
-        # Captures two coordinates in one line, displaying degrees, minutes and seconds with different precision.
-        # Examples: '123°45'67.89″ N - 98°76'54.32″ W', '12°34'56.78″ S - 23°45'67.89″ E'
-        r'\b(?<!\.)\d{1,3}(?:[°º◦]|\u00B0)?\d{1,3}(?:′|\u2032|\u0027)?(?!0\.)\d{1,3}\.\d{1,3}(?:″|\u2033)?\s*[NSEW]\s*[-–−]\s*(?<!\.)\d{1,3}(?:[°◦]|\u00B0)?\d{1,3}(?:′|\u2032|\u0027)?(?!0\.)\d{1,3}\.\d{1,3}(?:″|\u2033)?\s*[NSEW]\b',
-
-        # Captures coordinates in tables in degrees, minutes and seconds, whereby the seconds can have decimal places.
-        # Note: No word boundary (\b) as coordinates in table
-        # Examples: '123°45'67.89" N', '12°34'56.78"S'
-        r'(?<!\.)\d{1,3}[°º◦]\s*\d{1,3}[′’\u0027\u2032]\d{1,3}\.\d{1,3}["”]\s*[NSEW]?',
-
-        # ------------------- Only [ʹ′'’] pattern -------------------------------------------
-        # Captures specific coordinates in minutes, also in tables.
-        # Introduced, because '°' was converted to '0' in some PDFs
-        # Examples: "43010'", "39058'"
-        r"(?<!\.)\d{1,3}0\d{1,3}[ʹ′'’]",
-
-        # Captures specific coordinates in minutes, also in tables.
-        # Introduced, because '°' was converted to 'o' in some PDFs
-        # Examples: "44o26’N", "121o34’W"
-        r"(?<!\.)\d{1,3}o\d{1,3}[ʹ′'’]s*[NSEW]",
-
-        # ------------------- Other special case pattern -------------------------------------------
-        # Captures simple details of coordinate ranges, separated by the word 'to'.
-        # Examples: '123 to 130 N'"', '45 to 50 W'
-        r'\b(?<!\.)\d{1,3}\s*to\s*\d{1,3}0\s*[NSEW]\b',
-
-        # Captures ranges of decimal degrees, separated by the word 'to', with a final cardinal point at the latter coordinate.
-        # Examples: '123.456 to 789.012 N', '45.678 to 123.456 W'
-        r'\b(?<!\.)\d{1,3}\.\d{1,3}\s*to\s*\d{1,3}\.\d{1,3}\s*[NSEW]\b',
-
-        # Captures ranges of coordinates, separated by a hyphen, followed by a cardinal point.
-        # Examples: '36–528 N', '52–988 W'
-        r'\b(?<!\.)\d{1,3}[-–−]\d{1,3}\s[NSWE]\b',
-
-        # Captures coordinates in brackets, with 'lat' or 'long' prefix of length 9 to 10.
-        # Note: No word boundary (\b) as coordinates in table
-        # Examples: '(lat 1230230140, long 340450260)'
-        r'\(lat \d{9,10}, long \d{9,10}\)',
-
-        # Captures very large numerical values as coordinates with subsequent cardinal points.
-        # Note: Due to a wrong conversation of some PDFs the special characters like '°' and "'" are either deleted or numbers
-        # Note: No word boundary (\b) as coordinates in table
-        # Examples: '123456789N', '987654321 W'
-        r'(?<!\.)(?!0\.)\d{9,10}\s*[NSEW]',
-
-        # Captures coordinates with cardinal points, connected by a semicolon.
-        # Note: The zeros here are incorrectly converted '°'
-        # Examples: '12034 56078 N; 12034 56078 E'
-        r'\b(?<!\.)\d{1,3}\s*0\d{1,3}\s*\d{1,3}\s*0\d{1,3}\s*[NSEW];\s*\d{1,3}\s*0\d{1,3}\*\d{1,3}\s*0\d{1,3}\s*[NSEW]\b'
-    ]
+    Args:
+        coordinates (set): All coordinates found in a PDF.
 
-    # Add all found coordinates to the 'matches' list, which is created here
-    matches = []
-    # Iterate over the pattern and as soon as a pattern has found a result in a line, add it to “matches” using extend()
-    for pattern in patterns:
-        matches.extend(re.findall(pattern, line))
+    Returns:
+        set: The coordinates which are not part of any other found coordinate.
 
-    return matches
+    References:
+        - Set membership in constant time: https://wiki.python.org/moin/TimeComplexity#set
+        - Slicing strings: https://docs.python.org/3/tutorial/introduction.html#text
+    """
+    # Only substrings with the length of a found coordinate can be a found coordinate, so these lengths are collected in ascending order
+    coordinate_lengths = sorted({len(coordinate) for coordinate in coordinates})
+
+    # Set for all coordinates that were found as part of another coordinate
+    contained_coordinates = set()
+    for other_coordinate in coordinates:
+        for length in coordinate_lengths:
+            # A coordinate can only be part of a different coordinate if it is shorter
+            if length >= len(other_coordinate):
+                break
+            # Look up every substring of this length in the set of found coordinates
+            for start in range(len(other_coordinate) - length + 1):
+                substring = other_coordinate[start:start + length]
+                if substring in coordinates:
+                    contained_coordinates.add(substring)
+
+    return coordinates - contained_coordinates
 
 # -------------------------------------------- SEARCH & EXTRACT ------------------------------------------------------ #
-def find_study_site(lines):
+def find_study_site(document):
     """
     Searches for specific terms/keywords that represent a relevant entry in the “Area name” column of the Excel table and returns the relevant rows.
     Here, if one of these keywords is found, the search will be stopped on purpose.
@@ -235,62 +523,44 @@ def find_study_site(lines):
 
 
     Args:
-        lines (list): A list of text lines in which keywords are searched for the study area.
+        document (Document): The prepared lines of a PDF with the keywords found in them, as created by build_document().
 
     Returns:
         str or None: A string containing the context of the areas found in a study, or None if none were found
 
     References:
         - Python RegEx in general: https://www.w3schools.com/python/python_regex.asp
-        - 're.search()':https://docs.python.org/3/library/re.html#re.search
         - 're.IGNORECASE': https://docs.python.org/3/library/re.html#re.IGNORECASE
+        - 'min()' with default: https://docs.python.org/3/library/functions.html#min
     """
 
-    # Iterates over all lines of the text of a PDf, if a keyword is found, this line
-    # and the following 4 lines are saved and appended to the lines that provide information about the searched area.
-    for i, line in enumerate(lines):
-        # Check for all searched keywords, upper and lower case is ignored here
-        if (re.search(r'\bData Sources and Location\b', line, re.IGNORECASE)
-                or re.search(r'\bstudy area\b', line, re.IGNORECASE)
-                or re.search(r'\bstudy  area\b', line, re.IGNORECASE)
-                or re.search(r'\bThe area of\b', line, re.IGNORECASE)
-                or re.search(r'\bforest areas\b', line, re.IGNORECASE)
-
-                or re.search(r'\bstudy site\b', line, re.IGNORECASE)
-                or re.search(r'\bstudy sites\b', line, re.IGNORECASE)
-                or re.search(r'\bS T U D Y S I T E\b', line, re.IGNORECASE)
-
-
-                #  If “study site” is separated by a line break
-                or (line.strip().endswith("study") and (i + 1 < len(lines)) and lines[i + 1].strip().startswith(
-                    "site"))
-
-                or re.search(r'\bcompared three sites\b', line, re.IGNORECASE)
-                or re.search(r'\bstudy region\b', line, re.IGNORECASE)
-                or re.search(r'\bBioregional  description\b', line, re.IGNORECASE)
-                or re.search(r'\bStudy landscapes\b', line, re.IGNORECASE)
-                or re.search(r'\bsite description\b', line, re.IGNORECASE)
-                or re.search(r'\bStudy system\b', line, re.IGNORECASE)
-                or re.search(r'\bforest sites\b', line, re.IGNORECASE)
-                or re.search(r'\bstudy was conducted at\b', line, re.IGNORECASE)
-                or re.search(r'\bstudy was conducted in\b', line, re.IGNORECASE)
-                or re.search(r'\bsite is located\b', line, re.IGNORECASE)
-                or re.search(r'\bstudy location\b', line, re.IGNORECASE)
-
-        ):
-            # Save context lines (the line in which the keyword was found and the following 4)
-            # This is done to ensure not only that the complete study site description is saved, but also that if the keywords is
-            # a headline for a section of the paper, not only this is saved but also its following content
-            context_lines = lines[i:i + 4]
-            return " ".join(context_lines).strip()
+    lines = document.lines
+
+    # Check for all searched keywords, upper and lower case is ignored here, and get the first line in which one of them was found
+    study_site_keywords = {fold(keyword) for keyword in STUDY_SITE_KEYWORDS}
+    first_line = min((line_number for line_number, keyword in document.keyword_hits if keyword in study_site_keywords), default=None)
+
+    # If “study site” is separated by a line break, this can also be the first line, so the lines in front of the first keyword are checked for this
+    for i, line in enumerate(lines[:first_line]):
+        if line.strip().endswith("study") and (i + 1 < len(lines)) and lines[i + 1].strip().startswith("site"):
+            first_line = i
+            break
+
+    # If a keyword is found, this line and the following 3 lines are saved and returned as the lines that provide information about the searched area.
+    if first_line is not None:
+        # Save context lines (the line in which the keyword was found and the following 3)
+        # This is done to ensure not only that the complete study site description is saved, but also that if the keywords is
+        # a headline for a section of the paper, not only this is saved but also its following content
+        context_lines = lines[first_line:first_line + 4]
+        return " ".join(context_lines).strip()
     return None
 
-def find_analyzed_years(lines):
+def find_analyzed_years(document):
     """
     Extracts time periods from the given text lines using regex patterns.
 
     Args:
-        lines (list of str): (Bereinigte) Zeilen aus dem PDF-Dokument.
+        document (Document): Die vorbereiteten (bereinigten) Zeilen aus dem PDF-Dokument, wie sie von build_document() erstellt wurden.
 
     Returns:
         str oder None: Sortierte Liste der extrahierten Zeiträume, wenn nichts gefunden wurde eine leere Liste.
@@ -338,14 +608,15 @@ def find_analyzed_years(lines):
     # List for saving the time periods found
     found_periods = []
 
+    # Compile the patterns once for the whole PDF, re.IGNORECASE so upper and lowercase is ignored
+    time_period_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in time_period_patterns]
+
     # Iterate over each given line from a PDF to search for the single years which are correlated to drought
-    for line in lines:
-        # Stop searching for years if the word 'reference' was found, so that years given in the reference section of a study are not included
-        if "reference" in line.lower():
-            break
+    # Stop searching for years at the line where the word 'reference' was found, so that years given in the reference section of a study are not included
+    for line in document.lines[:document.reference_line]:
         for pattern in time_period_patterns:
-            # Search for all occurrences that match the pattern(s) in one of the lines, re.IGNORECASE so upper and lowercase is ignored
-            matches = re.findall(pattern, line, re.IGNORECASE)
+            # Search for all occurrences that match the pattern(s) in one of the lines
+            matches = pattern.findall(line)
             for match in matches:
                 # If the match found is a tuple (several parts, e.g. start and end year) continue here for further conversion and validation purposes
                 if isinstance(match, tuple):
@@ -386,12 +657,12 @@ def find_analyzed_years(lines):
 
     return sorted(found_periods)
 
-def find_periods_with_drought(lines):
+def find_periods_with_drought(document):
     """
     Extracts time periods from the given text lines if they are related to drought by being in the same sentence as drought keywords.
 
     Args:
-        lines (list of str): (Cleaned) lines holding the PDF text
+        document (Document): The prepared (cleaned) lines holding the PDF text, as created by build_document()
 
     Returns:
         list: Sorted list containing the extracted drought periods or if no drought periods were found an empty list
@@ -440,20 +711,19 @@ def find_periods_with_drought(lines):
     # List for saving the drought time periods found
     drought_periods = []
 
-    # Iterate over each given line from a PDF to search for the single years which are correlated to drought
-    for line in lines:
-        # Stop searching for years if the word 'references' was found, so that years given in the reference section of a study are not included
-        if "references" in line.lower():
-            break
-        # Split the lines into sentences using a regex pattern including all sentence ending characters.
-        sentences = re.split(r'(?<=[.!?])\s+', line)
+    # Compile the patterns once for the whole PDF
+    drought_periods_patterns = [re.compile(pattern) for pattern in drought_periods_patterns]
+
+    # Iterate over the sentences of each given line from a PDF to search for the periods which are correlated to drought
+    # The sentences are only prepared up to the line where the word 'references' was found, so that years given in the reference section of a study are not included
+    for sentences in document.sentences:
         for sentence in sentences:
             # Check if a drought keyword from the drought pattern is included in a sentence
             if drought_pattern.search(sentence):
                 # If the keyword for drought was found, search for each period pattern (drought_periods_patterns) in the sentences
                 for pattern in drought_periods_patterns:
                     # Store all found time periods as matches
-                    matches = re.findall(pattern, sentence)
+                    matches = pattern.findall(sentence)
                     for match in matches:
                         # If the match found is a tuple (several parts, e.g. start and end year) continue here for further conversion and validation purposes
                         if isinstance(match, tuple):
@@ -491,7 +761,7 @@ def find_periods_with_drought(lines):
 
     return sorted(drought_periods)
 
-def find_single_years_with_drought(lines):
+def find_single_years_with_drought(document):
     """
     Extracts individual years from the given text lines if they are related to drought.
     Years that appear directly after a minus sign '-', before a closing bracket ')' and directly after a period and a space are ignored,
@@ -499,7 +769,7 @@ def find_single_years_with_drought(lines):
     The maximum number to be entered is 2024, which is limited by the regex pattern (|2[0-4])
 
     Args:
-        lines (list of str): (Cleaned) lines holding the PDF text
+        document (Document): The prepared (cleaned) lines holding the PDF text, as created by build_document()
 
     Returns:
         list: Sorted list containing the extracted drought years or if no drought years were found an empty list
@@ -514,7 +784,7 @@ def find_single_years_with_drought(lines):
         - 'isinstance()': https://www.w3schools.com/python/ref_func_isinstance.asp
     """
     # Regex pattern to catch single years with the restrictions described in the Docstring of this function
-    single_year_pattern = r'(?<![-–−])(?<!\.\s)\b(19\d{2}|20(0[0-9]|1[0-9]|2[0-4]))\b(?![);])'
+    single_year_pattern = re.compile(r'(?<![-–−])(?<!\.\s)\b(19\d{2}|20(0[0-9]|1[0-9]|2[0-4]))\b(?![);])')
 
     # Regex pattern for the keywords 'drought', 'droughts' and 'drier' to ensure that the individual years are related to drought
     # re.IGNORECASE so upper and lower case is ignored here
@@ -523,18 +793,14 @@ def find_single_years_with_drought(lines):
     # List for saving the individual years found
     single_drought_years = []
 
-    # Iterate over each given line from a PDF to search for the single years which are correlated to drought
-    for line in lines:
-        # Stop searching for years if the word 'references' was found, so that years given in the reference section of a study are not included
-        if "references" in line.lower():
-            break
-        # Split the lines into sentences using a regex pattern including all sentence ending characters.
-        sentences = re.split(r'(?<=[.!?])\s+', line)
+    # Iterate over the sentences of each given line from a PDF to search for the single years which are correlated to drought
+    # The sentences are only prepared up to the line where the word 'references' was found, so that years given in the reference section of a study are not included
+    for sentences in document.sentences:
         for sentence in sentences:
             # Check if a drought keyword from the drought pattern is included in a sentence
             if drought_pattern.search(sentence):
                 # If a drought keyword was found, search for the single years in the sentence
-                matches = re.findall(single_year_pattern, sentence)
+                matches = single_year_pattern.findall(sentence)
                 # Iterate over all matches (the found years)
                 for match in matches:
                     # Check if the returned match is a tuple of strings or  a single string representing the years and depending on which it is saving it for comparison
@@ -548,13 +814,13 @@ def find_single_years_with_drought(lines):
 
     return sorted(single_drought_years)
 
-def find_study_type(lines, pdf_file):
+def find_study_type(document, pdf_file):
     """
     Identifies the study type of a study by estimating the highest score of each study type based on keyword occurrences.
     If it is a close comparison, the best fitting and second best fitting study type will be taken into account.
 
     Args:
-        lines (list):  A list of text lines in which keywords are searched for the study types.
+        document (Document): The prepared text lines in which keywords are searched for the study types, as created by build_document().
         pdf_file (str): The file name of the PDF from which the lines originate.
 
     Returns:
@@ -590,7 +856,7 @@ def find_study_type(lines, pdf_file):
     study_type_scores = {key: 0 for key in study_types}
 
     # Search for the keywords using the patterns for each study type inside the given text lines and store the corresponding counts into the 'scores' dictionary
-    for line in lines:
+    for line in document.lines:
         for study_type, pattern in study_type_pattern.items():
             study_type_scores[study_type] += len(pattern.findall(line))
 
@@ -616,7 +882,7 @@ def find_study_type(lines, pdf_file):
     elif max_score > second_highest_score:
         return best_fit_study_type
 
-def find_drought_definitions(lines, pdf_file):
+def find_drought_definitions(document, pdf_file):
     """
     Searches for specific terms related to the characterization of droughts and returns the relevant lines and the keywords found.
     In contrast to the search methodology in 'find_study_site(lines)', the search is not aborted as soon as a keyword is found.
@@ -625,7 +891,7 @@ def find_drought_definitions(lines, pdf_file):
     Because these keywords are crucial for the evaluation, the keywords are not automatically mapped, but all taken into account for manual verification.
 
     Args:
-        lines (list): A list of text lines in which keywords are searched for the drought definitions
+        document (Document): The prepared text lines with the keywords found in them, as created by build_document().
         pdf_file (str): The file name of the PDF from which the lines originate.
 
     Returns:
@@ -634,64 +900,33 @@ def find_drought_definitions(lines, pdf_file):
 
     References:
         - Python RegEx in general: https://www.w3schools.com/python/python_regex.asp
-        - 're.search()': https://docs.python.org/3/library/re.html#re.search
-        - 're.escape()': https://docs.python.org/3/library/re.html#re.escape
         - 're.INGORECASE: 'https://docs.python.org/3/library/re.html#re.IGNORECASE
+        - 'dict.setdefault()': https://docs.python.org/3/library/stdtypes.html#dict.setdefault
         - Saving context lines: https://stackoverflow.com/a/45291736
     """
 
-    # The drought definition terms to be searched for are saved in this list:
-    keywords = ['PET',
-                'SPI',
-                'SPEI',
-                'PDSI',
-                'scPDSI',
-                'index',
-                'low soil moisture',
-                'soil water content',
-                'VPD',
-                'reduced rainfall',
-                'low precipitation',
-                'lower precipitation',
-                'soil water content',
-                'dry soil conditions',
-                'absence of precipitation',
-                'decline in precipitation',
-                'throughfall exclusion',
-                'elevated temperatures',
-                'water withdrawal',
-                'long-term mean',
-                'plant water stress',
-                'low NPP',
-                'drought',
-                'droughts'
-                'dry conditions',
-                'drought conditions',
-                'hot droughts',
-                'big dry',
-                'dry season',
-                'dry period',
-                'drought year',
-                'El Niño',
-                'Big Dry']
 
     # This list saves all those lines which contain a keyword plus 3 lines after it
     drought_lines = []
     # This list saves all terms found in a PDF from the 'keywords' list
     drought_quantification_keywords = []
 
-    # Iterating each line from the PDF using enumerate() to search for the drought definitions keywords
-    for keyword in keywords:
-        for i, line in enumerate(lines):
-            # re.escape to ensure that all special characters are treated as literals and not regex meta characters
-            # re.IGNORECASE so upper and lower case is ignored here
-            if re.search(r'\b' + re.escape(keyword) + r'\b', line, re.IGNORECASE):
-                # If a term was found, it is added to 'drought_quantification_keywords'
-                drought_quantification_keywords.append(keyword)
-                # and the line in which the term was found and the following three are saved
-                context_lines = lines[max(0, i - 1):i + 3]
-                drought_lines.append(" ".join(context_lines).strip())
-                break
+    lines = document.lines
+
+    # Store the line in which each keyword was found first, the hits are already in the order of the text
+    first_line_of_keyword = {}
+    for line_number, keyword in document.keyword_hits:
+        first_line_of_keyword.setdefault(keyword, line_number)
+
+    # Iterating over the drought definitions keywords in their given order to look up the first line each one was found in
+    for keyword in DROUGHT_DEFINITION_KEYWORDS:
+        i = first_line_of_keyword.get(fold(keyword))
+        if i is not None:
+            # If a term was found, it is added to 'drought_quantification_keywords'
+            drought_quantification_keywords.append(keyword)
+            # and the line in which the term was found and the following three are saved
+            context_lines = lines[max(0, i - 1):i + 3]
+            drought_lines.append(" ".join(context_lines).strip())
 
     if drought_lines:
         # The relevant lines are merged into a single string, `.strip()` removes all superfluous spaces.
@@ -701,24 +936,143 @@ def find_drought_definitions(lines, pdf_file):
         # the function returns a tuple containing two “None” values.
     return None, None
 
-def extract_spatial_information_from_pdfs(folder_path):
+def iter_lines_from_pdf(pdf_file):
     """
-    Extracts spatial information (coordinates and their context) from PDF files in the specified folder,
-    ignoring duplicates coordinates and those that match certain patterns.
+    Extracts the text of a PDF file page by page, cleans it and yields its lines as soon as each page is parsed, so that the complete text
+    never needs to be stored as one string. The lines are exactly the same as the ones of the complete text extracted by pdfminer's 'extract_text',
+    because a line which is not finished at the end of a page is only given out together with its continuation on the next page.
+    All pages are parsed, because the coordinates, the study site, the study type and the drought definitions are searched in the complete text.
+
+    Args:
+        pdf_file (str): The full file path to the PDF file.
+
+    Yields:
+        str: The cleaned lines of the PDF.
+
+    References:
+        - Text extraction of pdfminer page by page (as done by 'extract_text'): https://pdfminersix.readthedocs.io/en/latest/reference/composable.html
+        - 'StringIO': https://docs.python.org/3/library/io.html#io.StringIO
+        - Generators using 'yield': https://docs.python.org/3/reference/expressions.html#yield-expressions
+    """
+    with open(pdf_file, 'rb') as file, StringIO() as page_text:
+        # Set up pdfminer the same way 'extract_text' does, but read out the text after each page
+        resource_manager = PDFResourceManager(caching=True)
+        device = TextConverter(resource_manager, page_text, codec='utf-8', laparams=LAParams())
+        interpreter = PDFPageInterpreter(resource_manager, device)
+
+        # The last, possibly unfinished, line of the previous pages
+        unfinished_line = ''
+        # Whether a line was given out already, which is needed to treat empty lines exactly like re.split() on the complete text does
+        first_line = True
+
+        for page in PDFPage.get_pages(file, caching=True):
+            with instrumentation.stage('pdfminer'):
+                interpreter.process_page(page)
+            instrumentation.count('pages')
+            # Take the text of this page and empty the buffer for the next page
+            text = page_text.getvalue()
+            page_text.seek(0)
+            page_text.truncate(0)
+
+            # Clean the text of specific special characters using the helper function clean_and_remove_control_characters() and divide it into lines
+            with instrumentation.stage('cleaning'):
+                lines = re.split(LINE_SPLIT_PATTERN, unfinished_line + clean_and_remove_control_characters(text))
+            # The last line could be continued on the next page, so it is kept back
+            unfinished_line = lines.pop()
+            # An empty first line only exists at the beginning of the text, otherwise it is only the rest of a line break between two pages
+            if lines and not lines[0] and not first_line:
+                lines.pop(0)
+
+            for line in lines:
+                first_line = False
+                yield line
+
+        device.close()
+
+    yield unfinished_line
+
+def extract_lines_from_pdf(pdf_file, options=None):
+    """
+    Extracts the text of a PDF file, cleans it and divides it into lines.
+    If a cache folder is given, the lines are taken from the text cache instead, as long as the PDF, the pdfminer version and the cleaning rules did not change,
+    otherwise they are stored there after the extraction for the next run.
+    If streaming is set, the text is extracted page by page with iter_lines_from_pdf(), which gives the same lines
+    without storing the raw and the cleaned text of the whole PDF as one string each.
+
+    Args:
+        pdf_file (str): The full file path to the PDF file.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
+
+    Returns:
+        list: The cleaned lines of the PDF.
+    """
+    options = options or TextExtractionOptions()
+
+    # Look up the cleaned lines in the text cache first, if it is used
+    if options.cache_dir:
+        with instrumentation.stage('cache_read'):
+            cache_key = text_cache.build_cache_key(pdf_file, TEXT_EXTRACTION_FINGERPRINT)
+            lines = text_cache.read_cached_lines(options.cache_dir, cache_key)
+        if lines is not None:
+            instrumentation.count('cache_hits')
+            return lines
+
+    # Extract the text page by page, if streaming is set
+    if options.stream:
+        lines = list(iter_lines_from_pdf(pdf_file))
+    else:
+        # Extract the text from the PDF file using pdfminer's 'extract_text' method
+        with instrumentation.stage('pdfminer'):
+            text = extract_text(pdf_file)
+        with instrumentation.stage('cleaning'):
+            # Clean the text of specific special characters using the helper function clean_and_remove_control_characters()
+            cleaned_text = clean_and_remove_control_characters(text)
+            # Divide the cleaned text into lines for a clearer search process
+            lines = re.split(LINE_SPLIT_PATTERN, cleaned_text)
+
+    # Store the cleaned lines in the text cache for the next run
+    if options.cache_dir:
+        with instrumentation.stage('cache_write'):
+            text_cache.write_cached_lines(options.cache_dir, cache_key, lines, options.cache_max_size)
+
+    return lines
+
+def list_pdf_files(folder_path):
+    """
+    Lists all PDF files in the specified folder in a sorted order, so that the results are always processed and stored
+    in the same, deterministic order no matter in which order the operating system returns the files or in how many processes they are searched.
 
     Args:
         folder_path (str): The path to the folder containing PDF files to be processed.
 
     Returns:
-        list: A list of tuples, where each tuple contains extracted spatial information for a PDF file. Each tuple includes:
+        list: The full file paths of all PDF files inside the folder, sorted by file name.
+
+    References:
+        - 'os.listdir': https://docs.python.org/3/library/os.html#os.listdir
+        - 'sorted()': https://docs.python.org/3/library/functions.html#sorted
+    """
+    # Only use files with the '.pdf' file extension and join them with the folder path
+    return [os.path.join(folder_path, filename) for filename in sorted(os.listdir(folder_path)) if filename.endswith('.pdf')]
+
+def extract_spatial_information_from_pdf(pdf_file, options=None):
+    """
+    Extracts spatial information (coordinates and their context) from a single PDF file,
+    ignoring duplicates coordinates and those that match certain patterns.
+
+    Args:
+        pdf_file (str): The full file path to the PDF file to be processed.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
+
+    Returns:
+        tuple: A tuple containing the extracted spatial information for the PDF file. The tuple includes:
               pdf_basename (str): The file name of the PDF without the file extension (.pdf).
-              final_coordinates (set): The valid coordinates or 'No coordinates found/given' if there were no coordinates found or given.
+              final_coordinates (set): The valid coordinates or 'No coordinates found/given' if the text could not be extracted.
               lines_with_coordinates (list): The context lines of valid coordinates as list.
-              lines (list): All lines from a PDF as list.
-              pdf_file (str): The full file path to a PDF file.
+              lines (list): All lines from a PDF as list or None if the text could not be extracted.
+              pdf_file (str): The full file path to a PDF file or None if the text could not be extracted.
 
     References:
-        - 'os.listdir': https://docs.python.org/3/library/os.html#os.listdir
         - 'os.path': https://docs.python.org/3/library/os.path.html
         - Regular expressions in Python: https://www.w3schools.com/python/python_regex.asp
         - 're.split': https://docs.python.org/3/library/re.html#re.split
@@ -726,104 +1080,109 @@ def extract_spatial_information_from_pdfs(folder_path):
         - 'items()': https://www.w3schools.com/python/ref_dictionary_items.asp
         - 'next(iter())': https://www.programiz.com/python-programming/methods/built-in/next
         - Saving context lines using max() and index: https://python-forum.io/thread-28918-post-122845.html#pid122845
+        - 'enumerate()': https://docs.python.org/3/library/functions.html#enumerate
     """
-    # Initialize the list for the results of the automatic coordinate extraction
-    spatial_data = []
-
     # Patterns used for the identification of coordinate formats, which should be ignored if they occur alone
     decimal_pattern = r'\b(?<!\.)\d{1,3}\.\d{6}\b'
     decimal_dir_pattern = r'\b(?!0\.)\d{1,3}\.\d{2}\s*[NSEW]\b'
     number_dir_pattern = r'\b(?!0\.)\d{1,6}(?<!\d8\d{2}0)\s*[NSEW]\b'
     number_dir_pattern_range = r'\b(?!0\.)\d{3}–\d{3}[NSEW]\b'
 
-    # Search all files in the specified folder
-    for filename in os.listdir(folder_path):
-        # Make sure that only PDFs in the specified folder are used and their file extension gets removed
-        if filename.endswith('.pdf'):
-            pdf_file = os.path.join(folder_path, filename)
-            pdf_basename = os.path.splitext(os.path.basename(pdf_file))[0]
-            # Log the pure name of the PDF file which is being searched for coordinates and their context
-            logging.info(f"Looking for coordinates in '{pdf_basename}'")
-            logging.info("")
-            try:
-                # Extract the text from the PDF file using pdfminer's 'extract_text' method
-                text = extract_text(pdf_file)
-                # Clean the text of specific special characters using the helper function clean_and_remove_control_characters()
-                cleaned_text = clean_and_remove_control_characters(text)
-                # Set for saving all coordinates found
-                all_coordinates = set()
-                # List for saving the context lines of these where coordinates were found
-                lines_with_coordinates = []
-                # Divide the cleaned text into lines for a clearer search process
-                lines = re.split('\n+', cleaned_text)
-
-                # Sets for managing individual coordinates found for ignoring depending on the pattern
-                all_found_types = {decimal_pattern: set(), decimal_dir_pattern: set(), number_dir_pattern: set(), number_dir_pattern_range: set()}
-                # List for storing ignored coordinates
-                ignored_coordinates = []
-
-                # Create dictionary to store all matches so find_matches() has only be calles once
-                line_matches_dictionary = {}
-
-                # Search each line of the cleaned PDF text for coordinates, both the correct ones and those to be ignored
-                for line in lines:
-                    # Find any coordinate matches in the given lines using the helper function 'find_matches()' and store them in the corresponding dictionary
-                    matches = find_matches(line)
-                    line_matches_dictionary[line] = matches
-                    # If a match was found, add it to the 'coordinates' set
-                    if matches:
-                        for match in matches:
-                            all_coordinates.add(match)
-                            # Check each match against the specific given patterns which require special handling
-                            for pattern in [decimal_pattern, decimal_dir_pattern, number_dir_pattern, number_dir_pattern_range]:
-                                # If a match fits one of the specified pattern, store it in `all_found_types`
-                                if re.match(pattern, match):
-                                    all_found_types[pattern].add(match)
-
-
-                # Create a new set for only these coordinates, which will be used later and are validated for duplicates
-                final_coordinates = set()
-                # Check whether coordinates found are duplicates or part of other coordinates
-                for coord in all_coordinates:
-                    include_match = True
-                    for other_coord in all_coordinates:
-                        # Be sure that a match is not compared with itself and then check if it is included in another match
-                        if coord != other_coord and coord in other_coord:
-                            # If a match is part of another match, indirectly exclude it by setting include to false. 'break' stops the comparison for this match, because it is already a duplicate
-                            include_match = False
-                            break
-                    # If include is still True, add the coordinate to the final set
-                    if include_match:
-                        final_coordinates.add(coord)
-
-                # This part makes sure that single coordinates are removed and not part of the final coordinate set if they match one of the, directly in this function specified patterns
-                for pattern, coord_set in all_found_types.items():
-                    # Only use single coordinates for comparison and retrieve them using next(iter()
-                    if len(coord_set) == 1:
-                        coord_to_ignore = next(iter(coord_set))
-                        # Remove a coordinate that matches the criteria to be ignored and keep track of them for logging
-                        if coord_to_ignore in final_coordinates:
-                            final_coordinates.remove(coord_to_ignore)
-                            ignored_coordinates.append(coord_to_ignore)
-                            # log, which coordinate match was ignored in which PDF
-                            logging.info(f"Ignored single coordinate {coord_to_ignore} in '{pdf_basename}'.")
-                            logging.info("")
-
-                # If a match was found, and it is valid, take the line it was in and the previous 2 lines as context
-                for line, line_matches in line_matches_dictionary.items():
-                    valid_matches = [match for match in line_matches if match in final_coordinates]
-                    if valid_matches:
-                        context_lines = lines[max(0, lines.index(line) - 2):lines.index(line) + 1]
-                        lines_with_coordinates.append(" ".join(context_lines).strip())
-
-                spatial_data.append((pdf_basename, final_coordinates, lines_with_coordinates, lines, pdf_file))
-
-            # Backup logging, if there was an error that prevents information from being searched for in the PDFs
-            except Exception as e:
-                logging.error(f"Failed to extract text from '{pdf_file}': {str(e)}")
-                spatial_data.append((pdf_basename, 'No coordinates found/given', '', None, None))
-
-    return spatial_data
+    # Remove the file extension to get the pure name of the PDF file
+    pdf_basename = os.path.splitext(os.path.basename(pdf_file))[0]
+    # Log the pure name of the PDF file which is being searched for coordinates and their context
+    logging.info(f"Looking for coordinates in '{pdf_basename}'")
+    logging.info("")
+    try:
+        # Get the cleaned lines of the PDF (from the text cache, if possible) using the helper function extract_lines_from_pdf()
+        lines = extract_lines_from_pdf(pdf_file, options)
+        instrumentation.count('pdf_bytes', os.path.getsize(pdf_file))
+        instrumentation.count('lines', len(lines))
+        # Set for saving all coordinates found
+        all_coordinates = set()
+        # List for saving the context lines of these where coordinates were found
+        lines_with_coordinates = []
+
+        # Sets for managing individual coordinates found for ignoring depending on the pattern
+        all_found_types = {decimal_pattern: set(), decimal_dir_pattern: set(), number_dir_pattern: set(), number_dir_pattern_range: set()}
+        # List for storing ignored coordinates
+        ignored_coordinates = []
+
+        # Create a list to store all matches together with the number of the line they were found in, so find_matches() has only be called once
+        # and every line (also a repeated one, like the rows of a table) keeps its own position in the text
+        line_matches = []
+
+        # Search each line of the cleaned PDF text for coordinates, both the correct ones and those to be ignored, timed as the stage 'find_matches'
+        with instrumentation.stage('find_matches'):
+            for line_number, line in enumerate(lines):
+                # Find any coordinate matches in the given lines using the helper function 'find_matches()'
+                matches = find_matches(line)
+                # If a match was found, store it with its line number and add it to the 'coordinates' set
+                if matches:
+                    line_matches.append((line_number, matches))
+                    for match in matches:
+                        all_coordinates.add(match)
+                        # Check each match against the specific given patterns which require special handling
+                        for pattern in [decimal_pattern, decimal_dir_pattern, number_dir_pattern, number_dir_pattern_range]:
+                            # If a match fits one of the specified pattern, store it in `all_found_types`
+                            if re.match(pattern, match):
+                                all_found_types[pattern].add(match)
+
+        # Count all found coordinate matches, including the ones that are removed afterward
+        instrumentation.count('coordinate_matches', sum(len(matches) for _, matches in line_matches))
+
+        # Create a new set for only these coordinates, which will be used later and are validated for duplicates
+        # using the helper function remove_contained_coordinates(), which removes all coordinates that are part of other coordinates, timed as the stage 'dedup'
+        with instrumentation.stage('dedup'):
+            final_coordinates = remove_contained_coordinates(all_coordinates)
+
+            # This part makes sure that single coordinates are removed and not part of the final coordinate set if they match one of the, directly in this function specified patterns
+            for pattern, coord_set in all_found_types.items():
+                # Only use single coordinates for comparison and retrieve them using next(iter()
+                if len(coord_set) == 1:
+                    coord_to_ignore = next(iter(coord_set))
+                    # Remove a coordinate that matches the criteria to be ignored and keep track of them for logging
+                    if coord_to_ignore in final_coordinates:
+                        final_coordinates.remove(coord_to_ignore)
+                        ignored_coordinates.append(coord_to_ignore)
+                        # log, which coordinate match was ignored in which PDF
+                        logging.info(f"Ignored single coordinate {coord_to_ignore} in '{pdf_basename}'.")
+                        logging.info("")
+
+        # If a match was found, and it is valid, take the line it was in and the previous 2 lines as context using the stored line number
+        for line_number, matches in line_matches:
+            valid_matches = [match for match in matches if match in final_coordinates]
+            if valid_matches:
+                context_lines = lines[max(0, line_number - 2):line_number + 1]
+                lines_with_coordinates.append(" ".join(context_lines).strip())
+
+        return pdf_basename, final_coordinates, lines_with_coordinates, lines, pdf_file
+
+    # Running out of memory is not a problem of the PDF text, so it is passed on and handled by process_pdf_safely()
+    except MemoryError:
+        raise
+
+    # Backup logging, if there was an error that prevents information from being searched for in the PDFs
+    except Exception as e:
+        logging.error(f"Failed to extract text from '{pdf_file}': {str(e)}")
+        return pdf_basename, 'No coordinates found/given', '', None, None
+
+def extract_spatial_information_from_pdfs(folder_path, options=None):
+    """
+    Extracts spatial information (coordinates and their context) from all PDF files in the specified folder
+    by calling extract_spatial_information_from_pdf() for each of them.
+    The PDFs are given out one after another, so that only the lines of a single PDF are kept in memory and not the ones of the whole folder.
+
+    Args:
+        folder_path (str): The path to the folder containing PDF files to be processed.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
+
+    Yields:
+        tuple: The tuple as returned by extract_spatial_information_from_pdf(), for each PDF file.
+    """
+    # Search all PDF files in the specified folder one after another
+    for pdf_file in list_pdf_files(folder_path):
+        yield extract_spatial_information_from_pdf(pdf_file, options)
 
 # ------------------------------------------------- PROCESSING ------------------------------------------------------- #
 
@@ -895,120 +1254,462 @@ def logging_extraction_results(pdf_basename, coordinates, coordinate_context_lin
     # Logging a blank line to separate two PDFs for a better overview
     logging.info("")
 
-def process_extraction_results(folder_path):
+def fallback_extraction_result(pdf_basename, reason=''):
     """
-    Processes extracted results from a PDF file and appends relevant data to the results list that is used by extract_spatial_information() to give it to the main module
+    Creates the placeholder result for a PDF file from which no information could be extracted,
+    so that the study still gets its own row in the Excel file and can be checked manually.
 
-    This function acts as a management function for this module, as it calls all other functions except extract_spatial_information_from_pdfs(),
-    converts the information to strings and then stores it in the result list. It also calls the logging function, for an information output.
+    Args:
+        pdf_basename (str): The file name of the PDF without the file extension (.pdf)
+        reason (str): Why the PDF could not be searched (e.g. an exceeded time limit), which is stored instead of the context lines.
+
+    Returns:
+        ExtractionResult: The result containing only placeholders and the reason why the PDF could not be searched.
+    """
+    return ExtractionResult(pdf_basename, context_lines=reason, failure_reason=reason or 'Text could not be extracted')
+
+def process_pdf(pdf_file, options=None):
+    """
+    Processes a single PDF file by extracting its spatial information and calling all other search functions on its text.
+    This is the unit of work that is handed to the worker processes if the extraction is executed in parallel.
 
     Args:
-        folder_path (str): The path to the folder containing PDF files to be processed.
+        pdf_file (str): The full file path to the PDF file to be processed.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
 
     Returns:
-        list: A list of tuples containing extracted data for each PDF file. Each tuple represents one PDF and includes the following elements:
+        ExtractionResult: The extracted data for the PDF file.
+    """
+
+    # Call the extract_spatial_information_from_pdf() function and store the given information
+    pdf_basename, final_coordinates, lines_with_coordinates, lines, pdf_file = extract_spatial_information_from_pdf(pdf_file, options)
+
+    # If the text of the PDF could not be extracted, there is nothing to search in, so the placeholder result is returned directly
+    if lines is None:
+        return fallback_extraction_result(pdf_basename)
+
+    # Prepare the lines once for all following search functions using build_document(), this includes the lowercase lines, the sentences,
+    # the start of the reference section and all drought definition and study site keywords, which are searched in a single pass over the text
+    with instrumentation.stage('build_document'):
+        document = build_document(lines, DOCUMENT_KEYWORD_MATCHER)
+    # The keyword pass runs the combined keyword pattern once over every line
+    instrumentation.count('keyword_pattern_checks', len(lines))
+    instrumentation.count('keyword_hits', len(document.keyword_hits))
+
+    # Execute the helper function 'find_drought_definitions()' to find out how drought was defined in a study
+    with instrumentation.stage('find_drought_definitions'):
+        drought_characterization, drought_characterization_keywords = find_drought_definitions(document, pdf_file)
+
+    # Execute the helper function 'find_study_type()' to get study type of a study
+    with instrumentation.stage('find_study_type'):
+        study_type = find_study_type(document, pdf_file)
+
+    # Execute the helper function 'find_analyzed_years()' to find out the studied years
+    with instrumentation.stage('find_analyzed_years'):
+        analyzed_years = find_analyzed_years(document)
+
+    # Execute the helper function 'find_periods_with_drought()' to find out the given drought period(s) of a study
+    with instrumentation.stage('find_periods_with_drought'):
+        periods_with_drought = find_periods_with_drought(document)
+
+    # Execute the helper function find_single_years_with_drought to find out given drought year(s) of a study
+    with instrumentation.stage('find_single_years_with_drought'):
+        single_years_with_drought = find_single_years_with_drought(document)
+
+    # Execute the helper function 'find_study_site()' to find out the site(s) for a study
+    with instrumentation.stage('find_study_site'):
+        study_site_context = find_study_site(document)
+
+    # All search functions are finished, so the text of the PDF is released before the results are put together
+    del lines, document
+
+    # Check whether coordinates and/or study areas have been found
+    coordinates_found = bool(final_coordinates)
+    study_site_lines_found  = bool(lines_with_coordinates)
+
+    # If valid coordinates were found, they are joined as a string,
+    # otherwise 'No coordinates found/given' is set for logging output.
+    coordinates_str = ', '.join(final_coordinates) if coordinates_found else 'No coordinates found/given'
+
+    # If context lines with coordinates were found, these are joined as a string,
+    # otherwise 'No study sites found/given' is set for logging.
+    coordinate_context_lines = '; '.join(
+        lines_with_coordinates) if study_site_lines_found else 'No study sites found/given'
+
+    # If a study region/site was found, the result is cleaned up so that it can be further processed with openpyxl,
+    # otherwise 'No study sites found/given' is set for logging.
+    cleaned_study_site_context = clean_and_remove_control_characters(
+        study_site_context) if study_site_context else 'No study sites found/given'
+
+    # Logging the results of the extractions by calling the logging_extraction_results() function
+    logging_extraction_results(pdf_basename, coordinates_str, coordinate_context_lines, cleaned_study_site_context,
+                               drought_characterization_keywords, study_type, analyzed_years, periods_with_drought, single_years_with_drought)
+
+    # If valid coordinates were found, their context lines are stored, otherwise the cleaned study site
+    # or a placeholder ('') if no study region/site was found either
+    if final_coordinates:
+        context_lines = coordinate_context_lines
+    elif study_site_context:
+        context_lines = cleaned_study_site_context
+    else:
+        context_lines = ''
+
+    # Return all extracted information of the PDF
+    return ExtractionResult(
+        pdf_basename,
+        coordinates_str,
+        context_lines,
+        drought_characterization,
+        drought_characterization_keywords,
+        study_type,
+        analyzed_years,
+        periods_with_drought,
+        single_years_with_drought
+    )
+
+def process_pdf_safely(pdf_file, options=None):
+    """
+    Calls process_pdf() for a single PDF file, but returns the placeholder result instead of stopping the whole run,
+    if the PDF needs more memory than is available (e.g. because of the memory limit of process_pdf_isolated()).
+
+    Args:
+        pdf_file (str): The full file path to the PDF file to be processed.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
+
+    Returns:
+        ExtractionResult: The extracted data for the PDF file.
+    """
+    try:
+        return process_pdf(pdf_file, options)
+    except MemoryError:
+        pdf_basename = os.path.splitext(os.path.basename(pdf_file))[0]
+        reason = "Extraction aborted: memory limit exceeded"
+        logging.error(f"{reason} while searching '{pdf_file}'")
+        return fallback_extraction_result(pdf_basename, reason)
+
+def process_pdf_measured(pdf_file, options=None):
+    """
+    Calls process_pdf_safely() for a single PDF file and measures the time and counters of every stage with 'instrumentation'.
+    If the PDF is the one chosen for profiling in the options, it is additionally searched with a profiler.
+
+    Args:
+        pdf_file (str): The full file path to the PDF file to be processed.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
+
+    Returns:
+        tuple: The ExtractionResult of the PDF and its measurements (DocumentMetrics).
+    """
+    options = options or TextExtractionOptions()
+    pdf_basename = os.path.splitext(os.path.basename(pdf_file))[0]
+
+    instrumentation.start_document(pdf_basename)
+    start = time.perf_counter()
+    if pdf_basename == options.profile_document:
+        profile_path = os.path.join(options.profile_dir, f"profile_{pdf_basename}")
+        result = instrumentation.profile_call(process_pdf_safely, (pdf_file, options), profile_path, options.profiler)
+    else:
+        result = process_pdf_safely(pdf_file, options)
+
+    # Only the placeholder result of a PDF that could not be searched has a reason
+    status = result.failure_reason or 'ok'
+    return result, instrumentation.finish_document(time.perf_counter() - start, status)
+
+def fallback_extraction_measured(pdf_file, reason, seconds=0.0):
+    """
+    Creates the placeholder result for a PDF file whose process was stopped or died, together with its measurements for the report.
+
+    Args:
+        pdf_file (str): The full file path to the PDF file.
+        reason (str): Why the PDF could not be searched.
+        seconds (float): The time the PDF took until it was stopped.
+
+    Returns:
+        tuple: The placeholder result as returned by fallback_extraction_result() and the measurements of the PDF (DocumentMetrics).
+    """
+    pdf_basename = os.path.splitext(os.path.basename(pdf_file))[0]
+    logging.error(f"{reason} while searching '{pdf_file}'")
+    metrics = instrumentation.DocumentMetrics(pdf_basename, status=reason, seconds=seconds)
+    return fallback_extraction_result(pdf_basename, reason), metrics
+
+def run_isolated_worker(connection, pdf_file, options, max_memory):
+    """
+    Searches a single PDF file inside its own process started by process_pdf_isolated() and sends the result back through a pipe.
+
+    Args:
+        connection (Connection): The sending end of the pipe to the main process.
+        pdf_file (str): The full file path to the PDF file to be processed.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
+        max_memory (int or None): The maximum memory (address space) of the process in bytes, None for no limit.
+
+    References:
+        - 'resource.setrlimit()': https://docs.python.org/3/library/resource.html#resource.setrlimit
+        - 'Connection.send()': https://docs.python.org/3/library/multiprocessing.html#multiprocessing.connection.Connection.send
+    """
+    # Limit the memory of this process, so that allocating more raises a MemoryError instead of slowing down the whole system
+    if max_memory and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+
+    connection.send(process_pdf_measured(pdf_file, options))
+    connection.close()
+
+def process_pdfs_isolated(pdf_files, workers=1, options=None, timeout=None, max_memory=None):
+    """
+    Searches every PDF file in its own process, so that a PDF which takes longer than the time limit can be stopped
+    and a PDF which needs more than the memory limit only fails itself. At most 'workers' processes run at the same time.
+    A PDF that hits one of the limits gets the placeholder result with the reason, and the run continues with the next PDF.
+    The results are given out in the order of the PDF files as soon as all PDFs in front of them are finished.
+
+    Args:
+        pdf_files (list): The full file paths to the PDF files to be processed.
+        workers (int): The maximum number of processes running at the same time.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
+        timeout (float or None): The maximum time in seconds a single PDF may take, None for no limit.
+        max_memory (int or None): The maximum memory of the process of a single PDF in bytes, None for no limit.
+
+    Yields:
+        tuple: Pairs of the ExtractionResult and the measurements of the PDF, in the same order as the PDF files.
+
+    References:
+        - 'multiprocessing.Process': https://docs.python.org/3/library/multiprocessing.html#multiprocessing.Process
+        - 'multiprocessing.connection.wait()': https://docs.python.org/3/library/multiprocessing.html#multiprocessing.connection.wait
+    """
+    # Without the 'resource' module (e.g. on Windows) only the time limit can be used
+    if max_memory and resource is None:
+        logging.error("The memory limit is not supported on this operating system and is ignored")
+
+    # Dictionary to store the results and measurements of each PDF file by its path until they can be given out in the original order
+    results_by_file = {}
+    next_index = 0
+
+    # PDFs that are still waiting for a process and the running processes with their PDF and deadline, stored by the receiving end of their pipe
+    waiting_pdf_files = list(reversed(pdf_files))
+    running = {}
+
+    while waiting_pdf_files or running:
+        # Start new processes until the maximum number of processes is running
+        while waiting_pdf_files and len(running) < max(workers, 1):
+            pdf_file = waiting_pdf_files.pop()
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(target=run_isolated_worker, args=(sender, pdf_file, options, max_memory), daemon=True)
+            process.start()
+            # The sending end is only needed by the new process, closing it here lets the receiver notice when the process died
+            sender.close()
+            running[receiver] = (pdf_file, process, time.monotonic())
+
+        # Wait until a process sent its result or died, but not longer than until the next deadline
+        wait_time = max(0, min(start for _, _, start in running.values()) + timeout - time.monotonic()) if timeout else None
+        for receiver in wait(list(running), timeout=wait_time):
+            pdf_file, process, running_since = running.pop(receiver)
+            try:
+                results_by_file[pdf_file] = receiver.recv()
+            # If the process died without sending a result (e.g. a crash inside pdfminer), the PDF gets the placeholder result
+            except EOFError:
+                process.join()
+                reason = f"Extraction aborted: worker process ended with exit code {process.exitcode}"
+                results_by_file[pdf_file] = fallback_extraction_measured(pdf_file, reason, time.monotonic() - running_since)
+            process.join()
+            receiver.close()
+
+        # Stop every process that took longer than the time limit
+        now = time.monotonic()
+        for receiver, (pdf_file, process, running_since) in list(running.items()):
+            if timeout and now - running_since >= timeout:
+                process.terminate()
+                process.join()
+                receiver.close()
+                del running[receiver]
+                reason = f"Extraction aborted: time limit of {timeout:g} s exceeded"
+                results_by_file[pdf_file] = fallback_extraction_measured(pdf_file, reason, now - running_since)
+
+        # Give out all results for which every PDF in front of them is finished
+        while next_index < len(pdf_files) and pdf_files[next_index] in results_by_file:
+            yield results_by_file.pop(pdf_files[next_index])
+            next_index += 1
+
+def process_pdf_in_fresh_process(pdf_file, options=None):
+    """
+    Searches a single PDF file again in its own new worker process after the worker pool broke down,
+    so that a single broken PDF can only take down itself.
+
+    Args:
+        pdf_file (str): The full file path to the PDF file to be processed.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
+
+    Returns:
+        tuple: The ExtractionResult of the PDF and its measurements (DocumentMetrics).
+    """
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        try:
+            return executor.submit(process_pdf_measured, pdf_file, options).result()
+        # If the worker process dies again, this PDF is the broken one and gets the placeholder result
+        except BrokenProcessPool:
+            return fallback_extraction_measured(pdf_file, "The worker process crashed")
+
+def process_pdfs_in_pool(pdf_files, workers, options=None):
+    """
+    Spreads the PDF files across a pool of worker processes. If a worker process dies (e.g. because of a crash inside pdfminer),
+    every PDF that was lost with it is searched again in its own fresh process by process_pdf_in_fresh_process().
+
+    Args:
+        pdf_files (list): The full file paths to the PDF files to be processed.
+        workers (int): The number of worker processes.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
+
+    Yields:
+        tuple: Pairs of the ExtractionResult and the measurements of the PDF, in the same order as the PDF files.
+
+    References:
+        - 'ProcessPoolExecutor': https://docs.python.org/3/library/concurrent.futures.html#processpoolexecutor
+        - 'BrokenProcessPool': https://docs.python.org/3/library/concurrent.futures.html#concurrent.futures.process.BrokenProcessPool
+    """
+    # Spread the PDFs across the worker processes, the futures are collected in the order of the PDF files
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {pdf_file: executor.submit(process_pdf_measured, pdf_file, options) for pdf_file in pdf_files}
+        for pdf_file in pdf_files:
+            # The future is removed once it is done, so that its result can be freed as soon as it is given out
+            future = futures.pop(pdf_file)
+            try:
+                measured_result = future.result()
+            # If a worker process died, all PDFs that were not finished at that point are lost, so they are searched again one by one
+            except BrokenProcessPool:
+                measured_result = process_pdf_in_fresh_process(pdf_file, options)
+            yield measured_result
+
+def iter_extraction_results(folder_path, workers=1, options=None, timeout=None, max_memory=None, skip_basenames=None, manifest_path=None,
+                            journal_path=None, resume=False):
+    """
+    Processes extracted results from a PDF file and appends relevant data to the results list that is used by extract_spatial_information() to give it to the main module
+
+    This function acts as a management function for this module, as it calls process_pdf() for every PDF file in the given folder,
+    which calls all other functions, converts the information to strings and also calls the logging function, for an information output.
+    If more than one worker is requested, the PDF files are spread across a pool of processes by process_pdfs_in_pool(), while the order of the results stays the same as in the sequential case.
+    If a time or memory limit is given, every PDF file is searched in its own process by process_pdfs_isolated(), so that the limits can be enforced.
+    The results are given out one by one as soon as a PDF is finished, so that they can be stored before the remaining PDFs are searched.
+
+    Args:
+        folder_path (str): The path to the folder containing PDF files to be processed.
+        workers (int): The number of processes used to search the PDF files in parallel, 1 means that all PDFs are searched one after another in this process.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
+        timeout (float or None): The maximum time in seconds a single PDF may take, None for no limit.
+        max_memory (int or None): The maximum memory of the process of a single PDF in bytes, None for no limit.
+        skip_basenames (set or None): The file names (without .pdf) of PDFs which are not searched, e.g. because they are already stored in the Excel file.
+        manifest_path (str or None): The path to the manifest of already searched PDFs, if only new or changed PDFs should be searched,
+                                     the stored results of all other PDFs are given out instead (as StoredExtractionResult).
+        journal_path (str or None): The path to the journal, into which the result of every searched PDF is written as soon as it is finished.
+        resume (bool): Whether the PDFs that are already in the journal (of a stopped run) are not searched again, but their results are given out instead.
+
+    Yields:
+        ExtractionResult: The extracted data for each PDF file, in the order of the PDF files, with the following fields:
             - pdf_basename (str): The file name of the PDF without the file extension (.pdf)
-            - coordinates_str (str): The valid coordinates or 'No coordinates found/given' if there were no coordinates found or given
-            - coordinate_context_lines (str): The context lines of coordinates as string
-            - cleaned_context_lines (str): The context lines of study sites as string (only if no valid coordinates were found) or a placeholder '' (if no valid coordinates and no study site were found)
+            - coordinates (str): The valid coordinates or 'No coordinates found/given' if there were no coordinates found or given
+            - context_lines (str): The context lines of coordinates as string, the context lines of study sites as string (only if no valid coordinates were found)
+                                   or a placeholder '' (if no valid coordinates and no study site were found)
             - drought_characterization (str) The context lines of the found drought keywords
             - drought_characterization_keywords (list): The found keywords how drought was characterized
             - study_type (str): The approach to study drought of a study.
             - analyzed_years (list): The general years analyzed by a study or 'No analyzed years specified'
             - periods_with_drought (list): Time periods were a study characterized drought or 'No drought periods found/given'.
             - single_years_with_drought (list): Year(s) were a study characterized drought or 'No single drought years found/given'.
+            - failure_reason (str or None): Why the PDF could not be searched, None if it was searched.
+
+    References:
+        - 'ProcessPoolExecutor': https://docs.python.org/3/library/concurrent.futures.html#processpoolexecutor
+        - 'BrokenProcessPool': https://docs.python.org/3/library/concurrent.futures.html#concurrent.futures.process.BrokenProcessPool
+    """
+
+    # Get all PDF files in a fixed order, so that the results are always in the same order
+    pdf_files = list_pdf_files(folder_path)
+
+    # Leave out the PDFs which should not be searched again
+    if skip_basenames:
+        all_pdf_files, pdf_files = pdf_files, [pdf_file for pdf_file in pdf_files if os.path.splitext(os.path.basename(pdf_file))[0] not in skip_basenames]
+        logging.info(f"Skipping {len(all_pdf_files) - len(pdf_files)} PDF(s) which are already stored")
+
+    rules_version = extraction_rules_version(options)
+
+    # Results that do not need to be searched again: the unchanged PDFs of the manifest and the PDFs finished before a stopped run
+    # Only the results of the manifest are already stored in the Excel file, the results of the journal were not written into it by the stopped run
+    stored_records = {}
+    result_types = {}
+    connection = None
+    if manifest_path:
+        connection = manifest.open_manifest(manifest_path)
+        stored_records.update(manifest.find_stored_records(connection, pdf_files, rules_version))
+        result_types.update(dict.fromkeys(stored_records, StoredExtractionResult))
+    if journal_path and resume:
+        journal_records = journal.read_journal(journal_path, rules_version)
+        stored_records.update({pdf_file: journal_records[os.path.abspath(pdf_file)] for pdf_file in pdf_files if os.path.abspath(pdf_file) in journal_records})
+        result_types.update(dict.fromkeys((pdf_file for pdf_file in pdf_files if os.path.abspath(pdf_file) in journal_records), ExtractionResult))
+    journal_file = journal.open_journal(journal_path, resume) if journal_path else None
+
+    try:
+        changed_pdf_files = [pdf_file for pdf_file in pdf_files if pdf_file not in stored_records]
+        if stored_records:
+            logging.info(f"Searching {len(changed_pdf_files)} PDF(s), reusing the stored results of {len(stored_records)} PDF(s)")
+
+        # The searched PDFs come in the order of the PDF files, so they can be merged with the stored results in this order
+        measured_results = iter_measured_results(changed_pdf_files, workers, options, timeout, max_memory)
+        for pdf_file in pdf_files:
+            if pdf_file in stored_records:
+                yield result_types[pdf_file](**stored_records.pop(pdf_file))
+                continue
+
+            result, metrics = next(measured_results)
+            # Keep the measurements of every PDF for the timing report of the run
+            instrumentation.record_document(metrics)
+            # Only successfully searched PDFs are stored in the manifest, so that PDFs that failed (e.g. because of the time limit) are searched again next time
+            if connection is not None and metrics.status == 'ok':
+                manifest.store_record(connection, pdf_file, rules_version, result)
+            if journal_file is not None:
+                journal.append_to_journal(journal_file, pdf_file, rules_version, result)
+            yield result
+    finally:
+        if connection is not None:
+            connection.close()
+        if journal_file is not None:
+            journal_file.close()
+
+def iter_measured_results(pdf_files, workers=1, options=None, timeout=None, max_memory=None):
+    """
+    Searches the given PDF files in the way that fits the given workers and limits (see iter_extraction_results()).
+
+    Args:
+        pdf_files (list): The full file paths to the PDF files to be processed.
+        workers (int): The number of processes used to search the PDF files in parallel.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
+        timeout (float or None): The maximum time in seconds a single PDF may take, None for no limit.
+        max_memory (int or None): The maximum memory of the process of a single PDF in bytes, None for no limit.
+
+    Returns:
+        iterator: Pairs of the ExtractionResult and the measurements of the PDF, in the same order as the PDF files.
+    """
+    # The limits can only be enforced, if every PDF is searched in its own process
+    if timeout or max_memory:
+        return process_pdfs_isolated(pdf_files, workers, options, timeout, max_memory)
+
+    # Without additional workers all PDFs are processed one after another in this process
+    if workers <= 1:
+        return (process_pdf_measured(pdf_file, options) for pdf_file in pdf_files)
+
+    return process_pdfs_in_pool(pdf_files, workers, options)
+
+def process_extraction_results(folder_path, workers=1, options=None, timeout=None, max_memory=None, skip_basenames=None, manifest_path=None,
+                               journal_path=None, resume=False):
     """
+    Searches all PDF files in the given folder with iter_extraction_results() and collects their results in a list.
+
+    Args:
+        folder_path (str): The path to the folder containing PDF files to be processed.
+        workers (int): The number of processes used to search the PDF files in parallel, 1 means that all PDFs are searched one after another in this process.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
+        timeout (float or None): The maximum time in seconds a single PDF may take, None for no limit.
+        max_memory (int or None): The maximum memory of the process of a single PDF in bytes, None for no limit.
+        skip_basenames (set or None): The file names (without .pdf) of PDFs which are not searched.
+        manifest_path (str or None): The path to the manifest of already searched PDFs, if only new or changed PDFs should be searched.
+        journal_path (str or None): The path to the journal, into which the result of every searched PDF is written as soon as it is finished.
+        resume (bool): Whether the PDFs that are already in the journal are not searched again.
 
-    # Call the extract_spatial_information_from_pdfs() function and store the given information into 'spatial_data'
-    spatial_data = extract_spatial_information_from_pdfs(folder_path)
-
-    # Create a list to store all information in, that will be given to 'extracted_data' in the main module
-    results = []
-
-    # To ensure that the PDFs are all processed in sequence and that the information always fit together, use the data from the extract_spatial_information_from_pdfs() function
-    for pdf_basename, final_coordinates, lines_with_coordinates, lines, pdf_file in spatial_data:
-
-        # Execute the helper function 'find_drought_definitions()' to find out how drought was defined in a study
-        drought_characterization, drought_characterization_keywords = find_drought_definitions(lines, pdf_file)
-
-        # Execute the helper function 'find_study_type()' to get study type of a study
-        study_type = find_study_type(lines, pdf_file)
-
-        # Execute the helper function 'find_analyzed_years()' to find out the studied years
-        analyzed_years = find_analyzed_years(lines)
-
-        # Execute the helper function 'find_periods_with_drought()' to find out the given drought period(s) of a study
-        periods_with_drought = find_periods_with_drought(lines)
-
-        # Execute the helper function find_single_years_with_drought to find out given drought year(s) of a study
-        single_years_with_drought = find_single_years_with_drought(lines)
-
-        # Check whether coordinates and/or study areas have been found
-        coordinates_found = bool(final_coordinates)
-        study_site_lines_found  = bool(lines_with_coordinates)
-
-        # If valid coordinates were found, they are joined as a string,
-        # otherwise 'No coordinates found/given' is set for logging output.
-        coordinates_str = ', '.join(final_coordinates) if coordinates_found else 'No coordinates found/given'
-
-        # If context lines with coordinates were found, these are joined as a string,
-        # otherwise 'No study sites found/given' is set for logging.
-        coordinate_context_lines = '; '.join(
-            lines_with_coordinates) if study_site_lines_found else 'No study sites found/given'
-
-        # Execute the helper function 'find_study_site()' to find out the site(s) for a study
-        study_site_context = find_study_site(lines)
-        cleaned_study_site_context = clean_and_remove_control_characters(
-            study_site_context) if study_site_context else 'No study sites found/given'
-
-        # Logging the results of the extractions by calling the logging_extraction_results() function
-        logging_extraction_results(pdf_basename, coordinates_str, coordinate_context_lines, cleaned_study_site_context,
-                                   drought_characterization_keywords, study_type, analyzed_years, periods_with_drought, single_years_with_drought)
-
-        # Save all results for the case, that valid coordinates were found
-        if final_coordinates:
-            # Return tuple with all extracted information, including valid coordinates and context lines
-            results.append((
-                pdf_basename,
-                coordinates_str,
-                coordinate_context_lines,
-                drought_characterization,
-                drought_characterization_keywords,
-                study_type,
-                analyzed_years,
-                periods_with_drought,
-                single_years_with_drought
-            ))
-        # If no valid coordinates were found, get the study locations from the helper function 'find_study_site()'
-        else:
-            study_site_context = find_study_site(lines)
-            # If a study region/site was found by the helper function 'find_study_site()',
-            # the result is cleaned up so that it can be further processed with openpyxl and the results are saved.
-            if study_site_context:
-                cleaned_context_lines = clean_and_remove_control_characters(study_site_context)
-                results.append((
-                    pdf_basename,
-                    'No coordinates found/given',
-                    cleaned_context_lines,
-                    drought_characterization,
-                    drought_characterization_keywords,
-                    study_type,
-                    analyzed_years,
-                    periods_with_drought,
-                    single_years_with_drought
-                ))
-            # If nothing was found by the helper function 'find_study_site()', a placeholder gets added to the results ('')
-            else:
-                results.append((
-                    pdf_basename,
-                    'No coordinates found/given',
-                    '',
-                    drought_characterization,
-                    drought_characterization_keywords,
-                    study_type,
-                    analyzed_years,
-                    periods_with_drought,
-                    single_years_with_drought
-                ))
-
-    return results
\ No newline at end of file
+    Returns:
+        list: The ExtractionResult of each PDF file as described in iter_extraction_results().
+    """
+    return list(iter_extraction_results(folder_path, workers, options, timeout, max_memory, skip_basenames, manifest_path, journal_path, resume))
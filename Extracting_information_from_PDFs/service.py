@@ -0,0 +1,521 @@
+"""
+service.py
+
+This script offers the information retrieval as a small local HTTP service, so that other tools can have PDFs searched without starting
+the extraction themselves. It only uses the standard library (asyncio), so it runs without an internet connection and without additional
+libraries. The PDFs are searched in a pool of worker processes with a limited number of places; if all places are taken, further
+requests are answered with '503 Service Unavailable' instead of piling up.
+
+Endpoints:
+    POST /extract   Searches a single PDF, either uploaded as body ('Content-Type: application/pdf', the file name is given with '?name=...')
+                    or given as path inside the folder of the PDFs ('Content-Type: application/json', {"path": "..."}).
+    POST /batch     Searches several PDFs of the folder of the PDFs at once ({"paths": ["...", ...]}).
+    GET  /metrics   Gives out the latencies of every stage and the state of the queue.
+
+Author:
+    Jonathan Mattis Wisser
+    jmader@uni-muenster.de
+
+Version:
+    1.0
+Datum:
+    2026-10-17
+"""
+
+__author__ = "Jonathan Mattis Wisser"
+__version__ = "1.0"
+__date__ = "2026-10-17"
+
+# ------------------------------------------------- IMPORTS ---------------------------------------------------------- #
+# 'os', 'shutil' and 'tempfile' for data management (checking the given paths and storing uploaded PDFs temporarily)
+import os
+import shutil
+import tempfile
+
+# 'asyncio' for the HTTP server, 'json' for the bodies of the requests and responses
+import asyncio
+import json
+
+# 'time' to measure the time of every request
+import time
+
+# 'urllib.parse' to read the path and the query of a request, 'urllib.request' for the client
+from urllib.parse import urlsplit, parse_qs, quote
+from urllib.request import Request, urlopen
+
+# 'asdict' to give out the extracted information by the names of its fields
+from dataclasses import asdict
+
+# 'ProcessPoolExecutor' for the worker processes, which are started once and kept for all requests
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# The search of a single PDF and the measurements of every stage
+from pdf_processing import process_pdf_measured, process_pdf_in_fresh_process
+import instrumentation
+
+# Logging for a better understanding of the results and outputs as set up in the main module
+# Logging.info() and logging.error() are used here
+# https://docs.python.org/3/library/logging.html#logging.INFO
+# https://docs.python.org/3/library/logging.html#logging.error
+import logging
+
+# ------------------------------------------------- SET-UPS ---------------------------------------------------------- #
+# Address of the service, only reachable from this computer by default
+SERVICE_HOST = '127.0.0.1'
+SERVICE_PORT = 8000
+
+# Number of PDFs which may wait for a free worker process, further requests are answered with '503 Service Unavailable'
+QUEUE_SIZE = 32
+
+# Maximum size of an uploaded PDF, of a JSON body and of the header of a request in bytes
+MAX_UPLOAD_BYTES = 100 * 1024 * 1024
+MAX_JSON_BYTES = 1024 * 1024
+MAX_HEADER_BYTES = 64 * 1024
+
+# Size of the parts in which an uploaded PDF is read from the connection and written into its temporary file, so it is never kept in memory completely
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+# Number of the last searched PDFs whose measurements are used for the latencies of '/metrics'
+METRICS_WINDOW = 1000
+
+# Reason phrases of the used HTTP status codes
+# https://developer.mozilla.org/en-US/docs/Web/HTTP/Status
+HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 403: 'Forbidden', 404: 'Not Found', 405: 'Method Not Allowed', 411: 'Length Required',
+                413: 'Content Too Large', 415: 'Unsupported Media Type', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+class HTTPError(Exception):
+    """
+    An error that is answered with the given HTTP status code and message.
+
+    Attributes:
+        status (int): The HTTP status code.
+        message (str): The message given out in the body of the response.
+    """
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+# ------------------------------------------------- UTILITY ---------------------------------------------------------- #
+def build_metrics(queue_state):
+    """
+    Summarizes the measurements of the last 'METRICS_WINDOW' searched PDFs into the latencies of every stage.
+
+    Args:
+        queue_state (dict): The state of the queue of the service.
+
+    Returns:
+        dict: The number of searched and failed PDFs, the latencies of every stage and of the whole PDF and the state of the queue.
+    """
+    documents = instrumentation.RUN_DOCUMENTS[-METRICS_WINDOW:]
+    stage_seconds = {'total': sorted(metrics.seconds for metrics in documents)}
+    for metrics in documents:
+        for name, seconds in metrics.stages.items():
+            stage_seconds.setdefault(name, []).append(seconds)
+
+    latencies = {}
+    for name, seconds in stage_seconds.items():
+        seconds.sort()
+        latencies[name] = {'count': len(seconds), 'mean': sum(seconds) / len(seconds) if seconds else 0.0,
+                           'p50': instrumentation.percentile(seconds, 0.5), 'p95': instrumentation.percentile(seconds, 0.95), 'max': seconds[-1] if seconds else 0.0}
+
+    return {
+        'documents_total': len(instrumentation.RUN_DOCUMENTS),
+        'documents_failed': sum(metrics.status != 'ok' for metrics in instrumentation.RUN_DOCUMENTS),
+        'window': len(documents),
+        'latencies': latencies,
+        'queue': queue_state,
+    }
+
+def parse_json(body):
+    """
+    Reads the JSON body of a request.
+
+    Args:
+        body (bytes): The body of the request.
+
+    Returns:
+        dict: The content of the body.
+
+    Raises:
+        HTTPError: If the body is not a JSON object.
+    """
+    try:
+        content = json.loads(body or b'{}')
+    except ValueError:
+        raise HTTPError(400, "The body is not valid JSON")
+    if not isinstance(content, dict):
+        raise HTTPError(400, "The body must be a JSON object")
+    return content
+
+async def read_request(reader):
+    """
+    Reads the header of an HTTP request from the connection. Only requests with a 'Content-Length' are supported, every connection handles one request.
+    The body is not read here, so that the request can be rejected (e.g. if the service is busy) before a large upload is received.
+
+    Args:
+        reader (asyncio.StreamReader): The reading side of the connection.
+
+    Returns:
+        tuple: The method, the path, the query (dict) and the headers (dict with lowercase names) of the request and the length of its body in bytes.
+
+    Raises:
+        HTTPError: If the request is not valid or too large.
+
+    References:
+        - HTTP/1.1 message format: https://www.rfc-editor.org/rfc/rfc9112#section-2.1
+        - 'StreamReader.readuntil()': https://docs.python.org/3/library/asyncio-stream.html#asyncio.StreamReader.readuntil
+    """
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+    except asyncio.LimitOverrunError:
+        raise HTTPError(400, "Request header too large")
+
+    request_line, *header_lines = head.decode('latin-1').rstrip('\r\n').split('\r\n')
+    try:
+        method, target, _ = request_line.split(' ', 2)
+    except ValueError:
+        raise HTTPError(400, "Invalid request line")
+
+    headers = {}
+    for header_line in header_lines:
+        name, _, value = header_line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    length = 0
+    if method == 'POST':
+        if 'content-length' not in headers:
+            raise HTTPError(411, "A 'Content-Length' header is required")
+        try:
+            length = int(headers['content-length'])
+        except ValueError:
+            raise HTTPError(400, "Invalid 'Content-Length' header")
+        if length < 0:
+            raise HTTPError(400, "Invalid 'Content-Length' header")
+        if length > MAX_UPLOAD_BYTES:
+            raise HTTPError(413, f"The body must not be larger than {MAX_UPLOAD_BYTES} bytes")
+
+    url = urlsplit(target)
+    return method, url.path, parse_qs(url.query), headers, length
+
+async def read_json_body(reader, length):
+    """
+    Reads the (small) JSON body of a request and its content.
+
+    Args:
+        reader (asyncio.StreamReader): The reading side of the connection.
+        length (int): The length of the body in bytes as given by read_request().
+
+    Returns:
+        dict: The content of the body.
+
+    Raises:
+        HTTPError: If the body is too large or not a JSON object.
+    """
+    if length > MAX_JSON_BYTES:
+        raise HTTPError(413, f"A JSON body must not be larger than {MAX_JSON_BYTES} bytes")
+    return parse_json(await reader.readexactly(length))
+
+async def receive_upload(reader, length, pdf_file):
+    """
+    Writes an uploaded PDF from the connection into a file, part by part, so that it is never kept in memory completely.
+    The file is opened, written and closed in a thread, so that the other requests are not blocked while waiting for the disk.
+
+    Args:
+        reader (asyncio.StreamReader): The reading side of the connection.
+        length (int): The length of the body in bytes as given by read_request().
+        pdf_file (str): The full file path the PDF is written to.
+
+    References:
+        - 'loop.run_in_executor()': https://docs.python.org/3/library/asyncio-eventloop.html#asyncio.loop.run_in_executor
+    """
+    loop = asyncio.get_running_loop()
+    file = await loop.run_in_executor(None, open, pdf_file, 'wb')
+    try:
+        remaining = length
+        while remaining:
+            chunk = await reader.readexactly(min(remaining, UPLOAD_CHUNK_BYTES))
+            await loop.run_in_executor(None, file.write, chunk)
+            remaining -= len(chunk)
+    finally:
+        await loop.run_in_executor(None, file.close)
+
+async def write_response(writer, status, payload, extra_headers=None):
+    """
+    Writes an HTTP response with a JSON body and closes the connection.
+
+    Args:
+        writer (asyncio.StreamWriter): The writing side of the connection.
+        status (int): The HTTP status code.
+        payload (dict or list): The body of the response, which is given out as JSON.
+        extra_headers (dict or None): Additional headers (e.g. 'Retry-After').
+    """
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    headers = {'Content-Type': 'application/json; charset=utf-8', 'Content-Length': str(len(body)), 'Connection': 'close', **(extra_headers or {})}
+    head = f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n" + ''.join(f"{name}: {value}\r\n" for name, value in headers.items()) + "\r\n"
+    writer.write(head.encode('latin-1') + body)
+    await writer.drain()
+    writer.close()
+
+# ------------------------------------------------- PROCESSING ------------------------------------------------------- #
+class ExtractionService:
+    """
+    The HTTP service with its pool of worker processes and the number of PDFs that are searched or waiting at the moment.
+
+    Attributes:
+        folder_path (str): The folder of the PDFs, only PDFs inside it can be given as path.
+        workers (int): The number of worker processes.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
+        queue_size (int): The number of PDFs which may wait for a free worker process.
+        active (int): The number of PDFs that are searched or waiting at the moment.
+        rejected (int): The number of PDFs that were rejected because the queue was full.
+    """
+    def __init__(self, folder_path, workers=1, options=None, queue_size=QUEUE_SIZE):
+        self.folder_path = os.path.realpath(folder_path)
+        self.workers = max(workers, 1)
+        self.options = options
+        self.queue_size = queue_size
+        self.active = 0
+        self.rejected = 0
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def reserve(self, count):
+        """
+        Reserves places in the pool for the given number of PDFs, or rejects them all if there are not enough places left.
+
+        Args:
+            count (int): The number of PDFs.
+
+        Raises:
+            HTTPError: '503 Service Unavailable' if the worker processes and the queue are full.
+        """
+        if self.active + count > self.workers + self.queue_size:
+            self.rejected += count
+            raise HTTPError(503, "All worker processes and the queue are busy, please try again later")
+        self.active += count
+
+    def release(self, count):
+        """
+        Frees the places reserved with reserve() again, which must be done in any case, also if the request failed.
+
+        Args:
+            count (int): The number of PDFs.
+        """
+        self.active -= count
+
+    def resolve_path(self, path):
+        """
+        Checks that a given path points to an existing PDF inside the folder of the PDFs.
+
+        Args:
+            path (str): The path, absolute or relative to the folder of the PDFs.
+
+        Returns:
+            str: The full file path to the PDF file.
+
+        Raises:
+            HTTPError: If the path is outside the folder of the PDFs or the PDF does not exist.
+        """
+        pdf_file = os.path.realpath(os.path.join(self.folder_path, path))
+        if os.path.commonpath([pdf_file, self.folder_path]) != self.folder_path:
+            raise HTTPError(403, f"Only PDFs inside '{self.folder_path}' can be searched")
+        if not pdf_file.endswith('.pdf') or not os.path.isfile(pdf_file):
+            raise HTTPError(404, f"No PDF found at '{path}'")
+        return pdf_file
+
+    async def search(self, pdf_file):
+        """
+        Searches a single PDF in the pool of worker processes. If a worker process dies, the PDF is searched again in its own process
+        and the pool is started anew.
+
+        Args:
+            pdf_file (str): The full file path to the PDF file, a place in the pool must be reserved for it (and released afterward) by the caller.
+
+        Returns:
+            dict: The extracted information of the PDF together with its status and time.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        try:
+            result, metrics = await loop.run_in_executor(executor, process_pdf_measured, pdf_file, self.options)
+        except BrokenProcessPool:
+            # The pool is only started anew once, even if several PDFs were lost with it
+            if self.executor is executor:
+                executor.shutdown(wait=False)
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            result, metrics = await loop.run_in_executor(None, process_pdf_in_fresh_process, pdf_file, self.options)
+
+        instrumentation.record_document(metrics)
+        # Only the measurements of the last PDFs are kept, so that a long-running service does not grow
+        del instrumentation.RUN_DOCUMENTS[:-METRICS_WINDOW]
+        return {**asdict(result), 'status': metrics.status, 'seconds': metrics.seconds}
+
+    async def extract(self, reader, query, headers, length):
+        """
+        Handles 'POST /extract' for an uploaded PDF or a PDF inside the folder of the PDFs.
+        The content type and the free places are checked from the header, before the body is read, so that a busy service
+        does not receive any uploads. An uploaded PDF is written into a temporary file part by part with receive_upload().
+
+        Args:
+            reader (asyncio.StreamReader): The reading side of the connection, from which the body is read.
+            query (dict): The query of the request, 'name' is the file name of an uploaded PDF.
+            headers (dict): The headers of the request.
+            length (int): The length of the body (the uploaded PDF or the JSON body with the path) in bytes.
+
+        Returns:
+            dict: The extracted information of the PDF.
+        """
+        content_type = headers.get('content-type', '').split(';')[0].strip()
+
+        if content_type == 'application/json':
+            pdf_file = self.resolve_path((await read_json_body(reader, length)).get('path', ''))
+            self.reserve(1)
+            try:
+                return await self.search(pdf_file)
+            finally:
+                self.release(1)
+
+        if content_type in ('application/pdf', 'application/octet-stream'):
+            # The PDF is stored under its own name, so that the name of the paper is the same as for a PDF of the folder
+            name = os.path.basename(query.get('name', ['upload'])[0])
+            name = name if name.endswith('.pdf') else name + '.pdf'
+            self.reserve(1)
+            loop = asyncio.get_running_loop()
+            upload_folder = None
+            try:
+                upload_folder = await loop.run_in_executor(None, lambda: tempfile.mkdtemp(prefix='pdf_upload_'))
+                pdf_file = os.path.join(upload_folder, name)
+                await receive_upload(reader, length, pdf_file)
+                return await self.search(pdf_file)
+            finally:
+                self.release(1)
+                if upload_folder is not None:
+                    await loop.run_in_executor(None, lambda: shutil.rmtree(upload_folder, ignore_errors=True))
+
+        raise HTTPError(415, "Use 'application/pdf' to upload a PDF or 'application/json' to give its path")
+
+    async def batch(self, reader, length):
+        """
+        Handles 'POST /batch' for several PDFs inside the folder of the PDFs, which are searched at the same time.
+
+        Args:
+            reader (asyncio.StreamReader): The reading side of the connection, from which the JSON body with the paths is read.
+            length (int): The length of the body in bytes.
+
+        Returns:
+            list: The extracted information of every PDF, in the order of the paths.
+        """
+        paths = (await read_json_body(reader, length)).get('paths')
+        if not isinstance(paths, list) or not paths:
+            raise HTTPError(400, "The body must contain a non-empty list 'paths'")
+        pdf_files = [self.resolve_path(path) for path in paths]
+        self.reserve(len(pdf_files))
+        # All PDFs are waited for before their places are released, also if one of them failed
+        # https://docs.python.org/3/library/asyncio-task.html#asyncio.gather
+        try:
+            results = await asyncio.gather(*(self.search(pdf_file) for pdf_file in pdf_files), return_exceptions=True)
+        finally:
+            self.release(len(pdf_files))
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    async def handle_connection(self, reader, writer):
+        """
+        Answers a single request of a connection.
+
+        Args:
+            reader (asyncio.StreamReader): The reading side of the connection.
+            writer (asyncio.StreamWriter): The writing side of the connection.
+        """
+        start = time.perf_counter()
+        method, path = None, None
+        try:
+            method, path, query, headers, length = await read_request(reader)
+            if path == '/metrics' and method == 'GET':
+                payload = build_metrics({'active': self.active, 'workers': self.workers, 'queue_size': self.queue_size, 'rejected': self.rejected})
+            elif path == '/extract' and method == 'POST':
+                payload = await self.extract(reader, query, headers, length)
+            elif path == '/batch' and method == 'POST':
+                payload = await self.batch(reader, length)
+            elif path in ('/metrics', '/extract', '/batch'):
+                raise HTTPError(405, f"'{method}' is not allowed for '{path}'")
+            else:
+                raise HTTPError(404, f"Unknown endpoint '{path}'")
+            await write_response(writer, 200, payload)
+            logging.info(f"{method} {path} answered in {time.perf_counter() - start:.2f} s")
+
+        except HTTPError as error:
+            logging.error(f"{method} {path}: {error.status} {error.message}")
+            await write_response(writer, error.status, {'error': error.message}, {'Retry-After': '5'} if error.status == 503 else None)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+        except Exception as e:
+            logging.error(f"{method} {path}: unexpected error: {e}")
+            await write_response(writer, 500, {'error': str(e)})
+
+    async def serve(self, host=SERVICE_HOST, port=SERVICE_PORT):
+        """
+        Starts the HTTP server and answers requests until the service is stopped.
+
+        Args:
+            host (str): The address the service listens on.
+            port (int): The port the service listens on.
+
+        References:
+            - 'asyncio.start_server()': https://docs.python.org/3/library/asyncio-stream.html#asyncio.start_server
+        """
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_HEADER_BYTES)
+        logging.info(f"Extraction service listening on http://{host}:{port} with {self.workers} worker process(es)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.executor.shutdown(wait=True)
+
+def run_service(folder_path, workers=1, options=None, host=SERVICE_HOST, port=SERVICE_PORT, queue_size=QUEUE_SIZE):
+    """
+    Runs the HTTP service until it is stopped with Ctrl+C or 'docker stop'.
+
+    Args:
+        folder_path (str): The folder of the PDFs, only PDFs inside it can be given as path.
+        workers (int): The number of worker processes.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
+        host (str): The address the service listens on.
+        port (int): The port the service listens on.
+        queue_size (int): The number of PDFs which may wait for a free worker process.
+    """
+    service = ExtractionService(folder_path, workers, options, queue_size)
+    try:
+        asyncio.run(service.serve(host, port))
+    except KeyboardInterrupt:
+        logging.info("Extraction service stopped")
+
+def submit_pdf(url, pdf_file=None, path=None, timeout=600):
+    """
+    Client for the service: uploads a PDF or gives the path of a PDF inside the folder of the service and returns its extracted information.
+
+    Args:
+        url (str): The address of the service, e.g. 'http://127.0.0.1:8000'.
+        pdf_file (str or None): The PDF file to be uploaded.
+        path (str or None): The path of a PDF inside the folder of the service, used if no PDF file is uploaded.
+        timeout (float): The maximum time in seconds to wait for the answer.
+
+    Returns:
+        dict: The extracted information of the PDF as given out by the service.
+
+    References:
+        - 'urllib.request': https://docs.python.org/3/library/urllib.request.html
+    """
+    if pdf_file is not None:
+        with open(pdf_file, 'rb') as file:
+            body = file.read()
+        name = os.path.basename(pdf_file)
+        request = Request(f"{url}/extract?name={quote(name)}", data=body, headers={'Content-Type': 'application/pdf'})
+    else:
+        request = Request(f"{url}/extract", data=json.dumps({'path': path}).encode('utf-8'), headers={'Content-Type': 'application/json'})
+
+    with urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())
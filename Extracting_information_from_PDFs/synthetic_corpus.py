@@ -0,0 +1,253 @@
+"""
+synthetic_corpus.py
+
+This script creates synthetic scientific papers as PDF files, so that the automated information retrieval can be measured with any number of studies
+and not only with the few example studies. Every paper contains a study area with coordinates in all formats searched by 'pdf_processing',
+drought keywords, analyzed years, drought periods and years as well as a reference section, and can be made as long as needed.
+The PDFs are written directly without any additional library, using the standard font Helvetica.
+
+Author:
+    Jonathan Mattis Wisser
+    jmader@uni-muenster.de
+
+Version:
+    1.0
+Datum:
+    2026-10-17
+"""
+
+__author__ = "Jonathan Mattis Wisser"
+__version__ = "1.0"
+__date__ = "2026-10-17"
+
+# ------------------------------------------------- IMPORTS ---------------------------------------------------------- #
+# 'os' for data management (creating the folder of the corpus)
+import os
+
+# 'random' to vary the content of the papers, always with the same seed so that the corpus is the same every time
+import random
+
+# 'textwrap' to divide the paragraphs into lines that fit on a page
+import textwrap
+
+# ------------------------------------------------- SET-UPS ---------------------------------------------------------- #
+# Number of lines on a page and number of characters in a line (Helvetica in 10 pt on A4 with a margin of about 2 cm)
+LINES_PER_PAGE = 60
+CHARACTERS_PER_LINE = 95
+
+# Templates of coordinates in every format family of 'COORDINATE_PATTERNS', filled with random numbers by create_coordinate()
+# Only characters of the Windows-1252 encoding of the standard fonts can be used, so minutes and seconds are written as ' and "
+COORDINATE_TEMPLATES = [
+    # Decimal degrees
+    "{lat}.{d6}",
+    "{lat}.{d4}° N",
+    "{lat}.{d4}N, {lon}.{d4}E",
+    "{lat}.{d3}°N, {lon}.{d3}°W",
+    "({lat}.{d3}, -{lon}.{d3})",
+    # Degrees
+    "{lat}° S",
+    "{lat}° - {lat2}° N",
+    # Degrees and minutes
+    "{lat}° {m}' N, {lon}°{m2}' E",
+    "{lat}°{m}'{s}.{d2}''",
+    # Degrees, minutes and seconds
+    "{lat}°{m}'{s}\" N",
+    "{lat}°{m}'{s}.{d2}\" W",
+    # Minutes (the degree sign was read as 'o')
+    "{lat}o{m}'N",
+    # Special cases
+    "{lat}.{d2} to {lat2}.{d2} N",
+]
+
+# Keywords which are searched by find_drought_definitions() and find_study_type()
+DROUGHT_SENTENCES = [
+    "Drought intensity was quantified with the SPEI and the scPDSI at a monthly resolution.",
+    "Periods of low soil moisture and reduced rainfall were identified from the soil water content measurements.",
+    "The VPD and PET were derived from the meteorological station data.",
+    "Tree-ring widths were measured on increment cores to analyze the radial growth response to drought.",
+    "Remote sensing data of Sentinel-2 were used to derive a vegetation index for every plot.",
+    "A forest gap model was used to simulate the carbon dynamics under low precipitation.",
+]
+
+# Sentences without any information, which are used to reach the wanted length of a paper
+FILLER_SENTENCES = [
+    "The results are discussed in the context of previous studies on forest ecosystems.",
+    "Measurements were repeated at all plots to reduce the influence of local conditions.",
+    "Statistical analyses were performed with linear mixed-effects models.",
+    "Differences between the plots were tested for significance at the 5 % level.",
+    "The canopy was dominated by broadleaved species with a closed crown cover.",
+    "All data were checked for outliers and missing values before the analysis.",
+    "This pattern was consistent across the sampled sites and years.",
+    "Further research is needed to understand the underlying mechanisms.",
+]
+
+# ------------------------------------------------- UTILITY ---------------------------------------------------------- #
+def create_coordinate(template, generator):
+    """
+    Fills a coordinate template with random numbers.
+
+    Args:
+        template (str): One of the templates of 'COORDINATE_TEMPLATES'.
+        generator (random.Random): The random number generator.
+
+    Returns:
+        str: The coordinate.
+    """
+    return template.format(lat=generator.randint(10, 89), lat2=generator.randint(10, 89), lon=generator.randint(10, 179),
+                           m=generator.randint(10, 59), m2=generator.randint(10, 59), s=generator.randint(10, 59),
+                           d2=generator.randint(10, 99), d3=generator.randint(100, 999), d4=generator.randint(1000, 9999),
+                           d6=generator.randint(100000, 999999))
+
+def escape_pdf_text(text):
+    """
+    Escapes the characters which have a special meaning inside a string of a PDF content stream.
+
+    Args:
+        text (str): The text of a line.
+
+    Returns:
+        str: The escaped text.
+
+    References:
+        - PDF 1.7 reference, section 7.3.4.2 'Literal Strings': https://opensource.adobe.com/dc-acrobat-sdk-docs/pdfstandards/PDF32000_2008.pdf
+    """
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+def wrap_paragraphs(paragraphs):
+    """
+    Divides paragraphs into lines that fit on a page, with an empty line after every paragraph.
+
+    Args:
+        paragraphs (list): The paragraphs as strings.
+
+    Returns:
+        list: The lines.
+
+    References:
+        - 'textwrap.wrap()': https://docs.python.org/3/library/textwrap.html#textwrap.wrap
+    """
+    lines = []
+    for paragraph in paragraphs:
+        lines.extend(textwrap.wrap(paragraph, CHARACTERS_PER_LINE))
+        lines.append('')
+    return lines
+
+# ------------------------------------------------- PROCESSING ------------------------------------------------------- #
+def write_pdf(pdf_path, lines):
+    """
+    Writes lines of text into a PDF file, with 'LINES_PER_PAGE' lines on every page.
+    The PDF only contains the objects which are really needed: the catalog, the page tree, the font and a page with its content stream for every page.
+
+    Args:
+        pdf_path (str): The full file path of the PDF file to be written.
+        lines (list): The lines of text.
+
+    References:
+        - Structure of a minimal PDF file: https://brendanzagaeski.appspot.com/0004.html
+        - Standard fonts and 'WinAnsiEncoding': https://opensource.adobe.com/dc-acrobat-sdk-docs/pdfstandards/PDF32000_2008.pdf (section 9.6.2)
+    """
+    pages = [lines[start:start + LINES_PER_PAGE] for start in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+
+    # Object 1 is the catalog, 2 the page tree and 3 the font, then every page is followed by its content stream
+    page_ids = [4 + 2 * index for index in range(len(pages))]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{' '.join(f'{page_id} 0 R' for page_id in page_ids)}] /Count {len(pages)} >>".encode('ascii'),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    for page_id, page_lines in zip(page_ids, pages):
+        # Start at the top left of the page and move one line down (T*) after every line
+        content = "BT /F1 10 Tf 12 TL 56 790 Td\n" + ''.join(f"({escape_pdf_text(line)}) Tj T*\n" for line in page_lines) + "ET"
+        stream = content.encode('cp1252', errors='replace')
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Resources << /Font << /F1 3 0 R >> >> "
+                       f"/Contents {page_id + 1} 0 R >>".encode('ascii'))
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n".encode('ascii') + stream + b"\nendstream")
+
+    # Write all objects and remember where each of them starts for the cross-reference table
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for object_id, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f"{object_id} 0 obj\n".encode('ascii') + body + b"\nendobj\n"
+
+    xref_offset = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode('ascii')
+    pdf += ''.join(f"{offset:010d} 00000 n \n" for offset in offsets).encode('ascii')
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode('ascii')
+
+    with open(pdf_path, 'wb') as file:
+        file.write(pdf)
+
+def create_paper_lines(seed, pages=4):
+    """
+    Creates the lines of a synthetic scientific paper with all information searched by 'pdf_processing'.
+
+    Args:
+        seed (int): The seed of the random number generator, every seed gives a different paper.
+        pages (int): The approximate number of pages, which is reached with sentences without any information.
+
+    Returns:
+        list: The lines of the paper.
+    """
+    generator = random.Random(seed)
+    start_year = generator.randint(1950, 2000)
+    end_year = generator.randint(start_year + 10, 2023)
+    drought_start = generator.randint(start_year, end_year - 3)
+    drought_year = generator.randint(start_year, end_year)
+
+    # Some coordinates of every format, in random order
+    coordinates = [create_coordinate(template, generator) for template in COORDINATE_TEMPLATES]
+    generator.shuffle(coordinates)
+
+    paragraphs = [
+        f"Synthetic study {seed}: Effects of drought on forest growth",
+        "Abstract",
+        f"We analyzed forest growth between {start_year} and {end_year} at several plots. " + ' '.join(generator.sample(FILLER_SENTENCES, 3)),
+        "1. Introduction",
+        ' '.join(generator.sample(FILLER_SENTENCES, 4)),
+        "2. Study area",
+        f"The study area is located in a temperate forest at {coordinates[0]}, {coordinates[1]}. "
+        f"The plots are located at {', '.join(coordinates[2:])}. " + ' '.join(generator.sample(FILLER_SENTENCES, 2)),
+        "3. Methods",
+        ' '.join(generator.sample(DROUGHT_SENTENCES, 3)),
+        f"Data were analyzed for the period {start_year}-{end_year}.",
+        "4. Results",
+        f"A severe drought from {drought_start} to {drought_start + 2} reduced the growth of all trees. "
+        f"The extreme drought in {drought_year} was the strongest of the analyzed period. " + ' '.join(generator.sample(FILLER_SENTENCES, 3)),
+    ]
+
+    # Add sentences without information until the paper has the wanted length
+    lines = wrap_paragraphs(paragraphs)
+    while len(lines) < (pages - 1) * LINES_PER_PAGE:
+        lines.extend(wrap_paragraphs([' '.join(generator.sample(FILLER_SENTENCES, 5))]))
+
+    # The reference section, whose years must not be found as analyzed or drought years
+    references = [f"Author {index}, A. ({generator.randint(1950, 2023)}). A previous study on drought {generator.randint(1950, 2023)}. "
+                  f"Journal of Forest Research {generator.randint(1, 80)}, {generator.randint(1, 999)}." for index in range(1, 21)]
+    lines.extend(wrap_paragraphs(["References"] + references))
+
+    return lines
+
+def create_corpus(folder_path, count, pages=4, seed=0):
+    """
+    Creates a folder with synthetic papers, papers which already exist in the folder are not written again.
+
+    Args:
+        folder_path (str): The path to the folder of the corpus.
+        count (int): The number of papers.
+        pages (int): The approximate number of pages of every paper.
+        seed (int): The seed of the first paper, the following papers use the following seeds.
+
+    Returns:
+        list: The full file paths to the PDF files of the corpus.
+    """
+    os.makedirs(folder_path, exist_ok=True)
+
+    pdf_files = []
+    for index in range(count):
+        pdf_file = os.path.join(folder_path, f"synthetic_{seed + index:05d}_{pages}p.pdf")
+        if not os.path.exists(pdf_file):
+            write_pdf(pdf_file, create_paper_lines(seed + index, pages))
+        pdf_files.append(pdf_file)
+
+    return pdf_files
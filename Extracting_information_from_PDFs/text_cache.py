@@ -0,0 +1,252 @@
+"""
+text_cache.py
+
+This script stores the cleaned text lines of already searched PDFs on disk, so that 'pdf_processing' does not need to parse a PDF again
+as long as neither the PDF itself, the pdfminer version nor the cleaning rules have changed.
+
+Author:
+    Jonathan Mattis Wisser
+    jmader@uni-muenster.de
+
+Version:
+    1.0
+Datum:
+    2026-10-17
+"""
+
+__author__ = "Jonathan Mattis Wisser"
+__version__ = "1.0"
+__date__ = "2026-10-17"
+
+# ------------------------------------------------- IMPORTS ---------------------------------------------------------- #
+# 'os' for data management (reading, writing and deleting the cache files)
+import os
+
+# 'hashlib' to create the content hash of the PDFs, which is used as key for the cache
+import hashlib
+
+# 'json' and 'gzip' to store the cleaned lines in compressed text files
+import json
+import gzip
+
+# 'tempfile' to write the cache files under a temporary name first, so that a cache file is never read half written
+import tempfile
+
+# Logging for a better understanding of the results and outputs as set up in the main module
+# Logging.info() and logging.error() are used here
+# https://docs.python.org/3/library/logging.html#logging.INFO
+# https://docs.python.org/3/library/logging.html#logging.error
+import logging
+
+# File extension of all cache files, so that only these are touched when evicting or invalidating the cache
+CACHE_FILE_EXTENSION = '.json.gz'
+
+# Share of the maximum cache size that a process may write into the cache before the size of the cache folder is checked again,
+# so that the cache folder is not listed after every single PDF, the cache can grow beyond its maximum size by this share per process
+EVICTION_CHECK_SHARE = 0.1
+
+# Bytes written into every cache folder by this process since its size was last checked, stored by the path of the cache folder
+bytes_written_since_check = {}
+
+# ------------------------------------------------- UTILITY ---------------------------------------------------------- #
+def hash_file(file_path):
+    """
+    Calculates the SHA-256 hash of the content of a file, so that a PDF is recognized by its content and not by its name.
+
+    Args:
+        file_path (str): The full file path to the file to be hashed.
+
+    Returns:
+        str: The hexadecimal SHA-256 hash of the file content.
+
+    References:
+        - 'hashlib.sha256()': https://docs.python.org/3/library/hashlib.html
+        - Reading a file in chunks: https://stackoverflow.com/a/3431838
+    """
+    file_hash = hashlib.sha256()
+    # Read the file in chunks of 1 MB, so that large PDFs do not need to be loaded into memory completely
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+def build_cache_key(pdf_file, fingerprint):
+    """
+    Creates the key of a PDF in the cache out of the hash of its content and the fingerprint of the text extraction,
+    which contains the pdfminer version and the cleaning rules.
+
+    Args:
+        pdf_file (str): The full file path to the PDF file.
+        fingerprint (str): The fingerprint of the text extraction as created by 'pdf_processing'.
+
+    Returns:
+        str: The cache key in the form '<content hash>-<fingerprint>'.
+    """
+    return f"{hash_file(pdf_file)}-{fingerprint}"
+
+def list_cache_files(cache_dir):
+    """
+    Lists all cache files in the cache folder together with their size and the time of their last usage.
+
+    Args:
+        cache_dir (str): The path to the cache folder.
+
+    Returns:
+        list: A list of tuples (file path, size in bytes, modification time), sorted from the least to the most recently used file.
+
+    References:
+        - 'os.scandir()': https://docs.python.org/3/library/os.html#os.scandir
+    """
+    # Without a cache folder there are also no cache files
+    if not os.path.isdir(cache_dir):
+        return []
+
+    cache_files = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(CACHE_FILE_EXTENSION):
+            # The file might have been evicted by another worker process in the meantime
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            cache_files.append((entry.path, stat.st_size, stat.st_mtime))
+
+    return sorted(cache_files, key=lambda cache_file: cache_file[2])
+
+def remove_cache_file(file_path):
+    """
+    Deletes a single cache file and ignores the case that it was already deleted by another worker process.
+
+    Args:
+        file_path (str): The full file path to the cache file.
+    """
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+
+# ------------------------------------------------- PROCESSING ------------------------------------------------------- #
+def read_cached_lines(cache_dir, cache_key):
+    """
+    Reads the cleaned lines of a PDF from the cache, if they are stored there.
+    The modification time of the cache file is updated, so that recently used files are the last ones to be evicted.
+
+    Args:
+        cache_dir (str): The path to the cache folder.
+        cache_key (str): The key of the PDF as created by build_cache_key().
+
+    Returns:
+        list or None: The cleaned lines of the PDF or None if they are not stored in the cache (or the cache file is damaged).
+
+    References:
+        - 'gzip.open()': https://docs.python.org/3/library/gzip.html#gzip.open
+        - 'os.utime()': https://docs.python.org/3/library/os.html#os.utime
+    """
+    cache_file = os.path.join(cache_dir, cache_key + CACHE_FILE_EXTENSION)
+    try:
+        with gzip.open(cache_file, 'rt', encoding='utf-8') as file:
+            lines = json.load(file)
+        # Mark the cache file as recently used
+        os.utime(cache_file)
+        return lines
+
+    # If the file does not exist, there is no cached text for this PDF yet
+    except FileNotFoundError:
+        return None
+
+    # If the cache file cannot be read, it is deleted, so that the PDF is parsed again and stored correctly
+    except (OSError, ValueError) as e:
+        logging.error(f"Removing unreadable cache file '{cache_file}': {e}")
+        remove_cache_file(cache_file)
+        return None
+
+def write_cached_lines(cache_dir, cache_key, lines, max_size):
+    """
+    Stores the cleaned lines of a PDF in the cache. Once this process has written 'EVICTION_CHECK_SHARE' of the allowed size
+    since the last check (and at the first write), the least recently used cache files are evicted if the cache folder got bigger than the allowed size.
+
+    Args:
+        cache_dir (str): The path to the cache folder.
+        cache_key (str): The key of the PDF as created by build_cache_key().
+        lines (list): The cleaned lines of the PDF.
+        max_size (int): The maximum size of the cache folder in bytes.
+
+    References:
+        - 'tempfile.mkstemp()': https://docs.python.org/3/library/tempfile.html#tempfile.mkstemp
+        - Replacing a file atomically with 'os.replace()': https://docs.python.org/3/library/os.html#os.replace
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_file = os.path.join(cache_dir, cache_key + CACHE_FILE_EXTENSION)
+
+    # Write into a temporary file first and rename it afterward, so that other processes never read a half written cache file
+    file_descriptor, temporary_file = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(file_descriptor, 'wb') as raw_file, gzip.GzipFile(fileobj=raw_file, mode='wb') as file:
+            file.write(json.dumps(lines, ensure_ascii=False).encode('utf-8'))
+        os.replace(temporary_file, cache_file)
+    # A cache that cannot be written must not stop the extraction, so this is only logged
+    except OSError as e:
+        logging.error(f"Failed to write cache file '{cache_file}': {e}")
+        remove_cache_file(temporary_file)
+        return
+
+    # Only list the cache folder again after enough was written, so a run over many PDFs does not list it once per PDF
+    try:
+        written_size = os.path.getsize(cache_file)
+    except FileNotFoundError:
+        written_size = 0
+    bytes_written = bytes_written_since_check.get(cache_dir, max_size) + written_size
+    if bytes_written >= max_size * EVICTION_CHECK_SHARE:
+        evict_cache(cache_dir, max_size)
+        bytes_written = 0
+    bytes_written_since_check[cache_dir] = bytes_written
+
+def evict_cache(cache_dir, max_size):
+    """
+    Deletes the least recently used cache files until the cache folder is not bigger than the allowed size anymore.
+
+    Args:
+        cache_dir (str): The path to the cache folder.
+        max_size (int): The maximum size of the cache folder in bytes.
+
+    Returns:
+        int: The number of deleted cache files.
+    """
+    cache_files = list_cache_files(cache_dir)
+    total_size = sum(size for _, size, _ in cache_files)
+
+    # Delete the oldest files first, until the cache is small enough again
+    evicted = 0
+    for file_path, size, _ in cache_files:
+        if total_size <= max_size:
+            break
+        remove_cache_file(file_path)
+        total_size -= size
+        evicted += 1
+
+    return evicted
+
+def invalidate_cache(cache_dir, pdf_files=None):
+    """
+    Deletes the cached text of the given PDFs or, if no PDFs are given, the complete cache.
+
+    Args:
+        cache_dir (str): The path to the cache folder.
+        pdf_files (list or None): The full file paths to the PDFs whose cached text should be deleted, or None to delete all cached texts.
+
+    Returns:
+        int: The number of deleted cache files.
+    """
+    # The cache files of a PDF all start with the hash of its content, no matter which pdfminer version or cleaning rules were used
+    content_hashes = None
+    if pdf_files:
+        content_hashes = {hash_file(pdf_file) for pdf_file in pdf_files}
+
+    removed = 0
+    for file_path, _, _ in list_cache_files(cache_dir):
+        if content_hashes is None or os.path.basename(file_path).split('-', 1)[0] in content_hashes:
+            remove_cache_file(file_path)
+            removed += 1
+
+    logging.info(f"Removed {removed} file(s) from the text cache in '{cache_dir}'")
+    return removed
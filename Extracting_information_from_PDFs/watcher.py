@@ -0,0 +1,338 @@
+"""
+watcher.py
+
+This script keeps the information retrieval running as a service, which watches the folder of the PDFs and searches every PDF that is added to it.
+New PDFs are noticed with inotify on Linux (or by looking at the folder at regular intervals on other systems), are only searched once they are
+completely written, and are handed to worker processes that stay alive the whole time, so that Python, pdfminer and openpyxl are not loaded
+again for every new PDF. The results are collected and written into the Excel file (or the staging file) at regular intervals.
+
+Author:
+    Jonathan Mattis Wisser
+    jmader@uni-muenster.de
+
+Version:
+    1.0
+Datum:
+    2026-10-17
+"""
+
+__author__ = "Jonathan Mattis Wisser"
+__version__ = "1.0"
+__date__ = "2026-10-17"
+
+# ------------------------------------------------- IMPORTS ---------------------------------------------------------- #
+# 'os' for data management (looking at the files of the watched folder)
+import os
+
+# 'time' for the intervals, 'select' to wait for events of inotify and 'signal' to stop the service when the container is stopped
+import time
+import select
+import signal
+
+# 'ctypes' to call inotify of the C library directly, without any additional library
+# https://docs.python.org/3/library/ctypes.html
+import ctypes
+import ctypes.util
+
+# 'ProcessPoolExecutor' for the worker processes, which are started once and kept for all PDFs
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# The search of a single PDF, the Excel file and the staging file as targets of the results and the journal for the results that are not written yet
+from pdf_processing import ExtractionResult, list_pdf_files, process_pdf_measured, process_pdf_in_fresh_process, extraction_rules_version
+from excel_processing import build_excel_row, write_rows_into_excel, read_existing_papers, open_staging_file, stage_row
+import journal
+import instrumentation
+
+# Logging for a better understanding of the results and outputs as set up in the main module
+# Logging.info() and logging.error() are used here
+# https://docs.python.org/3/library/logging.html#logging.INFO
+# https://docs.python.org/3/library/logging.html#logging.error
+import logging
+
+# ------------------------------------------------- SET-UPS ---------------------------------------------------------- #
+# Events of inotify which show that a file was written completely or moved into the folder
+# https://man7.org/linux/man-pages/man7/inotify.7.html
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = 0x00000800
+IN_CLOEXEC = 0x00080000
+
+# Time in seconds the size and modification time of a new PDF must stay the same before it is searched
+SETTLE_SECONDS = 2.0
+
+# Time in seconds between two looks at the folder, if inotify is not available (or a change was not reported, e.g. on network drives)
+POLL_INTERVAL = 5.0
+
+# Time in seconds between two writes of the collected results into the Excel file or the staging file
+FLUSH_INTERVAL = 60.0
+
+# A PDF whose end of file marker is missing is only searched after it did not change for this many times 'SETTLE_SECONDS' (e.g. a damaged PDF)
+INCOMPLETE_SETTLE_FACTOR = 10
+
+# ------------------------------------------------- UTILITY ---------------------------------------------------------- #
+def open_inotify(folder_path):
+    """
+    Starts watching the folder with inotify, so that the service is woken up as soon as a file is written or moved into it.
+
+    Args:
+        folder_path (str): The path to the watched folder.
+
+    Returns:
+        int or None: The file descriptor of inotify, None if inotify is not available (e.g. on Windows or macOS).
+
+    References:
+        - 'inotify_init1()' and 'inotify_add_watch()': https://man7.org/linux/man-pages/man7/inotify.7.html
+        - Loading the C library: https://docs.python.org/3/library/ctypes.html#loading-shared-libraries
+    """
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        inotify_init1 = libc.inotify_init1
+        inotify_add_watch = libc.inotify_add_watch
+    except (OSError, AttributeError):
+        logging.info("inotify is not available, the folder is looked at in regular intervals instead")
+        return None
+
+    inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    inotify_fd = inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+    if inotify_fd < 0:
+        logging.error(f"inotify could not be started: {os.strerror(ctypes.get_errno())}")
+        return None
+
+    if inotify_add_watch(inotify_fd, os.fsencode(folder_path), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+        logging.error(f"inotify could not watch '{folder_path}': {os.strerror(ctypes.get_errno())}")
+        os.close(inotify_fd)
+        return None
+
+    return inotify_fd
+
+def wait_for_changes(inotify_fd, timeout):
+    """
+    Waits until a file in the watched folder was written or moved, or until the timeout is over.
+    The events themselves are not needed, because the folder is looked at afterward anyway, so they are only read to empty the queue.
+
+    Args:
+        inotify_fd (int or None): The file descriptor of inotify, None to simply wait for the timeout.
+        timeout (float): The maximum time to wait in seconds.
+
+    References:
+        - 'select.select()': https://docs.python.org/3/library/select.html#select.select
+    """
+    if inotify_fd is None:
+        time.sleep(timeout)
+        return
+
+    readable, _, _ = select.select([inotify_fd], [], [], timeout)
+    if readable:
+        try:
+            while os.read(inotify_fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+
+def scan_folder(folder_path):
+    """
+    Reads the size and modification time of every PDF in the folder, which change as long as a PDF is still written.
+
+    Args:
+        folder_path (str): The path to the watched folder.
+
+    Returns:
+        dict: The size and modification time in nanoseconds, stored by the full file path of each PDF.
+    """
+    states = {}
+    for pdf_file in list_pdf_files(folder_path):
+        try:
+            stat = os.stat(pdf_file)
+        # The PDF was removed again in the meantime
+        except FileNotFoundError:
+            continue
+        states[pdf_file] = (stat.st_size, stat.st_mtime_ns)
+    return states
+
+def has_end_of_file_marker(pdf_file):
+    """
+    Checks whether the PDF ends with the end of file marker '%%EOF', which is missing as long as the PDF is not written completely.
+
+    Args:
+        pdf_file (str): The full file path to the PDF file.
+
+    Returns:
+        bool: True if the end of file marker was found in the last kilobyte of the PDF.
+
+    References:
+        - PDF 1.7 reference, section 7.5.5 'File Trailer': https://opensource.adobe.com/dc-acrobat-sdk-docs/pdfstandards/PDF32000_2008.pdf
+    """
+    try:
+        with open(pdf_file, 'rb') as file:
+            file.seek(max(os.path.getsize(pdf_file) - 1024, 0))
+            return b'%%EOF' in file.read()
+    except OSError:
+        return False
+
+def flush_results(results, excel_path, staging_path=None):
+    """
+    Writes the collected results into the Excel file, updating the rows of papers that are already stored in it,
+    or appends them to the staging file, from which they can be added to the Excel file later with '--merge-staging'.
+
+    Args:
+        results (list): The collected results (ExtractionResult).
+        excel_path (str): The full file path to the Excel file.
+        staging_path (str or None): The path to the staging file, None to write into the Excel file directly.
+
+    Returns:
+        bool: True if the results were written, False otherwise (e.g. because the Excel file is opened in another program).
+    """
+    if staging_path:
+        with open_staging_file(staging_path) as file:
+            for result in results:
+                stage_row(file, result)
+        logging.info(f"Stored {len(results)} new result(s) in the staging file '{staging_path}'")
+        return True
+
+    return write_rows_into_excel(excel_path, [build_excel_row(result) for result in results], upsert=True)
+
+# ------------------------------------------------- PROCESSING ------------------------------------------------------- #
+def watch_folder(folder_path, excel_path, workers=1, options=None, staging_path=None, journal_path=None, metrics_path=None,
+                 export_sinks=(), flush_interval=FLUSH_INTERVAL, settle_seconds=SETTLE_SECONDS, poll_interval=POLL_INTERVAL):
+    """
+    Watches the folder and searches every PDF that is added or changed until the service is stopped (Ctrl+C or 'docker stop').
+
+    PDFs that are already stored in the Excel file when the service starts are not searched again. A new PDF is only searched once its size
+    and modification time did not change for 'settle_seconds' and it ends with the end of file marker, so that PDFs which are still copied
+    into the folder are not searched too early. The PDFs are searched in a pool of worker processes that is kept for the whole time.
+    Every finished result is written into the journal directly, and all results are written into the Excel file (or the staging file)
+    every 'flush_interval' seconds, so that at most the results of one interval have to be taken from the journal after a crash.
+
+    Args:
+        folder_path (str): The path to the watched folder.
+        excel_path (str): The full file path to the Excel file.
+        workers (int): The number of worker processes.
+        options (TextExtractionOptions or None): The options of the text extraction, None for the default options.
+        staging_path (str or None): The path to the staging file, None to write into the Excel file directly.
+        journal_path (str or None): The path to the journal of the results that are not written into the Excel file yet.
+        metrics_path (str or None): The path of the timing report, which is written after every flush.
+        export_sinks (list): Additional outputs as created by 'export.create_sink()', which get every result directly.
+        flush_interval (float): The time in seconds between two writes of the results.
+        settle_seconds (float): The time in seconds a new PDF must not change before it is searched.
+        poll_interval (float): The maximum time in seconds between two looks at the folder.
+
+    References:
+        - 'signal.signal()': https://docs.python.org/3/library/signal.html#signal.signal
+        - 'Future.done()': https://docs.python.org/3/library/concurrent.futures.html#concurrent.futures.Future.done
+    """
+    rules_version = extraction_rules_version(options)
+
+    # All PDFs are stored by their absolute file path, in the same way as in the journal, so that the PDFs of the journal are recognized in the folder
+    folder_path = os.path.abspath(folder_path)
+
+    # 'docker stop' sends SIGTERM, which stops the service in the same way as Ctrl+C, after the running PDFs are finished and written
+    stop_requested = []
+    signal.signal(signal.SIGTERM, lambda signal_number, frame: stop_requested.append(signal_number))
+
+    # The state of every PDF that was already searched (or is already stored) and the state and first time of every PDF that is still changing
+    searched_states = {}
+    settling = {}
+    # The results that are not written into the Excel file yet
+    pending_results = []
+
+    # PDFs of papers that are already stored in the Excel file are not searched again
+    stored_papers = read_existing_papers(excel_path) if os.path.exists(excel_path) else set()
+    for pdf_file, state in scan_folder(folder_path).items():
+        if os.path.splitext(os.path.basename(pdf_file))[0] in stored_papers:
+            searched_states[pdf_file] = state
+
+    # Results of a previous service that were finished but not written into the Excel file yet are taken from its journal
+    journal_file = None
+    if journal_path:
+        for pdf_file, record in journal.read_journal(journal_path, rules_version).items():
+            pending_results.append(ExtractionResult(**record))
+            if os.path.exists(pdf_file):
+                stat = os.stat(pdf_file)
+                searched_states[pdf_file] = (stat.st_size, stat.st_mtime_ns)
+        journal_file = journal.open_journal(journal_path, resume=True)
+
+    inotify_fd = open_inotify(folder_path)
+    executor = ProcessPoolExecutor(max_workers=max(workers, 1))
+    running = {}
+    next_flush = time.monotonic() + flush_interval
+    logging.info(f"Watching '{folder_path}' for new PDFs, results are written every {flush_interval:g} s")
+
+    try:
+        while True:
+            try:
+                # Hand every PDF that did not change for long enough to the worker processes
+                now = time.monotonic()
+                if not stop_requested:
+                    for pdf_file, state in scan_folder(folder_path).items():
+                        if searched_states.get(pdf_file) == state:
+                            continue
+                        if pdf_file not in settling or settling[pdf_file][0] != state:
+                            settling[pdf_file] = (state, now)
+                            continue
+                        settled_for = now - settling[pdf_file][1]
+                        if settled_for >= settle_seconds and (has_end_of_file_marker(pdf_file) or settled_for >= settle_seconds * INCOMPLETE_SETTLE_FACTOR):
+                            del settling[pdf_file]
+                            searched_states[pdf_file] = state
+                            # A pool whose worker process died cannot take new PDFs anymore, so it is started anew
+                            try:
+                                future = executor.submit(process_pdf_measured, pdf_file, options)
+                            except BrokenProcessPool:
+                                executor.shutdown(wait=False)
+                                executor = ProcessPoolExecutor(max_workers=max(workers, 1))
+                                future = executor.submit(process_pdf_measured, pdf_file, options)
+                            running[future] = pdf_file
+                            logging.info(f"Searching the new PDF '{pdf_file}'")
+                    # PDFs that were removed before they were searched are forgotten
+                    for pdf_file in [pdf_file for pdf_file in settling if not os.path.exists(pdf_file)]:
+                        del settling[pdf_file]
+
+                # Collect the results of all finished PDFs
+                for future in [future for future in running if future.done()]:
+                    pdf_file = running.pop(future)
+                    try:
+                        result, metrics = future.result()
+                    # If a worker process died, every PDF that was lost with it is searched again in its own process
+                    except BrokenProcessPool:
+                        result, metrics = process_pdf_in_fresh_process(pdf_file, options)
+                    instrumentation.record_document(metrics)
+                    if journal_file is not None:
+                        journal.append_to_journal(journal_file, pdf_file, rules_version, result)
+                    for sink in export_sinks:
+                        sink.write(result)
+                    pending_results.append(result)
+
+                # Write the collected results at the end of every interval and when the service is stopped
+                if pending_results and (time.monotonic() >= next_flush or (stop_requested and not running)):
+                    if flush_results(pending_results, excel_path, staging_path):
+                        pending_results = []
+                        # The journal is only needed for the results that are not written yet
+                        if journal_file is not None:
+                            journal_file.close()
+                            journal_file = journal.open_journal(journal_path)
+                        if metrics_path:
+                            instrumentation.write_report(metrics_path)
+                    next_flush = time.monotonic() + flush_interval
+
+                if stop_requested and not running:
+                    break
+
+                # Wait shortly while PDFs are settling or searched, otherwise until inotify reports a change or the folder is looked at again
+                timeout = settle_seconds / 2 if settling or running or stop_requested else poll_interval
+                wait_for_changes(inotify_fd, max(min(timeout, next_flush - time.monotonic()), 0.1))
+
+            # Ctrl+C stops the service in the same way as 'docker stop'
+            except KeyboardInterrupt:
+                stop_requested.append(signal.SIGINT)
+                logging.info("Stopping the service after the running PDFs are finished")
+    finally:
+        executor.shutdown(wait=True)
+        if inotify_fd is not None:
+            os.close(inotify_fd)
+        if journal_file is not None:
+            journal_file.close()
+        for sink in export_sinks:
+            sink.close()
+        # Results that could not be written stay in the journal and are written by the next service
+        if journal_path and not pending_results:
+            journal.remove_journal(journal_path)
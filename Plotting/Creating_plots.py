@@ -30,6 +30,25 @@ import matplotlib.pyplot as plot
 # Add the patches module from matplotlib for a better representation of the legends and giving it the alias mpatches for further usage
 import matplotlib.patches as mpatches
 
+# 'os' to get the absolute path and the time of the last change of the data files for the dataset cache
+import os
+
+# 'pyarrow' for the Parquet cache of the shapefile attributes, which is only used if it is installed
+# https://arrow.apache.org/docs/python/parquet.html
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# 'time' to measure how long every chart takes and 'warnings' to hide the warning of plot.show() without a window
+import time
+import warnings
+
+# 'argparse' to select the charts on the command line and 'concurrent.futures' to render them in parallel processes
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 # Path to the shapefile containing the information needed for all plots depending on the re-analysis data
 reanalysis_shapefile_path = r"D:\Uni\Bachelorarbeit\complete_paper_points\re-analysed paper points with forest\re-analysed_paper_points_with_forest.shp"
 
@@ -39,2986 +58,1371 @@ all_studies_shapefile_path = r"D:\Uni\Bachelorarbeit\complete_paper_points\compl
 # Path to the Excel file containing all data
 excel_file_path = r"D:\Uni\Bachelorarbeit\2024Apr_Mana_Review_v2i - paper_coords_area_years_plotkeywords_speireanalysis_month_finished.xlsx"
 
-
-# ------------------------------------------------- BAR CHARTS ------------------------------------------------------- #
-def create_reanalysis_based_bar_chart(shapefile_path, chart_type):
+# Name of the sheet of the Excel file where the data for the plots is stored
+excel_sheet_name = "relevantInfo"
+
+# Loaded and cleaned datasets, stored by the absolute file path, the time of the last change of the file and whether only the attributes were loaded,
+# so every shapefile and the Excel file is only read once no matter how many charts are created from it
+dataset_cache = {}
+
+# File extensions of the files that belong to a shapefile, a change of any of them (e.g. of the attributes in the .dbf file) means the shapefile was changed
+shapefile_extensions = [".shp", ".dbf", ".shx", ".prj", ".cpg"]
+
+# Ending of the Parquet file next to every shapefile where its attribute columns (without the geometries) are cached,
+# so the shapefile only has to be read again after it was changed
+attribute_cache_suffix = ".attributes.parquet"
+
+# Columns of the shapefiles and the Excel file that the charts are grouped by, they are the dimensions of the count cube
+cube_dimensions = [
+    "forest",
+    "Continent",
+    "studytype",
+    "drouquanti",
+    "wasdrquant",
+    "drouright",
+    "Category",
+    "sphere",
+    "study type",
+    "drought_sphere",
+    "drought quantification keyword for plots",
+]
+
+# Count cubes of the loaded datasets, stored by the same keys as the datasets in 'dataset_cache'
+count_cube_cache = {}
+
+
+# ------------------------------------------------- DATA LOADING ----------------------------------------------------- #
+def clean_dataset(dataframe):
     """
-    Generates a stacked bar chart to visualize the distribution of SPEI (Standardized Precipitation
-    Evapotranspiration Index) drought categories in correlation with either drought quantification
-    keywords or MODIS forest categories. The function processes the data from a shapefile, groups it,
-    calculates percentages, and generates a stacked bar chart that is saved as a JPG image.
-    The function is designed to combine bar chart creation logic for different cases which all use the SPEI drought category
-    from the re-analysis into a single function.
-    This allows for easy extension if more bar charts are needed in the future from the same re-analysis shapefile data,
-    without requiring the creation of additional function.
+    Cleans the text columns that are used for grouping in the charts, so that every chart gets the same values:
+    extra spaces are removed from all of them and the quotes are removed from the drought quantification keywords
+    (because python gives an error for "Dry" if there are quotes, they are added back in the labels of the charts).
+    Columns that are not part of the given dataset are skipped, so the same function works for the shapefiles and the Excel file.
 
     Args:
-        shapefile_path (str): The path to the shapefile that contains the data for analysis.
-        chart_type (str): Specifies the type of bar chart to generate.
-                        Options are:
-                            - "Drought keyword SPEI": Correlates SPEI drought categories with drought quantification keywords.
-                            - "MODIS SPEI": Correlates SPEI drought categories with MODIS forest types.
-                            - "Continent SPEI": Correlates SPEI drought categories with the continent of locations.
-                            - "Study type SPEI Bar": Correlates SPEI drought categories with the study types.
+        dataframe (DataFrame or GeoDataFrame): The dataset as read from the shapefile or the Excel file.
+
     Returns:
-        None: The function saves the generated bar chart as a JPG image.
+        DataFrame or GeoDataFrame: The same dataset with cleaned columns.
     """
+    # Columns of the shapefiles and the Excel file where only the extra spaces are removed
+    # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
+    for column in ["sphere", "study type", "drought_sphere"]:
+        if column in dataframe.columns:
+            dataframe[column] = dataframe[column].str.strip()
 
-    # Reading the given shapefile using geopandas read_file() method and storing it as geodataframe
-    # https://geopandas.org/en/stable/docs/user_guide/data_structures.html#geodataframe
-    # https://geopandas.org/en/stable/docs/user_guide/io.html#reading-and-writing-files
-    gdf = geopd.read_file(shapefile_path)
-
-    # For Study types and SPEI drought categories
-    if chart_type == "Study type SPEI Bar":
-        # Grouping the data by "studytype" and "Category" to count occurrences for the drought chart
-        # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-        # https://www.statology.org/pandas-unstack/
-        # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-        category_counts = (
-            gdf.groupby(["studytype", "Category"]).size().unstack(fill_value=0)
-        )
-        # X-axis text
-        xaxisdescription = "Study type"
-        # Title of the plot
-        title = "Distribution of SPEI drought categories in correlation with the used study types of the re-analysed paper locations"
-        # Path where the plot is going to be saved
-        output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\re-analysis\No frame on legend\NEW Bar chart for correlation of SPEI drought category and the used study types of the re-analysed paper locations in percent.jpg"
-
-
-    # For continents and SPEI drought categories
-    if chart_type == "Continent SPEI":
-        # Grouping the data by "Continent" and "Category" to count occurrences for the drought chart
-        # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-        # https://www.statology.org/pandas-unstack/
-        # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-        category_counts = (
-            gdf.groupby(["Continent", "Category"]).size().unstack(fill_value=0)
-        )
-        # X-axis text
-        xaxisdescription = "Global region"
-        # Title of the plot
-        title = "Distribution of SPEI drought categories in correlation with the continents of the re-analysed paper locations"
-        # Path where the plot is going to be saved
-        output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\re-analysis\No frame on legend\NEW Bar chart for correlation of SPEI drought category and the continents of the re-analysed paper locations in percent.jpg"
-
-    # For the given drought quantification keywords from the studies and SPEI drought categories
-    if chart_type == "Drought keyword SPEI":
-        # Grouping the data by "drouquanti" and "Category" to count occurrences for the drought chart
-        # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-        # https://www.statology.org/pandas-unstack/
-        # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-        category_counts = (
-            gdf.groupby(["drouquanti", "Category"]).size().unstack(fill_value=0)
-        )
-        # X-axis text
-        xaxisdescription = "Given drought category"
-        # Title of the plot
-        title = "Distribution of SPEI drought categories in correlation with the given drought quantification keywords from the studies"
-        # Path where the plot is going to be saved
-        output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Bar chart for correlation of SPEI drought category and the given drought quantifications of the studies  in percent.jpg"
-
-    # For MODIS forest types and SPEI drought categories
-    if chart_type == "MODIS SPEI":
-        # Grouping the data by "forest" and "Category" to count occurrences for the MODIS chart
-        # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-        # https://www.statology.org/pandas-unstack/
-        # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-        category_counts = (
-            gdf.groupby(["forest", "Category"]).size().unstack(fill_value=0)
-        )
-        # X-axis text
-        xaxisdescription = "Forest type"
-        # Title of the plot
-        title = "Distribution of SPEI drought categories within each MODIS category"
-        # Path where the plot is going to be saved
-        output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\re-analysis\No frame on legend\NEW Bar chart for correlation MODIS classes and SPEI drought categories in percent.jpg"
-
-    # For all cases that somehow use "Category" (The SPEI categories)
-    if chart_type in ["Drought keyword SPEI", "MODIS SPEI", "Continent SPEI", "Study type SPEI Bar"]:
-        # Change the label for "Other" category, so it is not too long (only for bar plots with MODIS involved)
-        # https://pandas.pydata.org/docs/user_guide/basics.html#renaming-mapping-labels
-        category_counts.rename(
-            index={
-                "Other (Mangrove Forest, Open Shrubland, Savannas, Permanent Wetlands, ...)": "Other"
-            },
-            inplace=True,
-        )
+    # Columns with the drought quantification keywords where the quotes are removed as well
+    # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.replace.html
+    for column in ["drouquanti", "drought quantification keyword for plots"]:
+        if column in dataframe.columns:
+            dataframe[column] = dataframe[column].str.strip().str.replace('"', "")
 
-        # Define the colors for SPEI drought categories, so they match in every plot (and with the QGIS map) from
-        # https://spei.csic.es/map/maps.html
-        # https://stackoverflow.com/questions/26139423/plot-different-color-for-different-categorical-levels
-        spei_color_mapping = {
-            "no drought (+1 < SPEI)": "#0000FF",  # Blue
-            "near normal conditions (-1 < SPEI < +1)": "#ADD8E6",  # Light Blue
-            "moderately dry (-1.5 < SPEI <= -1)": "#FFA500",  # Orange
-            "severely dry (-2 < SPEI <= -1.5)": "#FF4500",  # Orange-Red
-            "extremely dry (SPEI <= -2)": "#8B0000",  # Dark Red
-        }
+    return dataframe
 
-        # Calculate the percentage for each category by dividing each value by the global total (sum of all counts)
-        # https://www.w3schools.com/python/pandas/ref_df_sum.asp
-        # https://www.w3schools.com/python/pandas/ref_df_div.asp
-        global_total = category_counts.values.sum()
-        category_counts_percentage = category_counts.div(global_total) * 100
-
-        # Sorting the created pivot table by total occurrences (sum of rows), from most to least in descending order for all stacked bar plots
-        # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.loc.html#pandas-dataframe-loc
-        # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.sort_values.html
-        category_counts_sorted = category_counts_percentage.loc[
-            category_counts_percentage.sum(axis=1).sort_values(ascending=False).index
-        ]
 
-        # Sorting the columns by total occurrences (sum of columns) for legend and data
-        # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.sort_values.html
-        category_sums = category_counts.sum(axis=0)
-        category_counts_sorted = category_counts_sorted[
-            category_sums.sort_values(ascending=False).index
-        ]
+def get_modification_time(shape_or_excel_file_path):
+    """
+    Gets the time of the last change of a data file, for a shapefile the time of the last change of any of its files.
 
-        # Create a list for the desired order of the spei categories inside the bars
-        # https://pandas.pydata.org/docs/user_guide/indexing.html#indexing-and-selecting-data
-        spei_desired_order = [
-            "extremely dry (SPEI <= -2)",
-            "severely dry (-2 < SPEI <= -1.5)",
-            "moderately dry (-1.5 < SPEI <= -1)",
-            "near normal conditions (-1 < SPEI < +1)",
-            "no drought (+1 < SPEI)",
-        ]
+    Args:
+        shape_or_excel_file_path (str): The path to the Excel file (.xlsx) or shapefile (.shp).
 
-        # Reindex the columns of my "category_counts_sorted" DataFrame with the created list
-        # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.reindex.html
-        category_counts_sorted = category_counts_sorted.reindex(
-            columns=spei_desired_order
-        )
+    Returns:
+        float: The time of the last change in seconds since the epoch.
 
-        # Generate the plot with sorted categories and the customized colors
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.bar.html
-        category_counts_sorted.plot(
-            kind="bar",
-            stacked=True,
-            figsize=(14, 8),
-            color=[spei_color_mapping[cat] for cat in category_counts_sorted.columns],
-        )
+    References:
+        - 'os.path.getmtime()': https://docs.python.org/3/library/os.path.html#os.path.getmtime
+    """
+    modification_times = [os.path.getmtime(shape_or_excel_file_path)]
 
-        # Create custom legend labels by combining each SPEI category with its corresponding count using zip()
-        # https://www.geeksforgeeks.org/matplotlib-pyplot-legend-in-python/
-        # https://www.geeksforgeeks.org/create-pandas-dataframe-from-lists-using-zip/
-        legend_labels_with_counts = [
-            f"{category}: {int(category_sums[category])}"
-            for category in spei_desired_order
-        ]
+    # https://docs.python.org/3/library/os.path.html#os.path.splitext
+    file_path_without_extension, extension = os.path.splitext(shape_or_excel_file_path)
+    if extension.lower() == ".shp":
+        for shapefile_extension in shapefile_extensions:
+            if os.path.exists(file_path_without_extension + shapefile_extension):
+                modification_times.append(os.path.getmtime(file_path_without_extension + shapefile_extension))
 
-        # Replace "<=" with "≤" in the legend labels for the display inside the legend
-        # https://docs.python.org/3/library/stdtypes.html#str.replace
-        legend_labels_with_counts_display = [
-            label.replace("<=", "≤") for label in legend_labels_with_counts
-        ]
+    return max(modification_times)
 
-        # Sorting legend labels (SPEI categories) based on the counts numeric in descending order by taking the last string number into account
-        # https://docs.python.org/3/howto/sorting.html
-        sorted_legend_labels_with_counts = sorted(
-            legend_labels_with_counts_display,
-            key=lambda x: int(x.split()[-1]),
-            reverse=True,
-        )
 
-        # Create a list to lign the SPEI categories with the sorted legend labels based on their counts
-        sorted_spei_categories = [
-            spei_desired_order[legend_labels_with_counts_display.index(label)]
-            for label in sorted_legend_labels_with_counts
-        ]
+def read_shapefile_attributes(shapefile_path, modification_time):
+    """
+    Reads only the attribute columns of a shapefile, without creating the geometries.
+    If pyarrow is installed, the attributes are cached in a Parquet file next to the shapefile the first time they are read,
+    and later read from this file (memory-mapped) as long as the shapefile was not changed since.
+    If the Parquet file can not be written (e.g. in a read-only folder), the attributes are used without caching them.
 
-        # Creates custom legend handles with colors matching the sorted SPEI categories and labels
-        # Use zip() to combine the two lists to align the colors with the sorted legend labels
-        # https://matplotlib.org/stable/users/explain/axes/legend_guide.html#creating-artists-specifically-for-adding-to-the-legend-aka-proxy-artists
-        # https://www.geeksforgeeks.org/create-pandas-dataframe-from-lists-using-zip/
-        legend_handles = [
-            mpatches.Patch(color=spei_color_mapping[category], label=label)
-            for category, label in zip(
-                sorted_spei_categories, sorted_legend_labels_with_counts
-            )
-        ]
+    Args:
+        shapefile_path (str): The path to the shapefile (.shp).
+        modification_time (float): The time of the last change of the shapefile as given by get_modification_time().
 
-        # Place the sorted legend with counts inside the plot on the upper right
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.legend.html
-        plot.legend(
-            handles=legend_handles,
-            title="SPEI drought category",
-            loc="upper right",
-            frameon=False,
-        )
+    Returns:
+        DataFrame: The attribute columns of the shapefile.
 
-        # Add titles and axis labels that were defined before automatically from the titels
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.xlabel.html#matplotlib.pyplot.xlabel
-        # plot.title(title)
-        plot.xlabel(xaxisdescription)
-
-        # Add manual y-axis label for all studies
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.ylabel.html#matplotlib-pyplot-ylabel
-        plot.ylabel("Percentage of re-analysed study locations (%)")
-
-        # Rotate x-axis labels for readability and better plot-text ratio and replace "<=" with "≤"
-        # https://www.geeksforgeeks.org/matplotlib-pyplot-xticks-in-python/
-        # https://docs.python.org/3/library/stdtypes.html#str.replace
-        plot.xticks(
-            ticks=range(len(category_counts_sorted.index)),
-            labels=[label.replace("<=", "≤") for label in category_counts_sorted.index],
-            rotation=45,
-            ha="right",
+    References:
+        - 'ignore_geometry': https://geopandas.org/en/stable/docs/reference/api/geopandas.read_file.html
+        - 'pyarrow.parquet.read_table()': https://arrow.apache.org/docs/python/generated/pyarrow.parquet.read_table.html
+        - 'pyarrow.parquet.write_table()': https://arrow.apache.org/docs/python/generated/pyarrow.parquet.write_table.html
+    """
+    if pyarrow is None:
+        return geopd.read_file(shapefile_path, ignore_geometry=True)
+
+    # The time of the last change of the shapefile is stored in the metadata of the Parquet file, so a changed shapefile is read again
+    cache_path = os.path.splitext(shapefile_path)[0] + attribute_cache_suffix
+    source_version = repr(modification_time).encode()
+    try:
+        cache_metadata = pyarrow.parquet.read_schema(cache_path).metadata or {}
+        if cache_metadata.get(b"source_modification_time") == source_version:
+            return pyarrow.parquet.read_table(cache_path, memory_map=True).to_pandas()
+    except (OSError, pyarrow.ArrowException):
+        pass
+
+    attributes = geopd.read_file(shapefile_path, ignore_geometry=True)
+    temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        # https://arrow.apache.org/docs/python/generated/pyarrow.Table.html#pyarrow.Table.from_pandas
+        attribute_table = pyarrow.Table.from_pandas(attributes, preserve_index=False)
+        attribute_table = attribute_table.replace_schema_metadata(
+            {**(attribute_table.schema.metadata or {}), b"source_modification_time": source_version}
         )
 
-        # Adjust the Y-Axis manually by a fixed array
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.yticks.html#matplotlib-pyplot-yticks
-        # For the two cases that only need 0-35
-        if chart_type in ["MODIS SPEI", "Continent SPEI"]:
-            plot.yticks(
-                [0, 2.5, 5, 7.5, 10, 12.5, 15, 17.5, 20, 22.5, 25, 27.5, 30, 32.5, 35]
-            )
-        # For the other case that needs 0-40
-        elif chart_type in ["Drought keyword SPEI"]:
-            plot.yticks(
-                [
-                    0,
-                    2.5,
-                    5,
-                    7.5,
-                    10,
-                    12.5,
-                    15,
-                    17.5,
-                    20,
-                    22.5,
-                    25,
-                    27.5,
-                    30,
-                    32.5,
-                    35,
-                    37.5,
-                    40,
-                ]
-            )
-
-        # For the study types since Observational has way more then the other
-        elif chart_type in ["Study type SPEI Bar"]:
-            plot.yticks(
-                [
-                    0,
-                    2.5,
-                    5,
-                    7.5,
-                    10,
-                    12.5,
-                    15,
-                    17.5,
-                    20,
-                    50,
-                    43,
-                    70,
-                    76
-                ]
-            )
-
-
-        # Ensure that the tight layout is used for a better visualisation
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-        plot.tight_layout()
-
-        # Save the plot as a JPG file to use it in the bachelor-thesis
-        # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-        plot.savefig(output_file_path, format="jpg")
+        # Write into a temporary file first, so other processes (e.g. the render workers) never read a half written file
+        # https://docs.python.org/3/library/os.html#os.replace
+        pyarrow.parquet.write_table(attribute_table, temporary_path)
+        os.replace(temporary_path, cache_path)
+    except (OSError, pyarrow.ArrowException):
+        # A half written temporary file (e.g. if the disk is full) is removed again, the attributes are still returned
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
 
-        # Optionally display the plot (for finetuning so adjusting is easier)
-        # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-        plot.show()
+    return attributes
 
 
-def create_true_false_bar_chart(shape_or_excel_file_path, chart_type):
+def load_dataset(shape_or_excel_file_path, attributes_only=False):
     """
-    Generates a stacked bar chart visualizing either the correlation of drought category keywords with
-    drought quantification or the correctness of drought quantification. The chart is generated based on
-    the specified `chart_type`, using data from either a shapefile or an Excel file, and saved as a JPG image.
-    The function is designed to combine (hatched) bar chart creation logic for different cases which all use the given
-    drought categories from the papers and "True" or "False" values for the stacked bars.
-    This allows for easy extension if more bar charts are needed in the future from the same shapefile or Excel data,
-    without requiring the creation of additional functions.
+    Loads a shapefile (as geodataframe) or the "relevantInfo" sheet of the Excel file (as dataframe) and cleans it with clean_dataset().
+    Every file is only read once, later calls get the same dataset from the cache as long as the file was not changed in the meantime.
+    The returned dataset is shared by all charts, so it must not be changed in place.
 
     Args:
-        shape_or_excel_file_path (str): The file path to the shapefile or Excel file to be analyzed.
-                                        The path can be either a .shp or .xlsx file, and the data
-                                        should contain columns for drought quantification and correctness.
-        chart_type (str): Specifies the type of pie chart to generate.
-                        Options are:
-                            - "Drought quantified": Correlation of drought category keywords with quantification.
-                            - "Drought correctness": Correctness of drought quantification based on SPEI categories.
+        shape_or_excel_file_path (str): The path to the Excel file (.xlsx) or shapefile (.shp).
+        attributes_only (bool): Whether only the attribute columns of a shapefile are needed (as dataframe without geometries),
+                                which are read from the Parquet cache with read_shapefile_attributes().
 
     Returns:
-        None: The function saves the generated bar chart as a JPG image.
+        DataFrame or GeoDataFrame: The cleaned dataset.
     """
-    # For the case that shows the correlation between all given drought keywords and if drought was quantified in percent
-    if chart_type == "Drought quantified":
-        # Load the Excel file and "relevantInfo" sheet where the data for the pie charts is stored
+    # The time of the last change is part of the key, so a changed file is read again
+    absolute_path = os.path.abspath(shape_or_excel_file_path)
+    modification_time = get_modification_time(absolute_path)
+    cache_key = (absolute_path, modification_time, attributes_only)
+
+    if cache_key not in dataset_cache:
+        # Remove an older version of the same file from the caches, so it does not stay in memory
+        for cache in [dataset_cache, count_cube_cache]:
+            for stored_key in [key for key in cache if key[0] == absolute_path and key[1] != modification_time]:
+                del cache[stored_key]
+
+        # Read the Excel file with pandas and the shapefiles with geopandas
         # https://pandas.pydata.org/docs/reference/api/pandas.read_excel.html
-        reanalysed_gdf = geopd.read_file(shape_or_excel_file_path)
-
-        # Set the output path for this bar plot
-        output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\Bar plot that shows the correlation between all given drought keywords and if drought was quantified in percent.jpg"
-
-        # Grouping the data by "drought quantification keyword for plots" and "was drought quantified**"
-        # to count their occurrences and the percentages later
-        # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-        # https://www.geeksforgeeks.org/list-size-method-in-java-with-examples/
-        # https://www.statology.org/pandas-unstack/
-        drought_quantification_counts = (
-            reanalysed_gdf.groupby(["drouquanti", "wasdrquant"])
-            .size()
-            .unstack(fill_value=0)
-        )
-
-        # Calculate the percentage for each drought quantification keyword by dividing each value by the global total (sum of all counts)
-        # https://www.w3schools.com/python/pandas/ref_df_sum.asp
-        # https://www.w3schools.com/python/pandas/ref_df_div.asp
-        drought_quantification_global_total = drought_quantification_counts.values.sum()
-        drought_quantification_percentage = (
-            drought_quantification_counts.div(drought_quantification_global_total) * 100
-        )
-
-        # Set the order as wanted for the X-Axis by creating a list that has all the keywords in the wanted order
-        desired_drought_keyword_order = [
-            '"Dry"',
-            "Dry season",
-            "Differs from normal",
-            "Low soil moisture",
-            "Low water flow/depth",
-            "Reduced rainfall",
-            "Plant water stress",
-            "Standardized Index",
-        ]
-
-        # Calculate the percentage for each drought quantification keyword by dividing each value by the global total (sum of all counts)
-        # https://www.w3schools.com/python/pandas/ref_df_sum.asp
-        # https://www.w3schools.com/python/pandas/ref_df_div.asp
-        global_total = drought_quantification_counts.values.sum()
-        drought_quantification_counts_percentage = (
-            drought_quantification_counts.div(global_total) * 100
-        )
-
-        # Calculate the sum of all rows (True & False for each drought quantification keyword) and store it in a "Total" column
-        # This new "Total" column is then used for sorting the categories in descending order based on the total occurrences.
-        # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.sort_values.html
-        drought_quantification_counts_percentage["Total"] = (
-            drought_quantification_counts_percentage.sum(axis=1)
-        )
-
-        # Applying the desired order to the data. so the X-Axis is ordered from "worst" to "best" keyword from left to right
-        # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.reindex.html
-        sorted_category_counts_percentage = (
-            drought_quantification_counts_percentage.reindex(
-                desired_drought_keyword_order
-            )
-        )
-
-        # Generate the plot with sorted categories and hardcoded colors
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.bar.html
-        sorted_category_counts_percentage[["True", "False"]].plot(
-            kind="bar",
-            stacked=True,
-            figsize=(10, 6),
-            color=["darkblue", "red"],
-            edgecolor="black",
-        )
-
-        # Calculate the total number of occurrences where "wasdrquant" is "True" and "False"
-        # https://www.w3schools.com/python/pandas/ref_df_sum.asp
-        true_count = (
-            drought_quantification_counts["True"].sum()
-            if "True" in drought_quantification_counts.columns
-            else 0
-        )
-        false_count = (
-            drought_quantification_counts["False"].sum()
-            if "False" in drought_quantification_counts.columns
-            else 0
-        )
-
-        # Set the legend entries manually with all its attributes colors and hatches (using mpatches.Patch()), so they match the bars
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.patches.Patch.html#matplotlib-patches-patch
-        # https://stackoverflow.com/a/37296137
-        true_patch = mpatches.Patch(color="darkblue", label=f"Yes: {true_count}")
-        false_patch = mpatches.Patch(
-            facecolor="red", edgecolor="black", label=f"No: {false_count}", hatch="////"
-        )
+        # https://geopandas.org/en/stable/docs/user_guide/io.html#reading-and-writing-files
+        if absolute_path.lower().endswith((".xlsx", ".xls")):
+            dataset = pd.read_excel(absolute_path, sheet_name=excel_sheet_name)
+        elif attributes_only:
+            dataset = read_shapefile_attributes(absolute_path, modification_time)
+        else:
+            dataset = geopd.read_file(absolute_path)
 
-        # Add the legend, so it gets clear what part of the bars is "True" and "False"
-        # https://matplotlib.org/stable/api/legend_api.html#module-matplotlib.legend
-        plot.legend(
-            handles=[true_patch, false_patch],
-            title="Was drought quantified?",
-            loc="upper right",
-            alignment="left",
-            frameon=False,
-        )
+        dataset_cache[cache_key] = clean_dataset(dataset)
 
-        # Optionally set a title for this case for a better overview (not needed later in the thesis)
-        title = (
-            "Correlation between given drought keywords and if drought was quantified"
-        )
+    return dataset_cache[cache_key]
 
-        # Set the y-axis limit to 30% for a better overview
-        # https://www.geeksforgeeks.org/matplotlib-pyplot-ylim-in-python/
-        plot.ylim(0, 40)
 
-    # For the case with correctness of the given drought quantification keywords for all re-analyzed paper locations
-    if chart_type == "Drought correctness":
-        # Read the given shapefile geopandas read_file() method and storing it as geodataframe
-        # https://geopandas.org/en/stable/docs/user_guide/data_structures.html#geodataframe
-        # https://geopandas.org/en/stable/docs/user_guide/io.html#reading-and-writing-files
-        reanalysed_gdf = geopd.read_file(shape_or_excel_file_path)
-
-        # Set the output path for this bar plot
-        output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\Bar plot that shows the correctness of the given drought quantification keywords for all re-analyzed paper locations.jpg"
-
-        # Set the title for this case
-        title = "Bar plot to show the correctness of the given drought keywords"
-
-        # Grouping the data by "drouquanti" and "drouright" to count their occurrences and the percentages later
-        # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-        # https://www.geeksforgeeks.org/list-size-method-in-java-with-examples/
-        # https://www.statology.org/pandas-unstack/
-        drought_correctness_counts = (
-            reanalysed_gdf.groupby(["drouquanti", "drouright"])
-            .size()
-            .unstack(fill_value=0)
-        )
+def build_count_cube(dataset):
+    """
+    Counts every combination of the values of all 'cube_dimensions' that are part of the dataset, once for all charts.
+    The counts of one or two columns (as needed by the charts) are then only sums over this cube with count_values(),
+    instead of grouping all rows of the dataset again for every chart.
+    The columns are stored as categorical columns with the values in the order they first appear in the dataset,
+    so the counts of a single column keep the same order for equal counts as value_counts() on the rows.
 
-        # Calculate the percentage for each drought quantification keyword by dividing each value by the global total (sum of all counts)
-        # https://www.w3schools.com/python/pandas/ref_df_sum.asp
-        # https://www.w3schools.com/python/pandas/ref_df_div.asp
-        global_total = drought_correctness_counts.values.sum()
-        drought_correctness_counts_percentage = (
-            drought_correctness_counts.div(global_total) * 100
-        )
+    Args:
+        dataset (DataFrame or GeoDataFrame): The dataset as loaded by load_dataset().
 
-        # Calculate the sum of all rows (True & False for each drought quantification keyword) and store it in a "Total" column
-        # This new "Total" column is then used for sorting the categories in descending order based on the total occurrences.
-        # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.sort_values.html
-        drought_correctness_counts_percentage["Total"] = (
-            drought_correctness_counts_percentage.sum(axis=1)
-        )
+    Returns:
+        Series: The number of rows for every combination of values that occurs in the dataset, with one index level per dimension.
+                Missing values are kept as their own value, so no row is lost if another column of it is empty.
 
-        # Sort by the total percentage of (True & False) in descending order and then remove the "Total" column because it served its purpose
-        # https://www.w3schools.com/python/pandas/ref_df_sort_values.asp
-        # https://www.w3schools.com/python/pandas/ref_df_drop.asp
-        sorted_category_counts_percentage = (
-            drought_correctness_counts_percentage.sort_values(
-                by="Total", ascending=False
-            ).drop(columns=["Total"])
-        )
+    References:
+        - Categorical data: https://pandas.pydata.org/docs/user_guide/categorical.html
+        - 'observed' and 'dropna' of groupby(): https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.groupby.html
+    """
+    dimensions = [column for column in cube_dimensions if column in dataset.columns]
+
+    # https://pandas.pydata.org/docs/reference/api/pandas.Categorical.html
+    # https://pandas.pydata.org/docs/reference/api/pandas.Series.unique.html
+    categorical_columns = pd.DataFrame(
+        {
+            column: pd.Categorical(dataset[column], categories=dataset[column].dropna().unique())
+            for column in dimensions
+        }
+    )
 
-        # Generate the plot with sorted categories and hardcoded colors
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.bar.html
-        sorted_category_counts_percentage[["True", "False"]].plot(
-            kind="bar",
-            stacked=True,
-            figsize=(10, 6),
-            color=["darkblue", "red"],
-            edgecolor="black",
-        )
+    # Only the combinations that occur are counted (observed=True), so the cube is never larger than the dataset
+    return categorical_columns.groupby(dimensions, observed=True, dropna=False).size()
 
-        # Calculate the total number of occurrences where "wasdrquant" is "True" and "False"
-        # https://www.w3schools.com/python/pandas/ref_df_sum.asp
-        true_count = (
-            drought_correctness_counts["True"].sum()
-            if "True" in drought_correctness_counts.columns
-            else 0
-        )
-        false_count = (
-            drought_correctness_counts["False"].sum()
-            if "False" in drought_correctness_counts.columns
-            else 0
-        )
 
-        # Set the legend entries manually with all its attributes colors and hatches (using mpatches.Patch()), so they match the bars
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.patches.Patch.html#matplotlib-patches-patch
-        # https://stackoverflow.com/a/37296137
-        true_patch = mpatches.Patch(color="darkblue", label=f"Yes: {true_count}")
-        false_patch = mpatches.Patch(
-            facecolor="red", edgecolor="black", label=f"No: {false_count}", hatch="////"
-        )
+def load_count_cube(shape_or_excel_file_path):
+    """
+    Gets the count cube of a shapefile or the Excel file, which is only built once for every loaded dataset with build_count_cube().
 
-        # Add the legend, so it gets clear what part of the bars is "True" and "False"
-        # https://matplotlib.org/stable/api/legend_api.html#module-matplotlib.legend
-        plot.legend(
-            handles=[true_patch, false_patch],
-            title="Was there a drought according to SPEI?",
-            loc="upper right",
-            alignment="left",
-            frameon=False,
-        )
+    Args:
+        shape_or_excel_file_path (str): The path to the Excel file (.xlsx) or shapefile (.shp).
 
-    # Bringing the two cases back here together, so everything below does not have to be hard-coded for each case separately
-    if chart_type in ["Drought quantified", "Drought correctness"]:
-
-        # Customize the "False" bars with diagonal stripes by using .gca() to get the needed axis and its patches
-        # https://www.geeksforgeeks.org/matplotlib-pyplot-gca-in-python/
-        # https://stackoverflow.com/a/59586067 (set_hatch)
-        # Use gca to get all axes and their patches with .patches
-        bars = plot.gca().patches
-        # Iterate over the bars
-        for bar in bars:
-            # Determines that only the red colored stacked bar gets diagonally striped
-            if bar.get_facecolor() == (1.0, 0.0, 0.0, 1.0):
-                bar.set_hatch("//")
-
-        # Add X-axis title manually for both cases because it is the same
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.xlabel.html#matplotlib.pyplot.xlabel
-        plot.xlabel("Given drought category")
-
-        # Add manual y-axis label manually for both cases because it is the same
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.ylabel.html#matplotlib-pyplot-ylabel
-        plot.ylabel("Percentage of all drought category keywords")
-
-        # Optionally add the title from the cases
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
-        plot.title(title)
-
-        # Rotate x-axis labels for readability and better plot-text ratio
-        # https://www.geeksforgeeks.org/matplotlib-pyplot-xticks-in-python/
-        plot.xticks(rotation=45)
-
-        # Ensure that the tight layout is used for a better visualisation
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-        plot.tight_layout()
+    Returns:
+        Series: The count cube of the cleaned dataset.
+    """
+    # The charts only need the attributes, the count cube is stored by the key of the dataset it is built from,
+    # load_dataset() removes the count cube of an older version of the file from the cache
+    dataset = load_dataset(shape_or_excel_file_path, attributes_only=True)
+    cache_key = next(key for key, cached_dataset in dataset_cache.items() if cached_dataset is dataset)
+
+    if cache_key not in count_cube_cache:
+        count_cube_cache[cache_key] = build_count_cube(dataset)
+
+    return count_cube_cache[cache_key]
+
+
+# ------------------------------------------------- CHART SETTINGS --------------------------------------------------- #
+# Long label of the "Other" MODIS forest category, which is shortened to "Other" in the charts where it does not fit
+other_forest_label = "Other (Mangrove Forest, Open Shrubland, Savannas, Permanent Wetlands, ...)"
+
+# Define the colors for SPEI drought categories, so they match in every plot (and with the QGIS map) from
+# https://spei.csic.es/map/maps.html
+# https://stackoverflow.com/questions/26139423/plot-different-color-for-different-categorical-levels
+spei_color_mapping = {
+    "no drought (+1 < SPEI)": "#0000FF",  # Blue
+    "near normal conditions (-1 < SPEI < +1)": "#ADD8E6",  # Light Blue
+    "moderately dry (-1.5 < SPEI <= -1)": "#FFA500",  # Orange
+    "severely dry (-2 < SPEI <= -1.5)": "#FF4500",  # Orange-Red
+    "extremely dry (SPEI <= -2)": "#8B0000",  # Dark Red
+}
+
+# Define consistent colors for each drought quantification keyword across all plots
+# https://stackoverflow.com/questions/26139423/plot-different-color-for-different-categorical-levels
+drought_keywords_color_mapping = {
+    "Dry": "#ff7f0e",  # Dark Orange
+    "Differs from normal": "#ff4500",  # Orange-Red
+    "Dry season": "#adff2f",  # Green Yellow
+    "Low soil moisture": "#b47d49",  # Brown
+    "Low water flow/depth": "#4682b4",  # Steel Blue
+    "Plant water stress": "#32cd32",  # Lime Green
+    "Reduced rainfall": "#87CEEB",  # Sky Blue
+    "Standardized Index": "#a245a8",  # Purple
+}
+
+# Map the MODIS forest types to their corresponding colors from https://developers.google.com/earth-engine/datasets/catalog/MODIS_061_MCD12Q1#bands "LC_Type1 Class Table"
+# https://stackoverflow.com/questions/26139423/plot-different-color-for-different-categorical-levels
+modis_color_mapping = {
+    "Evergreen Needleleaf Forest": "#05450a",  # Dark Green
+    "Evergreen Broadleaf Forest": "#086a10",  # Forest Green
+    "Deciduous Needleleaf Forest": "#54a708",  # Lime Green
+    "Deciduous Broadleaf Forest": "#78d203",  # Bright Lime
+    "Mixed Forest": "#009900",  # Green
+    "Closed Shrubland": "#c6b044",  # Goldenrod
+    "Woody Savanna": "#dade48",  # Light Yellow-Green
+    "Other": "#27ff87",  # Bright Mint Green
+}
+
+# Define consistent colors for each continent
+continent_color_mapping = {
+    "Europe": "#0000FF",  # blue
+    "Africa": "#808080",  # grey
+    "Asia": "#FFFF00",  # yellow
+    "Oceania": "#008000",  # green
+    "US": "#ADD8E6",  # light blue
+    "North America": "#FF0000",  # red
+    "Latin and South America": "#FFA500",  # orange
+}
+
+# Define consistent colors for each drought sphere
+sphere_color_mapping = {
+    "soil": "#8B4513",  # brown
+    "atmospheric": "#ADD8E6",  # light blue
+    "hydrological": "#3232d1",  # dark blue
+    "meteorological": "#808080",  # grey
+}
+
+# SPEI categories from the driest to the wettest, used for the stacked bars and the pie charts of the drought quantification
+spei_dry_to_wet_order = [
+    "extremely dry (SPEI <= -2)",
+    "severely dry (-2 < SPEI <= -1.5)",
+    "moderately dry (-1.5 < SPEI <= -1)",
+    "near normal conditions (-1 < SPEI < +1)",
+    "no drought (+1 < SPEI)",
+]
+
+# SPEI categories from the wettest to the driest, used for the segments of the SPEI breakdown pie charts
+spei_wet_to_dry_order = spei_dry_to_wet_order[::-1]
+
+# Display only the study types "experimental", "observational", and "modeling" in a specific order for the breakdown pie charts
+study_type_order = ["Experimental", "Observational", "Modeling"]
+
+# Order of the MODIS Categories based on https://developers.google.com/earth-engine/datasets/catalog/MODIS_061_MCD12Q1#bands "LC_Type1 Class Table"
+forest_order = [
+    "Evergreen Needleleaf Forest",
+    "Evergreen Broadleaf Forest",
+    "Deciduous Needleleaf Forest",
+    "Deciduous Broadleaf Forest",
+    "Mixed Forest",
+    "Closed Shrubland",
+    "Woody Savanna",
+    other_forest_label,
+]
+
+# Same order for the re-analysed locations (No "Deciduous Needleleaf Forest" because there are no re-analysed locations that have this MODIS forest type)
+reanalysed_forest_order = [forest for forest in forest_order if forest != "Deciduous Needleleaf Forest"]
+
+# Set the order as wanted for the X-Axis of the drought quantified bar chart, from "worst" to "best" keyword from left to right
+drought_keyword_order = [
+    "Dry",
+    "Dry season",
+    "Differs from normal",
+    "Low soil moisture",
+    "Low water flow/depth",
+    "Reduced rainfall",
+    "Plant water stress",
+    "Standardized Index",
+]
+
+# Names of the values of "wasdrquant" in the titles of the pie charts
+drought_quantified_names = {"True": "Yes", "False": "No"}
+
+
+# ------------------------------------------------- CHART REGISTRY --------------------------------------------------- #
+# All charts of the thesis, described by the data they are created from and how they look, so that one generic renderer (create_chart()) can create all of them.
+# Every chart has a "kind":
+#   - "bar": stacked bar chart of the counts (or percentages) of "group" [X-Axis, stacked bars]
+#   - "pie": single pie chart with the percentages of "group" [segments]
+#   - "breakdown": one pie chart per value of "group" [pie charts, segments]
+# Further keys (all optional except "data", "group" and "output"):
+#   - "data": path to the shapefile or Excel file, "group": the columns that are counted
+#   - "order": order (and selection) of the bars or pie charts, "segment_order": order of the stacked bars or pie chart segments
+#   - "rename": new names for the counted values, "colors": colors by value (or a list of colors in the order of the segments)
+#   - "figsize" and "layout" (rows, columns) of the figure, "title", "suptitle", "xlabel", "ylabel", "legend" and further settings of matplotlib
+#   - "output": path where the chart is saved as JPG, "save": False to only display the chart with '--show' (the batch rendering always saves it)
+# https://docs.python.org/3/tutorial/datastructures.html#dictionaries
+chart_registry = {
+    # CONTINENT:
+    # General continent percentages pie chart from all studies
+    "Continent percentage all": {
+        "kind": "pie",
+        "data": all_studies_shapefile_path,
+        "group": ["Continent"],
+        "colors": continent_color_mapping,
+        # Exploding the "Africa" slice so the difference and the percentages are clearer
+        "explode": [0, 0, 0, 0, 0, 0, 0.2],
+        "figsize": (9, 7),
+        "startangle": 90,
+        "wedgeprops": {"edgecolor": "black", "linewidth": 0.5},
+        # Set label positions manually for the continents "Africa" and "North America" so they are right next to its segment in the pie chart
+        "label_positions": {"North America": (-0.635, -0.944), "Africa": (0, 1.245)},
+        "tight_layout": False,
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Pie chart with continent percentages from the complete locations shapefile from all paper location.jpg",
+        "save": False,
+    },
+    # General continent percentages pie chart from re-analysis locations
+    "Continent percentage": {
+        "kind": "pie",
+        "data": reanalysis_shapefile_path,
+        "group": ["Continent"],
+        "colors": continent_color_mapping,
+        "figsize": (8, 7),
+        "startangle": 90,
+        "wedgeprops": {"edgecolor": "black", "linewidth": 0.5},
+        # Set label positions manually for the continent "North America" so it is right next to its segment in the pie chart
+        "label_positions": {"North America": (0.1, 1.05)},
+        "title": "Distribution of the continents in percentages",
+        "tight_layout": False,
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Pie chart with continent percentages from the re-analysed paper locations shapefile.jpg",
+        "save": False,
+    },
+    # Continent drought category keywords percentage pie charts from all paper locations since one paper can have multiple continents
+    "Continent drought category all": {
+        "kind": "breakdown",
+        "data": all_studies_shapefile_path,
+        "group": ["Continent", "drouquanti"],
+        "colors": drought_keywords_color_mapping,
+        "layout": (2, 4),
+        "figsize": (30, 10),
+        "startangle": 90,
+        "suptitle": "Breakdown of the given drought quantification for all paper locations continents",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Breakdown pie charts for percentages of drought definitions for all continents from complete location shapefile.jpg",
+    },
+    # Continent drought category keywords percentage pie charts from the re-analysed paper locations
+    "Continent drought category": {
+        "kind": "breakdown",
+        "data": reanalysis_shapefile_path,
+        "group": ["Continent", "drouquanti"],
+        "colors": drought_keywords_color_mapping,
+        "layout": (2, 4),
+        "figsize": (30, 10),
+        "startangle": 90,
+        "suptitle": "Breakdown of the given drought quantification for the re-analysed paper locations continents",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Breakdown pie charts for percentages of drought definitions for all continents from re-analysed location shapefile.jpg",
+    },
+    # Continent SPEI bar chart
+    "Continent SPEI": {
+        "kind": "bar",
+        "data": reanalysis_shapefile_path,
+        "group": ["Continent", "Category"],
+        "percentage": True,
+        "segment_order": spei_dry_to_wet_order,
+        "colors": spei_color_mapping,
+        "figsize": (14, 8),
+        "legend": {"title": "SPEI drought category", "loc": "upper right", "patches": True},
+        "xlabel": "Global region",
+        "ylabel": "Percentage of re-analysed study locations (%)",
+        "xtick_alignment": "right",
+        "yticks": [0, 2.5, 5, 7.5, 10, 12.5, 15, 17.5, 20, 22.5, 25, 27.5, 30, 32.5, 35],
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\re-analysis\No frame on legend\NEW Bar chart for correlation of SPEI drought category and the continents of the re-analysed paper locations in percent.jpg",
+    },
+    # SPHERES:
+    # Overview pie chart of drought spheres
+    "spheres": {
+        "kind": "pie",
+        "data": excel_file_path,
+        "group": ["drought_sphere"],
+        # Set colors for every sphere for a good overview
+        # https://proclusacademy.com/blog/customize_matplotlib_piechart/#slice-colors
+        "colors": ["#8B4513", "#ADD8E6", "#3232d1", "#808080"],
+        "figsize": (6.5, 6),
+        "startangle": 90,
+        "title_case_labels": True,
+        # Set label positions manually for the "Meteorological" sphere
+        "label_positions": {"Meteorological": (-0.25, 1.05)},
+        "equal_axis": True,
+        "title": "Distribution of the drought spheres out of all used studies",
+        "tight_layout": False,
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\Re-worked data\NEW main pie chart with complete drought sphere percentages.jpg",
+        "save": False,
+    },
+    # Spheres drought category keywords percentage pie charts from the Excel file since every paper can have only one sphere
+    "Spheres drought category excel": {
+        "kind": "breakdown",
+        "data": excel_file_path,
+        "group": ["drought_sphere", "drought quantification keyword for plots"],
+        "colors": drought_keywords_color_mapping,
+        "layout": (1, 4),
+        "figsize": (20, 5),
+        "title_case_panels": True,
+        "suptitle": "Breakdown of the given drought quantification for the drought spheres",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Breakdown pie charts for percentages of drought definitions for the drought spheres from the Excel file.jpg",
+    },
+    # Spheres drought category keywords percentage pie charts from re-analysed paper locations
+    "Spheres drought category": {
+        "kind": "breakdown",
+        "data": reanalysis_shapefile_path,
+        "group": ["sphere", "drouquanti"],
+        "colors": drought_keywords_color_mapping,
+        "layout": (1, 4),
+        "figsize": (20, 5),
+        "title_case_panels": True,
+        "suptitle": "Breakdown of the given drought quantification of the drought spheres",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Breakdown pie charts for percentages of drought definitions for the drought spheres from the re-analysis paper points.jpg",
+    },
+    # Sphere SPEI category percentage pie charts
+    "Spheres SPEI": {
+        "kind": "breakdown",
+        "data": reanalysis_shapefile_path,
+        "group": ["sphere", "Category"],
+        "segment_order": spei_wet_to_dry_order,
+        "colors": spei_color_mapping,
+        "layout": (2, 2),
+        "figsize": (15, 7),
+        "startangle": 90,
+        "percentage_color": "white",
+        "title_case_panels": True,
+        "suptitle": "Breakdown of the given SPEI categories from the drought spheres",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\Re-worked data\NEW Breakdown pie charts for percentages of SPEI categories for the drought spheres from the re-analysed shapefile locations.jpg",
+        "save": False,
+    },
+    # MODIS:
+    # MODIS forest type percentage pie chart for all study locations
+    "MODIS percentage all": {
+        "kind": "pie",
+        "data": all_studies_shapefile_path,
+        "group": ["forest"],
+        "rename": {other_forest_label: "Other"},
+        "colors": modis_color_mapping,
+        # Exploding the "Deciduous Needleleaf Forest" slice so the difference and the percentages are clearer
+        "explode": [0, 0, 0, 0, 0, 0, 0, 0.2],
+        "figsize": (10, 8),
+        "startangle": 90,
+        "wedgeprops": {"edgecolor": "white", "linewidth": 0.5},
+        "title_case_labels": True,
+        # Set label positions manually for the MODIS forest types "Deciduous Needleleaf Forest", "Closed Shrubland" and "Other"
+        "label_positions": {
+            "Deciduous Needleleaf Forest": (-0.25, 1.24),
+            "Closed Shrubland": (0.07, 1.062),
+            "Other": (0.632, 0.87),
+        },
+        "equal_axis": True,
+        "title": "Distribution of the MODIS forest types in percentages",
+        "tight_layout": False,
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Pie chart with MODIS forest category percentages from the complete locations shapefile.jpg",
+        "save": False,
+    },
+    # MODIS forest type percentage pie chart for re-analysis location
+    "MODIS percentage": {
+        "kind": "pie",
+        "data": reanalysis_shapefile_path,
+        "group": ["forest"],
+        "rename": {other_forest_label: "Other"},
+        "colors": modis_color_mapping,
+        # Exploding the smallest slice so the difference and the percentages are clearer
+        "explode": [0, 0, 0, 0, 0, 0, 0.2],
+        "figsize": (10, 8),
+        "startangle": 90,
+        "wedgeprops": {"edgecolor": "white", "linewidth": 0.5},
+        "title_case_labels": True,
+        # Set label positions manually for the MODIS forest type "Closed Shrubland"
+        "label_positions": {"Closed Shrubland": (-0.1, 1.258)},
+        "equal_axis": True,
+        "title": "Distribution of the MODIS forest types in percentages for re-analysed paper locations",
+        "tight_layout": False,
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Pie chart with MODIS forest category percentages from the re-analysis locations shapefile.jpg",
+        "save": False,
+    },
+    # MODIS breakdown of given drought quantification keyword pie charts from all paper locations since one paper can have multiple MODIS forest types
+    "MODIS drought category all": {
+        "kind": "breakdown",
+        "data": all_studies_shapefile_path,
+        "group": ["forest", "drouquanti"],
+        "order": forest_order,
+        "colors": drought_keywords_color_mapping,
+        "layout": (2, 4),
+        "figsize": (30, 10),
+        "suptitle": "Breakdown of the given drought quantification for all paper locations MODIS forest types",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Breakdown pie charts for percentages of drought definitions for MODIS forest types from complete location shapefile.jpg",
+    },
+    # MODIS breakdown of given drought quantification keyword pie charts for the re-analysed paper locations
+    "MODIS drought category": {
+        "kind": "breakdown",
+        "data": reanalysis_shapefile_path,
+        "group": ["forest", "drouquanti"],
+        "order": reanalysed_forest_order,
+        "colors": drought_keywords_color_mapping,
+        "layout": (2, 4),
+        "figsize": (30, 10),
+        "startangle": 120,
+        "suptitle": "Breakdown of the given drought quantification for the re-analysed paper locations MODIS forest types",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW DATA Breakdown pie charts for percentages of drought definitions for MODIS forest types from re-analysed shapefile.jpg",
+    },
+    # MODIS SPEI category bar chart
+    "MODIS SPEI": {
+        "kind": "bar",
+        "data": reanalysis_shapefile_path,
+        "group": ["forest", "Category"],
+        "rename": {other_forest_label: "Other"},
+        "percentage": True,
+        "segment_order": spei_dry_to_wet_order,
+        "colors": spei_color_mapping,
+        "figsize": (14, 8),
+        "legend": {"title": "SPEI drought category", "loc": "upper right", "patches": True},
+        "xlabel": "Forest type",
+        "ylabel": "Percentage of re-analysed study locations (%)",
+        "xtick_alignment": "right",
+        "yticks": [0, 2.5, 5, 7.5, 10, 12.5, 15, 17.5, 20, 22.5, 25, 27.5, 30, 32.5, 35],
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\re-analysis\No frame on legend\NEW Bar chart for correlation MODIS classes and SPEI drought categories in percent.jpg",
+    },
+    # MODIS breakdown of drought spheres pie charts
+    "MODIS drought sphere": {
+        "kind": "breakdown",
+        "data": all_studies_shapefile_path,
+        "group": ["forest", "sphere"],
+        "order": forest_order,
+        "colors": sphere_color_mapping,
+        "layout": (2, 4),
+        "figsize": (20, 10),
+        "title_case_panels": True,
+        "suptitle": "Breakdown of the given drought spheres for all MODIS forest types from all paper locations",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\Re-worked data\Breakdown pie charts for percentages of drought spheres for MODIS forest types from all paper location.jpg",
+        "save": False,
+    },
+    # MODIS and given drought category keyword bar chart (not needed since the pie charts give a better overview)
+    "MODIS drought keyword": {
+        "kind": "bar",
+        "data": all_studies_shapefile_path,
+        "group": ["forest", "drouquanti"],
+        "rename": {other_forest_label: "Other"},
+        "colors": drought_keywords_color_mapping,
+        "figsize": (12, 6),
+        "legend": {"title": "Drought Keyword", "loc": "upper right"},
+        "title": "Distribution of given drought quantification keywords within each MODIS category from all paper locations",
+        "xlabel": "Forest type",
+        "ylabel": "Number of occurrences",
+        "xtick_alignment": "right",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\Re-worked data\NEW Bar chart for correlation between MODIS classes and given drought quantification keywords from complete paper points shapefile.jpg",
+        "save": False,
+    },
+    # STUDY TYPE:
+    # General study type percentages pie chart
+    "study type": {
+        "kind": "pie",
+        "data": excel_file_path,
+        "group": ["study type"],
+        # Set colors for every study type for a good overview
+        # https://proclusacademy.com/blog/customize_matplotlib_piechart/#slice-colors
+        "colors": ["#1f77b4", "#ff7f0e", "#2ca02c", "#9467bd"],
+        "figsize": (6, 5),
+        "startangle": 90,
+        "wedgeprops": {"edgecolor": "white", "linewidth": 0.5},
+        "title_case_labels": True,
+        # Set label positions manually for the study type "Review", so it is right next to its piece
+        "label_positions": {"Review": (-0.05, 1.05)},
+        "equal_axis": True,
+        "title": "Distribution of the study types out of all used studies",
+        "tight_layout": False,
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Main pie chart with complete study type percentages.jpg",
+        "save": False,
+    },
+    # Study type breakdown of given drought quantification keyword pie charts from Excel since every paper only has one study type
+    "study type drought category excel": {
+        "kind": "breakdown",
+        "data": excel_file_path,
+        "group": ["study type", "drought quantification keyword for plots"],
+        "order": study_type_order,
+        "colors": drought_keywords_color_mapping,
+        "layout": (1, 3),
+        "figsize": (20, 8),
+        "suptitle": "Breakdown of the given drought quantification for the relevant study types",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Breakdown pie charts for percentages of drought definitions for study types.jpg",
+    },
+    # Study type breakdown of given drought quantification keyword pie charts from the re-analysed paper locations
+    "study type drought category": {
+        "kind": "breakdown",
+        "data": reanalysis_shapefile_path,
+        "group": ["studytype", "drouquanti"],
+        "order": study_type_order,
+        "colors": drought_keywords_color_mapping,
+        # Explode the "Plant water stress" segment in the "Observational" pie chart for better readability of the percentages
+        "explode": {"Observational": {"Plant water stress": 0.1}},
+        "layout": (1, 3),
+        "figsize": (20, 8),
+        "startangle": 110,
+        "suptitle": "Breakdown of the given drought quantification for the relevant study types",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW DATA Breakdown pie charts for percentages of drought definitions for study types for the re-analysed paper locations.jpg",
+    },
+    # Study type SPEI breakdown pie charts
+    "study type SPEI": {
+        "kind": "breakdown",
+        "data": reanalysis_shapefile_path,
+        "group": ["studytype", "Category"],
+        "order": study_type_order,
+        "segment_order": spei_wet_to_dry_order,
+        "colors": spei_color_mapping,
+        "layout": (1, 3),
+        "figsize": (27, 8),
+        "startangle": 90,
+        "percentage_color": "white",
+        "title_case_panels": True,
+        "suptitle": "Breakdown of the given SPEI categories from the study types",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\re-analysis\BIGGER NEW Breakdown pie charts for percentages of SPEI categories for the study types of the papers from the re-analysed shapefile locations.jpg",
+    },
+    # SPEI:
+    # SPEI category percentage pie chart
+    "SPEI category percentage": {
+        "kind": "pie",
+        "data": reanalysis_shapefile_path,
+        "group": ["Category"],
+        "colors": spei_color_mapping,
+        "figsize": (14, 8),
+        "startangle": 90,
+        "wedgeprops": {"edgecolor": "black", "linewidth": 0.4},
+        "percentage_color": "white",
+        # Set label position manually for the SPEI category "no drought (+1 < SPEI)" because it's not right on default
+        "label_positions": {"no drought (+1 < SPEI)": (-0.1, 1.1)},
+        "title": "Distribution of the SPEI categories out of all re-analysed studies in percentage",
+        "legend": {"title": "SPEI Categories (Count)", "loc": "center right", "bbox_to_anchor": (1, 0, 0.4, 1)},
+        "output": r"D:\Uni\Bachelorarbeit\Plots\NEW Pie chart with complete SPEI drought category percentages and legend for total numbers.jpg",
+        "save": False,
+    },
+    # Study type SPEI category bar chart
+    "Study type SPEI Bar": {
+        "kind": "bar",
+        "data": reanalysis_shapefile_path,
+        "group": ["studytype", "Category"],
+        "percentage": True,
+        "segment_order": spei_dry_to_wet_order,
+        "colors": spei_color_mapping,
+        "figsize": (14, 8),
+        "legend": {"title": "SPEI drought category", "loc": "upper right", "patches": True},
+        "xlabel": "Study type",
+        "ylabel": "Percentage of re-analysed study locations (%)",
+        "xtick_alignment": "right",
+        # For the study types since Observational has way more than the others
+        "yticks": [0, 2.5, 5, 7.5, 10, 12.5, 15, 17.5, 20, 50, 43, 70, 76],
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\re-analysis\No frame on legend\NEW Bar chart for correlation of SPEI drought category and the used study types of the re-analysed paper locations in percent.jpg",
+    },
+    # Drought quantification keyword SPEI bar chart
+    "Drought keyword SPEI": {
+        "kind": "bar",
+        "data": reanalysis_shapefile_path,
+        "group": ["drouquanti", "Category"],
+        "percentage": True,
+        "segment_order": spei_dry_to_wet_order,
+        "colors": spei_color_mapping,
+        "figsize": (14, 8),
+        "legend": {"title": "SPEI drought category", "loc": "upper right", "patches": True},
+        "xlabel": "Given drought category",
+        "ylabel": "Percentage of re-analysed study locations (%)",
+        "xtick_alignment": "right",
+        "yticks": [0, 2.5, 5, 7.5, 10, 12.5, 15, 17.5, 20, 22.5, 25, 27.5, 30, 32.5, 35, 37.5, 40],
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Bar chart for correlation of SPEI drought category and the given drought quantifications of the studies  in percent.jpg",
+    },
+    # Drought keywords percentage pie chart from the re-analysed paper locations
+    "drought keywords percentage": {
+        "kind": "pie",
+        "data": reanalysis_shapefile_path,
+        "group": ["drouquanti"],
+        "colors": drought_keywords_color_mapping,
+        "figsize": (10, 7),
+        "wedgeprops": {"edgecolor": "black", "linewidth": 0.4},
+        "percentage_color": "white",
+        "title": "Distribution of the drought keywords out of all re-analysed studies in percentage",
+        "legend": {"title": "Drought keywords (Count)", "loc": "upper right", "bbox_to_anchor": (0.9, 0, 0.4, 1)},
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\Re-worked data\NEW Pie chart with drought keywords percentages and legend for total numbers from re-analysed paper location.jpg",
+        "save": False,
+    },
+    # Pie charts that show the contribution of SPEI categories for quantified or not
+    "Quantification drought keywords": {
+        "kind": "breakdown",
+        "data": reanalysis_shapefile_path,
+        "group": ["wasdrquant", "Category"],
+        "segment_order": spei_dry_to_wet_order,
+        "colors": spei_color_mapping,
+        "layout": (1, 2),
+        "figsize": (19, 7),
+        "startangle": 90,
+        "percentage_color": "white",
+        "panel_title": "Drought quantified: {panel}",
+        "panel_names": drought_quantified_names,
+        # A legend for each pie chart separately, placed below the pie charts
+        "legend": {
+            "title": 'Total count of "Drought quantified: {panel}" studies: {total}',
+            "loc": "upper center",
+            "bbox_to_anchor": (0.5, 0.1),
+        },
+        "suptitle": "Distribution of drought findings for quantified vs not quantified",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\Quantified_drought_keywords_pie_chart.jpg",
+    },
+    # General:
+    # Drought keywords percentage pie chart from the Excel file to show the general paper contribution
+    "drought keywords percentage excel": {
+        "kind": "pie",
+        "data": excel_file_path,
+        "group": ["drought quantification keyword for plots"],
+        "colors": drought_keywords_color_mapping,
+        "figsize": (11, 7),
+        "wedgeprops": {"edgecolor": "black", "linewidth": 0.4},
+        "percentage_color": "black",
+        "title": "Distribution of the drought keywords out of all studies",
+        "legend": {"title": "Drought categories: 168 total", "loc": "center right", "bbox_to_anchor": (1, 0.15, 0.4, 1)},
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Pie chart with drought keywords percentages and legend for total numbers from excel updated.jpg",
+    },
+    # TRUE OR FALSE:
+    # Pie charts that show drought correctness for quantified or not, no matter the category
+    "Quantified correctness": {
+        "kind": "breakdown",
+        "data": reanalysis_shapefile_path,
+        "group": ["wasdrquant", "drouright"],
+        "colors": {"True": "darkblue", "False": "red"},
+        "segment_labels": {"True": "Correct (True)", "False": "Incorrect (False)"},
+        "layout": (1, 2),
+        "figsize": (15, 7),
+        "startangle": 90,
+        "wedgeprops": {"edgecolor": "black", "linewidth": 0.5},
+        "percentage_color": "white",
+        "panel_title": "Drought quantified: {panel}",
+        "panel_names": drought_quantified_names,
+        # Set the legend entries manually, so both values are always listed
+        "legend": {
+            "title": "Classification of drought correctness: {total}",
+            "loc": "upper right",
+            "entries": [
+                ("True", "Correct (True)", {"color": "darkblue"}),
+                ("False", "Incorrect (False)", {"color": "red"}),
+            ],
+        },
+        "suptitle": "Correctness of drought findings for quantified vs not quantified",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\Quantified_correctness_pie_chart.jpg",
+    },
+    # Bar chart with correctness of the given drought quantification keywords for all re-analyzed paper locations
+    "Drought correctness": {
+        "kind": "bar",
+        "data": reanalysis_shapefile_path,
+        "group": ["drouquanti", "drouright"],
+        "percentage": True,
+        "segment_order": ["True", "False"],
+        "colors": {"True": "darkblue", "False": "red"},
+        "edgecolor": "black",
+        "figsize": (10, 6),
+        # Set the legend entries manually with all its attributes colors and hatches, so they match the bars
+        "legend": {
+            "title": "Was there a drought according to SPEI?",
+            "loc": "upper right",
+            "alignment": "left",
+            "entries": [
+                ("True", "Yes", {"color": "darkblue"}),
+                ("False", "No", {"facecolor": "red", "edgecolor": "black", "hatch": "////"}),
+            ],
+        },
+        # Customize the "False" bars with diagonal stripes
+        "hatches": {"False": "//"},
+        "title": "Bar plot to show the correctness of the given drought keywords",
+        "xlabel": "Given drought category",
+        "ylabel": "Percentage of all drought category keywords",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\Bar plot that shows the correctness of the given drought quantification keywords for all re-analyzed paper locations.jpg",
+    },
+    # Bar chart that shows the correlation between all given drought keywords and if drought was quantified in percent
+    "Drought quantified": {
+        "kind": "bar",
+        "data": reanalysis_shapefile_path,
+        "group": ["drouquanti", "wasdrquant"],
+        "percentage": True,
+        "order": drought_keyword_order,
+        "segment_order": ["True", "False"],
+        "colors": {"True": "darkblue", "False": "red"},
+        "edgecolor": "black",
+        "figsize": (10, 6),
+        "legend": {
+            "title": "Was drought quantified?",
+            "loc": "upper right",
+            "alignment": "left",
+            "entries": [
+                ("True", "Yes", {"color": "darkblue"}),
+                ("False", "No", {"facecolor": "red", "edgecolor": "black", "hatch": "////"}),
+            ],
+        },
+        "hatches": {"False": "//"},
+        # Set the y-axis limit to 40% for a better overview
+        "ylim": (0, 40),
+        "title": "Correlation between given drought keywords and if drought was quantified",
+        "xlabel": "Given drought category",
+        "ylabel": "Percentage of all drought category keywords",
+        "output": r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\Bar plot that shows the correlation between all given drought keywords and if drought was quantified in percent.jpg",
+    },
+}
+
+
+# ------------------------------------------------- CHART RENDERING -------------------------------------------------- #
+def format_label(label):
+    """
+    Formats a value of the data for the labels of the charts: the quotes are added back to the "Dry" drought keyword
+    (they had to be removed for python rules when loading the data) and "<=" is replaced with "≤".
 
-        # Save the bar plot as a JPG file to use it in the thesis
-        # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-        plot.savefig(output_file_path, format="jpg")
+    Args:
+        label (str): The value as stored in the data.
 
-        # Optionally display the plot (for finetuning so adjusting is easier)
-        # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-        plot.show()
+    Returns:
+        str: The label as displayed in the chart.
+    """
+    if label == "Dry":
+        return '"Dry"'
+    # https://docs.python.org/3/library/stdtypes.html#str.replace
+    return label.replace("<=", "≤")
 
 
-def create_drought_keywords_bar_chart(shape_or_excel_file_path, chart_type):
+def count_values(count_cube, group_columns):
     """
-    Generates a stacked bar chart to visualize the distribution of drought quantification keywords, currently only with
-    each MODIS forest type from a given dataset.
-    This function is used for bar charts with the given drought quantification keywords from the papers
-    The function is designed to combine bar chart creation logic for different cases which all have
-    "drought quantification keyword for plots" as stacked bars into a single function.
-    This allows for easy extension if more bar charts are needed in the future from the same shapefile data,
-    without requiring the creation of additional functions.
-    Not needed since a pie chart serves the purpose better since it provides a better overview for this type of analysis
+    Counts how often every value (for one column) or every combination of values (for two columns) occurs in the dataset,
+    by adding up the counts of the count cube over all other columns.
 
     Args:
-        shape_or_excel_file_path (str): The path to the Excel file (.xlsx) or shapefile (.shp) to be used for data extraction.
-        chart_type (str): Specifies the type of bar chart to generate.
-                        Options are:
-                         - "MODIS drought keyword": Correlates SPEI drought categories with drought quantification keywords.
-
+        count_cube (Series): The count cube of the dataset as loaded by load_count_cube().
+        group_columns (list): One column, or two columns where the values of the second column become the columns of the table.
 
     Returns:
-        None: The function saves the generated bar chart as a JPG image.
+        Series or DataFrame: The counts, for one column from most to least common,
+                             for two columns as pivot table (sorted by the values) with missing combinations filled with 0.
+    """
+    # Add up the counts of the wanted columns, missing values are left out like when grouping the rows
+    # https://pandas.pydata.org/docs/reference/api/pandas.Series.groupby.html
+    counts = count_cube.groupby(level=group_columns, observed=True).sum()
+
+    # Sort the counts from most to least common, equal counts keep the order of the first appearance like value_counts()
+    # https://pandas.pydata.org/docs/reference/api/pandas.Series.sort_values.html
+    if len(group_columns) == 1:
+        counts = counts.sort_values(ascending=False, kind="stable")
+        counts.index = counts.index.astype(object)
+        return counts
+
+    # Create the pivot table, fill missing combinations with 0 and sort both axes by the values like grouping the rows does
+    # https://www.statology.org/pandas-unstack/
+    # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.sort_index.html
+    counts = counts.unstack(fill_value=0)
+    counts.index = counts.index.astype(object)
+    counts.columns = counts.columns.astype(object)
+    return counts.sort_index().sort_index(axis=1)
+
+
+def create_legend_patches(entries, counts):
     """
+    Creates the legend entries that are set manually (with their colors and hatches), each with the count of its value.
 
-    # Read the given shapefile for all pie chart cases using geopandas read_file() method and storing it as a geodataframe
-    # https://geopandas.org/en/stable/docs/user_guide/data_structures.html#geodataframe
-    # https://geopandas.org/en/stable/docs/user_guide/io.html#reading-and-writing-files
-    complete_gdf = geopd.read_file(shape_or_excel_file_path)
+    Args:
+        entries (list): Tuples of the value, the label text and the properties of the patch, as given in the "legend" of a chart.
+        counts (Series): The counts of the values, values that are missing are counted as 0.
 
-    # Clean up the "drought quantification keyword for plots" to remove quotes (because python gives an error for "dry" if there are quotes) and extra spaces
-    # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-    # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.replace.html
-    complete_gdf["drouquanti"] = (
-        complete_gdf["drouquanti"].str.strip().str.replace('"', "")
-    )
+    Returns:
+        list: The patches for the legend.
 
-    # For MODIS categories and SPEI drought categories
-    if chart_type == "MODIS drought keyword":
-        # Grouping the data by "MODIS" and "drouquanti" to count occurrences of the drought quantifications
-        # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-        # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-        # https://www.statology.org/pandas-unstack/
-        drought_keywords_counts = (
-            complete_gdf.groupby(["forest", "drouquanti"]).size().unstack(fill_value=0)
-        )
+    References:
+        - https://matplotlib.org/stable/api/_as_gen/matplotlib.patches.Patch.html#matplotlib-patches-patch
+        - https://stackoverflow.com/a/37296137
+    """
+    # https://www.w3schools.com/python/ref_dictionary_get.asp
+    return [
+        mpatches.Patch(label=f"{text}: {counts.get(value, 0)}", **patch_properties)
+        for value, text, patch_properties in entries
+    ]
 
-        # X-axis text
-        xaxisdescription = "Forest type"
-        # Title of the plot
-        title = "Distribution of given drought quantification keywords within each MODIS category from all paper locations"
-        # Path where the plot is going to be saved
-        output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\Re-worked data\NEW Bar chart for correlation between MODIS classes and given drought quantification keywords from complete paper points shapefile.jpg"
-
-    # For the (currently only) case with MODIS forest cover on the X-Axis and the given drought keywords as stacked bars
-    if chart_type in ["MODIS drought keyword"]:
-        # Change the label for "Other" category, so it is not too long (only for bar plots with MODIS involved)
-        # https://pandas.pydata.org/docs/user_guide/basics.html#renaming-mapping-labels
-        drought_keywords_counts.rename(
-            index={
-                "Other (Mangrove Forest, Open Shrubland, Savannas, Permanent Wetlands, ...)": "Other"
-            },
-            inplace=True,
-        )
 
-        # Sorting the created pivot table by total occurrences (sum of rows), from most to least in descending order for all stacked bar plots for the custom legend
-        # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.loc.html#pandas-dataframe-loc
-        # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.sort_values.html
-        # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.sort_values.html
-        drought_keywords_counts_sorted = drought_keywords_counts.loc[
-            drought_keywords_counts.sum(axis=1).sort_values(ascending=False).index
-        ]
+def render_bar_chart(chart, counts):
+    """
+    Creates a stacked bar chart with the first group column on the X-Axis and the values of the second group column as stacked bars.
 
-        # Sorting the columns by total occurrences (sum of columns) for legend and data
-        # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.sort_values.html
-        drought_keywords_sums = drought_keywords_counts_sorted.sum(axis=0)
-        drought_keywords_counts_sorted = drought_keywords_counts_sorted[
-            drought_keywords_sums.sort_values(ascending=False).index
-        ]
+    Args:
+        chart (dict): The settings of the chart from 'chart_registry'.
+        counts (DataFrame): The pivot table of the counts as created by count_values().
+    """
+    # Calculate the percentage for each value by dividing each count by the global total (sum of all counts)
+    # https://www.w3schools.com/python/pandas/ref_df_sum.asp
+    # https://www.w3schools.com/python/pandas/ref_df_div.asp
+    bar_values = counts.div(counts.values.sum()) * 100 if chart.get("percentage") else counts
+
+    # Use the given order of the bars, or sort them by total occurrences (sum of rows) from most to least
+    # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.reindex.html
+    # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.sort_values.html
+    if "order" in chart:
+        bar_values = bar_values.reindex(chart["order"])
+    else:
+        bar_values = bar_values.loc[bar_values.sum(axis=1).sort_values(ascending=False).index]
+
+    # Use the given order of the stacked bars, or sort them by total occurrences (sum of columns) from most to least
+    column_sums = counts.sum(axis=0)
+    if "segment_order" in chart:
+        bar_values = bar_values.reindex(columns=chart["segment_order"])
+    else:
+        bar_values = bar_values[bar_values.sum(axis=0).sort_values(ascending=False).index]
+
+    # Generate the plot with sorted categories and the customized colors
+    # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.bar.html
+    bar_settings = {"edgecolor": chart["edgecolor"]} if "edgecolor" in chart else {}
+    bar_axes = bar_values.plot(
+        kind="bar",
+        stacked=True,
+        figsize=chart["figsize"],
+        color=[chart["colors"][column] for column in bar_values.columns],
+        **bar_settings,
+    )
 
-        # Create custom legend labels by combining each drought quantification keyword (category)
-        # with its corresponding count using zip(). Dry is changed back to "Dry"
-        # https://www.geeksforgeeks.org/matplotlib-pyplot-legend-in-python/
-        # https://www.geeksforgeeks.org/create-pandas-dataframe-from-lists-using-zip/
-        legend_labels_with_counts = [
-            f'"{category}": {count}' if category == "Dry" else f"{category}: {count}"
-            for category, count in zip(
-                drought_keywords_sums.index, drought_keywords_sums.values
-            )
+    # Customize the stacked bars of the given values with hatches (e.g. diagonal stripes for "False")
+    # https://stackoverflow.com/a/59586067 (set_hatch)
+    for column, hatch in chart.get("hatches", {}).items():
+        for bar in bar_axes.containers[list(bar_values.columns).index(column)]:
+            bar.set_hatch(hatch)
+
+    # Add the legend, either with the manually set entries or with every stacked value and its count, from most to least
+    # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.legend.html
+    legend = chart["legend"]
+    legend_settings = {key: legend[key] for key in ["title", "loc", "alignment"] if key in legend}
+    if "entries" in legend:
+        plot.legend(handles=create_legend_patches(legend["entries"], column_sums), frameon=False, **legend_settings)
+    else:
+        # Either patches with the colors of the values or the stacked bars themselves are shown in the legend
+        # https://matplotlib.org/stable/users/explain/axes/legend_guide.html#creating-artists-specifically-for-adding-to-the-legend-aka-proxy-artists
+        legend_handles = [
+            mpatches.Patch(color=chart["colors"][column]) if legend.get("patches") else bar_container
+            for column, bar_container in zip(bar_values.columns, bar_axes.containers)
         ]
+        legend_labels = [f"{format_label(column)}: {int(column_sums.get(column, 0))}" for column in bar_values.columns]
 
-        # Sorting legend labels based on the counts numeric in descending order
+        # Sorting the legend entries based on the counts in descending order
         # https://docs.python.org/3/howto/sorting.html
-        sorted_legend_labels_with_counts = sorted(
-            legend_labels_with_counts,
-            key=lambda x: int(x.split()[-1]),
+        sorted_entries = sorted(
+            zip(legend_handles, legend_labels, bar_values.columns),
+            key=lambda entry: int(column_sums.get(entry[2], 0)),
             reverse=True,
         )
-
-        # Define consistent colors for each drought quantification keyword across all charts
-        # https://stackoverflow.com/questions/26139423/plot-different-color-for-different-categorical-levels
-        drought_keywords_color_mapping = {
-            "Dry": "#ff7f0e",  # Dark Orange
-            "Differs from normal": "#ff4500",  # Orange-Red
-            "Dry season": "#adff2f",  # Green Yellow
-            "Low soil moisture": "#b47d49",  # Brown
-            "Low water flow/depth": "#4682b4",  # Steel Blue
-            "Plant water stress": "#32cd32",  # Lime Green
-            "Reduced rainfall": "#87CEEB",  # Sky Blue
-            "Standardized Index": "#a245a8",  # Purple
-        }
-
-        # Generate the plot with sorted categories and the customized colors
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.bar.html
-        drought_keywords_counts_sorted.plot(
-            kind="bar",
-            stacked=True,
-            figsize=(12, 6),
-            color=[
-                drought_keywords_color_mapping[cat]
-                for cat in drought_keywords_counts_sorted.columns
-            ],
-        )
-
-        # Add titles and axis labels that were defined before depending on automatically from the titels
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.xlabel.html#matplotlib.pyplot.xlabel
-        plot.title(title)
-        plot.xlabel(xaxisdescription)
-
-        # Add manual y-axis label for all studies
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.ylabel.html#matplotlib-pyplot-ylabel
-        plot.ylabel("Number of occurrences")
-
-        # Place the sorted legend with counts inside the plot on the upper right
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.legend.html
         plot.legend(
-            sorted_legend_labels_with_counts,
-            title="Drought Keyword",
-            loc="upper right",
+            [handle for handle, _, _ in sorted_entries],
+            [label for _, label, _ in sorted_entries],
             frameon=False,
+            **legend_settings,
         )
 
-        # Rotate x-axis labels for readability and better plot-text ratio
-        # https://www.geeksforgeeks.org/matplotlib-pyplot-xticks-in-python/
-        plot.xticks(
-            ticks=range(len(drought_keywords_counts_sorted.index)),
-            labels=drought_keywords_counts_sorted.index,
-            rotation=45,
-            ha="right",
-        )
-
-        # Ensure that the tight layout is used for a better visualisation
-        # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-        plot.tight_layout()
-
-        # Save the plot as a JPG file to use it in the bachelor-thesis
-        # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-        # plot.savefig(output_file_path, format="jpg")
+    # Add titles and axis labels
+    # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
+    # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.xlabel.html#matplotlib.pyplot.xlabel
+    # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.ylabel.html#matplotlib-pyplot-ylabel
+    if "title" in chart:
+        plot.title(chart["title"])
+    plot.xlabel(chart["xlabel"])
+    plot.ylabel(chart["ylabel"])
+
+    # Rotate x-axis labels for readability and better plot-text ratio
+    # https://www.geeksforgeeks.org/matplotlib-pyplot-xticks-in-python/
+    plot.xticks(
+        ticks=range(len(bar_values.index)),
+        labels=[format_label(label) for label in bar_values.index],
+        rotation=45,
+        ha=chart.get("xtick_alignment", "center"),
+    )
 
-        # Optionally display the plot (for finetuning so adjusting is easier)
-        # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-        plot.show()
+    # Adjust the Y-Axis manually by a fixed array or limit
+    # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.yticks.html#matplotlib-pyplot-yticks
+    # https://www.geeksforgeeks.org/matplotlib-pyplot-ylim-in-python/
+    if "yticks" in chart:
+        plot.yticks(chart["yticks"])
+    if "ylim" in chart:
+        plot.ylim(*chart["ylim"])
 
 
-# ------------------------------------------------- PIE CHARTS ------------------------------------------------------- #
-def create_pie_chart(shape_or_excel_file_path, chart_type):
+def render_pie_chart(chart, counts):
     """
-    Generates pie charts based on the specified `chart_type` using data from either an Excel file or a
-    shapefile. The function supports multiple types of pie charts, such as study type distributions,
-    drought classifications, MODIS categories, and SPEI drought categories.
-    Additional pie chart types can be implemented easily by adding new cases based on the same input data.
+    Creates a single pie chart with the percentage of every value, optionally with a legend of the counts.
 
     Args:
-        shape_or_excel_file_path (str): The path to the Excel file (.xlsx) or shapefile (.shp) to be used for data extraction.
-        chart_type (str): Specifies the type of pie chart to generate.
-                        Options are:
-                            - "drought keywords percentage excel": Distribution of drought keywords from Excel.
-                            - "drought keywords percentage": Distribution of drought keywords from re-analysed paper points.
-                            - "study type": Distribution of study types from Excel.
-                            - "study type drought category excel": Breakdown of drought quantification keywords by study type from Excel.
-                            - "study type drought category": Breakdown of drought quantification keywords by study type from re-analysed paper locations.
-                            - "study type SPEI": Breakdown of SPEI categories for each study type.
-                            - "MODIS drought category all": Breakdown of drought categories for MODIS forest types from all locations.
-                            - "MODIS drought category": Breakdown of drought categories for MODIS forest types from re-analysed locations.
-                            - "MODIS percentage all": Percentage distribution of MODIS forest types from all locations.
-                            - "MODIS percentage": Percentage distribution of MODIS forest types from re-analysis locations.
-                            - "MODIS drought sphere": Drought sphere categories for MODIS forest types.
-                            - "Spheres drought category excel": Drought quantification breakdown for each sphere from Excel.
-                            - "Spheres drought category": Drought quantification breakdown for each sphere from re-analysed paper locations.
-                            - "spheres": Percentage overview of drought spheres.
-                            - "Spheres SPEI": Breakdown of SPEI categories for each sphere.
-                            - "Continent percentage all": Percentage distribution by continent from all locations.
-                            - "Continent percentage" Percentage distribution by continent from reanalyzed locations.
-                            - "Continent drought category all": Drought quantification breakdown for each continent from all locations.
-                            - "Continent drought category": Drought quantification breakdown for each continent re-analysis locations.
-                            - "Continent SPEI": Breakdown of SPEI categories for each continent.
-                            - "SPEI category percentage": Percentage of re-analysed study locations by SPEI category.
-                            - "Quantified correctness": Correctness of whether drought was quantified or not.
-                            - "Quantification drought keywords": Contribution of drought keywords for quantified or not.
-
-    Returns:
-        None: The function saves the generated pie chart(s) as a JPG image.
+        chart (dict): The settings of the chart from 'chart_registry'.
+        counts (Series): The counts of the values as created by count_values().
     """
+    # Create a list of colors in the same order as the values, either from the color mapping or from the given list
+    colors = chart["colors"]
+    if isinstance(colors, dict):
+        colors = [colors[label] for label in counts.index]
+
+    # Adjust the size of the plot so the picture is better usable later and nothing gets cut off
+    # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.figure.html
+    plot.figure(figsize=chart["figsize"])
+
+    # Create the pie chart with percentages as texts
+    # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.pie.html
+    # https://www.educative.io/answers/how-to-explode-a-pie-chart-using-matplotlib-in-python
+    wedges, texts, autotexts = plot.pie(
+        counts,
+        autopct="%1.1f%%",
+        colors=colors,
+        startangle=chart.get("startangle", 0),
+        explode=chart.get("explode"),
+        wedgeprops=chart.get("wedgeprops"),
+    )
 
-    # Cases for the pie charts that need data from the Excel file
-    if chart_type in [
-        "study type",
-        "study type drought category excel",
-        "MODIS drought sphere",
-        "spheres",
-        "Spheres drought category excel",
-        "drought keywords percentage excel",
-    ]:
-
-        # Load the Excel file and "relevantInfo" sheet where the data for the pie charts is stored
-        # https://pandas.pydata.org/docs/reference/api/pandas.read_excel.html
-        excel_df = pd.read_excel(excel_file_path, sheet_name="relevantInfo")
-
-        # Clean up the "study type" column to avoid duplicates due to capitalization or extra spaces and make the filtering for the breakdown pie charts easier
-        # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-        excel_df["study type"] = excel_df["study type"].str.strip()
-
-        # Clean up the "drought_sphere" column to avoid duplicates due to capitalization or extra spaces and make the filtering for the pie charts easier
-        # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-        excel_df["drought_sphere"] = excel_df["drought_sphere"].str.strip()
-
-        # Clean up the "drought quantification keyword for plots" and remove quotes (because python gives an error for "Dry" if there are quotes) and extra spaces
-        # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-        # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.replace.html
-        excel_df["drought quantification keyword for plots"] = (
-            excel_df["drought quantification keyword for plots"]
-            .str.strip()
-            .str.replace('"', "")
+    # Change the color of the percentages for clearer visibility
+    # https://stackoverflow.com/a/27899541 (set_color())
+    if "percentage_color" in chart:
+        for autotext in autotexts:
+            autotext.set_color(chart["percentage_color"])
+
+    # Add the labels of the segments and set label positions manually where they are not right next to their pieces on default
+    # https://stackoverflow.com/a/43916835 (set_position())
+    # https://matplotlib.org/stable/api/text_api.html#module-matplotlib.text
+    label_positions = chart.get("label_positions", {})
+    for i, label in enumerate(counts.index):
+        # Re-capitalize labels for the pie chart by defining them as titles if wanted
+        label = format_label(label).title() if chart.get("title_case_labels") else format_label(label)
+        if label in label_positions:
+            texts[i].set_position(label_positions[label])
+        texts[i].set_text(label)
+
+    # Draw the plot as circle and ensure equal aspect ratio
+    # https://matplotlib.org/stable/gallery/subplots_axes_and_figures/axis_equal_demo.html
+    if chart.get("equal_axis"):
+        plot.axis("equal")
+
+    # Set the title of the pie chart
+    # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
+    if "title" in chart:
+        plot.title(chart["title"])
+
+    # Add a legend for the total numbers of every value and place it outside the pie chart (with bbox_to_anchor)
+    # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.items.html#pandas-dataframe-items
+    # https://matplotlib.org/stable/api/legend_api.html#module-matplotlib.legend
+    if "legend" in chart:
+        plot.legend(
+            wedges,
+            [f"{format_label(label)}: {count}" for label, count in counts.items()],
+            frameon=False,
+            **chart["legend"],
         )
 
-        # Define consistent colors for each drought quantification keyword across all plots, globally defined because of multiple use cases
-        # https://stackoverflow.com/questions/26139423/plot-different-color-for-different-categorical-levels
-        drought_keywords_color_mapping = {
-            "Dry": "#ff7f0e",  # Dark Orange
-            "Differs from normal": "#ff4500",  # Orange-Red
-            "Dry season": "#adff2f",  # Green Yellow
-            "Low soil moisture": "#b47d49",  # Brown
-            "Low water flow/depth": "#4682b4",  # Steel Blue
-            "Plant water stress": "#32cd32",  # Lime Green
-            "Reduced rainfall": "#87CEEB",  #  Sky Blue
-            "Standardized Index": "#a245a8",  # Purple
-        }
 
-        # If "drought keywords percentage excel" is selected, create the general drought keywords pie chart from the Excel
-        if chart_type == "drought keywords percentage excel":
-            # Count the occurrences of each drought keyword and clean them to create the percentages, then count its occurrences with size()
-            # Remove quotes with replace() (because python gives an error for "dry" keyword if there are quotes)
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.replace.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.value_counts.html
-            drought_keywords_counts = (
-                excel_df["drought quantification keyword for plots"]
-                .str.strip()
-                .str.replace('"', "")
-                .value_counts()
-            )
-
-            # Create a list of colors in the same order as the labels in spei_category_counts to use it for the pie chart
-            drought_keywords_colors = [
-                drought_keywords_color_mapping[label]
-                for label in drought_keywords_counts.index
-            ]
-
-            # Adjust the size of the plot so the picture is better usable later and nothing gets cut off
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.figure.html
-            plot.figure(figsize=(11, 7))
-
-            # Create the pie chart with black lines between pieces and percentages as texts
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.pie.html
-            wedges, category_texts, autotexts = plot.pie(
-                drought_keywords_counts,
-                autopct="%1.1f%%",
-                colors=drought_keywords_colors,
-                wedgeprops={"edgecolor": "black", "linewidth": 0.4},
-            )
-
-            # Change the color of the percentages to white for clearer visibility
-            # https://stackoverflow.com/a/27899541 (set_color())
-            for autotext in autotexts:
-                autotext.set_color("black")
-
-            # Manage the labels for the segments by iterating over the dataframe "drought_keywords_counts"
-            # https://www.w3schools.com/python/pandas/ref_df_index.asp
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html
-            for i, keyword_label in enumerate(drought_keywords_counts.index):
-
-                # Add back the "" for the "Dry" drought keyword since it had to be removed earlier for python rules
-                if keyword_label == "Dry":
-                    keyword_label = '"Dry"'
-
-                # Add the drought keyword label texts automatically from the drought_keywords_counts dataframe
-                # https://www.tutorialspoint.com/how-to-add-title-to-subplots-in-matplotlib#:~:text=The%20Matplotlib%20set_text()%20function,in%20a%20subplot%20or%20plot.
-                category_texts[i].set_text(keyword_label)
-
-            # Set the main title as well as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
-            plot.title("Distribution of the drought keywords out of all studies")
-            drought_keywords_output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Pie chart with drought keywords percentages and legend for total numbers from excel updated.jpg"
-
-            # Create and add a legend for the total numbers of drought keywords for a better overview of the data
-            # Create the labels out of the SPEI categories for the legend with counts so the total numbers are displayed
-            # Also add back the "" for the "Dry" drought keyword since it had to be removed earlier for python rules
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.items.html#pandas-dataframe-items
-            # https://docs.python.org/3/library/stdtypes.html#str.replace
-            keywords_legend_labels = [
-                f'"{label}": {count}' if label == "Dry" else f"{label}: {count}"
-                for label, count in drought_keywords_counts.items()
-            ]
-
-            # Now add the legend to the pie chart with the drought keyword labels and place it in the upper right outside the pie chart (with bbox_to_anchor)
-            # https://matplotlib.org/stable/api/legend_api.html#module-matplotlib.legend
-            plot.legend(
-                wedges,
-                keywords_legend_labels,
-                title="Drought categories: 168 total",
-                loc="center right",
-                bbox_to_anchor=(1, 0.15, 0.4, 1),
-                frameon=False,
-            )
-
-            # Ensure that the tight layout is used for a better visualisation and readability
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart as a JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            plot.savefig(drought_keywords_output_file_path, format="jpg")
-
-            # Optionally display the plot (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "Spheres drought category excel" is selected, create the drought quantification breakdown pie charts for each drought sphere
-        if chart_type == "Spheres drought category excel":
-
-            # Group the data by "drought_sphere" and clean the drought quantification keywords and then count its occurrences with size()
-            # Remove quotes with replace() (because python gives an error for "dry" keyword if there are quotes)
-            # Also create the pivot table to have "drought_sphere" as columns and fill missing with 0
-            # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.replace.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://www.geeksforgeeks.org/list-size-method-in-java-with-examples/
-            # https://www.statology.org/pandas-unstack/
-            # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-            spheres_breakdown_data = (
-                excel_df.groupby(
-                    [
-                        "drought_sphere",
-                        excel_df["drought quantification keyword for plots"]
-                        .str.strip()
-                        .str.replace('"', ""),
-                    ]
-                )
-                .size()
-                .unstack(fill_value=0)
-            )
-
-            # Set the size of the figure and define the number of subplots based on the number of relevant drought spheres
-            # manually because we need one pie chart for each sphere
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.subplots.html
-            fig, axes = plot.subplots(1, 4, figsize=(20, 5))
-
-            # Flatten the axes for easier iteration and a faster plot creation
-            # https://stackoverflow.com/questions/46862861/what-does-axes-flat-in-matplotlib-do
-            # axes = axes.flatten()
-
-            # Iterate over the final dataframe that holds the wanted information to filter out zero values and assign the wanted colors
-            # https://www.w3schools.com/python/pandas/ref_df_iterrows.asp
-            for i, (drought_sphere, row) in enumerate(
-                spheres_breakdown_data.iterrows()
-            ):
-                # Filter out redundant zero values in the rows (Given drought categories) so only the drought categories that are given for the study types are displayed
-                row = row[row > 0]
-                # Use consistent colors for each keyword, so it is not confusing (using the colors declared before globally
-                breakdown_colors = [
-                    drought_keywords_color_mapping[label] for label in row.index
-                ]
-
-                # Display percentages inside the pieces and assign the labels and colors to the pie chart pieces
-                # Also add the "" back to the "Dry" label since it had to be removed for python rules before
-                # No "startangle=90" because the percentages overlap if used
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.pie.html
-                axes[i].pie(
-                    row,
-                    labels=[
-                        f'"{label}"' if label == "Dry" else label for label in row.index
-                    ],
-                    autopct="%1.1f%%",
-                    colors=breakdown_colors,
-                )
-
-                # Display a title for every single pie chart containing its drought sphere type as title
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_title.html
-                axes[i].set_title(f"{drought_sphere.title()}")
-
-            # Set the main title for the entire figure (has to be done separately because every pie chart has its own title) aswell as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.suptitle.html
-            fig.suptitle(
-                "Breakdown of the given drought quantification for the drought spheres",
-                fontsize=16,
-            )
-            sphere_category_output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Breakdown pie charts for percentages of drought definitions for the drought spheres from the Excel file.jpg"
-
-            # Ensure that the tight layout is used for a better visualisation (the single pie charts are too close to another if not used)
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart(s) as one JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            plot.savefig(sphere_category_output_file_path, format="jpg")
-
-            # Optionally display the pie chart(s) (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "spheres" is selected, this case is used to create the percentage overview pie chart for the drought spheres
-        if chart_type == "spheres":
-            # Count the occurrences of each sphere to create the percentages
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.value_counts.html
-            spheres_count = excel_df["drought_sphere"].str.strip().value_counts()
-
-            # Set colors for every sphere for a good overview
-            # https://proclusacademy.com/blog/customize_matplotlib_piechart/#slice-colors
-            sphere_colors = [
-                "#8B4513",  # brown
-                "#ADD8E6",  # light blue
-                "#3232d1",  # dark blue
-                "#808080",  # grey
-            ]
-
-            # Adjust the size of the plot so the picture is better usable later on
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.figure.html
-            plot.figure(figsize=(6.5, 6))
-
-            # # Create the pie chart with percentages and white lines between the pieces
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.pie.html
-            wedges, texts, autotexts = plot.pie(
-                spheres_count,
-                autopct="%1.1f%%",
-                colors=sphere_colors,
-                startangle=90,
-            )
-
-            # Set label positions manually for the "Meteorological" sphere, by iterating over all labels by using .index to enumerate them
-            # https://stackoverflow.com/a/43916835 (set_position())
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html
-            # https://www.w3schools.com/python/pandas/ref_df_index.asp
-            # https://matplotlib.org/stable/api/text_api.html#module-matplotlib.text
-            for i, label in enumerate(spheres_count.index):
-                # Re-capitalize labels for the pie chart by defining them as titles
-                label = label.title()
-                # Adjusting the position of "Review" by using specific coordinates
-                if label == "Meteorological":
-                    texts[i].set_position((-0.25, 1.05))
-                else:
-                    # Keep default position for other labels since they are fine on default
-                    texts[i].set_position(texts[i].get_position())
-
-                # Adding back the other spheres label text (since set_position overrides them)
-                # https://www.tutorialspoint.com/how-to-add-title-to-subplots-in-matplotlib#:~:text=The%20Matplotlib%20set_text()%20function,in%20a%20subplot%20or%20plot.
-                texts[i].set_text(label)
-
-            # Draw the plot as circle and ensure equal aspect ratio
-            # https://matplotlib.org/stable/gallery/subplots_axes_and_figures/axis_equal_demo.html
-            plot.axis("equal")
-
-            # Set the title and filename for this pie chart
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
-            plot.title("Distribution of the drought spheres out of all used studies")
-            study_type_output_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\Re-worked data\NEW main pie chart with complete drought sphere percentages.jpg"
-
-            # Save the pie chart as a JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            # plot.savefig(study_type_output_path, format="jpg")
-
-            # Optionally display the plot (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "study type" is selected, this case is used to create the percentage overview pie chart for the study types
-        elif chart_type == "study type":
-            # Count the occurrences of each study type to create the percentages
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.value_counts.html
-            study_type_counts = excel_df["study type"].value_counts()
-
-            # Set colors for every study type for a good overview
-            # https://proclusacademy.com/blog/customize_matplotlib_piechart/#slice-colors
-            study_type_colors = [
-                "#1f77b4",  # blue
-                "#ff7f0e",  # orange
-                "#2ca02c",  # green
-                "#9467bd",  # purple
-            ]
-
-            # Adjust the size of the plot so the picture is better usable later on
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.figure.html
-            plot.figure(figsize=(6, 5))
-
-            # # Create the pie chart with percentages and white lines between the pieces
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.pie.html
-            wedges, texts, autotexts = plot.pie(
-                study_type_counts,
-                autopct="%1.1f%%",
-                colors=study_type_colors,
-                startangle=90,
-                wedgeprops={"edgecolor": "white", "linewidth": 0.5},
-            )
-
-            # Set label positions manually for the study type "Review", so they are right next to their pieces,
-            # by iterating over all labels by using .index to enumerate them
-            # https://stackoverflow.com/a/43916835 (set_position())
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html
-            # https://www.w3schools.com/python/pandas/ref_df_index.asp
-            # https://matplotlib.org/stable/api/text_api.html#module-matplotlib.text
-            for i, label in enumerate(study_type_counts.index):
-                # Re-capitalize labels for the pie chart by defining them as titles
-                label = label.title()
-                # Adjusting the position of "Review" by using specific coordinates
-                if label == "Review":
-                    texts[i].set_position((-0.05, 1.05))
-                else:
-                    # Keep default position for other labels since they are fine on default
-                    texts[i].set_position(texts[i].get_position())
-
-                # Adding back the study type label text (since set_position overrides them)
-                # https://www.tutorialspoint.com/how-to-add-title-to-subplots-in-matplotlib#:~:text=The%20Matplotlib%20set_text()%20function,in%20a%20subplot%20or%20plot.
-                texts[i].set_text(label)
-
-            # Draw the plot as circle and ensure equal aspect ratio
-            # https://matplotlib.org/stable/gallery/subplots_axes_and_figures/axis_equal_demo.html
-            plot.axis("equal")
-
-            # Set the title and filename for this pie chart
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
-            plot.title("Distribution of the study types out of all used studies")
-            study_type_output_path = r"D:\Uni\Bachelorarbeit\Plots\Main pie chart with complete study type percentages.jpg"
-
-            # Save the pie chart as a JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            # plot.savefig(study_type_output_path, format="jpg")
-
-            # Optionally display the plot (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "study type drought category excel" is selected, create the drought quantification breakdown pie charts for each study type
-        elif chart_type == "study type drought category excel":
-            # Group the data by "study type" and count the occurrences of "drought quantification keyword for plots"
-            # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-            # https://www.statology.org/pandas-unstack/
-            study_type_breakdown_data = (
-                excel_df.groupby("study type")[
-                    "drought quantification keyword for plots"
-                ]
-                .value_counts()
-                .unstack(fill_value=0)
-            )
-
-            # Display only the study types "experimental", "observational", and "modeling" in a specific order for pie charts
-            desired_study_type_order = ["Experimental", "Observational", "Modeling"]
-
-            # Filter and reorder the study types using .isin() to keep only the relevant types and .reindex() to match the desired order
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.loc.html#pandas-dataframe-loc
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.isin.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.reindex.html
-            final_breakdown_data = study_type_breakdown_data.loc[
-                study_type_breakdown_data.index.isin(desired_study_type_order)
-            ].reindex(desired_study_type_order)
-
-            # Define the number of subplots based on the number of study types because we need one pie chart for each relevant, named study type
-            # https://www.programiz.com/python-programming/methods/built-in/len
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.subplots.html
-            number_of_study_types = len(final_breakdown_data)
-            fig, axes = plot.subplots(1, 3, figsize=(20, 8))
-
-            # Flatten the axes for easier iteration and a faster plot creation
-            # https://stackoverflow.com/questions/46862861/what-does-axes-flat-in-matplotlib-do
-            axes = axes.flatten()
-
-            # Iterate over the final dataframe that holds the wanted information to filter out zero values and assign the wanted colors
-            # https://www.w3schools.com/python/pandas/ref_df_iterrows.asp
-            for i, (study_type, row) in enumerate(final_breakdown_data.iterrows()):
-                # Filter out redundant zero values in the rows (Given drought categories) so only the drought categories that are given for the study types are displayed
-                row = row[row > 0]
-                # Use consistent colors for each keyword, so it is not confusing (using the colors declared before in "drought_keywords_color_mapping"
-                breakdown_colors = [
-                    drought_keywords_color_mapping[label] for label in row.index
-                ]
-
-                # Display percentages inside the pieces and assign the labels and colors to the pie chart axes
-                # Also add the "" back to the "Dry" label since it had to be removed for python rules before
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.pie.html
-                axes[i].pie(
-                    row,
-                    labels=[
-                        f'"{label}"' if label == "Dry" else label for label in row.index
-                    ],
-                    autopct="%1.1f%%",
-                    colors=breakdown_colors,
-                )
+def render_breakdown_pie_charts(chart, counts):
+    """
+    Creates one pie chart for every value of the first group column, with the percentages of the values of the second group column.
 
-                # Display a title for every single pie chart containing its study type
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_title.html
-                axes[i].set_title(f"{study_type}")
-
-            # Set the main title for the entire figure (has to be done separately because every pie chart has its own title) as well as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.suptitle.html
-            fig.suptitle(
-                "Breakdown of the given drought quantification for the relevant study types",
-                fontsize=16,
-            )
-            breakdown_output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Breakdown pie charts for percentages of drought definitions for study types.jpg"
-
-            # Ensure that the tight layout is used for a better visualisation (the single pie charts are too close to another if not used)
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart(s) as one JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            plot.savefig(breakdown_output_file_path, format="jpg")
-
-            # Optionally display the pie chart(s) (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-    # Cases for all pie charts that need data from the shapefile with all re-analysed paper locations
-    elif chart_type in [
-        "SPEI category percentage",
-        "Spheres SPEI",
-        "Spheres drought category",
-        "study type SPEI",
-        "study type drought category",
-        "MODIS percentage",
-        "MODIS drought category",
-        "Continent percentage",
-        "Continent drought category",
-        "drought keywords percentage",
-        "Quantified correctness",
-        "Quantification drought keywords",
-    ]:
-
-        # Read the given shapefile for all pie chart cases using geopandas read_file() method and storing it as geodataframe
-        # https://geopandas.org/en/stable/docs/user_guide/data_structures.html#geodataframe
-        # https://geopandas.org/en/stable/docs/user_guide/io.html#reading-and-writing-files
-        reanalysed_gdf = geopd.read_file(shape_or_excel_file_path)
-
-        # Define the colors for SPEI drought categories, so they match in every plot (and with the QGIS map) from
-        # https://spei.csic.es/map/maps.html
-        # https://stackoverflow.com/questions/26139423/plot-different-color-for-different-categorical-levels
-        spei_color_mapping = {
-            "no drought (+1 < SPEI)": "#0000FF",  # Blue
-            "near normal conditions (-1 < SPEI < +1)": "#ADD8E6",  # Light Blue
-            "moderately dry (-1.5 < SPEI <= -1)": "#FFA500",  # Orange
-            "severely dry (-2 < SPEI <= -1.5)": "#FF4500",  # Orange-Red
-            "extremely dry (SPEI <= -2)": "#8B0000",  # Dark Red
-        }
+    Args:
+        chart (dict): The settings of the chart from 'chart_registry'.
+        counts (DataFrame): The pivot table of the counts as created by count_values().
+    """
+    # Filter and reorder the pie charts with .reindex() to keep only the relevant values in the desired order
+    # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.reindex.html
+    if "order" in chart:
+        counts = counts.reindex(chart["order"])
+
+    # Set the size of the figure and the number of subplots, then flatten the axes for easier iteration
+    # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.subplots.html
+    # https://stackoverflow.com/questions/46862861/what-does-axes-flat-in-matplotlib-do
+    fig, axes = plot.subplots(*chart["layout"], figsize=chart["figsize"])
+    axes = axes.flatten()
+
+    # Iterate over the pivot table to filter out zero values and assign the wanted colors
+    # https://www.w3schools.com/python/pandas/ref_df_iterrows.asp
+    for i, (panel, row) in enumerate(counts.iterrows()):
+        # Reorder the segments by the desired order, then filter out redundant zero values so only the given values are displayed
+        if "segment_order" in chart:
+            row = row.reindex(chart["segment_order"])
+        row = row[row > 0]
+
+        # Name of the pie chart for its title and its legend
+        panel = chart.get("panel_names", {}).get(panel, panel)
+        if chart.get("title_case_panels"):
+            panel = panel.title()
+
+        # Explode single segments of single pie charts for better readability of the percentages
+        # https://www.educative.io/answers/how-to-explode-a-pie-chart-using-matplotlib-in-python
+        explode = None
+        if panel in chart.get("explode", {}):
+            explode = [chart["explode"][panel].get(label, 0) for label in row.index]
+
+        # Display percentages inside the pieces and assign the labels and colors to the pie chart pieces
+        # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.pie.html
+        segment_labels = chart.get("segment_labels", {})
+        wedges, texts, autotexts = axes[i].pie(
+            row,
+            labels=[segment_labels.get(label, format_label(label)) for label in row.index],
+            autopct="%1.1f%%",
+            colors=[chart["colors"][label] for label in row.index],
+            startangle=chart.get("startangle", 0),
+            explode=explode,
+            wedgeprops=chart.get("wedgeprops"),
+        )
 
-        # Define consistent colors for each drought quantification keyword across all plots, globally defined because of multiple use cases
-        # https://stackoverflow.com/questions/26139423/plot-different-color-for-different-categorical-levels
-        drought_keywords_color_mapping = {
-            "Dry": "#ff7f0e",  # Dark Orange
-            "Differs from normal": "#ff4500",  # Orange-Red
-            "Dry season": "#adff2f",  # Green Yellow
-            "Low soil moisture": "#b47d49",  # Brown
-            "Low water flow/depth": "#4682b4",  # Steel Blue
-            "Plant water stress": "#32cd32",  # Lime Green
-            "Reduced rainfall": "#87CEEB",  # Sky Blue
-            "Standardized Index": "#a245a8",  # Purple
-        }
+        # Change the color of the percentages for clearer visibility
+        # https://stackoverflow.com/a/27899541 (set_color())
+        if "percentage_color" in chart:
+            for autotext in autotexts:
+                autotext.set_color(chart["percentage_color"])
 
-        # If "Quantification drought keywords" is selected, create the drought keywords distribution pie charts for if drought was quantified or not from the re-analysed paper points
-        if chart_type == "Quantification drought keywords":
-            # Group the data by "wasdrquant" and "drouright" then count its occurrences with size()
-            # Also create the pivot table to have "wasdrquant" as columns and fill missing values with 0
-            # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://www.geeksforgeeks.org/list-size-method-in-java-with-examples/
-            # https://www.statology.org/pandas-unstack/
-            # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-            quant_drought_keywords_counts = (
-                reanalysed_gdf.groupby(["wasdrquant", reanalysed_gdf["Category"]])
-                .size()
-                .unstack(fill_value=0)
-            )
-            # Set the output path for this drought category per quantification pie chart
-            quant_drought_keywords_output_file_path = (
-                r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\Quantified_drought_keywords_pie_chart.jpg"
-            )
-
-            # Set the size of the figure and define the number of subplots
-            # manually because we need one pie chart for each drought quantification category
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.subplots.html
-            fig, axes = plot.subplots(1, 2, figsize=(19, 7))
-
-            # Flatten the axes for easier iteration and a faster plot creation
-            # https://stackoverflow.com/questions/46862861/what-does-axes-flat-in-matplotlib-do
-            axes = axes.flatten()
-
-            # Create a list for the desired order of the spei categories inside the pie chars
-            # https://pandas.pydata.org/docs/user_guide/indexing.html#indexing-and-selecting-data
-            spei_desired_order = [
-                "extremely dry (SPEI <= -2)",
-                "severely dry (-2 < SPEI <= -1.5)",
-                "moderately dry (-1.5 < SPEI <= -1)",
-                "near normal conditions (-1 < SPEI < +1)",
-                "no drought (+1 < SPEI)",
-            ]
-
-            # Iterate over the final dataframe that holds the wanted information to filter out zero values and assign the wanted colors
-            # In this case everything has to be done in the for-loop because we need to add the legends separately for every pie chart, not one for all
-            # https://www.w3schools.com/python/pandas/ref_df_iterrows.asp
-            for i, wasdrquant_value in enumerate(quant_drought_keywords_counts.index):
-
-                # Get the counts for the drought keywords per drought quantification category and filter out any zero values.
-                # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.loc.html#pandas-dataframe-loc
-                counts = quant_drought_keywords_counts.loc[wasdrquant_value]
-
-                # Reorder the counts be the desires SPEI category defined above
-                # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.reindex.html
-                counts = counts.reindex(spei_desired_order)
-
-                # Filter out redundant zero values in the retrieved counts (drought quantifications) with a simple comparison
-                counts = counts[counts > 0]
-
-                # Calculate and get the total numbers of "wasdrquant" for the title of the legend(s)
-                # https://www.w3schools.com/python/ref_func_sum.asp
-                total_count = counts.sum()
-
-                # Create a list of colors in the same order as the labels in spei_category_counts to use it for the pie chart
-                spei_colors = [spei_color_mapping[label] for label in counts.index]
-
-                # Display percentages inside the pieces and assign the labels and colors to the pie chart pieces
-                # Also replace "<=" with "≤" in the pie chart segment labels
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.pie.html
-                # https://docs.python.org/3/library/stdtypes.html#str.replace
-                wedges, texts, autotexts = axes[i].pie(
-                    counts,
-                    labels=counts.index.str.replace("<=", "≤"),
-                    autopct="%1.1f%%",
-                    startangle=90,
-                    colors=spei_colors,
-                )
+        # Display a title for every single pie chart
+        # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_title.html
+        axes[i].set_title(chart.get("panel_title", "{panel}").format(panel=panel))
 
-                # Change the color of the percentages to white for clearer visibility
-                # https://stackoverflow.com/a/27899541 (set_color())
-                for autotext in autotexts:
-                    autotext.set_color("white")
-
-                # Display a title for every single pie chart containing its drought quantification status
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_title.html
-                status = "Yes" if wasdrquant_value == "True" else "No"
-                axes[i].set_title(f"Drought quantified: {status}")
-
-                # Create the labels for the legends out of the segment labels and add a count for each category
-                # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.items.html#pandas-dataframe-items
-                legend_labels = [
-                    f'{label.replace("<=", "≤")}: {count}'
-                    for label, count in counts.items()
-                ]
-
-                # Now add a legend to each pie chart separately on the upper right of the pie charts and
-                # place it below the pie charts using "loc" and "bbox_to_anchor"
-                # https://matplotlib.org/stable/api/legend_api.html#module-matplotlib.legend
+        # Add a legend to each pie chart separately, either with the manually set entries or with the counts of every segment
+        # https://matplotlib.org/stable/api/legend_api.html#module-matplotlib.legend
+        if "legend" in chart:
+            legend = chart["legend"]
+            legend_settings = {key: legend[key] for key in ["loc", "bbox_to_anchor"] if key in legend}
+            legend_title = legend["title"].format(panel=panel, total=row.sum())
+            if "entries" in legend:
+                axes[i].legend(handles=create_legend_patches(legend["entries"], row), title=legend_title, frameon=False, **legend_settings)
+            else:
                 axes[i].legend(
-                    legend_labels,
-                    title=f'Total count of "Drought quantified: {status}" studies: {total_count}',
-                    loc="upper center",
+                    wedges,
+                    [f"{format_label(label)}: {count}" for label, count in row.items()],
+                    title=legend_title,
                     frameon=False,
-                    bbox_to_anchor=(0.5, 0.1),
+                    **legend_settings,
                 )
 
-            # Set the main title for the entire figure (has to be done separately because every pie chart has its own title) as well as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.suptitle.html
-            fig.suptitle(
-                "Distribution of drought findings for quantified vs not quantified",
-                fontsize=16,
-            )
-
-            # Ensure that the tight layout is used for a better visualisation (the single pie charts are too close to another if not used)
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart(s) as one JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            plot.savefig(quant_drought_keywords_output_file_path, format="jpg")
-
-            # Optionally display the pie chart(s) (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "Quantified correctness" is selected, create the correctness pie charts for if drought was quantified or not from the re-analysed paper points
-        if chart_type == "Quantified correctness":
-
-            # Group the data by "wasdrquant" and "drouright" then count its occurrences with size()
-            # Also create the pivot table to have "wasdrquant" as columns and fill missing with 0
-            # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://www.geeksforgeeks.org/list-size-method-in-java-with-examples/
-            # https://www.statology.org/pandas-unstack/
-            # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-            quant_correctness_counts = (
-                reanalysed_gdf.groupby(["wasdrquant", reanalysed_gdf["drouright"]])
-                .size()
-                .unstack(fill_value=0)
-            )
-            # Set the output path for this quantification correctness pie chart
-            quant_correctness_output_file_path = (
-                r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\Quantified_correctness_pie_chart.jpg"
-            )
-
-            # Set the size of the figure and define the number of subplots
-            # manually because we need one pie chart for each drought quantification category
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.subplots.html
-            fig, axes = plot.subplots(1, 2, figsize=(15, 7))
-
-            # Hard code the colors as a list to be used for the pie chart segments in this order ("red" for "False", "darkblue" for "True")
-            correctness_colors = ["red", "darkblue"]
-
-            # Flatten the axes for easier iteration and a faster plot creation
-            # https://stackoverflow.com/questions/46862861/what-does-axes-flat-in-matplotlib-do
-            axes = axes.flatten()
-
-            # Iterate over the final dataframe that holds the wanted information to filter out zero values and assign the wanted colors
-            # In this case everything has to be done in the for-loop because we need to add the legends seperately for every pie chart, not one for all
-            # https://www.w3schools.com/python/pandas/ref_df_iterrows.asp
-            for i, wasdrquant_value in enumerate(quant_correctness_counts.index):
-
-                # Get the counts for the drought quantifications and filter out any zero values.
-                # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.loc.html#pandas-dataframe-loc
-                counts = quant_correctness_counts.loc[wasdrquant_value]
-                # Filter out redundant zero values in the retrieved counts (drought quantifications)
-                counts = counts[counts > 0]
-
-                # Calculate and get the total numbers of "wasdrquant" for the title of the legend(s)
-                # https://www.w3schools.com/python/ref_func_sum.asp
-                total_count = counts.sum()
-
-                # Display percentages inside the pieces, assign the labels and colors to the pie chart pieces and set the startangle to 90°
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.pie.html
-                wedges, texts, autotexts = axes[i].pie(
-                    counts,
-                    labels=[
-                        f"Correct (True)" if idx == "True" else "Incorrect (False)"
-                        for idx in counts.index
-                    ],
-                    autopct="%1.1f%%",
-                    colors=correctness_colors,
-                    startangle=90,
-                    wedgeprops={"edgecolor": "black", "linewidth": 0.5},
-                )
+    # Set the main title for the entire figure (has to be done separately because every pie chart has its own title)
+    # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.suptitle.html
+    fig.suptitle(chart["suptitle"], fontsize=16)
 
-                # Change the color of the percentages to white for clearer visibility
-                # https://stackoverflow.com/a/27899541 (set_color())
-                for autotext in autotexts:
-                    autotext.set_color("white")
-
-                # Display a title for every single pie chart containing its drought quantification status
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_title.html
-                status = "Yes" if wasdrquant_value == "True" else "No"
-                axes[i].set_title(f"Drought quantified: {status}")
-
-                # Get the counts for "True" and "False" values from "drouright", if they do not exist they get set to 0
-                # https://www.w3schools.com/python/ref_dictionary_get.asp
-                true_count = counts.get("True", 0)
-                false_count = counts.get("False", 0)
-
-                # Set the legend entries manually with all its attributes colors and hatches (using mpatches.Patch()), so they match the segments
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.patches.Patch.html#matplotlib-patches-patch
-                # https://stackoverflow.com/a/37296137
-                true_patch = mpatches.Patch(
-                    color="darkblue", label=f"Correct (True): {true_count}"
-                )
-                false_patch = mpatches.Patch(
-                    color="red", label=f"Incorrect (False): {false_count}"
-                )
+    # Remove the unused pie charts (e.g. 7 continents but 2 rows and 4 columns = 8 pie charts)
+    # https://www.geeksforgeeks.org/matplotlib-figure-figure-delaxes-in-python/
+    for unused_axes in axes[len(counts):]:
+        fig.delaxes(unused_axes)
 
-                # Now add a legend each pie charts separately on the upper right of the pie charts
-                # https://matplotlib.org/stable/api/legend_api.html#module-matplotlib.legend
-                axes[i].legend(
-                    handles=[true_patch, false_patch],
-                    title=f"Classification of drought correctness: {total_count}",
-                    loc="upper right",
-                    frameon=False,
-                )
 
-            # Set the main title for the entire figure (has to be done separately because every pie chart has its own title) as well as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.suptitle.html
-            fig.suptitle(
-                "Correctness of drought findings for quantified vs not quantified",
-                fontsize=16,
-            )
-
-            # Ensure that the tight layout is used for a better visualisation (the single pie charts are too close to another if not used)
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart(s) as one JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            plot.savefig(quant_correctness_output_file_path, format="jpg")
-
-            # Optionally display the pie chart(s) (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "MODIS drought category" is selected, create the drought quantification breakdown pie charts for each MODIS forest class from the re-analysed paper points
-        if chart_type == "MODIS drought category":
-            # Group the data by "forest" and clean "drouquanti" and then count its occurrences with size()
-            # Remove quotes with replace() (because python gives an error for "dry" keyword if there are quotes)
-            # Also create the pivot table to have forest as columns and fill missing with 0
-            # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.replace.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://www.geeksforgeeks.org/list-size-method-in-java-with-examples/
-            # https://www.statology.org/pandas-unstack/
-            # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-            forest_breakdown_data = (
-                reanalysed_gdf.groupby(
-                    [
-                        "forest",
-                        reanalysed_gdf["drouquanti"].str.strip().str.replace('"', ""),
-                    ]
-                )
-                .size()
-                .unstack(fill_value=0)
-            )
-
-            # Reorder the MODIS Categories based on https://developers.google.com/earth-engine/datasets/catalog/MODIS_061_MCD12Q1#bands "LC_Type1 Class Table"
-            # (No "Deciduous Needleleaf Forest" because there are no locations that have this MODIS forest type)
-            desired_forest_order = [
-                "Evergreen Needleleaf Forest",
-                "Evergreen Broadleaf Forest",
-                "Deciduous Broadleaf Forest",
-                "Mixed Forest",
-                "Closed Shrubland",
-                "Woody Savanna",
-                "Other (Mangrove Forest, Open Shrubland, Savannas, Permanent Wetlands, ...)",
-            ]
-
-            # Filter and reorder the MODIS forest types using .isin() to keep only the relevant types and .reindex() to match the desired order
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.loc.html#pandas-dataframe-loc
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.isin.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.reindex.html
-            final_forest_breakdown_data = forest_breakdown_data.loc[
-                forest_breakdown_data.index.isin(desired_forest_order)
-            ].reindex(desired_forest_order)
-
-            # Set the size of the figure and define the number of subplots based on the number of relevant MODIS forest types
-            # manually because we need one pie chart for each relevant, named MODIS forest type
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.subplots.html
-            fig, axes = plot.subplots(2, 4, figsize=(30, 10))
-
-            # Flatten the axes for easier iteration and a faster plot creation
-            # https://stackoverflow.com/questions/46862861/what-does-axes-flat-in-matplotlib-do
-            axes = axes.flatten()
-
-            # Iterate over the final dataframe that holds the wanted information to filter out zero values and assign the wanted colors
-            # https://www.w3schools.com/python/pandas/ref_df_iterrows.asp
-            for i, (forest, row) in enumerate(final_forest_breakdown_data.iterrows()):
-                # Filter out redundant zero values in the rows (Given drought categories) so only the drought categories that are given for the study types are displayed
-                row = row[row > 0]
-                # Use consistent colors for each keyword, so it is not confusing (using the colors declared before globally
-                breakdown_colors = [
-                    drought_keywords_color_mapping[label] for label in row.index
-                ]
-
-                # Display percentages inside the pieces and assign the labels and colors to the pie chart pieces
-                # Also add the "" back to the "Dry" label since it had to be removed for python rules before
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.pie.html
-                axes[i].pie(
-                    row,
-                    labels=[
-                        f'"{label}"' if label == "Dry" else label for label in row.index
-                    ],
-                    autopct="%1.1f%%",
-                    colors=breakdown_colors,
-                    startangle=120,
-                )
+# The function that creates each kind of chart
+chart_renderers = {
+    "bar": render_bar_chart,
+    "pie": render_pie_chart,
+    "breakdown": render_breakdown_pie_charts,
+}
 
-                # Display a title for every single pie chart containing its MODIS forest type
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_title.html
-                axes[i].set_title(f"{forest}")
-
-            # Set the main title for the entire figure (has to be done separately because every pie chart has its own title) as well as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.suptitle.html
-            fig.suptitle(
-                "Breakdown of the given drought quantification for the re-analysed paper locations MODIS forest types",
-                fontsize=16,
-            )
-            modis_drought_output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW DATA Breakdown pie charts for percentages of drought definitions for MODIS forest types from re-analysed shapefile.jpg"
-
-            # Remove the last unused pie chart since we only have 7 relevant MODIS forest types but 2 rows and 4 columns = 8 pie charts
-            # https://www.geeksforgeeks.org/matplotlib-figure-figure-delaxes-in-python/
-            fig.delaxes(axes[-1])
-
-            # Ensure that the tight layout is used for a better visualisation (the single pie charts are too close to another if not used)
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart(s) as one JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            plot.savefig(modis_drought_output_file_path, format="jpg")
-
-            # Optionally display the pie chart(s) (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "study type drought category" is selected, create the drought quantification breakdown pie charts for each study type from the re-analysed paper points
-        if chart_type == "study type drought category":
-            # Group the data by "study type" and clean the drought quantification keywords and then count its occurrences with size()
-            # Remove quotes with replace() (because python gives an error for "dry" keyword if there are quotes)
-            # Also create the pivot table to have "studytype" as columns and fill missing with 0
-            # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.replace.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://www.geeksforgeeks.org/list-size-method-in-java-with-examples/
-            # https://www.statology.org/pandas-unstack/
-            # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-            study_type_breakdown_data = (
-                reanalysed_gdf.groupby(
-                    [
-                        "studytype",
-                        reanalysed_gdf["drouquanti"].str.strip().str.replace('"', ""),
-                    ]
-                )
-                .size()
-                .unstack(fill_value=0)
-            )
-            # Display only the study types "experimental", "observational", and "modeling" in a specific order for pie charts
-            desired_study_type_order = ["Experimental", "Observational", "Modeling"]
-
-            # Filter and reorder the study types using .isin() to keep only the relevant types and .reindex() to match the desired order
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.loc.html#pandas-dataframe-loc
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.isin.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.reindex.html
-            final_breakdown_data = study_type_breakdown_data.loc[
-                study_type_breakdown_data.index.isin(desired_study_type_order)
-            ].reindex(desired_study_type_order)
-
-            # Define the number of subplots based on the number of study types because we need one pie chart for each relevant, named study type
-            # https://www.programiz.com/python-programming/methods/built-in/len
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.subplots.html
-            number_of_study_types = len(final_breakdown_data)
-            fig, axes = plot.subplots(1, 3, figsize=(20, 8))
-
-            # Flatten the axes for easier iteration and a faster plot creation
-            # https://stackoverflow.com/questions/46862861/what-does-axes-flat-in-matplotlib-do
-            axes = axes.flatten()
-
-            # Iterate over the final dataframe that holds the wanted information to filter out zero values and assign the wanted colors
-            # https://www.w3schools.com/python/pandas/ref_df_iterrows.asp
-            for i, (study_type, row) in enumerate(final_breakdown_data.iterrows()):
-                # Filter out redundant zero values in the rows (Given drought categories) so only the drought categories that are given for the study types are displayed
-                row = row[row > 0]
-                # Use consistent colors for each keyword, so it is not confusing (using the colors declared before in "drought_keywords_color_mapping"
-                breakdown_colors = [
-                    drought_keywords_color_mapping[label] for label in row.index
-                ]
-
-                # Explode the "Plant water stress" segment in the "Observational" pie chart for bettere readability of the percentages
-                # https://www.educative.io/answers/how-to-explode-a-pie-chart-using-matplotlib-in-python
-                explode = [
-                    0.1 if i == 1 and label == "Plant water stress" else 0
-                    for label in row.index
-                ]
-
-                # Display percentages inside the pieces and assign the labels and colors to the pie chart axes
-                # Also add the "" back to the "Dry" label since it had to be removed for python rules before
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.pie.html
-                axes[i].pie(
-                    row,
-                    labels=[
-                        f'"{label}"' if label == "Dry" else label for label in row.index
-                    ],
-                    autopct="%1.1f%%",
-                    colors=breakdown_colors,
-                    explode=explode,
-                    startangle=110,
-                )
-
-                # Display a title for every single pie chart containing its study type
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_title.html
-                axes[i].set_title(f"{study_type}")
-
-            # Set the main title for the entire figure (has to be done separately because every pie chart has its own title) as well as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.suptitle.html
-            fig.suptitle(
-                "Breakdown of the given drought quantification for the relevant study types",
-                fontsize=16,
-            )
-            breakdown_output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW DATA Breakdown pie charts for percentages of drought definitions for study types for the re-analysed paper locations.jpg"
-
-            # Ensure that the tight layout is used for a better visualisation (the single pie charts are too close to another if not used)
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart(s) as one JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            plot.savefig(breakdown_output_file_path, format="jpg")
-
-            # Optionally display the pie chart(s) (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "Spheres drought category" is selected, create the drought quantification breakdown pie charts for each drought sphere from the re-analysed paper points
-        if chart_type == "Spheres drought category":
-            # Group the data by "drought_sphere" and clean the drought quantification keywords and then count its occurrences with size()
-            # Remove quotes with replace() (because python gives an error for "dry" keyword if there are quotes)
-            # Also create the pivot table to have "sphere" as columns and fill missing with 0
-            # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.replace.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://www.geeksforgeeks.org/list-size-method-in-java-with-examples/
-            # https://www.statology.org/pandas-unstack/
-            # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-            spheres_breakdown_data = (
-                reanalysed_gdf.groupby(
-                    [
-                        "sphere",
-                        reanalysed_gdf["drouquanti"].str.strip().str.replace('"', ""),
-                    ]
-                )
-                .size()
-                .unstack(fill_value=0)
-            )
-
-            # Set the size of the figure and define the number of subplots based on the number of relevant drought spheres
-            # manually because we need one pie chart for each sphere
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.subplots.html
-            fig, axes = plot.subplots(1, 4, figsize=(20, 5))
-
-            # Flatten the axes for easier iteration and a faster plot creation
-            # https://stackoverflow.com/questions/46862861/what-does-axes-flat-in-matplotlib-do
-            # axes = axes.flatten()
-
-            # Iterate over the final dataframe that holds the wanted information to filter out zero values and assign the wanted colors
-            # https://www.w3schools.com/python/pandas/ref_df_iterrows.asp
-            for i, (drought_sphere, row) in enumerate(
-                spheres_breakdown_data.iterrows()
-            ):
-                # Filter out redundant zero values in the rows (Given drought categories) so only the drought categories that are given for the study types are displayed
-                row = row[row > 0]
-                # Use consistent colors for each keyword, so it is not confusing (using the colors declared before globally
-                breakdown_colors = [
-                    drought_keywords_color_mapping[label] for label in row.index
-                ]
-
-                # Display percentages inside the pieces and assign the labels and colors to the pie chart pieces
-                # Also add the "" back to the "Dry" label since it had to be removed for python rules before
-                # No "startangle=90" because the percentages overlap if used
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.pie.html
-                axes[i].pie(
-                    row,
-                    labels=[
-                        f'"{label}"' if label == "Dry" else label for label in row.index
-                    ],
-                    autopct="%1.1f%%",
-                    colors=breakdown_colors,
-                )
 
-                # Display a title for every single pie chart containing its drought sphere type as title
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_title.html
-                axes[i].set_title(f"{drought_sphere.title()}")
-
-            # Set the main title for the entire figure (has to be done separately because every pie chart has its own title) as well as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.suptitle.html
-            fig.suptitle(
-                "Breakdown of the given drought quantification of the drought spheres",
-                fontsize=16,
-            )
-            sphere_category_output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Breakdown pie charts for percentages of drought definitions for the drought spheres from the re-analysis paper points.jpg"
-
-            # Ensure that the tight layout is used for a better visualisation (the single pie charts are too close to another if not used)
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart(s) as one JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            plot.savefig(sphere_category_output_file_path, format="jpg")
-
-            # Optionally display the pie chart(s) (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "Continent drought category" is selected, this case is used to create the drought quantification breakdown pie charts for each continent for the re-analysed locations
-        if chart_type == "Continent drought category":
-            # Group the data by "Continent" and clean "drouquanti" and then count its occurrences with size()
-            # Remove quotes with replace() (because python gives an error for "dry" keyword if there are quotes)
-            # Also create the pivot table to have "Continent" as columns and fill missing with 0
-            # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.replace.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://www.geeksforgeeks.org/list-size-method-in-java-with-examples/
-            # https://www.statology.org/pandas-unstack/
-            # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-            continent_breakdown_data = (
-                reanalysed_gdf.groupby(
-                    [
-                        "Continent",
-                        reanalysed_gdf["drouquanti"].str.strip().str.replace('"', ""),
-                    ]
-                )
-                .size()
-                .unstack(fill_value=0)
-            )
-
-            # Set the size of the figure and define the number of subplots based on the number of continents
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.subplots.html
-            fig, axes = plot.subplots(2, 4, figsize=(30, 10))
-
-            # Flatten the axes for easier iteration and a faster plot creation
-            # https://stackoverflow.com/questions/46862861/what-does-axes-flat-in-matplotlib-do
-            axes = axes.flatten()
-
-            # Iterate over the final dataframe that holds the wanted information to filter out zero values and assign the wanted colors
-            # https://www.w3schools.com/python/pandas/ref_df_iterrows.asp
-            for i, (continent, row) in enumerate(continent_breakdown_data.iterrows()):
-                # Filter out redundant zero values in the rows (Given drought categories) so only the drought categories that are given for the study types are displayed
-                row = row[row > 0]
-                # Use consistent colors for each keyword, so it is not confusing (using the colors declared before globally
-                breakdown_colors = [
-                    drought_keywords_color_mapping[label] for label in row.index
-                ]
-
-                # Display percentages inside the pieces and assign the labels and colors to the pie chart pieces
-                # Also add the "" back to the "Dry" label since it had to be removed for python rules before
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.pie.html
-                axes[i].pie(
-                    row,
-                    labels=[
-                        f'"{label}"' if label == "Dry" else label for label in row.index
-                    ],
-                    autopct="%1.1f%%",
-                    colors=breakdown_colors,
-                    startangle=90,
-                )
-
-                # Display a title for every single pie chart containing the continents
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_title.html
-                axes[i].set_title(f"{continent}")
-
-            # Set the main title for the entire figure (has to be done separately because every pie chart has its own title) as well as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.suptitle.html
-            fig.suptitle(
-                "Breakdown of the given drought quantification for the re-analysed paper locations continents",
-                fontsize=16,
-            )
-            continent_drought_output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Breakdown pie charts for percentages of drought definitions for all continents from re-analysed location shapefile.jpg"
-
-            # Remove the last unused pie chart since we only have 7 continents but 2 rows and 4 columns = 8 pie charts
-            # https://www.geeksforgeeks.org/matplotlib-figure-figure-delaxes-in-python/
-            fig.delaxes(axes[-1])
-
-            # Ensure that the tight layout is used for a better visualisation (the single pie charts are too close to another if not used)
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart(s) as one JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            plot.savefig(continent_drought_output_file_path, format="jpg")
-
-            # Optionally display the pie chart(s) (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "Continent percentage" is selected, this case is used to create the general continent percentage pie chart
-        if chart_type == "Continent percentage":
-            # Count the occurrences of each continent to create the percentages
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.value_counts.html
-            continent_counts = reanalysed_gdf["Continent"].value_counts()
-
-            # Map the study types to their corresponding colors from https://developers.google.com/earth-engine/datasets/catalog/MODIS_061_MCD12Q1#bands "LC_Type1 Class Table"
-            # https://stackoverflow.com/questions/26139423/plot-different-color-for-different-categorical-levels
-            continent_color_mapping = {
-                "Europe": "#0000FF",  # blue
-                "Africa": "#808080",  # grey
-                "Asia": "#FFFF00",  # yellow
-                "Oceania": "#008000",  # green
-                "US": "#ADD8E6",  # light blue
-                "North America": "#FF0000",  # red
-                "Latin and South America": "#FFA500",  # orange
-            }
-
-            # Create a list of colors in the same order as the labels in modis_category_counts
-            continent_colors = [
-                continent_color_mapping[label] for label in continent_counts.index
-            ]
-
-            # Adjust the size of the plot so the picture is better usable later on
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.figure.html
-            plot.figure(figsize=(8, 7))
-
-            # Create the pie chart with percentages and black lines between the pieces
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.pie.html
-            wedges, texts, autotexts = plot.pie(
-                continent_counts,
-                autopct="%1.1f%%",
-                colors=continent_colors,
-                startangle=90,
-                wedgeprops={"edgecolor": "black", "linewidth": 0.5},
-            )
-
-            # Set label positions manually for the  continent "North America" so it is right next to its segment in the pie chart
-            # by iterating over all labels by using .index to enumerate them
-            # https://stackoverflow.com/a/43916835 (set_position())
-            # https://www.w3schools.com/python/pandas/ref_df_index.asp
-            # https://stackoverflow.com/a/43916835 (set_position())
-            # https://matplotlib.org/stable/api/text_api.html#module-matplotlib.text
-            for i, label in enumerate(continent_counts.index):
-                # Re-capitalize labels for the pie chart by defining them as titles
-                label = label
-                # Adjusting the position of "North America" by using specific coordinates
-                if label == "North America":
-                    texts[i].set_position((0.1, 1.05))
-                else:
-                    # Keep default position for other labels since they are fine on default
-                    texts[i].set_position(texts[i].get_position())
-
-                # Adding back the study type label text (since set_position overrides them)
-                # https://www.tutorialspoint.com/how-to-add-title-to-subplots-in-matplotlib#:~:text=The%20Matplotlib%20set_text()%20function,in%20a%20subplot%20or%20plot.
-                texts[i].set_text(label)
-
-            # Set the title and filename for this pie chart
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
-            plot.title("Distribution of the continents in percentages")
-            continent_output_path = r"D:\Uni\Bachelorarbeit\Plots\Pie chart with continent percentages from the re-analysed paper locations shapefile.jpg"
-
-            # Save the pie chart as a JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            # plot.savefig(continent_output_path, format="jpg")
-
-            # Optionally display the plot (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "MODIS percentage" is selected, this case is used to create the general MODIS forest type percentage pie chart for the re-analyzed locations
-        if chart_type == "MODIS percentage":
-
-            # Count the occurrences of each MODIS forest type to create the percentages
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.value_counts.html
-            modis_category_counts = reanalysed_gdf["forest"].value_counts()
-
-            # Change the label for "Other" category, so it is not too long (only for bar plots with MODIS involved)
-            # https://pandas.pydata.org/docs/user_guide/basics.html#renaming-mapping-labels
-            modis_category_counts.rename(
-                index={
-                    "Other (Mangrove Forest, Open Shrubland, Savannas, Permanent Wetlands, ...)": "Other"
-                },
-                inplace=True,
-            )
-
-            # Map the study types to their corresponding colors from https://developers.google.com/earth-engine/datasets/catalog/MODIS_061_MCD12Q1#bands "LC_Type1 Class Table"
-            # https://stackoverflow.com/questions/26139423/plot-different-color-for-different-categorical-levels
-            modis_color_mapping = {
-                "Evergreen Needleleaf Forest": "#05450a",  # Dark Green
-                "Evergreen Broadleaf Forest": "#086a10",  # Forest Green
-                "Deciduous Needleleaf Forest": "#54a708",  # Lime Green
-                "Deciduous Broadleaf Forest": "#78d203",  # Bright Lime
-                "Mixed Forest": "#009900",  # Green
-                "Closed Shrubland": "#c6b044",  # Goldenrod
-                "Woody Savanna": "#dade48",  # Light Yellow-Green
-                "Other": "#27ff87",  # Bright Mint Green
-            }
-
-            # Create a list of colors in the same order as the labels in modis_category_counts
-            modis_colors = [
-                modis_color_mapping[label] for label in modis_category_counts.index
-            ]
-
-            # Exploding the "Deciduous Needleleaf Forest" slice so the difference and the percentages are clearer
-            # https://www.educative.io/answers/how-to-explode-a-pie-chart-using-matplotlib-in-python
-            explode = [0, 0, 0, 0, 0, 0, 0.2]
-
-            # Adjust the size of the plot so the picture is better usable later on
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.figure.html
-            plot.figure(figsize=(10, 8))
-
-            # Create the pie chart with percentages and white lines between the pieces
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.pie.html
-            wedges, texts, autotexts = plot.pie(
-                modis_category_counts,
-                autopct="%1.1f%%",
-                colors=modis_colors,
-                startangle=90,
-                explode=explode,
-                wedgeprops={"edgecolor": "white", "linewidth": 0.5},
-            )
-
-            # Set label positions manually for the MODIS forest types "Deciduous Needleleaf Forest", "Closed Shrubland" and "Other",
-            # so they are right next to their pieces, by iterating over all labels by using .index to enumerate them
-            # https://stackoverflow.com/a/43916835 (set_position())
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html
-            # https://www.w3schools.com/python/pandas/ref_df_index.asp
-            # https://stackoverflow.com/a/43916835 (set_position())
-            # https://matplotlib.org/stable/api/text_api.html#module-matplotlib.text
-            for i, label in enumerate(modis_category_counts.index):
-                # Re-capitalize labels for the pie chart by defining them as titles
-                label = label.title()
-                # Adjusting the position of "Closed Shrubland" by using specific coordinates
-                if label == "Closed Shrubland":
-                    texts[i].set_position((-0.1, 1.258))
-                else:
-                    # Keep default position for other labels since they are fine on default
-                    texts[i].set_position(texts[i].get_position())
-
-                # Adding back the study type label text (since set_position overrides them)
-                # https://www.tutorialspoint.com/how-to-add-title-to-subplots-in-matplotlib#:~:text=The%20Matplotlib%20set_text()%20function,in%20a%20subplot%20or%20plot.
-                texts[i].set_text(label)
-
-            # Draw the plot as circle and ensure equal aspect ratio
-            # https://matplotlib.org/stable/gallery/subplots_axes_and_figures/axis_equal_demo.html
-            plot.axis("equal")
-
-            # Set the title and filename for this pie chart
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
-            plot.title(
-                "Distribution of the MODIS forest types in percentages for re-analysed paper locations"
-            )
-            study_type_output_path = r"D:\Uni\Bachelorarbeit\Plots\Pie chart with MODIS forest category percentages from the re-analysis locations shapefile.jpg"
-
-            # Save the pie chart as a JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            # plot.savefig(study_type_output_path, format="jpg")
-
-            # Optionally display the plot (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "drought keywords percentage" is selected, create the general drought keywords pie chart
-        if chart_type == "drought keywords percentage":
-
-            # Count the occurrences of each drought keyword to create the percentages and clean "drouquanti", then count its occurrences with size()
-            # Remove quotes with replace() (because python gives an error for "dry" keyword if there are quotes)
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.replace.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.value_counts.html
-            drought_keywords_counts = (
-                reanalysed_gdf["drouquanti"]
-                .str.strip()
-                .str.replace('"', "")
-                .value_counts()
-            )
-
-            # Create a list of colors in the same order as the labels in spei_category_counts to use it for the pie chart
-            drought_keywords_colors = [
-                drought_keywords_color_mapping[label]
-                for label in drought_keywords_counts.index
-            ]
-
-            # Adjust the size of the plot so the picture is better usable later and nothing gets cut off
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.figure.html
-            plot.figure(figsize=(10, 7))
-
-            # Create the pie chart with black lines between pieces and percentages as texts
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.pie.html
-            wedges, category_texts, autotexts = plot.pie(
-                drought_keywords_counts,
-                autopct="%1.1f%%",
-                colors=drought_keywords_colors,
-                wedgeprops={"edgecolor": "black", "linewidth": 0.4},
-            )
-
-            # Change the color of the percentages to white for clearer visibility
-            # https://stackoverflow.com/a/27899541 (set_color())
-            for autotext in autotexts:
-                autotext.set_color("white")
-
-            # Manage the labels for the segments by iterating over the dataframe "drought_keywords_counts"
-            # https://www.w3schools.com/python/pandas/ref_df_index.asp
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html
-            for i, keyword_label in enumerate(drought_keywords_counts.index):
-
-                # Add back the "" for the "Dry" drought keyword since it had to be removed earlier for python rules
-                if keyword_label == "Dry":
-                    keyword_label = '"Dry"'
-
-                # Add the drought keyword label texts automatically from the drought_keywords_counts dataframe
-                # https://www.tutorialspoint.com/how-to-add-title-to-subplots-in-matplotlib#:~:text=The%20Matplotlib%20set_text()%20function,in%20a%20subplot%20or%20plot.
-                category_texts[i].set_text(keyword_label)
-
-            # Set the main title as well as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
-            plot.title(
-                "Distribution of the drought keywords out of all re-analysed studies in percentage"
-            )
-            drought_keywords_output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\Re-worked data\NEW Pie chart with drought keywords percentages and legend for total numbers from re-analysed paper location.jpg"
-
-            # Create and add a legend for the total numbers of drought keywords for a better overview of the data
-            # Create the labels out of the SPEI categories for the legend with counts so the total numbers are displayed
-            # Also add back the "" for the "Dry" drought keyword since it had to be removed earlier for python rules
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.items.html#pandas-dataframe-items
-            # https://docs.python.org/3/library/stdtypes.html#str.replace
-            keywords_legend_labels = [
-                f'"{label}": {count}' if label == "Dry" else f"{label}: {count}"
-                for label, count in drought_keywords_counts.items()
-            ]
-
-            # Now add the legend to the pie chart with the drought keyword labels and place it in the upper right outside the pie chart (with bbox_to_anchor)
-            # https://matplotlib.org/stable/api/legend_api.html#module-matplotlib.legend
-            plot.legend(
-                wedges,
-                keywords_legend_labels,
-                title="Drought keywords (Count)",
-                loc="upper right",
-                bbox_to_anchor=(0.9, 0, 0.4, 1),
-                frameon=False,
-            )
-
-            # Ensure that the tight layout is used for a better visualisation and readability
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart as a JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            # plot.savefig(drought_keywords_output_file_path, format="jpg")
-
-            # Optionally display the plot (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "SPEI category percentage" is selected, create the SPEI drought category pie chart
-        if chart_type == "SPEI category percentage":
-
-            # Count the occurrences of each SPEI drought category to create the percentages
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.value_counts.html
-            spei_category_counts = reanalysed_gdf["Category"].value_counts()
-
-            # Create a list of colors in the same order as the labels in spei_category_counts to use it for the pie chart
-            spei_colors = [
-                spei_color_mapping[label] for label in spei_category_counts.index
-            ]
-
-            # Adjust the size of the plot so the picture is better usable later and nothing gets cut off
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.figure.html
-            plot.figure(figsize=(14, 8))
-
-            # Create the pie chart with black lines between pieces and percentages as texts
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.pie.html
-            wedges, category_texts, autotexts = plot.pie(
-                spei_category_counts,
-                autopct="%1.1f%%",
-                colors=spei_colors,
-                startangle=90,
-                wedgeprops={"edgecolor": "black", "linewidth": 0.4},
-            )
-
-            # Change the color of the percentages to white for clearer visibility
-            # https://stackoverflow.com/a/27899541 (set_color())
-            for autotext in autotexts:
-                autotext.set_color("white")
-
-            # Set label position manually for the SPEI category ("no drought (+1 < SPEI)"), by iterating over all labels by using .index to enumerate them,
-            # so it is right next to their piece and replace "<=" with "≤" if needed in the labels
-            # https://www.w3schools.com/python/pandas/ref_df_index.asp
-            # https://stackoverflow.com/a/43916835 (set_position())
-            # https://docs.python.org/3/library/stdtypes.html#str.replace
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html
-            for i, spei_label in enumerate(spei_category_counts.index):
-                # Replace "<=" with "≤" in the labels (pie chart pieces descriptions)
-                cleaned_spei_label = spei_label.replace("<=", "≤")
-
-                # We only want to manually position the "no drought (+1 < SPEI)" label because it's not right on default
-                if cleaned_spei_label == "no drought (+1 < SPEI)":
-                    # Manually adjusting the position of "no drought (+1 < SPEI)" by using coordinates
-                    category_texts[i].set_position((-0.1, 1.1))
-
-                # Adding back the SPEI category label text (because set_position overrides them)
-                # https://www.tutorialspoint.com/how-to-add-title-to-subplots-in-matplotlib#:~:text=The%20Matplotlib%20set_text()%20function,in%20a%20subplot%20or%20plot.
-                category_texts[i].set_text(cleaned_spei_label)
-
-            # Set the main title as well as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
-            plot.title(
-                "Distribution of the SPEI categories out of all re-analysed studies in percentage"
-            )
-            spei_category_output_file_path = r"D:\Uni\Bachelorarbeit\Plots\NEW Pie chart with complete SPEI drought category percentages and legend for total numbers.jpg"
-
-            # Create and add a legend for the total numbers of SPEI categories for a better overview of the data
-            # Create the labels out of the SPEI categories for the legend with counts so the total numbers are displayed
-            # Also replace "<=" with "≤" in the legend labels for better looks
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.items.html#pandas-dataframe-items
-            # https://docs.python.org/3/library/stdtypes.html#str.replace
-            spei_legend_labels = [
-                f"{label.replace('<=', '≤')}: {count}"
-                for label, count in spei_category_counts.items()
-            ]
-            # Now add the legend to the pie chart with the created SPEI category labels and place it in the center left outside the pie chart (with bbox_to_anchor)
-            # https://matplotlib.org/stable/api/legend_api.html#module-matplotlib.legend
-            plot.legend(
-                wedges,
-                spei_legend_labels,
-                title="SPEI Categories (Count)",
-                loc="center right",
-                bbox_to_anchor=(1, 0, 0.4, 1),
-                frameon=False,
-            )
-
-            # Ensure that the tight layout is used for a better visualisation and readability of the "no drought (+1 < SPEI)" percentage
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart as a JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            # plot.savefig(spei_category_output_file_path, format="jpg")
-
-            # Optionally display the plot (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "Spheres SPEI" is selected, create the Spheres SPEI pie chart
-        elif chart_type == "Spheres SPEI":
-
-            # Clean up the "sphere" values to be sure there are no duplicates due to blank spaces
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.replace.html
-            reanalysed_gdf["sphere"] = reanalysed_gdf["sphere"].str.strip()
-
-            # Group the data by "sphere" and "Category" then count its occurrences with size()
-            # Also create the pivot table to have "sphere" as columns and fill missing with 0
-            # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://www.geeksforgeeks.org/list-size-method-in-java-with-examples/
-            # https://www.statology.org/pandas-unstack/
-            # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-            sphere_spei_breakdown_data = (
-                reanalysed_gdf.groupby(["sphere", reanalysed_gdf["Category"]])
-                .size()
-                .unstack(fill_value=0)
-            )
-
-            # Set the size of the figure and define the number of subplots based on the number of relevant drought spheres
-            # manually because we need one pie chart for each sphere
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.subplots.html
-            fig, axes = plot.subplots(2, 2, figsize=(15, 7))
-
-            # Iterate over the final dataframe that holds the wanted information to filter out zero values and assign the wanted colors
-            # https://www.w3schools.com/python/pandas/ref_df_iterrows.asp
-            for i, (spheres, row) in enumerate(sphere_spei_breakdown_data.iterrows()):
-                # Filter out redundant zero values in the rows (Given drought categories) so only the drought categories that are given for the study types are displayed
-                row = row[row > 0]
-
-                # Create a list with the SPEI categories in the desired order for the segments inside the pie charts
-                desired_spei_order = [
-                    "no drought (+1 < SPEI)",
-                    "near normal conditions (-1 < SPEI < +1)",
-                    "moderately dry (-1.5 < SPEI <= -1)",
-                    "severely dry (-2 < SPEI <= -1.5)",
-                    "extremely dry (SPEI <= -2)",
-                ]
-
-                # Reindex the segments of the pie chart (SPEI categories) with the desired order list and drop NaN values
-                # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.reindex.html
-                # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.dropna.html
-                row = row.reindex(desired_spei_order).dropna()
-
-                # Use consistent colors for each keyword, so it is not confusing (using the colors declared before globally)
-                breakdown_colors = [spei_color_mapping[label] for label in row.index]
-
-                # Calculate the row and column for 2x2 layout because it can not be set in "plot.subplots" if not done
-                # https://how2matplotlib.com/plt-subplots.html
-                row_index = i // 2
-                col_index = i % 2
-
-                # Display percentages inside the pieces and assign the labels and colors to the pie chart pieces
-                # Also replace "<=" with "≤" in the pie chart labels
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.pie.html
-                # https://docs.python.org/3/library/stdtypes.html#str.replace
-                wedges, texts, autotexts = axes[row_index, col_index].pie(
-                    row,
-                    labels=row.index.str.replace("<=", "≤"),
-                    autopct="%1.1f%%",
-                    startangle=90,
-                    colors=breakdown_colors,
-                )
-
-                # Change the color of the percentages to white for clearer visibility
-                # https://stackoverflow.com/a/27899541 (set_color())
-                for autotext in autotexts:
-                    autotext.set_color("white")
-
-                # Display a title for every single pie chart containing its sphere as title
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_title.html
-                axes[row_index, col_index].set_title(f"{spheres.title()}")
-
-            # Set the main title for the entire figure (has to be done separately because every pie chart has its own title) as well as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.suptitle.html
-            fig.suptitle(
-                "Breakdown of the given SPEI categories from the drought spheres",
-                fontsize=16,
-            )
-            sphere_reanalysis_output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\Re-worked data\NEW Breakdown pie charts for percentages of SPEI categories for the drought spheres from the re-analysed shapefile locations.jpg"
-
-            # Ensure that the tight layout is used for a better visualisation (the single pie charts are too close to another if not used)
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart(s) as one JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            # plot.savefig(sphere_reanalysis_output_file_path, format="jpg")
-
-            # Optionally display the pie chart(s) (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        elif chart_type == "study type SPEI":
-            # Group the data by "studytype" and "Category" then count its occurrences with size()
-            # Also create the pivot table to have "studytype" as columns and fill missing with 0
-            # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://www.geeksforgeeks.org/list-size-method-in-java-with-examples/
-            # https://www.statology.org/pandas-unstack/
-            # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-            study_type_spei_data = (
-                reanalysed_gdf.groupby(["studytype", reanalysed_gdf["Category"]])
-                .size()
-                .unstack(fill_value=0)
-            )
-
-            # Display only the study types "experimental", "observational", and "modeling" in the given order as pie charts
-            desired_study_type_order = ["Experimental", "Observational", "Modeling"]
-
-            # Filter and reorder the study types using .isin() to keep only the relevant types and .reindex() to match the desired order
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.loc.html#pandas-dataframe-loc
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.isin.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.reindex.html
-            final_breakdown_data = study_type_spei_data.loc[
-                study_type_spei_data.index.isin(desired_study_type_order)
-            ].reindex(desired_study_type_order)
-
-            # Define the number of subplots based on the number of study types because we need one pie chart for each relevant, named study type
-            # https://www.programiz.com/python-programming/methods/built-in/len
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.subplots.html
-            number_of_study_types = len(final_breakdown_data)
-            fig, axes = plot.subplots(1, 3, figsize=(27, 8))
-
-            # Iterate over the final dataframe that holds the wanted information and the given order to filter out zero values and assign the wanted colors
-            # https://www.w3schools.com/python/pandas/ref_df_iterrows.asp
-            for i, (studytype, row) in enumerate(final_breakdown_data.iterrows()):
-                # Filter out redundant zero values in the rows (Given drought categories) so only the drought categories that are given for the study types are displayed
-                row = row[row > 0]
-
-                # Create a list with the SPEI categories in the desired order for the segments inside the pie charts
-                desired_spei_order = [
-                    "no drought (+1 < SPEI)",
-                    "near normal conditions (-1 < SPEI < +1)",
-                    "moderately dry (-1.5 < SPEI <= -1)",
-                    "severely dry (-2 < SPEI <= -1.5)",
-                    "extremely dry (SPEI <= -2)",
-                ]
-
-                # Reindex the segments of the pie chart (SPEI categories) with the desired order list and drop NaN values
-                # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.reindex.html
-                # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.dropna.html
-                row = row.reindex(desired_spei_order).dropna()
-
-                # Use consistent colors for each keyword, so it is not confusing (using the colors declared before globally)
-                breakdown_colors = [spei_color_mapping[label] for label in row.index]
-
-                # Display percentages inside the pieces and assign the labels and colors to the pie chart pieces
-                # Also replace "<=" with "≤" in the pie chart labels
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.pie.html
-                # https://docs.python.org/3/library/stdtypes.html#str.replace
-                wedges, texts, autotexts = axes[i].pie(
-                    row,
-                    labels=row.index.str.replace("<=", "≤"),
-                    autopct="%1.1f%%",
-                    startangle=90,
-                    colors=breakdown_colors,
-                )
-
-                # Change the color of the percentages to white for clearer visibility
-                # https://stackoverflow.com/a/27899541 (set_color())
-                for autotext in autotexts:
-                    autotext.set_color("white")
-
-                # Display a title for every single pie chart containing its study type as title
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_title.html
-                axes[i].set_title(f"{studytype.title()}")
-
-            # Set the main title for the entire figure (has to be done separately because every pie chart has its own title) as well as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.suptitle.html
-            fig.suptitle(
-                "Breakdown of the given SPEI categories from the study types",
-                fontsize=16,
-            )
-            sphere_reanalysis_output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\re-analysis\BIGGER NEW Breakdown pie charts for percentages of SPEI categories for the study types of the papers from the re-analysed shapefile locations.jpg"
-
-            # Ensure that the tight layout is used for a better visualisation (the single pie charts are too close to another if not used)
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart(s) as one JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            plot.savefig(sphere_reanalysis_output_file_path, format="jpg")
-
-            # Optionally display the pie chart(s) (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-    # Cases for all pie charts that need data from the shapefile with all paper points
-    elif chart_type in [
-        "MODIS percentage all",
-        "MODIS drought sphere",
-        "MODIS drought category all",
-        "Continent percentage all",
-        "Continent drought category all",
-    ]:
-
-        # Read the given shapefile for all pie chart cases using geopandas read_file() method and storing it as geodataframe
-        # https://geopandas.org/en/stable/docs/user_guide/data_structures.html#geodataframe
-        # https://geopandas.org/en/stable/docs/user_guide/io.html#reading-and-writing-files
-        complete_gdf = geopd.read_file(shape_or_excel_file_path)
-
-        # Define consistent colors for each drought quantification keyword across all plots, globally defined because of multiple use cases
-        # https://stackoverflow.com/questions/26139423/plot-different-color-for-different-categorical-levels
-        drought_keywords_color_mapping = {
-            "Dry": "#ff7f0e",  # Dark Orange
-            "Differs from normal": "#ff4500",  # Orange-Red
-            "Dry season": "#adff2f",  # Green Yellow
-            "Low soil moisture": "#b47d49",  # Brown
-            "Low water flow/depth": "#4682b4",  # Steel Blue
-            "Plant water stress": "#32cd32",  # Lime Green
-            "Reduced rainfall": "#87CEEB",  # Sky Blue
-            "Standardized Index": "#a245a8",  # Purple
-        }
-
-        # If "MODIS drought category all" is selected, create the drought quantification breakdown pie charts for each MODIS forest type
-        if chart_type == "MODIS drought category all":
-
-            # Group the data by "forest" and clean "drouquanti" and then count its occurrences with size()
-            # Remove quotes with replace() (because python gives an error for "dry" keyword if there are quotes)
-            # Also create the pivot table to have "forest" as columns and fill missing with 0
-            # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.replace.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://www.geeksforgeeks.org/list-size-method-in-java-with-examples/
-            # https://www.statology.org/pandas-unstack/
-            # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-            forest_breakdown_data = (
-                complete_gdf.groupby(
-                    [
-                        "forest",
-                        complete_gdf["drouquanti"].str.strip().str.replace('"', ""),
-                    ]
-                )
-                .size()
-                .unstack(fill_value=0)
-            )
-
-            # Reorder the MODIS Categories based on https://developers.google.com/earth-engine/datasets/catalog/MODIS_061_MCD12Q1#bands "LC_Type1 Class Table"
-            desired_forest_order = [
-                "Evergreen Needleleaf Forest",
-                "Evergreen Broadleaf Forest",
-                "Deciduous Needleleaf Forest",
-                "Deciduous Broadleaf Forest",
-                "Mixed Forest",
-                "Closed Shrubland",
-                "Woody Savanna",
-                "Other (Mangrove Forest, Open Shrubland, Savannas, Permanent Wetlands, ...)",
-            ]
-
-            # Filter and reorder the MODIS forest types using .isin() to keep only the relevant types and .reindex() to match the desired order
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.loc.html#pandas-dataframe-loc
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.isin.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.reindex.html
-            final_forest_breakdown_data = forest_breakdown_data.loc[
-                forest_breakdown_data.index.isin(desired_forest_order)
-            ].reindex(desired_forest_order)
-
-            # Set the size of the figure and define the number of subplots based on the number of relevant MODIS forest types
-            # manually because we need one pie chart for each relevant, named MODIS forest type
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.subplots.html
-            fig, axes = plot.subplots(2, 4, figsize=(30, 10))
-
-            # Flatten the axes for easier iteration and a faster plot creation
-            # https://stackoverflow.com/questions/46862861/what-does-axes-flat-in-matplotlib-do
-            axes = axes.flatten()
-
-            # Iterate over the final dataframe that holds the wanted information to filter out zero values and assign the wanted colors
-            # https://www.w3schools.com/python/pandas/ref_df_iterrows.asp
-            for i, (forest, row) in enumerate(final_forest_breakdown_data.iterrows()):
-                # Filter out redundant zero values in the rows (Given drought categories) so only the drought categories that are given for the study types are displayed
-                row = row[row > 0]
-                # Use consistent colors for each keyword, so it is not confusing (using the colors declared before globally
-                breakdown_colors = [
-                    drought_keywords_color_mapping[label] for label in row.index
-                ]
-
-                # Display percentages inside the pieces and assign the labels and colors to the pie chart pieces
-                # Also add the "" back to the "Dry" label since it had to be removed for python rules before
-                # No "startangle=90" because the percentages overlap if used
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.pie.html
-                axes[i].pie(
-                    row,
-                    labels=[
-                        f'"{label}"' if label == "Dry" else label for label in row.index
-                    ],
-                    autopct="%1.1f%%",
-                    colors=breakdown_colors,
-                )
-
-                # Display a title for every single pie chart containing its MODIS forest type
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_title.html
-                axes[i].set_title(f"{forest}")
-
-            # Set the main title for the entire figure (has to be done separately because every pie chart has its own title) as well as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.suptitle.html
-            fig.suptitle(
-                "Breakdown of the given drought quantification for all paper locations MODIS forest types",
-                fontsize=16,
-            )
-            modis_drought_output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Breakdown pie charts for percentages of drought definitions for MODIS forest types from complete location shapefile.jpg"
-
-            # Ensure that the tight layout is used for a better visualisation (the single pie charts are too close to another if not used)
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart(s) as one JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            plot.savefig(modis_drought_output_file_path, format="jpg")
-
-            # Optionally display the pie chart(s) (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "MODIS drought sphere" is selected, create the drought quantification breakdown pie charts for each MODIS forest type
-        if chart_type == "MODIS drought sphere":
-
-            # Group the data by "forest" and "sphere". then count its occurrences with size()
-            # Also create the pivot table to have sphere as columns and fill missing with 0
-            # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://www.geeksforgeeks.org/list-size-method-in-java-with-examples/
-            # https://www.statology.org/pandas-unstack/
-            # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-            forest_sphere_breakdown_data = (
-                complete_gdf.groupby(["forest", complete_gdf["sphere"]])
-                .size()
-                .unstack(fill_value=0)
-            )
-
-            # Reorder the MODIS Categories based on https://developers.google.com/earth-engine/datasets/catalog/MODIS_061_MCD12Q1#bands "LC_Type1 Class Table"
-            desired_forest_order = [
-                "Evergreen Needleleaf Forest",
-                "Evergreen Broadleaf Forest",
-                "Deciduous Needleleaf Forest",
-                "Deciduous Broadleaf Forest",
-                "Mixed Forest",
-                "Closed Shrubland",
-                "Woody Savanna",
-                "Other (Mangrove Forest, Open Shrubland, Savannas, Permanent Wetlands, ...)",
-            ]
-
-            # Filter and reorder the MODIS forest types using .isin() to keep only the relevant types and .reindex() to match the desired order
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.loc.html#pandas-dataframe-loc
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.isin.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.reindex.html
-            final_forest_sphere_breakdown_data = forest_sphere_breakdown_data.loc[
-                forest_sphere_breakdown_data.index.isin(desired_forest_order)
-            ].reindex(desired_forest_order)
-
-            # Manually define the number of subplots based on the number of relevant MODIS forest types because we need one pie chart for each relevant, named MODIS forest type
-            # Also toggle size of the figures so every percentage is clear readable
-            # https://www.programiz.com/python-programming/methods/built-in/len
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.subplots.html
-            fig, axes = plot.subplots(2, 4, figsize=(20, 10))
-
-            # Flatten the axes for easier iteration and a faster plot creation
-            # https://stackoverflow.com/questions/46862861/what-does-axes-flat-in-matplotlib-do
-            axes = axes.flatten()
-
-            # Define consistent colors for each drought quantification keyword across all plots, globally defined because of multiple use cases
-            # https://stackoverflow.com/questions/26139423/plot-different-color-for-different-categorical-levels
-            sphere_color_mapping = {
-                "soil": "#8B4513",  # brown
-                "atmospheric": "#ADD8E6",  # light blue
-                "hydrological": "#3232d1",  # dark blue
-                "meteorological": "#808080",  # grey
-            }
-
-            # Iterate over the final dataframe that holds the wanted information to filter out zero values and assign the wanted colors
-            # https://www.w3schools.com/python/pandas/ref_df_iterrows.asp
-            for i, (drought_sphere, row) in enumerate(
-                final_forest_sphere_breakdown_data.iterrows()
-            ):
-                # Filter out redundant zero values in the rows (Given drought categories) so only the drought categories that are given for the study types are displayed
-                row = row[row > 0]
-                # Now use the declared colors for the stacked bar plot, also use strip() to assure every class get taken withouth error
-                sphere_breakdown_colors = [
-                    sphere_color_mapping[label.strip()] for label in row.index
-                ]
-
-                # Display percentages inside the pieces and assign the labels and colors to the pie chart pieces
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.pie.html
-                axes[i].pie(
-                    row,
-                    labels=row.index,
-                    autopct="%1.1f%%",
-                    colors=sphere_breakdown_colors,
-                )
-
-                # Display a title for every single pie chart containing its MODIS forest type
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_title.html
-                axes[i].set_title(f"{drought_sphere.title()}")
-
-            # Set the main title for the entire figure (has to be done separately because every pie chart has its own title) as well as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.suptitle.html
-            fig.suptitle(
-                "Breakdown of the given drought spheres for all MODIS forest types from all paper locations",
-                fontsize=16,
-            )
-            modis_sphere_output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\Re-worked data\Breakdown pie charts for percentages of drought spheres for MODIS forest types from all paper location.jpg"
-
-            # Ensure that the tight layout is used for a better visualisation (the single pie charts are too close to another if not used)
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart(s) as one JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            # plot.savefig(modis_sphere_output_file_path, format="jpg")
-
-            # Optionally display the pie chart(s) (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "MODIS percentage all" is selected, this case is used to create the general MODIS forest type percentage pie chart
-        if chart_type == "MODIS percentage all":
-
-            # Count the occurrences of each MODIS forest type to create the percentages
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.value_counts.html
-            modis_category_counts = complete_gdf["forest"].value_counts()
-
-            # Change the label for "Other" category, so it is not too long (only for bar plots with MODIS involved)
-            # https://pandas.pydata.org/docs/user_guide/basics.html#renaming-mapping-labels
-            modis_category_counts.rename(
-                index={
-                    "Other (Mangrove Forest, Open Shrubland, Savannas, Permanent Wetlands, ...)": "Other"
-                },
-                inplace=True,
-            )
-
-            # Map the study types to their corresponding colors from https://developers.google.com/earth-engine/datasets/catalog/MODIS_061_MCD12Q1#bands "LC_Type1 Class Table"
-            # https://stackoverflow.com/questions/26139423/plot-different-color-for-different-categorical-levels
-            modis_color_mapping = {
-                "Evergreen Needleleaf Forest": "#05450a",  # Dark Green
-                "Evergreen Broadleaf Forest": "#086a10",  # Forest Green
-                "Deciduous Needleleaf Forest": "#54a708",  # Lime Green
-                "Deciduous Broadleaf Forest": "#78d203",  # Bright Lime
-                "Mixed Forest": "#009900",  # Green
-                "Closed Shrubland": "#c6b044",  # Goldenrod
-                "Woody Savanna": "#dade48",  # Light Yellow-Green
-                "Other": "#27ff87",  # Bright Mint Green
-            }
-
-            # Create a list of colors in the same order as the labels in modis_category_counts
-            modis_colors = [
-                modis_color_mapping[label] for label in modis_category_counts.index
-            ]
-
-            # Exploding the "Deciduous Needleleaf Forest" slice so the difference and the percentages are clearer
-            # https://www.educative.io/answers/how-to-explode-a-pie-chart-using-matplotlib-in-python
-            explode = [0, 0, 0, 0, 0, 0, 0, 0.2]
-
-            # Adjust the size of the plot so the picture is better usable later on
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.figure.html
-            plot.figure(figsize=(10, 8))
-
-            # Create the pie chart with percentages and white lines between the pieces
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.pie.html
-            wedges, texts, autotexts = plot.pie(
-                modis_category_counts,
-                autopct="%1.1f%%",
-                colors=modis_colors,
-                startangle=90,
-                explode=explode,
-                wedgeprops={"edgecolor": "white", "linewidth": 0.5},
-            )
-
-            # Set label positions manually for the MODIS forest types "Deciduous Needleleaf Forest", "Closed Shrubland" and "Other",
-            # so they are right next to their pieces, by iterating over all labels by using .index to enumerate them
-            # https://stackoverflow.com/a/43916835 (set_position())
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html
-            # https://www.w3schools.com/python/pandas/ref_df_index.asp
-            # https://stackoverflow.com/a/43916835 (set_position())
-            # https://matplotlib.org/stable/api/text_api.html#module-matplotlib.text
-            for i, label in enumerate(modis_category_counts.index):
-                # Re-capitalize labels for the pie chart by defining them as titles
-                label = label.title()
-                # Adjusting the position of "Deciduous Needleleaf Forest" by using specific coordinates
-                if label == "Deciduous Needleleaf Forest":
-                    texts[i].set_position((-0.25, 1.24))
-                # Adjusting the position of "Closed Shrubland" by using specific coordinates
-                if label == "Closed Shrubland":
-                    texts[i].set_position((0.07, 1.062))
-                # Adjusting the position of "Other" by using specific coordinates
-                if label == "Other":
-                    texts[i].set_position((0.632, 0.87))
-                else:
-                    # Keep default position for other labels since they are fine on default
-                    texts[i].set_position(texts[i].get_position())
-
-                # Adding back the study type label text (since set_position overrides them)
-                # https://www.tutorialspoint.com/how-to-add-title-to-subplots-in-matplotlib#:~:text=The%20Matplotlib%20set_text()%20function,in%20a%20subplot%20or%20plot.
-                texts[i].set_text(label)
-
-            # Draw the plot as circle and ensure equal aspect ratio
-            # https://matplotlib.org/stable/gallery/subplots_axes_and_figures/axis_equal_demo.html
-            plot.axis("equal")
-
-            # Set the title and filename for this pie chart
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
-            plot.title("Distribution of the MODIS forest types in percentages")
-            study_type_output_path = r"D:\Uni\Bachelorarbeit\Plots\Pie chart with MODIS forest category percentages from the complete locations shapefile.jpg"
-
-            # Save the pie chart as a JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            # plot.savefig(study_type_output_path, format="jpg")
-
-            # Optionally display the plot (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "Continent percentage all" is selected, this case is used to create the general continent percentage pie chart
-        if chart_type == "Continent percentage all":
-            # Count the occurrences of each continent to create the percentages
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.value_counts.html
-            continent_counts = complete_gdf["Continent"].value_counts()
-
-            # Map the study types to their corresponding colors from https://developers.google.com/earth-engine/datasets/catalog/MODIS_061_MCD12Q1#bands "LC_Type1 Class Table"
-            # https://stackoverflow.com/questions/26139423/plot-different-color-for-different-categorical-levels
-            continent_color_mapping = {
-                "Europe": "#0000FF",  # blue
-                "Africa": "#808080",  # grey
-                "Asia": "#FFFF00",  # yellow
-                "Oceania": "#008000",  # green
-                "US": "#ADD8E6",  # light blue
-                "North America": "#FF0000",  # red
-                "Latin and South America": "#FFA500",  # orange
-            }
-
-            # Create a list of colors in the same order as the labels in modis_category_counts
-            continent_colors = [
-                continent_color_mapping[label] for label in continent_counts.index
-            ]
-
-            # Exploding the "Africa" slice so the difference and the percentages are clearer
-            # https://www.educative.io/answers/how-to-explode-a-pie-chart-using-matplotlib-in-python
-            explode = [0, 0, 0, 0, 0, 0, 0.2]
-
-            # Adjust the size of the plot so the picture is better usable later on
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.figure.html
-            plot.figure(figsize=(9, 7))
-
-            # Create the pie chart with percentages and black lines between the pieces
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.pie.html
-            wedges, texts, autotexts = plot.pie(
-                continent_counts,
-                autopct="%1.1f%%",
-                colors=continent_colors,
-                startangle=90,
-                explode=explode,
-                wedgeprops={"edgecolor": "black", "linewidth": 0.5},
-            )
-
-            # Set label positions manually for the  continents "Africa" and "North America" so they are right next to its segment in the pie chart
-            # by iterating over all labels by using .index to enumerate them
-            # https://stackoverflow.com/a/43916835 (set_position())
-            # https://www.w3schools.com/python/pandas/ref_df_index.asp
-            # https://stackoverflow.com/a/43916835 (set_position())
-            # https://matplotlib.org/stable/api/text_api.html#module-matplotlib.text
-            for i, label in enumerate(continent_counts.index):
-                # Re-capitalize labels for the pie chart by defining them as titles
-                label = label
-                # Adjusting the position of "North America" by using specific coordinates
-                if label == "North America":
-                    texts[i].set_position((-0.635, -0.944))
-                # Adjusting the position of "Africa" by using specific coordinates
-                if label == "Africa":
-                    texts[i].set_position((0, 1.245))
-                else:
-                    # Keep default position for other labels since they are fine on default
-                    texts[i].set_position(texts[i].get_position())
-
-                # Adding back the study type label text (since set_position overrides them)
-                # https://www.tutorialspoint.com/how-to-add-title-to-subplots-in-matplotlib#:~:text=The%20Matplotlib%20set_text()%20function,in%20a%20subplot%20or%20plot.
-                texts[i].set_text(label)
-
-            # Set the title and filename for this pie chart
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.title.html#matplotlib-pyplot-title
-            # plot.title("Distribution of the continents in percentages")
-            continent_output_path = r"D:\Uni\Bachelorarbeit\Plots\Pie chart with continent percentages from the complete locations shapefile from all paper location.jpg"
-
-            # Save the pie chart as a JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            # plot.savefig(continent_output_path, format="jpg")
-
-            # Optionally display the plot (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-        # If "Continent drought category all" is selected, create the drought quantification breakdown pie charts for each continent
-        if chart_type == "Continent drought category all":
-
-            # Group the data by "Continent" and clean "drouquanti" and then count its occurrences with size()
-            # Remove quotes with replace() (because python gives an error for "dry" keyword if there are quotes)
-            # Also create the pivot table to have drought_sphere as columns and fill missing with 0
-            # https://pandas.pydata.org/docs/user_guide/10min.html#grouping
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.replace.html
-            # https://pandas.pydata.org/docs/reference/api/pandas.Series.str.strip.html
-            # https://www.geeksforgeeks.org/list-size-method-in-java-with-examples/
-            # https://www.statology.org/pandas-unstack/
-            # https://note.nkmk.me/en/python-pandas-len-shape-size/#get-the-number-of-elements-dfsize
-            continent_breakdown_data = (
-                complete_gdf.groupby(
-                    [
-                        "Continent",
-                        complete_gdf["drouquanti"].str.strip().str.replace('"', ""),
-                    ]
-                )
-                .size()
-                .unstack(fill_value=0)
-            )
-
-            # Set the size of the figure and define the number of subplots based on the number of continents
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.subplots.html
-            fig, axes = plot.subplots(2, 4, figsize=(30, 10))
-
-            # Flatten the axes for easier iteration and a faster plot creation
-            # https://stackoverflow.com/questions/46862861/what-does-axes-flat-in-matplotlib-do
-            axes = axes.flatten()
-
-            # Iterate over the final dataframe that holds the wanted information to filter out zero values and assign the wanted colors
-            # https://www.w3schools.com/python/pandas/ref_df_iterrows.asp
-            for i, (continent, row) in enumerate(continent_breakdown_data.iterrows()):
-                # Filter out redundant zero values in the rows (Given drought categories) so only the drought categories that are given for the study types are displayed
-                row = row[row > 0]
-                # Use consistent colors for each keyword, so it is not confusing (using the colors declared before globally
-                breakdown_colors = [
-                    drought_keywords_color_mapping[label] for label in row.index
-                ]
-
-                # Display percentages inside the pieces and assign the labels and colors to the pie chart pieces
-                # Also add the "" back to the "Dry" label since it had to be removed for python rules before
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.pie.html
-                axes[i].pie(
-                    row,
-                    labels=[
-                        f'"{label}"' if label == "Dry" else label for label in row.index
-                    ],
-                    autopct="%1.1f%%",
-                    colors=breakdown_colors,
-                    startangle=90,
-                )
-
-                # Display a title for every single pie chart containing the continents
-                # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.set_title.html
-                axes[i].set_title(f"{continent}")
-
-            # Set the main title for the entire figure (has to be done separately because every pie chart has its own title) as well as the file name
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.suptitle.html
-            fig.suptitle(
-                "Breakdown of the given drought quantification for all paper locations continents",
-                fontsize=16,
-            )
-            continent_drought_output_file_path = r"D:\Uni\Bachelorarbeit\Plots\Aktuell\new data\NEW Breakdown pie charts for percentages of drought definitions for all continents from complete location shapefile.jpg"
-
-            # Remove the last unused pie chart since we only have 7 continents but 2 rows and 4 columns = 8 pie charts
-            # https://www.geeksforgeeks.org/matplotlib-figure-figure-delaxes-in-python/
-            fig.delaxes(axes[-1])
-
-            # Ensure that the tight layout is used for a better visualisation (the single pie charts are too close to another if not used)
-            # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
-            plot.tight_layout()
-
-            # Save the pie chart(s) as one JPG file to use it in the thesis
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
-            plot.savefig(continent_drought_output_file_path, format="jpg")
-
-            # Optionally display the pie chart(s) (for finetuning so adjusting is easier)
-            # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
-            plot.show()
-
-
-# ------------------------------------------------- EXECUTION ---------------------------------------------------------- #
-# CONTINENT:
-# DONE
-# Generate the general continent percentages pie chart from all studies
-# create_pie_chart(all_studies_shapefile_path, "Continent percentage all")
-
-# DONE
-# Generate the general continent percentages pie chart from re-analysis locations
-# create_pie_chart(reanalysis_shapefile_path, "Continent percentage")
-
-# DONE
-# Generate the continent drought category keywords percentage pie chart from all paper locations since one paper can have multiple continents
-# create_pie_chart(all_studies_shapefile_path, "Continent drought category all")
-
-# DONE
-# Generate the continent drought category keywords percentage pie chart from the re-analysed paper locations
-# create_pie_chart(reanalysis_shapefile_path, "Continent drought category")
-
-# DONE
-# Generate the Continent SPEI bar chart
-# create_reanalysis_based_bar_chart(reanalysis_shapefile_path, "Continent SPEI")
-
-# -------------------------------------------------------------------------------------
-# SPHERES:
-
-# Generate overview pie chart of drought spheres
-# create_pie_chart(excel_file_path, "spheres")
-
-# DONE
-# Generate the Spheres drought category keywords percentage pie chart from the Excel file since every paper can have only one sphere
-# create_pie_chart(excel_file_path, "Spheres drought category excel")
-
-# DONE
-# Generate the Spheres drought category keywords percentage pie chart from re-analysed paper locations
-# create_pie_chart(reanalysis_shapefile_path, "Spheres drought category")
-
-# DONE
-# Generate the sphere SPEI category percentage pie chart
-# create_pie_chart(reanalysis_shapefile_path, "Spheres SPEI")
+def create_chart(chart_type, save=None):
+    """
+    Creates a chart from its settings in 'chart_registry': loads the count cube of the data (only once for all charts), counts the values of the group columns,
+    creates the chart with the renderer of its kind, saves it as JPG and displays it.
+    New charts can be added by adding their settings to 'chart_registry' without any further code.
 
-# -------------------------------------------------------------------------------------
-# MODIS:
+    Args:
+        chart_type (str): The chart to create, one of the keys of 'chart_registry'.
+        save (bool or None): Whether the chart is saved as JPG, None to use the "save" setting of the chart.
 
-# DONE
-# Generate the MODIS forest type percentage pie chart for all study locations
-# create_pie_chart(all_studies_shapefile_path, "MODIS percentage all")
+    Returns:
+        None: The function saves the generated chart as a JPG image.
+    """
+    chart = chart_registry[chart_type]
 
-# DONE
-# Generate the MODIS forest type percentage pie chart for re-analysis location
-# create_pie_chart(reanalysis_shapefile_path, "MODIS percentage")
+    # Count the values of the group columns from the count cube and shorten long labels (e.g. for the "Other" MODIS forest category)
+    # https://pandas.pydata.org/docs/user_guide/basics.html#renaming-mapping-labels
+    counts = count_values(load_count_cube(chart["data"]), chart["group"])
+    if "rename" in chart:
+        counts = counts.rename(index=chart["rename"])
 
-# DONE
-# Generate the MODIS breakdown of given drought quantification keyword pie chart from all paper locations since one paper can have multiple MODIS forest types
-# create_pie_chart(all_studies_shapefile_path, "MODIS drought category all")
+    chart_renderers[chart["kind"]](chart, counts)
 
-# DONE
-# Generate the MODIS breakdown of given drought quantification keyword pie chart for the re-analysed paper locations
-# create_pie_chart(reanalysis_shapefile_path, "MODIS drought category")
+    # Ensure that the tight layout is used for a better visualisation
+    # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.tight_layout.html#matplotlib.pyplot.tight_layout
+    if chart.get("tight_layout", True):
+        plot.tight_layout()
 
-# DONE
-# Generate the MODIS SPEI category bar chart
-# create_reanalysis_based_bar_chart(reanalysis_shapefile_path, "MODIS SPEI")
+    # Save the chart as a JPG file to use it in the thesis
+    # https://www.geeksforgeeks.org/matplotlib-pyplot-savefig-in-python/
+    if chart.get("save", True) if save is None else save:
+        plot.savefig(chart["output"], format="jpg")
 
-# DONE
-# Generate the MODIS breakdown of drought spheres pie chart
-# create_pie_chart(all_studies_shapefile_path, "MODIS drought sphere")
+    # Optionally display the chart (for finetuning so adjusting is easier)
+    # https://www.geeksforgeeks.org/matplotlib-pyplot-show-in-python/
+    plot.show()
 
-# DONE but not needed
-# Generate the MODIS and given drought category keyword bar chart
-# create_drought_keywords_bar_chart(all_studies_shapefile_path, "MODIS drought keyword")
 
-# -------------------------------------------------------------------------------------
-# STUDY TYPE:
+# ------------------------------------------------- BATCH RENDERING ------------------------------------------------- #
+def init_render_worker(data_paths):
+    """
+    Prepares a worker process for rendering charts: switches matplotlib to the non-interactive Agg backend,
+    so no windows are opened, and loads every needed data file and its count cube once, so all charts of the worker use the same counts.
 
-# DONE
-# Generate the general study type percentages pie chart
-# create_pie_chart(excel_file_path, "study type")
+    Args:
+        data_paths (list): The paths of the shapefiles and the Excel file that the charts are created from.
 
-# DONE
-# Generate the study type breakdown of given drought quantification keyword pie chart from Excel since every paper only has one study type
-# create_pie_chart(excel_file_path, "study type drought category excel")
+    References:
+        - Backends: https://matplotlib.org/stable/users/explain/figure/backends.html
+        - 'switch_backend()': https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.switch_backend.html
+    """
+    plot.switch_backend("Agg")
 
-# DONE
-# Generate the study type breakdown of given drought quantification keyword pie chart from the re-analysed paper locations
-# create_pie_chart(reanalysis_shapefile_path, "study type drought category")
+    # plot.show() only gives a warning with the Agg backend, which is expected here
+    # https://docs.python.org/3/library/warnings.html#warnings.filterwarnings
+    warnings.filterwarnings("ignore", message=".*non-interactive.*")
 
-# DONE
-# Generate the study type SPEI breakdown pie chart
-# create_pie_chart(reanalysis_shapefile_path, "study type SPEI")
+    # A file that can not be loaded is not an error here, the charts that need it report the error themselves
+    for data_path in data_paths:
+        try:
+            load_count_cube(data_path)
+        except Exception:
+            pass
 
-# -------------------------------------------------------------------------------------
-# SPEI:
 
-# DONE
-# Generate the SPEI category percentage pie chart
-# create_pie_chart(reanalysis_shapefile_path, "SPEI category percentage")
+def render_chart(chart_type):
+    """
+    Creates a single chart from 'chart_registry' and closes all of its figures afterward, so the memory of the worker does not grow.
+    The chart is always saved, also if its settings say "save": False, because the Agg backend can not display it.
 
-# DONE
-# Generate the study type SPEI category bar chart
-create_reanalysis_based_bar_chart(reanalysis_shapefile_path, "Study type SPEI Bar")
+    Args:
+        chart_type (str): The chart to create, one of the keys of 'chart_registry'.
 
-# DONE
-# Generate the drought quantification keyword SPEI bar chart
-# create_reanalysis_based_bar_chart(reanalysis_shapefile_path, "Drought keyword SPEI")
+    Returns:
+        tuple: The chart type and the time in seconds it took to create the chart.
+    """
+    # https://docs.python.org/3/library/time.html#time.perf_counter
+    start_time = time.perf_counter()
+    create_chart(chart_type, save=True)
+    render_time = time.perf_counter() - start_time
 
-# DONE
-# Generate the drought keywords percentage pie chart from the re-analysed paper locations
-# create_pie_chart(reanalysis_shapefile_path, "drought keywords percentage")
+    # https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.close.html
+    plot.close("all")
+    return chart_type, render_time
 
-# DONE
-# Plot that shows the contribution of drought keywords for quantified or not.
-# create_pie_chart(reanalysis_shapefile_path, "Quantification drought keywords")
 
-# -------------------------------------------------------------------------------------
-# General:
+def render_charts(chart_types, workers):
+    """
+    Creates the given charts in parallel worker processes with the Agg backend and prints how long every chart took.
+    Every worker loads the needed data files once when it is started. A chart that fails is reported in the summary
+    and does not stop the other charts.
 
-# DONE
-# Generate the drought keywords percentage pie chart from the Excel file to show the general paper contribution
-# create_pie_chart(excel_file_path, "drought keywords percentage excel")
+    Args:
+        chart_types (list): The charts to create, keys of 'chart_registry'.
+        workers (int): The number of worker processes.
 
-# -------------------------------------------------------------------------------------
-# TRUE OR FALSE:
+    Returns:
+        dict: The time in seconds for every chart that was created, stored by its chart type.
 
-# DONE
-# Plot that shows drought correctness for quantified or not, no matter the category.
-# create_pie_chart(reanalysis_shapefile_path, "Quantified correctness")
+    References:
+        - 'ProcessPoolExecutor': https://docs.python.org/3/library/concurrent.futures.html#processpoolexecutor
+    """
+    # Only the data files that are needed for the selected charts are loaded by the workers
+    data_paths = sorted({chart_registry[chart_type]["data"] for chart_type in chart_types})
+
+    # No more workers than charts are started
+    workers = max(1, min(workers, len(chart_types)))
+
+    render_times = {}
+    failed_charts = {}
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_render_worker,
+        initargs=(data_paths,),
+    ) as executor:
+        futures = {
+            executor.submit(render_chart, chart_type): chart_type
+            for chart_type in chart_types
+        }
+        for future in as_completed(futures):
+            try:
+                chart_type, render_time = future.result()
+                render_times[chart_type] = render_time
+            except Exception as error:
+                failed_charts[futures[future]] = error
+    total_time = time.perf_counter() - start_time
+
+    # Summary of the render time of every chart, from the slowest to the fastest
+    print(f"{'Chart':<40} {'Seconds':>8}")
+    for chart_type, render_time in sorted(
+        render_times.items(), key=lambda item: item[1], reverse=True
+    ):
+        print(f"{chart_type:<40} {render_time:>8.2f}")
+    for chart_type, error in failed_charts.items():
+        print(f"{chart_type:<40} {'failed':>8}  ({error})")
+    print(
+        f"Rendered {len(render_times)} of {len(chart_types)} chart(s) in {total_time:.2f} s "
+        f"(sum of all charts: {sum(render_times.values()):.2f} s) with {workers} worker(s)"
+    )
+    return render_times
 
-# DONE
-# Generate the bar plot with correctness of the given drought quantification keywords for all re-analyzed paper locations
-# create_true_false_bar_chart(reanalysis_shapefile_path, "Drought correctness")
 
-# DONE
-# Generate the bar plot that shows the correlation between all given drought keywords and if drought was quantified in percent
-# create_true_false_bar_chart(reanalysis_shapefile_path, "Drought quantified")
\ No newline at end of file
+# ------------------------------------------------- EXECUTION ---------------------------------------------------------- #
+# The charts are only created when the script is run directly, not when the worker processes import it
+if __name__ == "__main__":
+    # Read the command line arguments, without any chart type all charts are created
+    # https://docs.python.org/3/library/argparse.html
+    parser = argparse.ArgumentParser(description="Creates the bar and pie charts of the thesis")
+    parser.add_argument("charts", nargs="*", metavar="CHART_TYPE", help="Chart types to create (default: all charts)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of processes used to create the charts in parallel (default: %(default)s)")
+    parser.add_argument("--show", action="store_true", help="Create the charts one after another in this process and display them (for finetuning)")
+    parser.add_argument("--list", action="store_true", help="Only list all chart types and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        print("\n".join(chart_registry))
+        raise SystemExit(0)
+
+    # Check the selected chart types before any worker is started
+    selected_charts = args.charts or list(chart_registry)
+    unknown_charts = [chart_type for chart_type in selected_charts if chart_type not in chart_registry]
+    if unknown_charts:
+        parser.error(f"Unknown chart type(s): {', '.join(unknown_charts)} (use --list to see all chart types)")
+
+    if args.show:
+        for chart_type in selected_charts:
+            create_chart(chart_type)
+    else:
+        render_charts(selected_charts, args.workers)